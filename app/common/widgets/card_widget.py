@@ -3,7 +3,7 @@
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QPushButton, QVBoxLayout, QHBoxLayout, QLabel
 
-from app.core.icon_manager import get_icon
+from app.core.icon_manager import get_pixmap
 
 
 class ActionCardWidget(QPushButton):
@@ -22,7 +22,7 @@ class ActionCardWidget(QPushButton):
         layout.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
 
         icon_label = QLabel()
-        icon_label.setPixmap(get_icon(icon_name).pixmap(32, 32))
+        icon_label.setPixmap(get_pixmap(icon_name, 32))
 
         title_label = QLabel(title_text)
         title_label.setObjectName("blockTitle")
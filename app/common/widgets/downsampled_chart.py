@@ -0,0 +1,91 @@
+# app/common/widgets/downsampled_chart.py
+import bisect
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from PySide6.QtCharts import QAbstractAxis, QChart, QDateTimeAxis, QXYSeries
+from PySide6.QtCore import QObject, QPointF, Qt, QTimer
+
+from app.core.analytics_logic import downsample_lttb
+
+log = logging.getLogger(__name__)
+
+# Above this many points across a chart's series, series animations are switched off.
+ANIMATION_POINT_LIMIT = 500
+# Before the chart is first laid out its plot area has no width; assume a typical one until then.
+DEFAULT_PLOT_WIDTH = 800
+
+
+class ChartDownsampler(QObject):
+    """
+    Keeps the line series of a QChart at about one point per horizontal pixel of its plot area.
+    The full data stays here. Each series shows an LTTB-downsampled copy (see
+    analytics_logic.downsample_lttb) of the part inside its x axis range. The copy is recomputed
+    when the plot area is resized or the x axis is zoomed. Call clear() before the chart's series
+    are removed and apply() once the new ones are attached to their axes.
+    """
+
+    def __init__(self, chart: QChart):
+        super().__init__(chart)
+        self._chart = chart
+        self._animation_options = chart.animationOptions()
+        self._series: List[Tuple[QXYSeries, List[float], List[float]]] = []
+        self._drawn: Dict[int, tuple] = {}  # id(series) -> (start, end, threshold) last drawn
+
+        # Resizing and zooming come in bursts; recompute once per event-loop turn.
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self.refresh)
+        chart.plotAreaChanged.connect(lambda _area: self._refresh_timer.start())
+
+    def clear(self):
+        """Forgets every series. Call before chart.removeAllSeries(), which deletes them."""
+        self._series.clear()
+        self._drawn.clear()
+
+    def set_points(self, series: QXYSeries, xs: Sequence[float], ys: Sequence[float]):
+        """Registers the full data of `series`; `xs` must be ascending. Nothing is drawn until apply()."""
+        self._series.append((series, list(xs), list(ys)))
+
+    def apply(self):
+        """Draws the registered series, follows zooming of their x axes and picks the animation setting."""
+        total_points = sum(len(xs) for _, xs, _ in self._series)
+        if total_points > ANIMATION_POINT_LIMIT:
+            self._chart.setAnimationOptions(QChart.AnimationOption.NoAnimation)
+        else:
+            self._chart.setAnimationOptions(self._animation_options)
+
+        x_axes = {id(axis): axis for series, _, _ in self._series if (axis := self._x_axis(series))}
+        for axis in x_axes.values():
+            axis.rangeChanged.connect(lambda *_range: self._refresh_timer.start())
+        self.refresh()
+
+    def refresh(self):
+        width = self._chart.plotArea().width()
+        threshold = max(3, int(width if width >= 1 else DEFAULT_PLOT_WIDTH))
+        for series, xs, ys in self._series:
+            x_min, x_max = self._x_range(series)
+            # One point beyond each edge, so the line runs to the border of the plot area.
+            start = max(bisect.bisect_left(xs, x_min) - 1, 0)
+            end = min(bisect.bisect_right(xs, x_max) + 1, len(xs))
+            drawn = (start, end, min(threshold, end - start))
+            if self._drawn.get(id(series)) == drawn:
+                continue
+            self._drawn[id(series)] = drawn
+            sampled_x, sampled_y = downsample_lttb(xs[start:end], ys[start:end], threshold)
+            series.replace([QPointF(x, y) for x, y in zip(sampled_x, sampled_y)])
+            log.debug(f"Series '{series.name()}': drawing {len(sampled_x)} of {end - start} points.")
+
+    @staticmethod
+    def _x_axis(series: QXYSeries) -> Optional[QAbstractAxis]:
+        return next((axis for axis in series.attachedAxes()
+                     if axis.orientation() == Qt.Orientation.Horizontal), None)
+
+    def _x_range(self, series: QXYSeries) -> Tuple[float, float]:
+        axis = self._x_axis(series)
+        if axis is None:
+            return float("-inf"), float("inf")
+        if isinstance(axis, QDateTimeAxis):
+            return axis.min().toMSecsSinceEpoch(), axis.max().toMSecsSinceEpoch()
+        return axis.min(), axis.max()
@@ -5,7 +5,7 @@ from PySide6.QtGui import QDrag, QPixmap, QPainter
 from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QHBoxLayout
 
 from app.core.constants import SPACING_SMALL
-from app.core.icon_manager import get_icon
+from app.core.icon_manager import get_pixmap
 
 
 class DragItem(QWidget):
@@ -27,7 +27,7 @@ class DragItem(QWidget):
 
         # Using a grip/hamburger menu icon is a common UI pattern for this.
         handle = QLabel()
-        handle.setPixmap(get_icon("DRAG_HANDLE").pixmap(16, 16))
+        handle.setPixmap(get_pixmap("DRAG_HANDLE", 16))
         handle.setToolTip("Click and drag to reorder")
         handle.setCursor(Qt.CursorShape.OpenHandCursor)  # Change cursor on hover
 
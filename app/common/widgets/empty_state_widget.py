@@ -3,7 +3,7 @@ from PySide6.QtCore import Signal, Qt
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton
 
 from app.core.constants import SPACING_LARGE
-from app.core.icon_manager import get_icon, THEME_ACCENT_TEXT_COLOR
+from app.core.icon_manager import get_icon, get_pixmap, THEME_ACCENT_TEXT_COLOR
 
 
 class EmptyStateWidget(QWidget):
@@ -20,7 +20,7 @@ class EmptyStateWidget(QWidget):
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         icon_label = QLabel()
-        icon_label.setPixmap(get_icon(icon_name).pixmap(48, 48))
+        icon_label.setPixmap(get_pixmap(icon_name, 48))
 
         title_label = QLabel(title)
         title_label.setObjectName("blockTitle")
@@ -1,5 +1,5 @@
 # app/core/analytics_logic.py
-from typing import List
+from typing import List, Sequence, Tuple
 
 from app.services.interfaces import DailyPerformance
 
@@ -17,6 +17,45 @@ def calculate_moving_average(data: List[float], window_size: int = 7) -> List[fl
     return averages
 
 
+def downsample_lttb(xs: Sequence[float], ys: Sequence[float], threshold: int) -> Tuple[List[float], List[float]]:
+    """
+    Largest-Triangle-Three-Buckets downsampling of a line sorted by x. Keeps the first and last
+    points and, from each of threshold - 2 equal buckets in between, the point that forms the
+    largest triangle with the previously kept point and the mean of the next bucket, which
+    preserves peaks and dips. Lines of at most `threshold` points, or a threshold below 3,
+    are returned as they are.
+    """
+    n = len(xs)
+    if threshold >= n or threshold < 3:
+        return list(xs), list(ys)
+
+    out_x, out_y = [xs[0]], [ys[0]]
+    bucket_size = (n - 2) / (threshold - 2)
+    kept = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+        next_end = min(int((bucket + 2) * bucket_size) + 1, n)
+        next_count = next_end - end
+        mean_x = sum(xs[end:next_end]) / next_count
+        mean_y = sum(ys[end:next_end]) / next_count
+
+        kept_x, kept_y = xs[kept], ys[kept]
+        best, best_area = start, -1.0
+        for i in range(start, end):
+            # Twice the triangle's area; the factor does not change which point wins.
+            area = abs((kept_x - mean_x) * (ys[i] - kept_y) - (kept_x - xs[i]) * (mean_y - kept_y))
+            if area > best_area:
+                best, best_area = i, area
+        out_x.append(xs[best])
+        out_y.append(ys[best])
+        kept = best
+
+    out_x.append(xs[-1])
+    out_y.append(ys[-1])
+    return out_x, out_y
+
+
 def calculate_streak_stats(daily_data: List[DailyPerformance], daily_goal: int) -> dict:
     """Calculates current streak, max streak, and success rates."""
     if not daily_data:
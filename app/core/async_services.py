@@ -0,0 +1,176 @@
+# app/core/async_services.py
+
+import asyncio
+import logging
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+
+log = logging.getLogger(__name__)
+
+
+class ServiceFuture(QObject):
+    """
+    The pending result of a service call running on a ServiceExecutor.
+
+    Callbacks registered with then() and the finished/failed signals always
+    run on the thread that created the future (the GUI thread). The future can
+    also be awaited from asyncio code, or waited on with result().
+    If the optional context object is destroyed before the call completes,
+    the result is silently dropped.
+    """
+    finished = Signal(object)
+    failed = Signal(object)
+    _resolved = Signal(object, object)
+
+    def __init__(self, context: Optional[QObject] = None):
+        super().__init__(context)
+        self._future: Future = Future()
+        self._outcome: Optional[tuple] = None
+        self._callbacks = []
+        self._on_settled: Optional[Callable[[], None]] = None
+        self._resolved.connect(self._on_resolved)
+
+    def then(self, on_success: Callable[[Any], None],
+             on_error: Optional[Callable[[BaseException], None]] = None) -> "ServiceFuture":
+        """Registers GUI-thread callbacks. Returns self so calls can be chained."""
+        if self._outcome is not None:
+            self._dispatch(on_success, on_error, *self._outcome)
+        else:
+            self._callbacks.append((on_success, on_error))
+        return self
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """Blocks until the call completes. Never call this from the GUI thread."""
+        return self._future.result(timeout)
+
+    def __await__(self):
+        return asyncio.wrap_future(self._future).__await__()
+
+    def _set_outcome(self, result: Any, error: Optional[BaseException]):
+        """Called from the worker thread."""
+        if error is not None:
+            self._future.set_exception(error)
+        else:
+            self._future.set_result(result)
+        try:
+            self._resolved.emit(result, error)
+        except RuntimeError:
+            # The context object (and this future with it) was deleted while the call was running.
+            log.debug("Service call finished after its context was destroyed. Result dropped.")
+            self._settle()
+
+    @Slot(object, object)
+    def _on_resolved(self, result: Any, error: Optional[BaseException]):
+        self._outcome = (result, error)
+        callbacks, self._callbacks = self._callbacks, []
+        for on_success, on_error in callbacks:
+            self._dispatch(on_success, on_error, result, error)
+        if error is not None:
+            self.failed.emit(error)
+        else:
+            self.finished.emit(result)
+        self._settle()
+
+    def _settle(self):
+        if self._on_settled is not None:
+            self._on_settled()
+            self._on_settled = None
+
+    @staticmethod
+    def _dispatch(on_success, on_error, result, error):
+        if error is None:
+            on_success(result)
+        elif on_error is not None:
+            on_error(error)
+        else:
+            log.error("Unhandled error in background service call.", exc_info=error)
+
+
+class _ServiceCall(QRunnable):
+    def __init__(self, fn: Callable, args: tuple, kwargs: dict, future: ServiceFuture):
+        super().__init__()
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+        self._future = future
+
+    def run(self):
+        try:
+            result = self._fn(*self._args, **self._kwargs)
+        except Exception as e:
+            log.debug(f"Background call {getattr(self._fn, '__qualname__', self._fn)} raised {e!r}")
+            self._future._set_outcome(None, e)
+        else:
+            self._future._set_outcome(result, None)
+
+
+class AsyncServiceFacade:
+    """
+    Awaitable view of a service: every method call is submitted to the executor
+    and returns a ServiceFuture instead of the result.
+
+        executor.wrap(session_service).get_history_for_cycle(cycle_id, context=view).then(populate)
+    """
+
+    def __init__(self, service: Any, executor: "ServiceExecutor"):
+        self._service = service
+        self._executor = executor
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self._service, name)
+        if not callable(attribute):
+            return attribute
+
+        def submit(*args, context: Optional[QObject] = None, **kwargs) -> ServiceFuture:
+            return self._executor.submit(attribute, *args, context=context, **kwargs)
+
+        submit.__name__ = name
+        return submit
+
+
+class ServiceExecutor:
+    """
+    Runs blocking service calls on a bounded pool of worker threads so that
+    views never query the database on the GUI thread.
+
+    Workers never expire, so each keeps its pooled database connection warm.
+    With max_threads=0 calls run inline on the calling thread, which keeps
+    controllers deterministic in tests.
+    """
+
+    def __init__(self, max_threads: int = 4):
+        self._inline = max_threads <= 0
+        self._pool = QThreadPool()
+        if not self._inline:
+            self._pool.setMaxThreadCount(max_threads)
+            self._pool.setExpiryTimeout(-1)
+        # Keeps context-less futures alive until their result has been delivered.
+        self._in_flight = set()
+
+    def submit(self, fn: Callable, *args, context: Optional[QObject] = None, **kwargs) -> ServiceFuture:
+        future = ServiceFuture(context)
+        self._in_flight.add(future)
+        future._on_settled = lambda: self._in_flight.discard(future)
+        call = _ServiceCall(fn, args, kwargs, future)
+        if self._inline:
+            call.run()
+        else:
+            self._pool.start(call)
+        return future
+
+    def wrap(self, service: Any) -> AsyncServiceFacade:
+        return AsyncServiceFacade(service, self)
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        return self._pool.waitForDone(msecs)
+
+    def shutdown(self):
+        """Drops queued calls and waits for the running ones to finish."""
+        self._pool.clear()
+        self._pool.waitForDone()
+        log.info("Service executor shut down.")
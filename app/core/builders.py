@@ -1,9 +1,11 @@
 # app/core/builders.py
 
 import logging
+from contextlib import nullcontext
 from typing import List, Dict, Any, Optional
 
 from app.core import business_logic
+from app.core.database import UnitOfWork
 
 from app.services.interfaces import (ICycleService, ICycleSubjectService, IStudyQueueService, IMasterSubjectService)
 
@@ -20,11 +22,13 @@ class CycleBuilder:
                  cycle_service: ICycleService,
                  cycle_subject_service: ICycleSubjectService,
                  master_subject_service: IMasterSubjectService,
-                 queue_service: IStudyQueueService):
+                 queue_service: IStudyQueueService,
+                 unit_of_work: Optional[UnitOfWork] = None):
         self._cycle_service = cycle_service
         self._cycle_subject_service = cycle_subject_service
         self._master_subject_service = master_subject_service
         self._queue_service = queue_service
+        self._unit_of_work = unit_of_work or nullcontext()
         self._subject_order: List[str] = []
 
         self._cycle_id: Optional[int] = None
@@ -62,18 +66,21 @@ class CycleBuilder:
         Executes the build process.
         Creates or updates the cycle, processes subjects, and generates the queue.
         Returns the ID of the created or updated cycle.
+        All writes happen inside one unit of work, so a failure leaves nothing behind.
         """
-        if self._cycle_id:
-            log.info(f"Builder is updating existing cycle_id: {self._cycle_id}")
-            self._update_existing_cycle()
-        elif self._exam_id:
-            log.info(f"Builder is creating new cycle for exam_id: {self._exam_id}")
-            self._create_new_cycle()
-        else:
+        if not self._cycle_id and not self._exam_id:
             raise ValueError("CycleBuilder requires either an exam_id (for creation) or a cycle_id (for update).")
 
-        self._process_subjects()
-        self._generate_queue()
+        with self._unit_of_work:
+            if self._cycle_id:
+                log.info(f"Builder is updating existing cycle_id: {self._cycle_id}")
+                self._update_existing_cycle()
+            else:
+                log.info(f"Builder is creating new cycle for exam_id: {self._exam_id}")
+                self._create_new_cycle()
+
+            self._process_subjects()
+            self._generate_queue()
 
         log.info(f"Cycle build complete for cycle_id: {self._cycle_id}")
         return self._cycle_id
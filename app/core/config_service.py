@@ -1,4 +1,5 @@
 # app/core/config_service.py
+import copy
 import toml
 from typing import Any
 
@@ -15,3 +16,7 @@ class ConfigService:
                 return default
             value = value[k]
         return value
+
+    def as_dict(self) -> dict:
+        """A copy of every loaded setting."""
+        return copy.deepcopy(self._config)
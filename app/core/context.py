@@ -1,7 +1,9 @@
 # app/core/context.py
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Optional
 
-from app.core.database import IDatabaseConnectionFactory
+from app.core.async_services import ServiceExecutor
+from app.core.database import IDatabaseConnectionFactory, ReadOnlySqliteConnectionFactory, UnitOfWork
 from app.core.config_service import ConfigService
 from app.services.interfaces import (
     ICycleService, ISessionService, IExamService, IUserService, IPerformanceService,
@@ -25,4 +27,8 @@ class AppContext:
     study_queue_service: IStudyQueueService
     work_unit_service: IWorkUnitService
     template_subject_service: ITemplateSubjectService
-    conn_factory: IDatabaseConnectionFactory
\ No newline at end of file
+    conn_factory: IDatabaseConnectionFactory
+    unit_of_work: Optional[UnitOfWork] = None
+    read_conn_factory: Optional[ReadOnlySqliteConnectionFactory] = None
+    # Defaults to running calls inline; the application passes a threaded executor.
+    service_executor: ServiceExecutor = field(default_factory=lambda: ServiceExecutor(max_threads=0))
\ No newline at end of file
@@ -3,7 +3,11 @@
 import logging
 import os
 import sqlite3
-from typing import Protocol
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Protocol
+from urllib.parse import quote
 
 log = logging.getLogger(__name__)
 
@@ -58,4 +62,314 @@ class SqliteConnectionFactory(IDatabaseConnectionFactory):
 
 
         conn.row_factory = sqlite3.Row
-        return conn
\ No newline at end of file
+        return conn
+
+
+class PooledConnection(sqlite3.Connection):
+    """
+    A connection owned by a PooledSqliteConnectionFactory.
+    Callers may still call close() when they are done with it; this only
+    releases the connection back to the pool (rolling back anything left
+    uncommitted) instead of tearing it down.
+    """
+
+    def close(self):
+        if self.in_transaction:
+            self.rollback()
+
+    def dispose(self):
+        """Actually closes the underlying database handle."""
+        super().close()
+
+
+class PooledSqliteConnectionFactory(IDatabaseConnectionFactory):
+    """
+    A connection factory that keeps one long-lived connection per thread.
+
+    The first checkout on a thread opens the connection and applies the tuned
+    pragmas once; every later checkout on that thread returns the same object.
+    Connections are periodically health-checked and transparently reopened if
+    they stop responding. close_all() should be called on shutdown.
+    """
+
+    DEFAULT_PRAGMAS = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 256 * 1024 * 1024,  # 256 MiB
+        "cache_size": -16000,  # Negative values are KiB, so ~16 MiB per connection
+        "temp_store": "MEMORY",
+    }
+
+    def __init__(self, db_path: str, pragmas: Optional[dict] = None, health_check_interval_sec: float = 30.0):
+        self._db_path = db_path
+        self._pragmas = {**self.DEFAULT_PRAGMAS, **(pragmas or {})}
+        self._health_check_interval_sec = health_check_interval_sec
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: Dict[int, PooledConnection] = {}
+        # Bumped by close_all() so that stale thread-local handles are discarded on next checkout.
+        self._generation = 0
+
+        if self._db_path != ":memory:" and not self._db_path.startswith("file:"):
+            db_dir = os.path.dirname(self._db_path)
+            if db_dir:
+                os.makedirs(db_dir, exist_ok=True)
+
+        log.info(f"Pooled database connection factory initialized for path: {self._db_path}")
+
+    def get_connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.generation == self._generation:
+            now = time.monotonic()
+            if now - self._local.last_checked < self._health_check_interval_sec:
+                return conn
+            if self._is_healthy(conn):
+                self._local.last_checked = now
+                return conn
+            log.warning("Pooled connection failed its health check. Reopening it.")
+            self._discard(conn)
+
+        return self._open_for_current_thread()
+
+    def close_all(self):
+        """Closes every pooled connection. Safe to call more than once."""
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+            self._generation += 1
+        for conn in connections:
+            try:
+                conn.dispose()
+            except sqlite3.Error:
+                log.debug("Ignoring error while closing pooled connection.", exc_info=True)
+        self._local = threading.local()
+        log.info(f"Closed {len(connections)} pooled database connection(s).")
+
+    def active_connection_count(self) -> int:
+        with self._lock:
+            return len(self._connections)
+
+    def _connect(self) -> PooledConnection:
+        is_uri = self._db_path.startswith("file:")
+        # check_same_thread is disabled only so close_all() can dispose of connections
+        # from the shutdown thread; each connection is still used by a single thread.
+        return sqlite3.connect(self._db_path, uri=is_uri, factory=PooledConnection, check_same_thread=False)
+
+    def _open_for_current_thread(self) -> PooledConnection:
+        conn = self._connect()
+        conn.row_factory = sqlite3.Row
+        self._apply_pragmas(conn)
+
+        with self._lock:
+            self._connections[threading.get_ident()] = conn
+            generation = self._generation
+
+        self._local.conn = conn
+        self._local.generation = generation
+        self._local.last_checked = time.monotonic()
+        log.debug(f"Opened pooled connection for thread {threading.get_ident()}.")
+        return conn
+
+    def _apply_pragmas(self, conn: sqlite3.Connection):
+        for name, value in self._pragmas.items():
+            try:
+                conn.execute(f"PRAGMA {name} = {value}")
+            except sqlite3.Error:
+                log.warning(f"Could not apply PRAGMA {name} = {value}", exc_info=True)
+
+    def _discard(self, conn: PooledConnection):
+        with self._lock:
+            if self._connections.get(threading.get_ident()) is conn:
+                del self._connections[threading.get_ident()]
+        try:
+            conn.dispose()
+        except sqlite3.Error:
+            pass
+        self._local.conn = None
+
+    @staticmethod
+    def _is_healthy(conn: sqlite3.Connection) -> bool:
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+
+class ReadOnlyConnection(PooledConnection):
+    """
+    A pooled read-only connection. While a snapshot is pinned, the per-call
+    transaction boundaries used by the services (the 'with conn:' block,
+    commit(), close()) leave the read transaction open.
+    """
+    pinned = False
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.pinned:
+            return False
+        return super().__exit__(exc_type, exc_val, exc_tb)
+
+    def commit(self):
+        if not self.pinned:
+            super().commit()
+
+    def close(self):
+        if not self.pinned:
+            super().close()
+
+
+class ReadOnlySqliteConnectionFactory(PooledSqliteConnectionFactory):
+    """
+    A pool of read-only connections for the analytics services.
+
+    Connections are opened with a 'mode=ro' URI and 'query_only', so they can
+    never take the write lock. In WAL mode a reader works from its own snapshot
+    of the database, so heavy aggregate scans neither block nor wait for the
+    writes of an active study session. The database must already be in WAL mode
+    (the writer pool switches it on first use).
+
+    Wrap a multi-query render in snapshot() to have every query see the same
+    committed state.
+    """
+
+    DEFAULT_PRAGMAS = {
+        "query_only": "ON",
+        "mmap_size": 256 * 1024 * 1024,  # 256 MiB
+        "cache_size": -16000,
+        "temp_store": "MEMORY",
+    }
+
+    def __init__(self, db_path: str, pragmas: Optional[dict] = None, health_check_interval_sec: float = 30.0):
+        if db_path == ":memory:":
+            raise ValueError("A read-only snapshot factory needs a database file, not ':memory:'.")
+        super().__init__(db_path, pragmas, health_check_interval_sec)
+
+    def _connect(self) -> ReadOnlyConnection:
+        if self._db_path.startswith("file:"):
+            separator = "&" if "?" in self._db_path else "?"
+            uri = f"{self._db_path}{separator}mode=ro"
+        else:
+            uri = f"file:{quote(os.path.abspath(self._db_path))}?mode=ro"
+        return sqlite3.connect(uri, uri=True, factory=ReadOnlyConnection, check_same_thread=False)
+
+    @contextmanager
+    def snapshot(self) -> Iterator[ReadOnlyConnection]:
+        """
+        Pins one read transaction on this thread's connection for the duration
+        of the block. Nested calls reuse the outer snapshot.
+        """
+        conn = self.get_connection()
+        if conn.pinned:
+            yield conn
+            return
+
+        conn.execute("BEGIN")
+        # The WAL read mark is only taken on the first read, so touch the schema now.
+        conn.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchall()
+        conn.pinned = True
+        try:
+            yield conn
+        finally:
+            conn.pinned = False
+            conn.rollback()
+
+
+class _UnitOfWorkConnection:
+    """
+    The connection handed to services while a UnitOfWork is open. It forwards
+    everything to the bound connection but turns the per-call transaction
+    boundaries the services use (the 'with conn:' block, commit(), close())
+    into no-ops, so only the outermost unit of work decides when to commit.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, unit_of_work: "UnitOfWork"):
+        self._conn = conn
+        self._unit_of_work = unit_of_work
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        log.warning("rollback() called inside a unit of work. The whole unit will be rolled back on exit.")
+        self._unit_of_work._mark_rollback_only()
+
+    def close(self):
+        pass
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+class UnitOfWork(IDatabaseConnectionFactory):
+    """
+    Binds a single connection and a single transaction across many service calls.
+
+    A UnitOfWork wraps the application's connection factory and is injected into
+    every service in its place. Outside of a 'with uow:' block it simply delegates;
+    inside one, every service call on the same thread shares one connection and
+    one transaction, which is committed (or rolled back on error) exactly once
+    when the outermost block exits. Nested blocks become savepoints, so an inner
+    failure can be rolled back without abandoning the outer unit.
+    """
+
+    def __init__(self, conn_factory: IDatabaseConnectionFactory):
+        self._conn_factory = conn_factory
+        self._local = threading.local()
+
+    @property
+    def is_active(self) -> bool:
+        return getattr(self._local, "depth", 0) > 0
+
+    def get_connection(self):
+        if self.is_active:
+            return self._local.proxy
+        return self._conn_factory.get_connection()
+
+    def __enter__(self) -> "UnitOfWork":
+        depth = getattr(self._local, "depth", 0)
+        if depth == 0:
+            conn = self._conn_factory.get_connection()
+            if not conn.in_transaction:
+                # IMMEDIATE takes the write lock up front, so the unit cannot fail
+                # half-way through with SQLITE_BUSY when it upgrades from reading.
+                conn.execute("BEGIN IMMEDIATE")
+            self._local.conn = conn
+            self._local.proxy = _UnitOfWorkConnection(conn, self)
+            self._local.rollback_only = False
+        else:
+            self._local.conn.execute(f"SAVEPOINT uow_{depth}")
+        self._local.depth = depth + 1
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._local.depth -= 1
+        depth = self._local.depth
+        conn = self._local.conn
+
+        if depth > 0:
+            savepoint = f"uow_{depth}"
+            if exc_type is not None:
+                conn.execute(f"ROLLBACK TO {savepoint}")
+            conn.execute(f"RELEASE {savepoint}")
+            return False
+
+        try:
+            if exc_type is not None or self._local.rollback_only:
+                conn.rollback()
+                log.info("Unit of work rolled back.")
+            else:
+                conn.commit()
+        finally:
+            self._local.conn = None
+            self._local.proxy = None
+        return False
+
+    def _mark_rollback_only(self):
+        self._local.rollback_only = True
@@ -1,8 +1,11 @@
 # app/core/icon_manager.py
 import logging
+from typing import Dict, Iterable, Tuple, Union
 
-import qtawesome as qta
-from PySide6.QtGui import QIcon
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QColor, QIcon, QPixmap
+
+from app.core.signals import app_signals
 
 log = logging.getLogger(__name__)
 
@@ -52,12 +55,84 @@ ICON_MAP = {
 }
 
 
-def get_icon(name: str, color: str = THEME_TEXT_COLOR) -> QIcon:
-    """Gets a QIcon from the icon map using qtawesome."""
+# Icons shown right after startup (toolbar, sidebar, dashboard) and the (name, size) renderings
+# used by empty states and cards. warm_icon_cache() builds them once the main window is up, so
+# first use does not have to.
+COMMON_ICONS = ("START_SESSION", "NEW_CYCLE", "REBALANCE", "UNDO", "REDO", "OVERVIEW", "HISTORY",
+                "SUBJECTS", "SUBJECT", "CONFIGURATIONS", "VIEW_PERFORMANCE", "HELP", "EDIT", "ADD")
+COMMON_PIXMAPS = (("SUBJECTS", 24), ("MAGIC_WAND", 32), ("NEW_CYCLE", 32), ("CONFIGURATIONS", 32),
+                  ("SUBJECTS", 48), ("HISTORY", 48), ("VIEW_PERFORMANCE", 48), ("DRAG_HANDLE", 16))
+WARM_BATCH_SIZE = 4
+
+# Keyed by (name, color) and (name, color, size). Colors are normalized to #AARRGGBB, so a QColor
+# and its hex string share an entry. Both caches are cleared when the theme changes.
+_icon_cache: Dict[Tuple[str, str], QIcon] = {}
+_pixmap_cache: Dict[Tuple[str, str, int], QPixmap] = {}
+
+
+def _color_key(color: Union[str, QColor]) -> str:
+    return QColor(color).name(QColor.NameFormat.HexArgb)
+
+
+def get_icon(name: str, color: Union[str, QColor] = THEME_TEXT_COLOR) -> QIcon:
+    """Gets a QIcon from the icon map using qtawesome. Icons are built once per name and color."""
+    key = (name, _color_key(color))
+    icon = _icon_cache.get(key)
+    if icon is None:
+        icon = _icon_cache[key] = _build_icon(name, color)
+    return icon
+
+
+def get_pixmap(name: str, size: int, color: Union[str, QColor] = THEME_TEXT_COLOR) -> QPixmap:
+    """Gets a size x size rendering of an icon, rasterized once per name, color and size."""
+    key = (name, _color_key(color), size)
+    pixmap = _pixmap_cache.get(key)
+    if pixmap is None:
+        pixmap = _pixmap_cache[key] = get_icon(name, color).pixmap(size, size)
+    return pixmap
+
+
+def clear_icon_cache():
+    """Drops every cached icon and pixmap; called when the theme changes."""
+    log.debug(f"Clearing {len(_icon_cache)} cached icons and {len(_pixmap_cache)} pixmaps.")
+    _icon_cache.clear()
+    _pixmap_cache.clear()
+
+
+def warm_icon_cache(icons: Iterable[str] = COMMON_ICONS,
+                    pixmaps: Iterable[Tuple[str, int]] = COMMON_PIXMAPS):
+    """
+    Builds `icons` and rasterizes `pixmaps` into the caches a few at a time on later event-loop
+    turns, so the work stays off the startup path and never blocks input for long. GUI thread only.
+    """
+    pending = [(name, None) for name in icons] + list(pixmaps)
+
+    def next_batch():
+        batch, pending[:] = pending[:WARM_BATCH_SIZE], pending[WARM_BATCH_SIZE:]
+        for name, size in batch:
+            if size is None:
+                get_icon(name)
+            else:
+                get_pixmap(name, size)
+        if pending:
+            QTimer.singleShot(0, next_batch)
+
+    QTimer.singleShot(0, next_batch)
+
+
+def _build_icon(name: str, color: Union[str, QColor]) -> QIcon:
+    # qtawesome loads every Qt binding qtpy knows about (OpenGL, DataVisualization...); defer it to the first icon.
+    import qtawesome as qta
+
     if name not in ICON_MAP:
         log.warning(f"Icon name '{name}' not found in ICON_MAP. Using fallback.")
         # FIX: The correct icon name is 'fa6s.circle-question' for FontAwesome 6 Solid
         return qta.icon("fa6s.circle-question", color="red")
 
     icon_name = ICON_MAP[name]
-    return qta.icon(icon_name, color=color)
\ No newline at end of file
+    return qta.icon(icon_name, color=color)
+
+
+# Connected at import, before any widget connects, so the caches are empty by the time widgets
+# re-request their icons for the new theme.
+app_signals.theme_changed.connect(clear_icon_cache)
@@ -0,0 +1,58 @@
+# app/core/plan_codec.py
+
+import json
+import zlib
+from typing import Any, Dict, Iterable
+
+# Bump when the encoding of a section changes; rows written with another version are ignored.
+PLAN_CODEC_VERSION = 1
+# Plan keys large enough to be stored, decoded and rewritten on their own.
+PLAN_SECTIONS = ("plan_scaffold", "processed_subjects", "subjects", "sequenced_plan")
+# Every other top-level key (focus text, meta, generation date, fingerprint...) shares this section.
+HEADER_SECTION = "header"
+# Plans are written often and read once per start; favour speed over the last few percent of size.
+COMPRESSION_LEVEL = 6
+
+
+def _plain(value):
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} cannot be stored in a plan cache")
+
+
+def section_for(key: str) -> str:
+    """The section a top-level plan key is stored in."""
+    return key if key in PLAN_SECTIONS else HEADER_SECTION
+
+
+def encode_section(value: Any) -> bytes:
+    """Serializes a section in a single pass (models via their to_dict) and compresses it."""
+    payload = json.dumps(value, default=_plain, separators=(",", ":"), ensure_ascii=False)
+    return zlib.compress(payload.encode("utf-8"), COMPRESSION_LEVEL)
+
+
+def decode_section(data: bytes) -> Any:
+    return json.loads(zlib.decompress(data).decode("utf-8"))
+
+
+def split_plan(plan: Dict[str, Any]) -> Dict[str, Any]:
+    """Splits a plan into {section: value}; the header holds all keys without a section of their own."""
+    sections = {HEADER_SECTION: {}}
+    for key, value in plan.items():
+        if section_for(key) == HEADER_SECTION:
+            sections[HEADER_SECTION][key] = value
+        else:
+            sections[key] = value
+    return sections
+
+
+def join_sections(sections: Dict[str, Any]) -> Dict[str, Any]:
+    """The inverse of split_plan, over whichever sections were decoded."""
+    plan = dict(sections.get(HEADER_SECTION) or {})
+    plan.update((name, value) for name, value in sections.items() if name != HEADER_SECTION)
+    return plan
+
+
+def sections_for_keys(keys: Iterable[str]) -> set:
+    """The sections needed to read `keys`; the header is always included."""
+    return {HEADER_SECTION, *(section_for(key) for key in keys)}
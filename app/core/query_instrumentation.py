@@ -0,0 +1,165 @@
+# app/core/query_instrumentation.py
+
+import logging
+import math
+import re
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Tuple
+
+log = logging.getLogger(__name__)
+
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE_RE = re.compile(r"\s+")
+_COMMENT_RE = re.compile(r"--[^\n]*")
+
+
+def normalize_statement(query: str) -> str:
+    """
+    Reduces a SQL statement to a stable key: comments are dropped, literals are
+    replaced with '?' and all whitespace is collapsed to single spaces.
+    """
+    normalized = _COMMENT_RE.sub(" ", query)
+    normalized = _STRING_LITERAL_RE.sub("?", normalized)
+    normalized = _NUMBER_LITERAL_RE.sub("?", normalized)
+    normalized = _WHITESPACE_RE.sub(" ", normalized).strip()
+    return normalized.rstrip(";").strip()
+
+
+@dataclass
+class QueryStats:
+    """Aggregated measurements for one normalized statement issued from one service method."""
+    caller: str
+    statement: str
+    calls: int
+    rows: int
+    total_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+
+class _StatementRecord:
+    __slots__ = ("calls", "rows", "total_ms", "samples")
+
+    def __init__(self, max_samples: int):
+        self.calls = 0
+        self.rows = 0
+        self.total_ms = 0.0
+        self.samples: Deque[float] = deque(maxlen=max_samples)
+
+
+def _percentile(sorted_samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile over an already sorted list."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(0, min(len(sorted_samples) - 1, math.ceil(fraction * len(sorted_samples)) - 1))
+    return sorted_samples[rank]
+
+
+class QueryInstrumentation:
+    """
+    Opt-in recorder for every statement that goes through BaseService.
+    Latencies are kept in a bounded window of recent samples per statement,
+    which is what the p50/p95/p99 figures are computed from.
+    """
+
+    def __init__(self, max_samples_per_statement: int = 2048):
+        self._max_samples = max_samples_per_statement
+        self._records: Dict[Tuple[str, str], _StatementRecord] = {}
+        self._lock = threading.Lock()
+        self.enabled = False
+
+    def enable(self):
+        self.enabled = True
+        log.info("SQL query instrumentation enabled.")
+
+    def disable(self):
+        self.enabled = False
+        log.info("SQL query instrumentation disabled.")
+
+    def reset(self):
+        with self._lock:
+            self._records.clear()
+
+    def record(self, caller: str, query: str, elapsed_ms: float, rows: int):
+        key = (caller, normalize_statement(query))
+        with self._lock:
+            record = self._records.get(key)
+            if record is None:
+                record = self._records[key] = _StatementRecord(self._max_samples)
+            record.calls += 1
+            record.rows += rows
+            record.total_ms += elapsed_ms
+            record.samples.append(elapsed_ms)
+
+    def snapshot(self) -> List[QueryStats]:
+        """Returns the collected statistics, most expensive (by total time) first."""
+        with self._lock:
+            items = [(key, rec.calls, rec.rows, rec.total_ms, sorted(rec.samples))
+                     for key, rec in self._records.items()]
+
+        stats = [
+            QueryStats(
+                caller=caller,
+                statement=statement,
+                calls=calls,
+                rows=rows,
+                total_ms=total_ms,
+                p50_ms=_percentile(samples, 0.50),
+                p95_ms=_percentile(samples, 0.95),
+                p99_ms=_percentile(samples, 0.99),
+            )
+            for (caller, statement), calls, rows, total_ms, samples in items
+        ]
+        stats.sort(key=lambda s: s.total_ms, reverse=True)
+        return stats
+
+
+class InstrumentedCursor:
+    """
+    A materialized stand-in for a sqlite3.Cursor. When instrumentation is on,
+    results are fetched eagerly so the measured latency includes the actual
+    row stepping, not just statement preparation.
+    """
+
+    def __init__(self, cursor, rows: list):
+        self._rows = rows
+        self._position = 0
+        self.lastrowid = cursor.lastrowid
+        self.rowcount = cursor.rowcount
+        self.description = cursor.description
+
+    def fetchone(self):
+        if self._position >= len(self._rows):
+            return None
+        row = self._rows[self._position]
+        self._position += 1
+        return row
+
+    def fetchmany(self, size: int = 1):
+        chunk = self._rows[self._position:self._position + size]
+        self._position += len(chunk)
+        return chunk
+
+    def fetchall(self):
+        remaining = self._rows[self._position:]
+        self._position = len(self._rows)
+        return remaining
+
+    def __iter__(self):
+        while True:
+            row = self.fetchone()
+            if row is None:
+                return
+            yield row
+
+
+# Create a single, globally accessible instance.
+query_instrumentation = QueryInstrumentation()
@@ -0,0 +1,71 @@
+# app/core/row_mapping.py
+
+import sqlite3
+from dataclasses import MISSING, fields
+from functools import lru_cache
+from operator import itemgetter
+from typing import Callable, Optional, Sequence, Tuple, Type, TypeVar
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=256)
+def _positional_plan(model: type, columns: Tuple[str, ...]) -> Optional[Tuple[Callable, tuple]]:
+    """
+    Works out how to call `model(*args)` straight from a row tuple with these columns.
+
+    Returns (getter, constants): `getter(row + constants)` yields the positional
+    arguments in field order. Missing fields after the last selected column are
+    simply left off so the dataclass fills in its own defaults; missing fields in
+    between are taken from `constants`. Returns None when that is not possible
+    (a default_factory field in a gap), in which case callers map by name.
+    """
+    init_fields = [f for f in fields(model) if f.init]
+    known = {f.name for f in init_fields}
+    unknown = [c for c in columns if c not in known]
+    if unknown:
+        raise TypeError(f"{model.__name__} has no fields for columns {unknown}")
+
+    position = {name: i for i, name in enumerate(columns)}
+    last_selected = max((i for i, f in enumerate(init_fields) if f.name in position), default=-1)
+    indices, constants = [], []
+    for field_ in init_fields[:last_selected + 1]:
+        if field_.name in position:
+            indices.append(position[field_.name])
+        elif field_.default is not MISSING:
+            indices.append(len(columns) + len(constants))
+            constants.append(field_.default)
+        elif field_.default_factory is not MISSING:
+            return None
+        else:
+            raise TypeError(f"{model.__name__}() is missing column '{field_.name}'")
+    for field_ in init_fields[last_selected + 1:]:
+        if field_.default is MISSING and field_.default_factory is MISSING:
+            raise TypeError(f"{model.__name__}() is missing column '{field_.name}'")
+
+    if len(indices) == 1:
+        single = indices[0]
+        return (lambda row: (row[single],)), tuple(constants)
+    return itemgetter(*indices), tuple(constants)
+
+
+def tuple_mapper(model: Type[T], columns: Sequence[str]) -> Callable[[tuple], T]:
+    """Returns a function that builds `model` from a positional row with the given column order."""
+    plan = _positional_plan(model, tuple(columns))
+    if plan is None:
+        names = tuple(columns)
+        return lambda row: model(**dict(zip(names, row)))
+    getter, constants = plan
+    if constants:
+        return lambda row: model(*getter(tuple(row) + constants))
+    return lambda row: model(*getter(row))
+
+
+def model_row_factory(model: Type[T], description) -> Callable[[sqlite3.Cursor, tuple], T]:
+    """
+    A sqlite3 row_factory that turns each raw row tuple into `model` directly,
+    without going through sqlite3.Row or an intermediate dict.
+    `description` is the cursor.description of the executed statement.
+    """
+    build = tuple_mapper(model, [column[0] for column in description])
+    return lambda _cursor, row: build(row)
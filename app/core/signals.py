@@ -1,20 +1,138 @@
 # app/core/signals.py
 
-from PySide6.QtCore import QObject, Signal
+import logging
+from collections import Counter
+from dataclasses import dataclass
+from enum import Flag, auto
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+log = logging.getLogger(__name__)
 
 
 class AppSignals(QObject):
     """
     A central hub for application-wide signals (Observer pattern).
     This allows for decoupled communication between different parts of the app.
+    Data changes go through the InvalidationBus below instead.
     """
-    # Emitted whenever cycle or subject configuration changes,
-    # requiring a refresh of the main dashboard and lists.
-    data_changed = Signal()
-
     # Emitted when the application theme (stylesheet) is changed.
     theme_changed = Signal()
 
 
-# Create a single, globally accessible instance.
-app_signals = AppSignals()
\ No newline at end of file
+class ChangeKind(Flag):
+    """What was written, by table group. Subscribers declare the kinds they depend on."""
+    EXAMS = auto()            # exams
+    CYCLES = auto()           # study_cycles: created, edited, deleted, restored or (de)activated
+    CYCLE_SUBJECTS = auto()   # cycle_subjects: weights, difficulty, membership
+    STUDY_QUEUE = auto()      # study_queue
+    MASTER_SUBJECTS = auto()  # subjects and topics
+    SESSIONS = auto()         # study_sessions and question_performance
+
+
+@dataclass(frozen=True, slots=True)
+class DataChange:
+    """
+    A typed invalidation event. Empty `cycle_ids` / `subject_ids` mean the change is not
+    limited to particular cycles / cycle subjects.
+    """
+    kinds: ChangeKind
+    cycle_ids: FrozenSet[int] = frozenset()
+    subject_ids: FrozenSet[int] = frozenset()
+
+    @classmethod
+    def of(cls, kinds: ChangeKind, cycle_ids: Iterable[Optional[int]] = (),
+           subject_ids: Iterable[Optional[int]] = ()) -> "DataChange":
+        """Builds an event, dropping unknown (None) ids."""
+        return cls(kinds, frozenset(i for i in cycle_ids if i is not None),
+                   frozenset(i for i in subject_ids if i is not None))
+
+    def merge(self, other: "DataChange") -> "DataChange":
+        # An unscoped change on either side leaves the merged change unscoped.
+        return DataChange(
+            self.kinds | other.kinds,
+            self.cycle_ids | other.cycle_ids if self.cycle_ids and other.cycle_ids else frozenset(),
+            self.subject_ids | other.subject_ids if self.subject_ids and other.subject_ids else frozenset(),
+        )
+
+    def affects_cycle(self, cycle_id: Optional[int]) -> bool:
+        return not self.cycle_ids or cycle_id in self.cycle_ids
+
+
+Subscriber = Callable[[DataChange], None]
+
+
+@dataclass(eq=False, slots=True)
+class _Subscription:
+    kinds: ChangeKind
+    callback: Subscriber
+    owner: str  # Class name of the owning QObject, for live_subscriptions().
+    active: bool = True
+
+
+class InvalidationBus(QObject):
+    """
+    Delivers DataChange events to the subscribers that depend on them. Everything published
+    during one turn of the event loop is merged into a single event, so a user action that
+    writes several tables causes at most one call per subscriber. Use from the GUI thread.
+
+    Subscriptions are tied to the lifetime of an owner QObject (usually the controller or its
+    view) and are removed when the owner is destroyed, so views that are built on every visit
+    do not pile up subscribers.
+    """
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._subscriptions: List[_Subscription] = []
+        self._pending: Optional[DataChange] = None
+
+    def subscribe(self, kinds: ChangeKind, callback: Subscriber, owner: QObject) -> Callable[[], None]:
+        """
+        Calls `callback(change)` for every flushed change that includes one of `kinds`, until
+        `owner` is destroyed. Returns a function that unsubscribes earlier.
+        """
+        subscription = _Subscription(kinds, callback, type(owner).__name__)
+        self._subscriptions.append(subscription)
+
+        def unsubscribe(*_):
+            if subscription.active:
+                subscription.active = False
+                self._subscriptions = [s for s in self._subscriptions if s is not subscription]
+
+        owner.destroyed.connect(unsubscribe)
+        return unsubscribe
+
+    def publish(self, change: DataChange):
+        """Queues a change; it is delivered, merged with the rest of this turn's changes, on the next turn."""
+        if self._pending is None:
+            self._pending = change
+            QTimer.singleShot(0, self.flush)
+        else:
+            self._pending = self._pending.merge(change)
+
+    def flush(self):
+        """Delivers the pending change now. Changes published by subscribers go out on the next turn."""
+        change, self._pending = self._pending, None
+        if change is None:
+            return
+        log.debug(f"Delivering {change} to {len(self._subscriptions)} subscriptions.")
+        for subscription in list(self._subscriptions):
+            # A subscriber earlier in the loop may have destroyed this one's owner.
+            if subscription.active and subscription.kinds & change.kinds:
+                try:
+                    subscription.callback(change)
+                except Exception:
+                    log.error(f"Subscriber {subscription.callback!r} failed to handle {change}.", exc_info=True)
+
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+    def live_subscriptions(self) -> Dict[str, int]:
+        """Live subscriptions per owner class; these should stay flat however long the app runs."""
+        return dict(Counter(s.owner for s in self._subscriptions))
+
+
+# Create single, globally accessible instances.
+app_signals = AppSignals()
+invalidation_bus = InvalidationBus()
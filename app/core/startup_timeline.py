@@ -0,0 +1,108 @@
+# app/core/startup_timeline.py
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional
+
+log = logging.getLogger(__name__)
+
+FIRST_PAINT = "first_paint"
+
+
+@dataclass(frozen=True, slots=True)
+class TimelineEvent:
+    """A named phase (or, with end_ns == start_ns, an instant mark), in ns since the timeline began."""
+    name: str
+    start_ns: int
+    end_ns: int
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+
+
+class StartupTimeline:
+    """
+    Records named startup phases on the monotonic clock, from the first import in main.py up to
+    the first paint of the main window. finish() freezes the timeline, so code that also runs after startup (e.g.
+    a later refresh) records nothing. The result goes to the log and to a Chrome trace-event JSON
+    file that chrome://tracing and Perfetto can open.
+    """
+
+    def __init__(self, clock: Callable[[], int] = time.perf_counter_ns):
+        self._clock = clock
+        self._origin = clock()
+        self._events: List[TimelineEvent] = []
+        self._lock = threading.Lock()
+        self.finished = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Times the enclosed block. Phases may nest."""
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self._record(name, start, self._clock())
+
+    def phase_since_start(self, name: str):
+        """Records a phase from the start of the timeline until now (e.g. the module imports)."""
+        self._record(name, self._origin, self._clock())
+
+    def mark(self, name: str):
+        now = self._clock()
+        self._record(name, now, now)
+
+    def _record(self, name: str, start: int, end: int):
+        with self._lock:
+            if not self.finished:
+                self._events.append(TimelineEvent(name, start - self._origin, end - self._origin))
+
+    def events(self) -> List[TimelineEvent]:
+        with self._lock:
+            return sorted(self._events, key=lambda event: (event.start_ns, -event.end_ns))
+
+    def elapsed_ms(self, name: str) -> Optional[float]:
+        """Milliseconds from the start of the timeline to the end of the named phase or mark."""
+        event = next((e for e in self.events() if e.name == name), None)
+        return event.end_ns / 1e6 if event else None
+
+    def finish(self):
+        with self._lock:
+            self.finished = True
+
+    def log_summary(self):
+        for event in self.events():
+            if event.end_ns == event.start_ns:
+                log.info(f"Startup: {event.name} at {event.start_ns / 1e6:.1f} ms")
+            else:
+                log.info(f"Startup: {event.name} took {event.duration_ms:.1f} ms "
+                         f"(ends at {event.end_ns / 1e6:.1f} ms)")
+
+    def to_trace(self) -> Dict:
+        pid = os.getpid()
+        trace_events = []
+        for event in self.events():
+            entry = {"name": event.name, "cat": "startup", "pid": pid, "tid": 0, "ts": event.start_ns / 1000}
+            if event.end_ns == event.start_ns:
+                entry.update(ph="i", s="g")
+            else:
+                entry.update(ph="X", dur=(event.end_ns - event.start_ns) / 1000)
+            trace_events.append(entry)
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def write_trace(self, path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_trace(), f, indent=1)
+        log.info(f"Startup trace written to {path}")
+
+
+# main.py imports this module before anything else, so the timeline starts with the process.
+# It deliberately imports nothing heavier than the standard library.
+startup_timeline = StartupTimeline()
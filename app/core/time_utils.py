@@ -0,0 +1,23 @@
+# app/core/time_utils.py
+
+from datetime import date, datetime, timedelta
+from typing import Tuple
+
+
+def normalize_start_time(start_time_iso: str) -> Tuple[int, str]:
+    """
+    Converts a stored ISO timestamp into (start_epoch, local_date).
+
+    Timestamps come in several flavours ('Z' suffix, explicit offsets, naive).
+    Naive values are taken to be local time, which is how they are written by
+    the manual session form. This mirrors the backfill in migration 006.
+    """
+    moment = datetime.fromisoformat(start_time_iso)
+    if moment.tzinfo is None:
+        moment = moment.astimezone()
+    return int(moment.timestamp()), moment.astimezone().date().isoformat()
+
+
+def local_date_cutoff(days_ago: int) -> str:
+    """The first local_date (inclusive) of a window covering the last `days_ago` days."""
+    return (date.today() - timedelta(days=days_ago)).isoformat()
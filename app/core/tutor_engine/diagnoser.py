@@ -1,12 +1,12 @@
 import logging
 import math
-from collections import defaultdict
 from datetime import datetime, timezone
-from typing import List
+from typing import List, Optional
 
 from app.core.config_service import ConfigService
 from app.models.session import StudySession
 from app.models.subject import CycleSubject
+from .diagnoser_state import DiagnoserState
 
 log = logging.getLogger(__name__)
 
@@ -17,10 +17,14 @@ class Diagnoser:
     """
 
     # TODO: Update call sites to pass ConfigService
-    def __init__(self, subject: CycleSubject, study_history: List[StudySession], config_service: ConfigService):
+    def __init__(self, subject: CycleSubject, study_history: List[StudySession], config_service: ConfigService,
+                 state: Optional[DiagnoserState] = None):
         self.subject = subject
         self.subject_history = self._filter_history(study_history)
         self.config = config_service
+        # The checkpoint to resume from. After run() it holds the aggregates to persist for the next replan.
+        self.state = state
+        self._aggregates: Optional[DiagnoserState] = None
 
     def _filter_history(self, full_history: List[StudySession]) -> List[StudySession]:
         """Isolates session records relevant to the current subject."""
@@ -33,7 +37,7 @@ class Diagnoser:
         Main execution method. Runs all diagnostic steps and returns the
         v20_Diagnostics package.
         """
-        if not self.subject_history:
+        if not self._has_history():
             log.debug(f"No history for subject '{self.subject.name}'. Using default diagnostics.")
             return self._default_diagnostics()
 
@@ -51,77 +55,100 @@ class Diagnoser:
         }
         return diagnostics
 
+    def _has_history(self) -> bool:
+        return bool(self.subject_history)
+
     def _calculate_performance_metrics(self) -> dict:
         """Implements logic from v20.md section 3.3.2."""
-        total_time_min = sum(s.liquid_duration_sec for s in self.subject_history) / 60
+        aggregates = self._update_aggregates()
+        total_time_min = aggregates.total_liquid_sec / 60
         total_time_hr = total_time_min / 60
 
-        all_questions = [q for s in self.subject_history for q in s.questions]
-
-        if not all_questions:
+        if not aggregates.total_questions:
             # We still have valid time-invested data even with no questions.
             # Use the default metrics as a template but overwrite the time.
             metrics = self._default_performance_metrics()
             metrics["total_time_invested_hr"] = total_time_hr
             return metrics
 
-        today_date = datetime.now(timezone.utc).date()
-
-        weighted_scores = []
-        weights = []
-        for session in self.subject_history:
-            try:
-                session_date = datetime.fromisoformat(session.start_time).date()
-                days_ago = (today_date - session_date).days
-                weight = math.exp(-self.config.get("diagnoser.decay_rate") * days_ago)
-                weights.append(weight)
-                for q in session.questions:
-                    weighted_scores.append(q.is_correct * weight)
-            except (ValueError, TypeError):
-                continue  # Skip sessions with invalid date formats
-
-        durable_mastery_score = (sum(weighted_scores) / len(weighted_scores)) if weighted_scores else 0.0
-        durability_factor = sum(weights) / len(weights) if weights else 0.0
-
-        # Calculate mastery_by_topic
-        mastery_by_topic = defaultdict(lambda: {'correct': 0, 'total': 0})
-        for q in all_questions:
-            mastery_by_topic[q.topic_name]['correct'] += q.is_correct
-            mastery_by_topic[q.topic_name]['total'] += 1
+        durable_mastery_score = (
+            aggregates.weighted_correct / aggregates.weighted_question_count
+            if aggregates.weighted_question_count else 0.0
+        )
+        durability_factor = (
+            aggregates.weighted_session_sum / aggregates.weighted_session_count
+            if aggregates.weighted_session_count else 0.0
+        )
 
         final_mastery_by_topic = {
-            topic: data['correct'] / data['total'] if data['total'] > 0 else 0.0
-            for topic, data in mastery_by_topic.items()
+            topic: correct / total if total > 0 else 0.0
+            for topic, (correct, total) in aggregates.topic_counts.items()
         }
 
         # Calculate learning_velocity
         learning_velocity = durable_mastery_score / total_time_hr if total_time_hr > 0 else 0.0
 
-        # --- FIX: Calculate effectiveness_metrics ---
-        effectiveness_by_method = defaultdict(lambda: {'total_score': 0, 'count': 0})
-        for session in self.subject_history:
-            if session.study_method and session.user_feedback_effectiveness is not None:
-                method = session.study_method
-                effectiveness_by_method[method]['total_score'] += session.user_feedback_effectiveness
-                effectiveness_by_method[method]['count'] += 1
-
         final_effectiveness_metrics = {
-            method: data['total_score'] / data['count']
-            for method, data in effectiveness_by_method.items()
-            if data['count'] > 0
+            method: score / count
+            for method, (score, count) in aggregates.method_feedback.items()
+            if count > 0
         }
-        # --- END FIX ---
 
         return {
             "durable_mastery_score": durable_mastery_score,
             "durability_factor": durability_factor,
             "learning_velocity": learning_velocity,
             "total_time_invested_hr": total_time_hr,
-            "total_questions": len(all_questions),
+            "total_questions": aggregates.total_questions,
             "mastery_by_topic": final_mastery_by_topic,
             "effectiveness_metrics": final_effectiveness_metrics
         }
 
+    def _update_aggregates(self) -> DiagnoserState:
+        """
+        Brings the checkpoint up to date with the history and returns the aggregates for this run.
+
+        Only sessions the checkpoint does not hold yet are folded in. Finished sessions are folded
+        into self.state so the next replan can skip them; sessions still in progress may gain
+        questions later, so they only count towards this run and are remembered in
+        open_session_ids until they finish. The checkpoint is discarded
+        when it no longer matches the history: a session was deleted, a folded session gained or
+        lost questions or time, or the decay rate changed.
+        """
+        if self._aggregates is not None:
+            return self._aggregates
+
+        today_date = datetime.now(timezone.utc).date()
+        decay_rate = self.config.get("diagnoser.decay_rate")
+        state = self.state
+        if state is not None:
+            folded = [s for s in self.subject_history if state.is_folded(s)]
+            if state.decay_rate != decay_rate or DiagnoserState.watermark_of(folded) != state.watermark():
+                log.debug(f"Diagnoser checkpoint for '{self.subject.name}' is stale; rebuilding it.")
+                state = None
+        if state is None:
+            state = DiagnoserState.empty(decay_rate, today_date)
+            pending = list(self.subject_history)
+        else:
+            state.rebase(today_date)
+            pending = [s for s in self.subject_history if not state.is_folded(s)]
+
+        # An abandoned session must not hold back the finished ones logged after it.
+        settled = [s for s in pending if s.id is not None and s.end_time is not None]
+        unsettled = [s for s in pending if s.id is None or s.end_time is None]
+        for session in sorted(settled, key=lambda s: s.id):
+            state.fold(session)
+        state.open_session_ids = sorted(s.id for s in unsettled if s.id is not None and s.id < state.last_session_id)
+        self.state = state
+
+        aggregates = state
+        if unsettled:
+            aggregates = state.copy()
+            for session in unsettled:
+                aggregates.fold(session)
+        self._aggregates = aggregates
+        return aggregates
+
     def _calculate_confidence_score(self, perf_metrics: dict) -> float:
         """Implements logic from v20.md section 3.3.3."""
         # 1. Confidence from Volume
@@ -217,16 +244,16 @@ class Diagnoser:
         This is to ensure that when a user completes a session, the subject's state can update appropriately.
         """
         # If there's no history, there's no progress to measure
-        if not self.subject_history:
+        if not self._has_history():
             return False
 
-        # Get the most recent session
-        recent_sessions = sorted(self.subject_history, key=lambda s: s.start_time, reverse=True)[:3]
+        # Get the most recent sessions
+        recent_durations = self._recent_session_durations()
 
         # If we have recent sessions, check if they represent significant progress
-        if recent_sessions:
+        if recent_durations:
             # Calculate total time in recent sessions
-            recent_time_hr = sum(s.liquid_duration_sec for s in recent_sessions) / 3600
+            recent_time_hr = sum(recent_durations) / 3600
 
             # If recent time is significant (more than 2 hours), consider it progress
             if recent_time_hr > 2.0:
@@ -235,6 +262,10 @@ class Diagnoser:
 
         return False
 
+    def _recent_session_durations(self) -> List[int]:
+        """Liquid seconds of the three most recent sessions, newest first."""
+        return [liquid_sec for _, liquid_sec in self._update_aggregates().recent_sessions]
+
     def _update_hysteresis_data(self, final_mode: str, current_mastery: float):
         """Updates the subject's hysteresis data based on the final mode."""
         previous_mode = self.subject.current_strategic_state
@@ -0,0 +1,132 @@
+# app/core/tutor_engine/diagnoser_state.py
+
+import math
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+from app.models.session import StudySession
+
+RECENT_SESSIONS_KEPT = 3
+
+
+@dataclass(slots=True)
+class DiagnoserState:
+    """
+    Running aggregates of a subject's study history, as consumed by the Diagnoser.
+
+    Decay-weighted sums are stored relative to `anchor_date`: a session from day d
+    contributes exp(-rate * (anchor_date - d)). Moving the anchor forward by k days
+    multiplies both sums by exp(-rate * k), so a checkpoint can be brought up to
+    date without revisiting the sessions it already holds.
+    Sessions with id <= last_session_id are folded in, except the unfinished ones listed in
+    `open_session_ids`, which are folded once they finish; there are `session_count` folded sessions.
+    Together with the question count and liquid seconds they form the checkpoint's watermark.
+    """
+    decay_rate: float
+    anchor_date: str
+    last_session_id: int = 0
+    session_count: int = 0
+    total_liquid_sec: int = 0
+    total_questions: int = 0
+    # Only sessions with a parseable start_time are weighted.
+    weighted_correct: float = 0.0
+    weighted_question_count: int = 0
+    weighted_session_sum: float = 0.0
+    weighted_session_count: int = 0
+    topic_counts: Dict[str, List[int]] = field(default_factory=dict)  # topic -> [correct, total]
+    method_feedback: Dict[str, List[int]] = field(default_factory=dict)  # method -> [score sum, count]
+    recent_sessions: List[list] = field(default_factory=list)  # [start_time, liquid_duration_sec], newest first
+    open_session_ids: List[int] = field(default_factory=list)  # unfinished sessions below last_session_id
+
+    @classmethod
+    def empty(cls, decay_rate: float, today: date) -> "DiagnoserState":
+        return cls(decay_rate=decay_rate, anchor_date=today.isoformat())
+
+    def rebase(self, today: date):
+        """Moves the anchor to `today`, decaying the weighted sums by the days elapsed."""
+        elapsed = (today - date.fromisoformat(self.anchor_date)).days
+        if elapsed:
+            factor = math.exp(-self.decay_rate * elapsed)
+            self.weighted_correct *= factor
+            self.weighted_session_sum *= factor
+            self.anchor_date = today.isoformat()
+
+    def fold(self, session: StudySession):
+        """Adds one session to the aggregates. The state must already be anchored at the current day."""
+        self.session_count += 1
+        if session.id is not None:
+            self.last_session_id = max(self.last_session_id, session.id)
+        self.total_liquid_sec += session.liquid_duration_sec or 0
+        self.total_questions += len(session.questions)
+
+        for q in session.questions:
+            counts = self.topic_counts.setdefault(q.topic_name, [0, 0])
+            counts[0] += q.is_correct
+            counts[1] += 1
+
+        if session.study_method and session.user_feedback_effectiveness is not None:
+            feedback = self.method_feedback.setdefault(session.study_method, [0, 0])
+            feedback[0] += session.user_feedback_effectiveness
+            feedback[1] += 1
+
+        try:
+            session_date = datetime.fromisoformat(session.start_time).date()
+        except (ValueError, TypeError):
+            session_date = None  # Sessions with invalid dates are not weighted
+        if session_date is not None:
+            days_ago = (date.fromisoformat(self.anchor_date) - session_date).days
+            weight = math.exp(-self.decay_rate * days_ago)
+            self.weighted_session_sum += weight
+            self.weighted_session_count += 1
+            for q in session.questions:
+                self.weighted_correct += q.is_correct * weight
+                self.weighted_question_count += 1
+
+        self.recent_sessions.append([session.start_time, session.liquid_duration_sec or 0])
+        self.recent_sessions.sort(key=lambda s: s[0], reverse=True)
+        del self.recent_sessions[RECENT_SESSIONS_KEPT:]
+
+    def is_folded(self, session: StudySession) -> bool:
+        return (session.id is not None and session.id <= self.last_session_id
+                and session.id not in self.open_session_ids)
+
+    def watermark(self) -> tuple:
+        """What the folded sessions added up to when they were folded in."""
+        return self.session_count, self.total_questions, self.total_liquid_sec
+
+    @staticmethod
+    def watermark_of(sessions: List[StudySession]) -> tuple:
+        """The watermark the given sessions would produce if they were folded in now."""
+        return (
+            len(sessions),
+            sum(len(s.questions) for s in sessions),
+            sum(s.liquid_duration_sec or 0 for s in sessions),
+        )
+
+    def copy(self) -> "DiagnoserState":
+        return DiagnoserState.from_dict(self.to_dict())
+
+    def to_dict(self) -> dict:
+        return {
+            "decay_rate": self.decay_rate,
+            "anchor_date": self.anchor_date,
+            "last_session_id": self.last_session_id,
+            "session_count": self.session_count,
+            "total_liquid_sec": self.total_liquid_sec,
+            "total_questions": self.total_questions,
+            "weighted_correct": self.weighted_correct,
+            "weighted_question_count": self.weighted_question_count,
+            "weighted_session_sum": self.weighted_session_sum,
+            "weighted_session_count": self.weighted_session_count,
+            "topic_counts": {topic: list(counts) for topic, counts in self.topic_counts.items()},
+            "method_feedback": {method: list(sums) for method, sums in self.method_feedback.items()},
+            "recent_sessions": [list(s) for s in self.recent_sessions],
+            "open_session_ids": list(self.open_session_ids),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[dict]) -> Optional["DiagnoserState"]:
+        if not data:
+            return None
+        return cls(**data)
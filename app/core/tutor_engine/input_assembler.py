@@ -1,15 +1,27 @@
 # app/core/tutor_engine/input_assembler.py
+import dataclasses
+import hashlib
+import json
 import logging
 from datetime import date
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
+from app.core.config_service import ConfigService
+from app.core.tutor_engine.vectorized_diagnoser import HAS_NUMPY
 from app.models.cycle import Cycle
-from app.models.user import User
+from app.models.subject import CycleSubject
+from app.models.user import HumanFactor, User
 from app.services.interfaces import (ICycleService, ICycleSubjectService, IWorkUnitService,
                                      ISessionService, IUserService)
 
 log = logging.getLogger(__name__)
 
+# Bump when the engine changes in a way that invalidates plans generated from the same inputs.
+PLAN_INPUTS_VERSION = 1
+# The cycle settings the engine reads; plan_cache_json and the timestamps are outputs, not inputs.
+CYCLE_INPUT_FIELDS = ("id", "exam_id", "block_duration_min", "daily_goal_blocks", "is_continuous",
+                      "timing_strategy", "phase")
+
 
 class V20InputAssembler:
     """
@@ -20,44 +32,43 @@ class V20InputAssembler:
 
     def __init__(self, cycle_service: ICycleService, cycle_subject_service: ICycleSubjectService,
                  work_unit_service: IWorkUnitService, session_service: ISessionService,
-                 user_service: IUserService):
+                 user_service: IUserService, columnar_history: bool = False,
+                 config_service: Optional[ConfigService] = None):
         self.cycle_service = cycle_service
         self.cycle_subject_service = cycle_subject_service
         self.work_unit_service = work_unit_service
         self.session_service = session_service
         self.user_service = user_service
+        self.config_service = config_service
+        # A columnar history keeps long histories in flat buffers; only the NumPy diagnoser reads it.
+        self.columnar_history = columnar_history and HAS_NUMPY
+        if columnar_history and not HAS_NUMPY:
+            log.warning("numpy is not installed; assembling the study history as session objects.")
 
-    def assemble(self, active_cycle: Cycle, current_user: User) -> Dict[str, Any]:
+    def assemble(self, active_cycle: Cycle, current_user: User,
+                 cycle_subject_id: Optional[int] = None) -> Dict[str, Any]:
         """
-        Gathers data from all sources and constructs the final dictionary.
+        Gathers data from all sources and constructs the final dictionary. With a
+        `cycle_subject_id`, the study history only holds that subject's sessions, which is all
+        Tutor.replan_subject reads.
         """
         log.debug(f"Assembling v20 input for cycle_id: {active_cycle.id} and user_id: {current_user.id}")
 
-        subjects_in_cycle = self.cycle_subject_service.get_subjects_for_cycle(active_cycle.id)
-        for subject in subjects_in_cycle:
-            # Enrich the cycle subject models with their associated work units
-            subject.work_units = self.work_unit_service.get_work_units_for_subject(subject.subject_id)
-
-        study_history = self.session_service.get_history_for_cycle(active_cycle.id)
-        human_factor_history = self.user_service.get_human_factor_history(current_user.id)
-
-        today_str = date.today().isoformat()
-        current_human_factor = next((h for h in human_factor_history if h.date == today_str), None)
+        subjects_in_cycle = self.load_subjects(active_cycle.id)
 
-        if current_human_factor:
-            current_human_factor_dict = {
-                'date': current_human_factor.date,
-                'energy_level': current_human_factor.energy_level,
-                'stress_level': current_human_factor.stress_level
-            }
+        history_filter = {}
+        changed = next((s for s in subjects_in_cycle if s.id == cycle_subject_id), None)
+        if changed is not None:
+            history_filter["subject_id"] = changed.subject_id
+        if self.columnar_history:
+            study_history = self.session_service.get_history_columns_for_cycle(active_cycle.id, **history_filter)
         else:
-            current_human_factor_dict = {
-                'date': today_str,
-                'energy_level': 'Normal',
-                'stress_level': 'Normal'
-            }
+            study_history = self.session_service.get_history_for_cycle(active_cycle.id, **history_filter)
+        human_factor_history = self.user_service.get_human_factor_history(current_user.id)
+        current_human_factor_dict = self._current_human_factor(human_factor_history)
 
-        previous_cycle_config = self.cycle_service.get_plan_cache(active_cycle.id) or {}
+        # The Tutor only reads the previous plan's subjects, so the other sections stay encoded.
+        previous_cycle_config = self.cycle_service.get_plan_cache(active_cycle.id, keys=("subjects",)) or {}
 
         return {
             "subjects": subjects_in_cycle,
@@ -68,4 +79,51 @@ class V20InputAssembler:
             "human_factor_history": human_factor_history,
             "previous_cycle_config": previous_cycle_config,
             "meta": {"human_factor_input": current_human_factor_dict}
-        }
\ No newline at end of file
+        }
+
+    def input_fingerprint(self, active_cycle: Cycle, current_user: User) -> str:
+        """
+        A digest of everything the Tutor reads for this cycle, cheap enough to compute on every
+        refresh: the history is summarised by its watermark instead of being loaded. A plan
+        generated from inputs with the same fingerprint is still valid and need not be regenerated.
+        """
+        human_factor_history = self.user_service.get_human_factor_history(current_user.id)
+        inputs = {
+            "version": PLAN_INPUTS_VERSION,
+            "cycle": {name: getattr(active_cycle, name) for name in CYCLE_INPUT_FIELDS},
+            # Includes the weights, strategic states, hysteresis data and work-unit completion.
+            "subjects": [dataclasses.asdict(subject) for subject in self.load_subjects(active_cycle.id)],
+            "history": self.session_service.get_history_watermark(active_cycle.id),
+            "human_factor_history": [dataclasses.asdict(h) for h in human_factor_history],
+            # Without the date, which would expire every plan at midnight even when nothing was entered.
+            "human_factor_input": {key: value for key, value in self._current_human_factor(human_factor_history).items()
+                                   if key != 'date'},
+            "config": self.config_service.as_dict() if self.config_service else None,
+        }
+        encoded = json.dumps(inputs, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def load_subjects(self, cycle_id: int) -> List[CycleSubject]:
+        """The cycle's subjects, each enriched with its work units."""
+        subjects_in_cycle = self.cycle_subject_service.get_subjects_for_cycle(cycle_id)
+        for subject in subjects_in_cycle:
+            # Enrich the cycle subject models with their associated work units
+            subject.work_units = self.work_unit_service.get_work_units_for_subject(subject.subject_id)
+        return subjects_in_cycle
+
+    @staticmethod
+    def _current_human_factor(human_factor_history: List[HumanFactor]) -> Dict[str, str]:
+        today_str = date.today().isoformat()
+        current_human_factor = next((h for h in human_factor_history if h.date == today_str), None)
+
+        if current_human_factor:
+            return {
+                'date': current_human_factor.date,
+                'energy_level': current_human_factor.energy_level,
+                'stress_level': current_human_factor.stress_level
+            }
+        return {
+            'date': today_str,
+            'energy_level': 'Normal',
+            'stress_level': 'Normal'
+        }
@@ -0,0 +1,99 @@
+# app/core/tutor_engine/subject_pipeline.py
+
+import copy
+import logging
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.core.config_service import ConfigService
+from app.models.subject import CycleSubject
+from .diagnoser import Diagnoser
+from .diagnoser_state import DiagnoserState
+from .priority_engine import PriorityEngine
+from .reasoning_engine import ReasoningEngine
+from .vectorized_diagnoser import HistoryColumns, VectorizedDiagnoser
+
+log = logging.getLogger(__name__)
+
+# Below this many subjects a pool costs more to start than the stage takes to run serially.
+PARALLEL_MIN_SUBJECTS = 8
+
+
+@dataclass(slots=True)
+class SubjectJob:
+    """
+    The inputs of the per-subject diagnose/score stage. `history` is either this subject's
+    sessions or the whole cycle's HistoryColumns, which the VectorizedDiagnoser slices itself.
+    """
+    subject: CycleSubject
+    history: Any  # List[StudySession] or HistoryColumns
+    checkpoint: Optional[dict]
+    previous_subject_config: Optional[dict]
+
+
+@dataclass(slots=True)
+class SubjectResult:
+    """The output of one SubjectJob. The Tutor persists it and merges it in subject order."""
+    processed: Dict[str, Any]
+    diagnoser_state: Optional[dict]
+
+
+def diagnose_and_score(job: SubjectJob, priority_engine: PriorityEngine, config_service: ConfigService) -> SubjectResult:
+    """
+    Runs the Diagnoser, PriorityEngine and ReasoningEngine for one subject. Only mutates
+    the job's own subject, so jobs for different subjects can run on any thread.
+    """
+    subject = job.subject
+    log.debug(f"Processing subject: {subject.name}")
+
+    if isinstance(job.history, HistoryColumns):
+        diagnoser = VectorizedDiagnoser(subject, job.history, config_service)
+    else:
+        diagnoser = Diagnoser(subject, job.history, config_service, state=DiagnoserState.from_dict(job.checkpoint))
+    diagnostics = diagnoser.run()
+
+    return SubjectResult(
+        processed=score_subject(subject, diagnostics, priority_engine, job.previous_subject_config),
+        diagnoser_state=diagnoser.state.to_dict() if diagnoser.state is not None else None,
+    )
+
+
+def score_subject(subject: CycleSubject, diagnostics: dict, priority_engine: PriorityEngine,
+                  previous_subject_config: Optional[dict]) -> Dict[str, Any]:
+    """
+    Runs the PriorityEngine and ReasoningEngine over a subject's diagnostics. An incremental
+    replan calls this directly with the diagnostics cached in the previous plan.
+    """
+    # PriorityEngine keeps the current subject's flags on the instance, so every call scores on its own copy.
+    final_priority, flags, breakdown = copy.copy(priority_engine).run(subject, diagnostics, previous_subject_config)
+    reasoning = ReasoningEngine.generate_reasoning(diagnostics, flags)
+
+    return {
+        'subject_id': subject.id,
+        'subject_name': subject.name,
+        'final_priority': final_priority,
+        'reasoning': reasoning,
+        'diagnostics': diagnostics,
+        'priority_breakdown': breakdown,
+        'reasoning_flags': flags
+    }
+
+
+def make_executor(max_workers: int) -> Executor:
+    """
+    A thread pool for the vectorized backend, whose NumPy reductions release the GIL.
+    The pure-Python Diagnoser holds the GIL, and shipping its session objects to worker
+    processes costs more than diagnosing them, so it always runs serially.
+    """
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tutor-subject")
+
+
+def run_subject_jobs(jobs: Iterable[SubjectJob], priority_engine: PriorityEngine, config_service: ConfigService,
+                     executor: Optional[Executor] = None) -> List[SubjectResult]:
+    """Runs the jobs serially, or on `executor`. Results always come back in job order."""
+    jobs = list(jobs)
+    if executor is None:
+        return [diagnose_and_score(job, priority_engine, config_service) for job in jobs]
+    count = len(jobs)
+    return list(executor.map(diagnose_and_score, jobs, [priority_engine] * count, [config_service] * count))
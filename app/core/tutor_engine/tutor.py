@@ -1,14 +1,20 @@
 # app/core/tutor_engine/tutor.py
 
 import logging
-from typing import Dict, Any
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
 
+from app.core.config_service import ConfigService
+from app.models.session import StudyHistoryColumns
+from app.models.subject import CycleSubject
 from app.services.interfaces import ICycleSubjectService
-from .diagnoser import Diagnoser
 from .human_factor_smoother import HumanFactorSmoother
 from .plan_assembler import PlanAssembler
 from .priority_engine import PriorityEngine
-from .reasoning_engine import ReasoningEngine
+from .subject_pipeline import (PARALLEL_MIN_SUBJECTS, SubjectJob, SubjectResult, diagnose_and_score,
+                               make_executor, run_subject_jobs, score_subject)
+from .vectorized_diagnoser import HAS_NUMPY, HistoryColumns
 
 log = logging.getLogger(__name__)
 
@@ -19,8 +25,16 @@ class Tutor:
     entire pipeline from input to final plan generation. (v20 spec Batch 7)
     """
 
-    def __init__(self, cycle_subject_service: ICycleSubjectService):
+    def __init__(self, cycle_subject_service: ICycleSubjectService, config_service: ConfigService,
+                 vectorized_diagnoser: bool = False, max_workers: int = 0):
         self.cycle_subject_service = cycle_subject_service
+        self.config_service = config_service
+        # With more than one worker, the per-subject stage of the vectorized backend fans out over a thread pool.
+        self.max_workers = max_workers
+        # The NumPy diagnoser rescans the full history with array reductions instead of resuming checkpoints.
+        self.vectorized_diagnoser = vectorized_diagnoser and HAS_NUMPY
+        if vectorized_diagnoser and not HAS_NUMPY:
+            log.warning("numpy is not installed; falling back to the pure-Python Diagnoser.")
 
     def create_study_cycle(self, cycle_config: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -28,8 +42,66 @@ class Tutor:
         """
         log.info("--- Starting v20 Cognitive Tutor Engine ---")
 
+        all_subjects = cycle_config.get('subjects', [])
+        priority_engine = self._build_priority_engine(cycle_config)
+        jobs = self._build_jobs(all_subjects, cycle_config)
+
+        if self.max_workers > 1 and jobs and isinstance(jobs[0].history, HistoryColumns) \
+                and len(jobs) >= PARALLEL_MIN_SUBJECTS:
+            with make_executor(self.max_workers) as executor:
+                results = run_subject_jobs(jobs, priority_engine, self.config_service, executor)
+        else:
+            results = run_subject_jobs(jobs, priority_engine, self.config_service)
+
+        # Results come back in subject order whatever the execution mode; persistence stays on this thread.
         processed_subjects_data = []
+        for subject, result in zip(all_subjects, results):
+            processed_subjects_data.append(result.processed)
+            self._persist_result(subject, result)
+
+        final_plan = self._assemble_plan(processed_subjects_data, cycle_config)
+        log.info("--- Cognitive Tutor Engine Finished ---")
+        return final_plan
+
+    def replan_subject(self, cycle_config: Dict[str, Any], previous_plan: Dict[str, Any],
+                       cycle_subject_id: int) -> Dict[str, Any]:
+        """
+        Incremental replan after a session of one subject was logged. Only that subject is
+        re-diagnosed; every other subject is re-scored from the diagnostics cached in
+        `previous_plan`, then the allocation runs again over all of them. `study_history` only
+        needs to hold the sessions of the changed subject (see V20InputAssembler.assemble).
 
+        Raises ValueError if the subject is not in the cycle or the previous plan does not
+        cover every other subject; a full create_study_cycle is needed then.
+        """
+        log.info(f"--- Incremental replan for cycle_subject_id {cycle_subject_id} ---")
+
+        all_subjects = cycle_config.get('subjects', [])
+        changed = next((s for s in all_subjects if s.id == cycle_subject_id), None)
+        if changed is None:
+            raise ValueError(f"Cycle subject {cycle_subject_id} is not part of the cycle.")
+        cached_diagnostics = {p['subject_id']: p['diagnostics'] for p in previous_plan.get('processed_subjects', [])}
+        missing = [s.id for s in all_subjects if s.id != cycle_subject_id and s.id not in cached_diagnostics]
+        if missing:
+            raise ValueError(f"The previous plan has no diagnostics for cycle subjects {missing}.")
+
+        priority_engine = self._build_priority_engine(cycle_config)
+        job, = self._build_jobs([changed], cycle_config)
+        result = diagnose_and_score(job, priority_engine, self.config_service)
+        self._persist_result(changed, result)
+
+        processed_subjects_data = [
+            result.processed if subject is changed
+            else score_subject(subject, cached_diagnostics[subject.id], priority_engine,
+                               self._previous_subject_config(cycle_config, subject))
+            for subject in all_subjects
+        ]
+
+        final_plan = self._assemble_plan(processed_subjects_data, cycle_config)
+        log.info("--- Incremental replan finished ---")
+        return final_plan
+
+    def _build_priority_engine(self, cycle_config: Dict[str, Any]) -> PriorityEngine:
         smoother = HumanFactorSmoother()
         cognitive_multiplier = smoother.run(
             cycle_config['human_factor_input'],
@@ -38,40 +110,56 @@ class Tutor:
 
         all_subjects = cycle_config.get('subjects', [])
         discovery_subjects = [s for s in all_subjects if s.current_strategic_state == 'DISCOVERY']
-
-        priority_engine = PriorityEngine(cognitive_multiplier, discovery_subjects)
-        reasoning_engine = ReasoningEngine()
-
-        for subject in all_subjects:
-            log.debug(f"Processing subject: {subject.name}")
-
-            diagnoser = Diagnoser(subject, cycle_config['study_history'])
-            diagnostics = diagnoser.run()
-
-            previous_subject_config = None
-            if cycle_config.get('previous_cycle_config'):
-                prev_subjects = cycle_config['previous_cycle_config'].get('subjects', [])
-                previous_subject_config = next((ps for ps in prev_subjects if ps['id'] == subject.id), None)
-
-            final_priority, flags, breakdown = priority_engine.run(subject, diagnostics, previous_subject_config)
-            reasoning = reasoning_engine.generate_reasoning(diagnostics, flags)
-
-            processed_subjects_data.append({
-                'subject_id': subject.id,
-                'subject_name': subject.name,
-                'final_priority': final_priority,
-                'reasoning': reasoning,
-                'diagnostics': diagnostics,
-                'priority_breakdown': breakdown,
-                'reasoning_flags': flags
-            })
-
-            self.cycle_subject_service.update_cycle_subject_state(
-                subject.id,
-                diagnostics['strategic_mode'],
-                subject.state_hysteresis_data
+        return PriorityEngine(cognitive_multiplier, discovery_subjects, self.config_service)
+
+    def _build_jobs(self, subjects: List[CycleSubject], cycle_config: Dict[str, Any]) -> List[SubjectJob]:
+        history_columns = None
+        checkpoints = {}
+        study_history = cycle_config['study_history']
+        if isinstance(study_history, StudyHistoryColumns):
+            # A columnar history (see V20InputAssembler) can only be read by the NumPy diagnoser.
+            if not HAS_NUMPY:
+                raise RuntimeError("A columnar study history requires numpy.")
+            history_columns = HistoryColumns.from_study_history(study_history, datetime.now(timezone.utc).date())
+        elif self.vectorized_diagnoser:
+            history_columns = HistoryColumns.from_sessions(study_history, datetime.now(timezone.utc).date())
+        else:
+            # Diagnoser checkpoints let each subject fold in only the sessions logged since the last replan.
+            cycle_id = subjects[0].cycle_id if subjects else None
+            if cycle_id is not None:
+                checkpoints = self.cycle_subject_service.get_diagnoser_states(cycle_id)
+
+        # Bucketing once spares every Diagnoser a scan of the whole history.
+        sessions_by_subject = defaultdict(list)
+        if history_columns is None:
+            for session in study_history:
+                sessions_by_subject[session.subject_id].append(session)
+        return [
+            SubjectJob(
+                subject=subject,
+                history=(history_columns if history_columns is not None
+                         else sessions_by_subject.get(subject.subject_id, [])),
+                checkpoint=checkpoints.get(subject.id),
+                previous_subject_config=self._previous_subject_config(cycle_config, subject),
             )
+            for subject in subjects
+        ]
+
+    @staticmethod
+    def _previous_subject_config(cycle_config: Dict[str, Any], subject: CycleSubject) -> Optional[dict]:
+        previous_subjects = (cycle_config.get('previous_cycle_config') or {}).get('subjects', [])
+        return next((ps for ps in previous_subjects if ps['id'] == subject.id), None)
+
+    def _persist_result(self, subject: CycleSubject, result: SubjectResult):
+        self.cycle_subject_service.update_cycle_subject_state(
+            subject.id,
+            result.processed['diagnostics']['strategic_mode'],
+            subject.state_hysteresis_data
+        )
+        if result.diagnoser_state is not None:
+            self.cycle_subject_service.save_diagnoser_state(subject.id, result.diagnoser_state)
 
+    def _assemble_plan(self, processed_subjects_data: List[Dict[str, Any]], cycle_config: Dict[str, Any]) -> Dict[str, Any]:
         plan_assembler = PlanAssembler(processed_subjects_data, cycle_config)
         plan_scaffold, allocated_time_map = plan_assembler.generate_strategic_view()
         sequenced_plan = plan_assembler.generate_tactical_view(allocated_time_map)
@@ -118,6 +206,4 @@ class Tutor:
                 "engine_version": "v20.1-Refactored"
             }
         }
-
-        log.info("--- Cognitive Tutor Engine Finished ---")
         return final_plan
\ No newline at end of file
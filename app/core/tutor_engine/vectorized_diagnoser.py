@@ -0,0 +1,204 @@
+# app/core/tutor_engine/vectorized_diagnoser.py
+
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import List
+
+from app.core.config_service import ConfigService
+from app.models.session import StudyHistoryColumns, StudySession
+from app.models.subject import CycleSubject
+from .diagnoser import Diagnoser
+
+# NumPy is optional: without it the Tutor keeps using the pure-Python Diagnoser.
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
+class HistoryColumns:
+    """
+    A study history laid out as parallel arrays, one entry per session or per question.
+
+    Sessions whose start_time cannot be parsed have a NaN day offset, which keeps them out
+    of the decay-weighted metrics exactly like the pure-Python Diagnoser.
+    Topic and method codes index into `topic_names` / `method_names`; a method code of -1
+    means the session has no rated study method.
+    """
+    session_subject_ids: "np.ndarray"
+    session_day_offsets: "np.ndarray"  # float64, days between the session date and today
+    session_liquid_sec: "np.ndarray"  # int64
+    session_recency_keys: "np.ndarray"  # start_time strings or start epochs, newest sorts last
+    session_method_codes: "np.ndarray"  # int64
+    session_feedback: "np.ndarray"  # int64, 0 where the method code is -1
+    question_session_index: "np.ndarray"  # int64, row into the session arrays
+    question_correct: "np.ndarray"  # int64, 0 or 1
+    question_topic_codes: "np.ndarray"  # int64
+    topic_names: tuple
+    method_names: tuple
+
+    @property
+    def session_count(self) -> int:
+        return len(self.session_subject_ids)
+
+    @classmethod
+    def from_sessions(cls, sessions: List[StudySession], today: date) -> "HistoryColumns":
+        topics, methods = {}, {}
+        subject_ids, offsets, liquid, starts, method_codes, feedback = [], [], [], [], [], []
+        q_session, q_correct, q_topic = [], [], []
+        for row, session in enumerate(sessions):
+            subject_ids.append(session.subject_id)
+            try:
+                offsets.append((today - datetime.fromisoformat(session.start_time).date()).days)
+            except (ValueError, TypeError):
+                offsets.append(float("nan"))
+            liquid.append(session.liquid_duration_sec or 0)
+            starts.append(session.start_time or "")
+            if session.study_method and session.user_feedback_effectiveness is not None:
+                method_codes.append(methods.setdefault(session.study_method, len(methods)))
+                feedback.append(session.user_feedback_effectiveness)
+            else:
+                method_codes.append(-1)
+                feedback.append(0)
+            for q in session.questions:
+                q_session.append(row)
+                q_correct.append(1 if q.is_correct else 0)
+                q_topic.append(topics.setdefault(q.topic_name, len(topics)))
+
+        return cls(
+            session_subject_ids=np.asarray(subject_ids, dtype=np.int64),
+            session_day_offsets=np.asarray(offsets, dtype=np.float64),
+            session_liquid_sec=np.asarray(liquid, dtype=np.int64),
+            session_recency_keys=np.asarray(starts, dtype=str),
+            session_method_codes=np.asarray(method_codes, dtype=np.int64),
+            session_feedback=np.asarray(feedback, dtype=np.int64),
+            question_session_index=np.asarray(q_session, dtype=np.int64),
+            question_correct=np.asarray(q_correct, dtype=np.int64),
+            question_topic_codes=np.asarray(q_topic, dtype=np.int64),
+            topic_names=tuple(topics),
+            method_names=tuple(methods),
+        )
+
+    @classmethod
+    def from_study_history(cls, history: StudyHistoryColumns, today: date) -> "HistoryColumns":
+        """
+        Wraps the buffers of a columnar history loaded by the session service. The integer
+        columns are widened once; nothing is rebuilt per session. Recency is ordered by
+        start_epoch, the UTC instant of start_time.
+        """
+        def column(buffer, dtype):
+            return np.frombuffer(buffer, dtype=buffer.typecode).astype(dtype) if len(buffer) else np.empty(0, dtype)
+
+        return cls(
+            session_subject_ids=column(history.subject_id, np.int64),
+            session_day_offsets=today.toordinal() - column(history.start_day, np.float64),
+            session_liquid_sec=column(history.liquid_sec, np.int64),
+            session_recency_keys=column(history.start_epoch, np.int64),
+            session_method_codes=column(history.method_code, np.int64),
+            session_feedback=column(history.feedback, np.int64),
+            question_session_index=column(history.question_session_row, np.int64),
+            question_correct=column(history.question_correct, np.int64),
+            question_topic_codes=column(history.question_topic, np.int64),
+            topic_names=tuple(history.topic_names),
+            method_names=tuple(history.method_names),
+        )
+
+    def for_subject(self, subject_id: int) -> "HistoryColumns":
+        """The sessions and questions of one subject, with question rows re-indexed to match."""
+        session_mask = self.session_subject_ids == subject_id
+        new_index = np.cumsum(session_mask) - 1
+        question_mask = session_mask[self.question_session_index]
+        return HistoryColumns(
+            session_subject_ids=self.session_subject_ids[session_mask],
+            session_day_offsets=self.session_day_offsets[session_mask],
+            session_liquid_sec=self.session_liquid_sec[session_mask],
+            session_recency_keys=self.session_recency_keys[session_mask],
+            session_method_codes=self.session_method_codes[session_mask],
+            session_feedback=self.session_feedback[session_mask],
+            question_session_index=new_index[self.question_session_index[question_mask]],
+            question_correct=self.question_correct[question_mask],
+            question_topic_codes=self.question_topic_codes[question_mask],
+            topic_names=self.topic_names,
+            method_names=self.method_names,
+        )
+
+
+class VectorizedDiagnoser(Diagnoser):
+    """
+    A Diagnoser that computes the performance metrics with NumPy reductions over
+    HistoryColumns instead of looping over session objects. The mode assignment and
+    hysteresis logic are inherited unchanged, so run() returns the same package.
+    """
+
+    def __init__(self, subject: CycleSubject, columns: HistoryColumns, config_service: ConfigService):
+        if not HAS_NUMPY:
+            raise RuntimeError("VectorizedDiagnoser requires numpy; use Diagnoser instead.")
+        super().__init__(subject, [], config_service)
+        self.columns = columns.for_subject(subject.subject_id)
+
+    def _has_history(self) -> bool:
+        return self.columns.session_count > 0
+
+    def _calculate_performance_metrics(self) -> dict:
+        cols = self.columns
+        total_time_min = int(cols.session_liquid_sec.sum()) / 60
+        total_time_hr = total_time_min / 60
+        total_questions = len(cols.question_correct)
+
+        if not total_questions:
+            metrics = self._default_performance_metrics()
+            metrics["total_time_invested_hr"] = total_time_hr
+            return metrics
+
+        decay_rate = self.config.get("diagnoser.decay_rate")
+        dated = ~np.isnan(cols.session_day_offsets)
+        weights = np.exp(-decay_rate * cols.session_day_offsets)
+
+        question_dated = dated[cols.question_session_index]
+        question_weights = weights[cols.question_session_index][question_dated]
+        weighted_correct = cols.question_correct[question_dated] * question_weights
+        durable_mastery_score = float(weighted_correct.sum() / len(weighted_correct)) if len(weighted_correct) else 0.0
+        durability_factor = float(weights[dated].mean()) if dated.any() else 0.0
+
+        topic_count = len(cols.topic_names)
+        topic_totals = np.bincount(cols.question_topic_codes, minlength=topic_count)
+        topic_correct = np.bincount(cols.question_topic_codes, weights=cols.question_correct, minlength=topic_count)
+        final_mastery_by_topic = {
+            cols.topic_names[code]: float(topic_correct[code] / topic_totals[code])
+            for code in np.flatnonzero(topic_totals)
+        }
+
+        learning_velocity = durable_mastery_score / total_time_hr if total_time_hr > 0 else 0.0
+
+        rated = cols.session_method_codes >= 0
+        method_count = len(cols.method_names)
+        method_counts = np.bincount(cols.session_method_codes[rated], minlength=method_count)
+        method_scores = np.bincount(cols.session_method_codes[rated], weights=cols.session_feedback[rated],
+                                    minlength=method_count)
+        final_effectiveness_metrics = {
+            cols.method_names[code]: float(method_scores[code] / method_counts[code])
+            for code in np.flatnonzero(method_counts)
+        }
+
+        return {
+            "durable_mastery_score": durable_mastery_score,
+            "durability_factor": durability_factor,
+            "learning_velocity": learning_velocity,
+            "total_time_invested_hr": total_time_hr,
+            "total_questions": total_questions,
+            "mastery_by_topic": final_mastery_by_topic,
+            "effectiveness_metrics": final_effectiveness_metrics
+        }
+
+    def _recent_session_durations(self) -> List[int]:
+        # Newest start_time first; ties keep history order, as with a stable reverse sort.
+        _, start_rank = np.unique(self.columns.session_recency_keys, return_inverse=True)
+        order = np.lexsort((np.arange(len(start_rank)), -start_rank))[:3]
+        return [int(sec) for sec in self.columns.session_liquid_sec[order]]
@@ -1,11 +1,15 @@
 # app/features/analytics/analytics_controller.py
 import logging
+from contextlib import nullcontext
+from typing import Optional
 
 from PySide6.QtCore import QObject
 from PySide6.QtWidgets import QMessageBox
 
 from app.common.error_handler import show_error_message
-from app.core.signals import app_signals
+from app.core.async_services import ServiceExecutor
+from app.core.database import ReadOnlySqliteConnectionFactory
+from app.core.signals import ChangeKind, DataChange, invalidation_bus
 from app.services.interfaces import IPerformanceService, ICycleSubjectService
 from .analytics_view import AnalyticsView
 
@@ -16,13 +20,17 @@ class AnalyticsController(QObject):
     """Controller for the analytics dashboard view."""
 
     def __init__(self, view: AnalyticsView, user_id: int, cycle_id: int,
-                 performance_service: IPerformanceService, cycle_subject_service: ICycleSubjectService):
+                 performance_service: IPerformanceService, cycle_subject_service: ICycleSubjectService,
+                 executor: ServiceExecutor, read_conn_factory: Optional[ReadOnlySqliteConnectionFactory] = None):
         super().__init__(view)
         self._view = view
         self.user_id = user_id
         self.cycle_id = cycle_id
         self.performance_service = performance_service
         self.cycle_subject_service = cycle_subject_service
+        self._executor = executor
+        self._read_conn_factory = read_conn_factory
+        self._load_generation = 0
 
         # State for filters
         self.current_subject_id = -1  # Default to All Subjects
@@ -35,12 +43,20 @@ class AnalyticsController(QObject):
 
     def _populate_initial_data(self):
         """Populates the subject filter with subjects from the current cycle."""
-        cycle_subjects = self.cycle_subject_service.get_subjects_for_cycle(self.cycle_id)
+        self._executor.wrap(self.cycle_subject_service).get_subjects_for_cycle(
+            self.cycle_id, context=self
+        ).then(self._on_cycle_subjects_loaded)
+        # Trigger initial load for "All Subjects" and default period
+        self._load_analytics_data()
+
+    def refresh(self):
+        """Reloads the data for the current filters, keeping the user's selection."""
+        self._load_analytics_data()
+
+    def _on_cycle_subjects_loaded(self, cycle_subjects):
         # We need the master subject ID (subject_id) for filtering performance data
         subjects_for_combo = [{'id': s.subject_id, 'name': s.name} for s in cycle_subjects]
         self._view.populate_subject_combo(subjects_for_combo)
-        # Trigger initial load for "All Subjects" and default period
-        self._load_analytics_data()
 
     def _on_subject_changed(self, subject_id: int):
         self.current_subject_id = subject_id
@@ -54,26 +70,44 @@ class AnalyticsController(QObject):
         """
         Central method to refresh all data based on current filter state.
         It now decides which view (overall summary or topic details) to show.
+        The queries run in the background; only the newest request updates the view.
         """
-        work_unit_summary = self.performance_service.get_work_unit_summary(user_id=self.user_id)
+        self._load_generation += 1
+        generation = self._load_generation
+        subject_id, days_ago = self.current_subject_id, self.current_period_days
+        self._executor.submit(self._fetch_analytics_data, subject_id, days_ago, context=self).then(
+            lambda data: self._on_analytics_data_loaded(generation, subject_id, *data)
+        )
+
+    def _fetch_analytics_data(self, subject_id: int, days_ago: int | None):
+        """Runs on a worker thread. Both queries read the same database snapshot."""
+        with self._read_conn_factory.snapshot() if self._read_conn_factory else nullcontext():
+            work_unit_summary = self.performance_service.get_work_unit_summary(user_id=self.user_id)
+
+            if subject_id == -1:
+                log.debug(f"Loading overall subject summary data for cycle_id: {self.cycle_id}.")
+                table_data = self.performance_service.get_subject_summary_for_analytics(
+                    user_id=self.user_id,
+                    cycle_id=self.cycle_id,
+                    days_ago=days_ago
+                )
+            else:
+                log.debug(f"Loading topic performance data for subject_id: {subject_id}")
+                table_data = self.performance_service.get_topic_performance(
+                    user_id=self.user_id,
+                    subject_id=subject_id,
+                    days_ago=days_ago
+                )
+        return work_unit_summary, table_data
+
+    def _on_analytics_data_loaded(self, generation: int, subject_id: int, work_unit_summary, table_data):
+        if generation != self._load_generation:
+            return  # The filters changed while this load was running.
         self._view.update_work_unit_summary(work_unit_summary)
-
-        if self.current_subject_id == -1:
-            log.debug(f"Loading overall subject summary data for cycle_id: {self.cycle_id}.")
-            summary_data = self.performance_service.get_subject_summary_for_analytics(
-                user_id=self.user_id,
-                cycle_id=self.cycle_id,
-                days_ago=self.current_period_days
-            )
-            self._view.update_subject_summary_table(summary_data)
+        if subject_id == -1:
+            self._view.update_subject_summary_table(table_data)
         else:
-            log.debug(f"Loading topic performance data for subject_id: {self.current_subject_id}")
-            topic_data = self.performance_service.get_topic_performance(
-                user_id=self.user_id,
-                subject_id=self.current_subject_id,
-                days_ago=self.current_period_days
-            )
-            self._view.update_topic_performance_table(topic_data)
+            self._view.update_topic_performance_table(table_data)
 
     def _on_prioritize_topic(self, topic_name: str):
         """Handles the user's request to increase a subject's priority based on a weak topic."""
@@ -103,7 +137,7 @@ class AnalyticsController(QObject):
                                     f"'{target_subject.name}' has been increased.\n\n"
                                     "Your study plan will now be updated.")
 
-            app_signals.data_changed.emit()
+            invalidation_bus.publish(DataChange.of(ChangeKind.CYCLE_SUBJECTS, [self.cycle_id], [target_subject.id]))
 
         except Exception as e:
             show_error_message(self._view, "Error", "Could not prioritize the subject.", str(e))
\ No newline at end of file
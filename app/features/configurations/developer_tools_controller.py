@@ -7,7 +7,9 @@ from PySide6.QtWidgets import QMessageBox
 
 from app.common.error_handler import show_error_message
 from app.core.database import IDatabaseConnectionFactory
+from app.core.query_instrumentation import query_instrumentation
 from .developer_tools_dialog import DeveloperToolsDialog
+from .query_stats_dialog import QueryStatsDialog
 
 log = logging.getLogger(__name__)
 
@@ -20,13 +22,38 @@ class DeveloperToolsController:
     def __init__(self, conn_factory: IDatabaseConnectionFactory, parent_view=None):
         self._conn_factory = conn_factory
         self._parent_view = parent_view
-        self._dialog = DeveloperToolsDialog(parent=parent_view)
+        self._dialog = DeveloperToolsDialog(parent=parent_view,
+                                            query_instrumentation_enabled=query_instrumentation.enabled)
         self._dialog.seed_long_term_user_requested.connect(self._on_seed_long_term_user)
+        self._dialog.query_instrumentation_toggled.connect(self._on_query_instrumentation_toggled)
+        self._dialog.query_stats_requested.connect(self._on_query_stats_requested)
 
     def show(self):
         """Shows the developer tools dialog."""
         self._dialog.exec()
 
+    def _on_query_instrumentation_toggled(self, enabled: bool):
+        if enabled:
+            query_instrumentation.enable()
+        else:
+            query_instrumentation.disable()
+
+    def _on_query_stats_requested(self):
+        """Opens the per-statement latency table."""
+        stats_dialog = QueryStatsDialog(parent=self._dialog)
+
+        def refresh():
+            stats_dialog.populate(query_instrumentation.snapshot(), query_instrumentation.enabled)
+
+        def reset():
+            query_instrumentation.reset()
+            refresh()
+
+        stats_dialog.refresh_requested.connect(refresh)
+        stats_dialog.reset_requested.connect(reset)
+        refresh()
+        stats_dialog.exec()
+
     def _on_seed_long_term_user(self):
         """
         Reads and executes the long_term_user_seed.sql script.
@@ -1,7 +1,7 @@
 # app/features/configurations/developer_tools_dialog.py
 
 from PySide6.QtCore import Signal
-from PySide6.QtWidgets import QDialog, QVBoxLayout, QPushButton, QLabel
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QPushButton, QLabel, QCheckBox
 
 
 class DeveloperToolsDialog(QDialog):
@@ -9,8 +9,10 @@ class DeveloperToolsDialog(QDialog):
     A dialog for developer-specific actions.
     """
     seed_long_term_user_requested = Signal()
+    query_instrumentation_toggled = Signal(bool)
+    query_stats_requested = Signal()
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, query_instrumentation_enabled: bool = False):
         super().__init__(parent)
         self.setWindowTitle("Developer Tools")
         self.setMinimumWidth(300)
@@ -25,6 +27,16 @@ class DeveloperToolsDialog(QDialog):
         seed_button.clicked.connect(self.seed_long_term_user_requested.emit)
         layout.addWidget(seed_button)
 
+        self.instrumentation_checkbox = QCheckBox("Record SQL query statistics")
+        self.instrumentation_checkbox.setToolTip("Times every service query. Adds a small overhead while enabled.")
+        self.instrumentation_checkbox.setChecked(query_instrumentation_enabled)
+        self.instrumentation_checkbox.toggled.connect(self.query_instrumentation_toggled.emit)
+        layout.addWidget(self.instrumentation_checkbox)
+
+        stats_button = QPushButton("Show Query Statistics")
+        stats_button.clicked.connect(self.query_stats_requested.emit)
+        layout.addWidget(stats_button)
+
         close_button = QPushButton("Close")
         close_button.clicked.connect(self.accept)
         layout.addWidget(close_button)
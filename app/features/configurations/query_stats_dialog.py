@@ -0,0 +1,82 @@
+# app/features/configurations/query_stats_dialog.py
+
+from typing import List
+
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QHeaderView, QLabel, QPushButton
+)
+
+from app.core.query_instrumentation import QueryStats
+
+
+class QueryStatsDialog(QDialog):
+    """
+    Shows the per-statement SQL statistics collected by the query instrumentation,
+    sorted by total time so the queries that dominate screen loads float to the top.
+    """
+    refresh_requested = Signal()
+    reset_requested = Signal()
+
+    COLUMNS = ["Caller", "Statement", "Calls", "Rows", "p50 (ms)", "p95 (ms)", "p99 (ms)", "Total (ms)"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("SQL Query Statistics")
+        self.setMinimumSize(900, 450)
+
+        layout = QVBoxLayout(self)
+
+        self.summary_label = QLabel()
+        layout.addWidget(self.summary_label)
+
+        self.table = QTableWidget()
+        self.table.setColumnCount(len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        for i in range(2, len(self.COLUMNS)):
+            header.setSectionResizeMode(i, QHeaderView.ResizeMode.ResizeToContents)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setWordWrap(False)
+        layout.addWidget(self.table)
+
+        refresh_button = QPushButton("Refresh")
+        refresh_button.clicked.connect(self.refresh_requested.emit)
+        reset_button = QPushButton("Reset")
+        reset_button.clicked.connect(self.reset_requested.emit)
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.accept)
+
+        buttons_layout = QHBoxLayout()
+        buttons_layout.addStretch()
+        buttons_layout.addWidget(refresh_button)
+        buttons_layout.addWidget(reset_button)
+        buttons_layout.addWidget(close_button)
+        layout.addLayout(buttons_layout)
+
+    def populate(self, stats: List[QueryStats], is_enabled: bool):
+        total_ms = sum(s.total_ms for s in stats)
+        state = "recording" if is_enabled else "not recording"
+        self.summary_label.setText(
+            f"{len(stats)} statements, {sum(s.calls for s in stats)} calls, {total_ms:.1f} ms total ({state})."
+        )
+
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(len(stats))
+        for row, stat in enumerate(stats):
+            statement_item = QTableWidgetItem(stat.statement)
+            statement_item.setToolTip(stat.statement)
+            values = [stat.calls, stat.rows, stat.p50_ms, stat.p95_ms, stat.p99_ms, stat.total_ms]
+
+            self.table.setItem(row, 0, QTableWidgetItem(stat.caller))
+            self.table.setItem(row, 1, statement_item)
+            for col, value in enumerate(values, start=2):
+                text = f"{value:.2f}" if isinstance(value, float) else str(value)
+                item = QTableWidgetItem(text)
+                item.setData(Qt.ItemDataRole.EditRole, value)
+                item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self.table.setItem(row, col, item)
+        self.table.setSortingEnabled(True)
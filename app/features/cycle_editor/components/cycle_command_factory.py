@@ -1,9 +1,11 @@
 # app/features/cycle_editor/components/cycle_command_factory.py
 import logging
+from typing import Optional
 
 from PySide6.QtGui import QUndoCommand
 
 from app.core.builders import CycleBuilder
+from app.core.database import UnitOfWork
 from app.services.interfaces import (ICycleService, ICycleSubjectService, IMasterSubjectService,
                                      IStudyQueueService)
 from .cycle_commands import CreateCycleCommand, EditCycleCommand, DeleteCycleCommand, SetActiveCycleCommand
@@ -15,11 +17,13 @@ class CycleCommandFactory:
     """A factory for creating QUndoCommand instances for cycle operations."""
 
     def __init__(self, cycle_service: ICycleService, cycle_subject_service: ICycleSubjectService,
-                 master_subject_service: IMasterSubjectService, study_queue_service: IStudyQueueService):
+                 master_subject_service: IMasterSubjectService, study_queue_service: IStudyQueueService,
+                 unit_of_work: Optional[UnitOfWork] = None):
         self.cycle_service = cycle_service
         self.cycle_subject_service = cycle_subject_service
         self.master_subject_service = master_subject_service
         self.study_queue_service = study_queue_service
+        self.unit_of_work = unit_of_work
 
     def _create_builder(self) -> CycleBuilder:
         """Helper to instantiate the builder with all necessary services."""
@@ -27,7 +31,8 @@ class CycleCommandFactory:
             self.cycle_service,
             self.cycle_subject_service,
             self.master_subject_service,
-            self.study_queue_service
+            self.study_queue_service,
+            unit_of_work=self.unit_of_work
         )
 
     def create_new_cycle_command(self, exam_id: int, cycle_data: dict, subjects_data: list,
@@ -5,11 +5,14 @@ import logging
 from PySide6.QtGui import QUndoCommand
 
 from app.core.builders import CycleBuilder
-from app.core.signals import app_signals
+from app.core.signals import ChangeKind, DataChange, invalidation_bus
 from app.services.interfaces import ICycleService
 
 log = logging.getLogger(__name__)
 
+# Building a cycle writes its row, its subjects and its study queue.
+_CYCLE_CONTENTS = ChangeKind.CYCLES | ChangeKind.CYCLE_SUBJECTS | ChangeKind.STUDY_QUEUE
+
 
 class CreateCycleCommand(QUndoCommand):
     """An undoable command for creating a new study cycle. Uses CycleBuilder."""
@@ -31,13 +34,13 @@ class CreateCycleCommand(QUndoCommand):
                               .with_properties(self.cycle_data)
                               .with_subjects(self.subjects_data)
                               .build())
-        app_signals.data_changed.emit()
+        invalidation_bus.publish(DataChange.of(_CYCLE_CONTENTS, [self._new_cycle_id]))
 
     def undo(self):
         if self._new_cycle_id is None: return
         log.info(f"Undoing CreateCycleCommand for cycle_id: {self._new_cycle_id}")
         self.builder._cycle_service.soft_delete(self._new_cycle_id)
-        app_signals.data_changed.emit()
+        invalidation_bus.publish(DataChange.of(ChangeKind.CYCLES, [self._new_cycle_id]))
 
 
 class EditCycleCommand(QUndoCommand):
@@ -55,12 +58,12 @@ class EditCycleCommand(QUndoCommand):
     def redo(self):
         log.info(f"Executing EditCycleCommand via Builder for cycle_id: {self.cycle_id}")
         self._apply_data(self.new_data)
-        app_signals.data_changed.emit()
+        invalidation_bus.publish(DataChange.of(_CYCLE_CONTENTS, [self.cycle_id]))
 
     def undo(self):
         log.info(f"Undoing EditCycleCommand for cycle_id: {self.cycle_id}")
         self._apply_data(self.old_data)
-        app_signals.data_changed.emit()
+        invalidation_bus.publish(DataChange.of(_CYCLE_CONTENTS, [self.cycle_id]))
 
     def _apply_data(self, data_to_apply: dict):
         if data_to_apply['cycle_data'].get('is_active', False):
@@ -94,14 +97,14 @@ class DeleteCycleCommand(QUndoCommand):
         self._cycle_name_for_text = cycle.name
         self.setText(f"Delete Cycle '{self._cycle_name_for_text}'")
         self.cycle_service.soft_delete(self.cycle_id)
-        app_signals.data_changed.emit()
+        invalidation_bus.publish(DataChange.of(ChangeKind.CYCLES, [self.cycle_id]))
 
     def undo(self):
         """Restores the soft-deleted cycle."""
         if self.cycle_id is None: return
         log.info(f"Undoing DeleteCycleCommand for cycle_id '{self.cycle_id}'")
         self.cycle_service.restore_soft_deleted(self.cycle_id)
-        app_signals.data_changed.emit()
+        invalidation_bus.publish(DataChange.of(ChangeKind.CYCLES, [self.cycle_id]))
 
 
 class SetActiveCycleCommand(QUndoCommand):
@@ -118,12 +121,14 @@ class SetActiveCycleCommand(QUndoCommand):
     def redo(self):
         log.info(f"Executing SetActiveCycleCommand for cycle_id: {self.cycle_id_to_activate}")
         self.cycle_service.set_active(self.cycle_id_to_activate)
-        app_signals.data_changed.emit()
+        invalidation_bus.publish(DataChange.of(ChangeKind.CYCLES, [self.cycle_id_to_activate, self.previously_active_id]))
 
     def undo(self):
         log.info(f"Undoing SetActiveCycleCommand. Restoring active status to cycle_id: {self.previously_active_id}")
         if self.previously_active_id:
             self.cycle_service.set_active(self.previously_active_id)
+            change = DataChange.of(ChangeKind.CYCLES, [self.cycle_id_to_activate, self.previously_active_id])
         else:
             self.cycle_service.set_all_inactive()
-        app_signals.data_changed.emit()
\ No newline at end of file
+            change = DataChange.of(ChangeKind.CYCLES)
+        invalidation_bus.publish(change)
\ No newline at end of file
@@ -1,12 +1,14 @@
 # app/feature/cycle_editor/cycle_editor_controller.py
 
 import logging
+from typing import Optional
 
 from PySide6.QtCore import QObject, Signal
 from PySide6.QtGui import QUndoStack
 from PySide6.QtWidgets import QMessageBox
 
 from app.core.builders import CycleBuilder
+from app.core.database import UnitOfWork
 from app.models.subject import Subject
 from app.services.interfaces import (ICycleService, IMasterSubjectService, ICycleSubjectService, IStudyQueueService)
 from .components.cycle_commands import EditCycleCommand, CreateCycleCommand
@@ -21,7 +23,8 @@ class CycleEditorController(QObject):
 
     def __init__(self, view: CycleEditorView, exam_id: int, cycle_id: int | None, undo_stack: QUndoStack,
                  cycle_service: ICycleService, master_subject_service: IMasterSubjectService,
-                 cycle_subject_service: ICycleSubjectService, study_queue_service: IStudyQueueService):
+                 cycle_subject_service: ICycleSubjectService, study_queue_service: IStudyQueueService,
+                 unit_of_work: Optional[UnitOfWork] = None):
         super().__init__(view)
         self._view = view
         self.exam_id = exam_id
@@ -31,6 +34,7 @@ class CycleEditorController(QObject):
         self._master_subject_service = master_subject_service
         self._cycle_subject_service = cycle_subject_service
         self._study_queue_service = study_queue_service
+        self._unit_of_work = unit_of_work
         self.old_data_for_undo = None
 
         self._view.save_requested.connect(self.save_cycle)
@@ -83,7 +87,7 @@ class CycleEditorController(QObject):
     def save_cycle(self, cycle_data: dict, subjects_data: list):
         log.info(f"Queueing save command for cycle: '{cycle_data['name']}'")
         builder = CycleBuilder(self._cycle_service, self._cycle_subject_service, self._master_subject_service,
-                               self._study_queue_service)
+                               self._study_queue_service, unit_of_work=self._unit_of_work)
 
         if self._cycle_id:
             new_data = {"cycle_data": cycle_data, "subjects_data": subjects_data}
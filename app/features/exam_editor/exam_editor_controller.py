@@ -1,12 +1,14 @@
 # app/features/exam_editor/exam_editor_controller.py
 import logging
+from typing import Optional
 
 from PySide6.QtCore import QObject, Signal
 from PySide6.QtWidgets import QMessageBox
 
 from app.common.error_handler import show_error_message
 from app.core.builders import CycleBuilder
-from app.core.signals import app_signals
+from app.core.database import UnitOfWork
+from app.core.signals import ChangeKind, DataChange, invalidation_bus
 from app.services.interfaces import (IExamService, ITemplateSubjectService, IMasterSubjectService,
                                      ICycleSubjectService, IStudyQueueService, ICycleService)
 from .exam_editor_view import ExamEditorView
@@ -24,7 +26,8 @@ class ExamEditorController(QObject):
     def __init__(self, user_id: int, exam_service: IExamService,
                  template_subject_service: ITemplateSubjectService, master_subject_service: IMasterSubjectService,
                  cycle_subject_service: ICycleSubjectService, study_queue_service: IStudyQueueService,
-                 cycle_service: ICycleService, parent_view=None, exam_id_to_edit: int | None = None):
+                 cycle_service: ICycleService, parent_view=None, exam_id_to_edit: int | None = None,
+                 unit_of_work: Optional[UnitOfWork] = None):
         super().__init__(parent_view)
         self._user_id = user_id
         self.exam_service = exam_service
@@ -33,6 +36,7 @@ class ExamEditorController(QObject):
         self.cycle_subject_service = cycle_subject_service
         self.study_queue_service = study_queue_service
         self.cycle_service = cycle_service
+        self.unit_of_work = unit_of_work
         self.exam_id_to_edit = exam_id_to_edit
         self._view = ExamEditorView(parent=parent_view)
         self._view.save_requested.connect(self.save_exam)
@@ -64,7 +68,7 @@ class ExamEditorController(QObject):
                 predicted_exam_date=data["predicted_exam_date"], exam_date=data["exam_date"],
                 status="PREVISTO", has_edital=0
             )
-            app_signals.data_changed.emit()
+            invalidation_bus.publish(DataChange.of(ChangeKind.EXAMS))
             self.save_completed.emit()
         except Exception as e:
             show_error_message(self._view, "Error", "Could not update the exam.", details=str(e))
@@ -81,7 +85,10 @@ class ExamEditorController(QObject):
             return
         if template_id := data.get("template_id"):
             self._create_cycle_from_template(new_id, data['name'], template_id)
-        app_signals.data_changed.emit()
+            # The template's initial cycle comes with its subjects and study queue.
+            invalidation_bus.publish(DataChange.of(
+                ChangeKind.CYCLES | ChangeKind.CYCLE_SUBJECTS | ChangeKind.STUDY_QUEUE))
+        invalidation_bus.publish(DataChange.of(ChangeKind.EXAMS))
         self.save_completed.emit()
 
     def _create_cycle_from_template(self, new_exam_id: int, exam_name: str, template_id: int):
@@ -96,7 +103,7 @@ class ExamEditorController(QObject):
             cycle_data = {'name': f"Initial Plan for {exam_name}", 'duration': 60,
                           'is_continuous': True, 'daily_goal': 3, 'timing_strategy': 'Adaptive'}
             (CycleBuilder(self.cycle_service, self.cycle_subject_service, self.master_subject_service,
-                          self.study_queue_service)
+                          self.study_queue_service, unit_of_work=self.unit_of_work)
              .for_exam(new_exam_id).with_properties(cycle_data).with_subjects(subjects_data).build())
         except Exception as e:
             log.error(f"Failed to create initial cycle from template for exam {new_exam_id}", exc_info=True)
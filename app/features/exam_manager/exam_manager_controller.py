@@ -5,7 +5,7 @@ import logging
 from PySide6.QtCore import QObject
 from PySide6.QtWidgets import QMessageBox
 
-from app.core.signals import app_signals
+from app.core.signals import ChangeKind, DataChange, invalidation_bus
 from app.services.interfaces import IExamService
 from .exam_manager_view import ExamManagerView
 
@@ -50,4 +50,5 @@ class ExamManagerController(QObject):
             self.exam_service.soft_delete(exam_id)
             log.info(f"Soft deleted exam_id: {exam_id}")
             self.load_data()  # Refresh the view
-            app_signals.data_changed.emit()
\ No newline at end of file
+            # Deleting an exam takes its cycles with it.
+            invalidation_bus.publish(DataChange.of(ChangeKind.EXAMS | ChangeKind.CYCLES))
\ No newline at end of file
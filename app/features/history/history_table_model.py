@@ -0,0 +1,149 @@
+# app/features/history/history_table_model.py
+
+import logging
+from datetime import datetime
+from typing import List, Optional
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QObject, Qt, Signal
+
+from app.core.async_services import ServiceExecutor
+from app.models.session import HistoryRow
+from app.services.interfaces import ISessionService
+
+log = logging.getLogger(__name__)
+
+HISTORY_PAGE_SIZE = 200
+
+# (header, HistoryRow field the column shows and sorts by)
+COLUMNS = (
+    ("Subject", "subject_name"),
+    ("Date", "start_time"),
+    ("Duration", "duration_sec"),
+    ("Questions", "questions_done"),
+    ("Correct", "questions_correct"),
+    ("Accuracy", "accuracy"),
+)
+DATE_COLUMN = 1
+
+
+class HistoryTableModel(QAbstractTableModel):
+    """
+    The session history as a lazily fetched table. Rows arrive a page at a time from
+    ISessionService.get_history_rows as the view scrolls (canFetchMore/fetchMore); sorting and
+    the subject filter are part of the query, so changing either starts over from the first page.
+    Cells are formatted when the view asks for them, so only visible rows cost any work.
+    """
+    page_loaded = Signal()
+
+    def __init__(self, cycle_id: int, session_service: ISessionService, executor: ServiceExecutor,
+                 parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.cycle_id = cycle_id
+        self._session_service = session_service
+        self._executor = executor
+        self._rows: List[HistoryRow] = []
+        self._sort_column = DATE_COLUMN
+        self._descending = True
+        self.subject_filter = ""
+        self._exhausted = True  # Nothing is fetched until reload().
+        self._loading = False
+        self._generation = 0
+
+    def reload(self):
+        """Drops the loaded rows and fetches the first page again."""
+        self._generation += 1
+        self.beginResetModel()
+        self._rows = []
+        self._exhausted = False
+        self._loading = False
+        self.endResetModel()
+        self.fetchMore()
+
+    def set_subject_filter(self, text: str):
+        text = text.strip()
+        if text != self.subject_filter:
+            self.subject_filter = text
+            self.reload()
+
+    @property
+    def is_complete(self) -> bool:
+        """True once the last page has been loaded."""
+        return self._exhausted
+
+    # --- QAbstractTableModel ---
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return COLUMNS[section][0]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display(row, COLUMNS[index.column()][1])
+        if role == Qt.ItemDataRole.UserRole:
+            return getattr(row, COLUMNS[index.column()][1])
+        return None
+
+    @staticmethod
+    def _display(row: HistoryRow, field: str) -> str:
+        if field == "start_time":
+            return datetime.fromisoformat(row.start_time).strftime('%Y-%m-%d %H:%M')
+        if field == "duration_sec":
+            minutes, seconds = divmod(row.duration_sec, 60)
+            return f"{int(minutes)}m {int(seconds)}s"
+        if field == "accuracy":
+            return f"{row.accuracy:.1f}%"
+        return str(getattr(row, field))
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        descending = order == Qt.SortOrder.DescendingOrder
+        if (column, descending) != (self._sort_column, self._descending):
+            self._sort_column, self._descending = column, descending
+            self.reload()
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted or self._loading:
+            return
+        self._loading = True
+        field = COLUMNS[self._sort_column][1]
+        after = self._rows[-1].keyset(field) if self._rows else None
+        generation = self._generation
+        self._executor.submit(
+            self._session_service.get_history_rows, self.cycle_id, field, self._descending,
+            self.subject_filter, HISTORY_PAGE_SIZE, after, context=self,
+        ).then(lambda rows: self._on_page_loaded(generation, rows),
+               lambda error: self._on_page_failed(generation, error))
+
+    def _on_page_loaded(self, generation: int, rows: List[HistoryRow]):
+        if generation != self._generation:
+            return  # The sort or filter changed, or a reload started, while this page was loading.
+        self._loading = False
+        self._exhausted = len(rows) < HISTORY_PAGE_SIZE
+        if rows:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+            self._rows.extend(rows)
+            self.endInsertRows()
+        log.debug(f"History page loaded: {len(rows)} rows, {len(self._rows)} in total.")
+        self.page_loaded.emit()
+
+    def _on_page_failed(self, generation: int, error: BaseException):
+        if generation != self._generation:
+            return
+        log.error("Failed to load a history page.", exc_info=error)
+        # Stop here rather than retrying on every scroll; the next reload() starts over.
+        self._loading = False
+        self._exhausted = True
+        self.page_loaded.emit()
@@ -1,12 +1,12 @@
 # app/features/history/history_view.py
 
 import logging
+from typing import List, Tuple
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QAbstractItemModel, Qt, QTimer, Signal
 from PySide6.QtGui import QStandardItemModel, QStandardItem
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem,
-    QHeaderView, QLabel, QStackedWidget, QTabWidget, QTreeView
+    QWidget, QVBoxLayout, QTableView, QHeaderView, QLabel, QLineEdit, QStackedWidget, QTabWidget, QTreeView
 )
 
 from app.common.widgets.empty_state_widget import EmptyStateWidget
@@ -14,10 +14,13 @@ from app.core.constants import PAGE_MARGINS
 
 log = logging.getLogger(__name__)
 
+FILTER_DELAY_MS = 250
+
 
 class HistoryView(QWidget):
     """A view that displays a table of past study sessions."""
     start_session_requested = Signal()
+    subject_filter_changed = Signal(str)
 
     def __init__(self, parent: QWidget | None = None):
         super().__init__(parent)
@@ -42,8 +45,24 @@ class HistoryView(QWidget):
         self.content_stack = QStackedWidget()
         session_layout.addWidget(self.content_stack)
 
-        self.history_table = QTableWidget()
+        self.history_page = QWidget()
+        history_layout = QVBoxLayout(self.history_page)
+        history_layout.setContentsMargins(0, 0, 0, 0)
+        self.subject_filter_input = QLineEdit()
+        self.subject_filter_input.setPlaceholderText("Filter by subject...")
+        self.subject_filter_input.setClearButtonEnabled(True)
+        history_layout.addWidget(self.subject_filter_input)
+        self.history_table = QTableView()
         self._setup_table()
+        history_layout.addWidget(self.history_table)
+
+        # Each change re-queries the history, so wait until the user stops typing.
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(
+            lambda: self.subject_filter_changed.emit(self.subject_filter_input.text()))
+        self.subject_filter_input.textChanged.connect(lambda _text: self._filter_timer.start())
 
         self.empty_widget = EmptyStateWidget(
             icon_name="HISTORY",
@@ -53,7 +72,7 @@ class HistoryView(QWidget):
         )
         self.empty_widget.action_requested.connect(self.start_session_requested.emit)
 
-        self.content_stack.addWidget(self.history_table)
+        self.content_stack.addWidget(self.history_page)
         self.content_stack.addWidget(self.empty_widget)
         
         # --- Second Tab: Daily Breakdown ---
@@ -73,63 +92,36 @@ class HistoryView(QWidget):
         self.tab_widget.addTab(self.daily_breakdown_tab, "Daily Breakdown")
 
     def _setup_table(self):
-        self.history_table.setColumnCount(6)
-        self.history_table.setHorizontalHeaderLabels([
-            "Subject", "Date", "Duration", "Questions", "Correct", "Accuracy"
-        ])
+        self.history_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.history_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        # Fixed row heights, so scrolling never measures rows that are not on screen.
+        self.history_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+
+    def set_history_model(self, model: QAbstractItemModel):
+        """Shows `model` in the session table. The model sorts itself (see HistoryTableModel.sort)."""
+        self.history_table.setModel(model)
         header = self.history_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        for i in range(1, 6):
+        for i in range(1, model.columnCount()):
             header.setSectionResizeMode(i, QHeaderView.ResizeMode.ResizeToContents)
-        self.history_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        # Sort by date descending by default
+        header.setSortIndicator(1, Qt.SortOrder.DescendingOrder)
         self.history_table.setSortingEnabled(True)
 
-    def clear_history(self):
-        """Clears the table for refreshing."""
-        self.history_table.setRowCount(0)
-
-    def populate_history(self, history_data: list):
-        if not history_data:
-            self.content_stack.setCurrentWidget(self.empty_widget)
-            return
-
-        self.content_stack.setCurrentWidget(self.history_table)
-
-        self.history_table.setSortingEnabled(False)  # Disable sorting during population for performance
-        self.history_table.setRowCount(len(history_data))
-        for row, session_data in enumerate(history_data):
-            # Create items that can be sorted by their actual value, not just text
-            duration_item = QTableWidgetItem(session_data['duration_str'])
-            duration_item.setData(Qt.ItemDataRole.UserRole, session_data['duration_sec'])
-
-            questions_item = QTableWidgetItem(str(session_data['questions_done']))
-            questions_item.setData(Qt.ItemDataRole.UserRole, session_data['questions_done'])
-
-            correct_item = QTableWidgetItem(str(session_data['questions_correct']))
-            correct_item.setData(Qt.ItemDataRole.UserRole, session_data['questions_correct'])
-
-            accuracy_item = QTableWidgetItem(f"{session_data['accuracy']:.1f}%")
-            accuracy_item.setData(Qt.ItemDataRole.UserRole, session_data['accuracy'])
-
-            self.history_table.setItem(row, 0, QTableWidgetItem(session_data['subject_name']))
-            self.history_table.setItem(row, 1, QTableWidgetItem(session_data['date']))
-            self.history_table.setItem(row, 2, duration_item)
-            self.history_table.setItem(row, 3, questions_item)
-            self.history_table.setItem(row, 4, correct_item)
-            self.history_table.setItem(row, 5, accuracy_item)
-
-        self.history_table.setSortingEnabled(True)
-        # Sort by date descending by default
-        self.history_table.sortByColumn(1, Qt.SortOrder.DescendingOrder)
+    def show_empty_state(self, empty: bool):
+        self.content_stack.setCurrentWidget(self.empty_widget if empty else self.history_page)
 
-    def populate_daily_breakdown(self, daily_data: dict):
+    def populate_daily_breakdown(self, daily_rows: List[Tuple[str, str, int]]):
+        """Fills the tree from (date, subject, sessions) rows, newest date first."""
         self.daily_breakdown_model.clear()
-        for date, subjects in sorted(daily_data.items(), reverse=True):
-            date_item = QStandardItem(date)
-            date_item.setEditable(False)  # Disable editing for date items
-            self.daily_breakdown_model.appendRow(date_item)
-            for subject_name in subjects:
-                subject_item = QStandardItem(subject_name)
-                subject_item.setEditable(False)  # Disable editing for subject items
-                date_item.appendRow(subject_item)
-            self.daily_breakdown_tree.expand(date_item.index()) # Automatically expand date items
\ No newline at end of file
+        date_item = None
+        for date, subject_name, sessions in daily_rows:
+            if date_item is None or date_item.text() != date:
+                date_item = QStandardItem(date)
+                date_item.setEditable(False)  # Disable editing for date items
+                self.daily_breakdown_model.appendRow(date_item)
+            label = subject_name if sessions == 1 else f"{subject_name} ({sessions} sessions)"
+            subject_item = QStandardItem(label)
+            subject_item.setEditable(False)  # Disable editing for subject items
+            date_item.appendRow(subject_item)
+        self.daily_breakdown_tree.expandAll()  # Automatically expand date items
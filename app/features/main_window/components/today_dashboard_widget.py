@@ -6,7 +6,7 @@ from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame, QProgressBar
 
 from app.core.constants import PAGE_MARGINS
-from app.core.icon_manager import get_icon, THEME_ACCENT_TEXT_COLOR
+from app.core.icon_manager import get_icon, get_pixmap, THEME_ACCENT_TEXT_COLOR
 from app.models.cycle import Cycle
 from app.models.subject import CycleSubject
 
@@ -121,7 +121,7 @@ class TodayDashboardWidget(QWidget):
         block_layout = QHBoxLayout(block_widget)
 
         icon_label = QLabel()
-        icon_label.setPixmap(get_icon("SUBJECTS").pixmap(24, 24))
+        icon_label.setPixmap(get_pixmap("SUBJECTS", 24))
 
         name_label = QLabel(subject.name)
         name_label.setObjectName("blockTitle")
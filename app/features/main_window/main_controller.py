@@ -1,7 +1,7 @@
 # app/features/main_window/main_controller.py
 
 import logging
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any
 
 from PySide6.QtCore import QObject, QThreadPool
 from PySide6.QtGui import QUndoStack
@@ -9,42 +9,9 @@ from PySide6.QtWidgets import QWidget, QMessageBox
 
 from app.core import business_logic
 from app.core.context import AppContext
-from app.core.signals import app_signals
-from app.features.rebalancer.rebalance_controller import RebalanceController
+from app.core.signals import ChangeKind, DataChange, invalidation_bus
+from app.core.startup_timeline import startup_timeline
 from app.navigation_service import NavigationService
-from app.features.configurations.configurations_landing_view import ConfigurationsLandingView
-from app.features.configurations.configurations_landing_controller import ConfigurationsLandingController
-from app.features.configurations.app_settings_view import AppSettingsView
-from app.features.configurations.configuration_controller import ConfigurationController
-from app.features.cycle_manager.cycle_manager_view import CycleManagerView
-from app.features.cycle_manager.cycle_manager_controller import CycleManagerController
-from app.features.exam_manager.exam_manager_view import ExamManagerView
-from app.features.exam_manager.exam_manager_controller import ExamManagerController
-from app.features.master_subject_manager.master_subject_manager_view import MasterSubjectManagerView
-from app.features.master_subject_manager.master_subject_manager_controller import MasterSubjectManagerController
-from app.features.exam_editor.exam_editor_controller import ExamEditorController
-from app.features.cycle_editor.cycle_editor_view import CycleEditorView
-from app.features.cycle_editor.cycle_editor_controller import CycleEditorController
-from app.features.onboarding.onboarding_view import OnboardingView
-from app.features.onboarding.onboarding_controller import OnboardingController
-from app.features.subject_summary.subject_summary_view import SubjectSummaryView
-from app.features.subject_summary.subject_summary_controller import SubjectSummaryController
-from app.features.history.history_view import HistoryView
-from app.features.history.history_controller import HistoryController
-from app.features.subject_details.subject_details_view import SubjectDetailsView
-from app.features.subject_details.subject_details_controller import SubjectDetailsController
-from app.features.help.help_view import HelpView
-from app.features.analitics.analytics_view import AnalyticsView
-from app.features.analitics.analytics_controller import AnalyticsController
-from app.features.performance_dashboard.performance_dashboard_view import PerformanceDashboardView
-from app.features.performance_dashboard.performance_dashboard_controller import PerformanceDashboardController
-from app.features.training_screen.training_screen_view import TrainingScreenView
-from app.features.training_screen.training_screen_controller import TrainingScreenController
-from app.features.performance_graphs.performance_graph_view import PerformanceGraphView
-from app.features.performance_graphs.performance_graph_controller import PerformanceGraphController
-from app.features.session_choice.session_choice_view import SessionChoiceView
-from app.features.session_mode_choice.session_mode_choice_view import SessionModeChoiceView
-from app.features.session_mode_choice.session_mode_choice_controller import SessionModeChoiceController
 from app.models.user import User
 from .action_factory import ActionFactory
 from .navigator import Navigator
@@ -52,8 +19,22 @@ from .plan_manager import PlanManager
 from .session_manager import SessionManager
 from .toolbar_manager import ToolbarManager
 
+if TYPE_CHECKING:
+    from app.features.onboarding.onboarding_controller import OnboardingController
+
 log = logging.getLogger(__name__)
 
+# Logged sessions reach the plan through SessionManager's incremental replan instead.
+MAIN_VIEW_DEPENDENCIES = (ChangeKind.EXAMS | ChangeKind.CYCLES | ChangeKind.CYCLE_SUBJECTS
+                          | ChangeKind.STUDY_QUEUE | ChangeKind.MASTER_SUBJECTS)
+# Kinds whose changes are confined to the cycles named in the event.
+CYCLE_CONTENT_KINDS = ChangeKind.CYCLE_SUBJECTS | ChangeKind.STUDY_QUEUE
+# What makes each cached view stale (see NavigationService).
+HISTORY_DEPENDENCIES = ChangeKind.SESSIONS | ChangeKind.CYCLES | ChangeKind.MASTER_SUBJECTS
+ANALYTICS_DEPENDENCIES = ChangeKind.SESSIONS | ChangeKind.CYCLE_SUBJECTS | ChangeKind.MASTER_SUBJECTS
+DASHBOARD_DEPENDENCIES = ChangeKind.SESSIONS
+GRAPH_DEPENDENCIES = ChangeKind.SESSIONS | ChangeKind.MASTER_SUBJECTS
+
 
 class MainWindowController(QObject):
     def __init__(self, view, current_user: User, app_context: AppContext, is_dev_mode: bool = False):
@@ -71,7 +52,7 @@ class MainWindowController(QObject):
         self._next_session_data = None
         self.current_main_widget: QWidget | None = None
         self.onboarding_page_cache: int = 0
-        self._active_onboarding_controller: OnboardingController | None = None
+        self._active_onboarding_controller: Optional["OnboardingController"] = None
 
         self.navigation_service = NavigationService()
         self.navigator = Navigator(self, self.navigation_service)
@@ -83,12 +64,18 @@ class MainWindowController(QObject):
         self._register_features()
         self._connect_signals_and_actions()
         self._populate_ui()
-        self.refresh_data_and_views(force_replan=True)
+        with startup_timeline.phase("first_refresh_data_and_views"):
+            self.refresh_data_and_views(force_replan=True)
 
     def _register_features(self):
-        """Registers all view providers with the NavigationService."""
+        """
+        Registers all view providers with the NavigationService.
+        Each provider imports its feature on first use, so only the main window is loaded at startup.
+        """
         # Provider for Configurations Landing
         def create_configurations_landing() -> QWidget:
+            from app.features.configurations.configurations_landing_controller import ConfigurationsLandingController
+            from app.features.configurations.configurations_landing_view import ConfigurationsLandingView
             view = ConfigurationsLandingView(parent=self.view)
             view.set_developer_mode(self.is_dev_mode)
             controller = ConfigurationsLandingController(
@@ -103,6 +90,9 @@ class MainWindowController(QObject):
 
         # Provider for App Settings
         def create_app_settings() -> QWidget:
+            from PySide6.QtWidgets import QPushButton
+            from app.features.configurations.app_settings_view import AppSettingsView
+            from app.features.configurations.configuration_controller import ConfigurationController
             view = AppSettingsView(parent=self.view)
             controller = ConfigurationController(
                 view=view.profile_form,
@@ -126,6 +116,8 @@ class MainWindowController(QObject):
 
         # Provider for Cycle Manager
         def create_cycle_manager() -> QWidget:
+            from app.features.cycle_manager.cycle_manager_controller import CycleManagerController
+            from app.features.cycle_manager.cycle_manager_view import CycleManagerView
             view = CycleManagerView(parent=self.view)
             controller = CycleManagerController(
                 view=view,
@@ -139,20 +131,24 @@ class MainWindowController(QObject):
                 lambda cycle_id: self.navigator.show_cycle_editor(active_cycle.exam_id,
                                                                   cycle_id) if active_cycle else None
             )
-            app_signals.data_changed.connect(controller.load_data)
+            invalidation_bus.subscribe(ChangeKind.CYCLES, lambda change: controller.load_data(),
+                                    owner=controller)
             return view
 
         self.navigation_service.register("cycle_manager", create_cycle_manager)
 
         # Provider for Exam Manager
         def create_exam_manager() -> QWidget:
+            from app.features.exam_manager.exam_manager_controller import ExamManagerController
+            from app.features.exam_manager.exam_manager_view import ExamManagerView
             view = ExamManagerView(parent=self.view)
             controller = ExamManagerController(
                 view=view, user_id=self.current_user.id,
                 exam_service=self.app_context.exam_service, navigator=self.navigator
             )
             controller.load_data()
-            app_signals.data_changed.connect(controller.load_data)
+            invalidation_bus.subscribe(ChangeKind.EXAMS, lambda change: controller.load_data(),
+                                    owner=controller)
             view.setProperty("controller", controller)
             return view
 
@@ -160,6 +156,8 @@ class MainWindowController(QObject):
 
         # Provider for Master Subject Manager
         def create_master_subject_manager() -> QWidget:
+            from app.features.master_subject_manager.master_subject_manager_controller import MasterSubjectManagerController
+            from app.features.master_subject_manager.master_subject_manager_view import MasterSubjectManagerView
             view = MasterSubjectManagerView(parent=self.view)
             controller = MasterSubjectManagerController(
                 view=view,
@@ -173,6 +171,7 @@ class MainWindowController(QObject):
 
         # Provider for Exam Editor
         def create_exam_editor(exam_id: int | None) -> QWidget:
+            from app.features.exam_editor.exam_editor_controller import ExamEditorController
             controller = ExamEditorController(
                 user_id=self.current_user.id,
                 exam_service=self.app_context.exam_service,
@@ -181,7 +180,8 @@ class MainWindowController(QObject):
                 cycle_subject_service=self.app_context.cycle_subject_service,
                 study_queue_service=self.app_context.study_queue_service,
                 cycle_service=self.app_context.cycle_service,
-                parent_view=self.view, exam_id_to_edit=exam_id
+                parent_view=self.view, exam_id_to_edit=exam_id,
+                unit_of_work=self.app_context.unit_of_work
             )
             view = controller.get_view()
             controller.save_completed.connect(self.navigator.show_exam_manager)
@@ -192,6 +192,8 @@ class MainWindowController(QObject):
 
         # Provider for Cycle Editor
         def create_cycle_editor(exam_id: int, cycle_id: int | None) -> QWidget:
+            from app.features.cycle_editor.cycle_editor_controller import CycleEditorController
+            from app.features.cycle_editor.cycle_editor_view import CycleEditorView
             view = CycleEditorView(parent=self.view)
             controller = CycleEditorController(
                 view=view, exam_id=exam_id, cycle_id=cycle_id,
@@ -199,7 +201,8 @@ class MainWindowController(QObject):
                 cycle_service=self.app_context.cycle_service,
                 master_subject_service=self.app_context.master_subject_service,
                 cycle_subject_service=self.app_context.cycle_subject_service,
-                study_queue_service=self.app_context.study_queue_service
+                study_queue_service=self.app_context.study_queue_service,
+                unit_of_work=self.app_context.unit_of_work
             )
             controller.load_data_into_view()
             controller.save_completed.connect(self.navigator.show_configurations_landing)
@@ -209,7 +212,9 @@ class MainWindowController(QObject):
         self.navigation_service.register("cycle_editor", create_cycle_editor)
 
         # Provider for Onboarding
-        def create_onboarding() -> tuple[QWidget, OnboardingController]:
+        def create_onboarding() -> tuple[QWidget, "OnboardingController"]:
+            from app.features.onboarding.onboarding_controller import OnboardingController
+            from app.features.onboarding.onboarding_view import OnboardingView
             view = OnboardingView(parent=self.view)
             controller = OnboardingController(
                 view=view,
@@ -220,7 +225,8 @@ class MainWindowController(QObject):
                 cycle_service=self.app_context.cycle_service,
                 cycle_subject_service=self.app_context.cycle_subject_service,
                 study_queue_service=self.app_context.study_queue_service,
-                work_unit_service=self.app_context.work_unit_service
+                work_unit_service=self.app_context.work_unit_service,
+                unit_of_work=self.app_context.unit_of_work
             )
             self._active_onboarding_controller = controller
             controller.start()
@@ -241,6 +247,8 @@ class MainWindowController(QObject):
 
         # Provider for Subject Summary
         def create_subject_summary() -> QWidget:
+            from app.features.subject_summary.subject_summary_controller import SubjectSummaryController
+            from app.features.subject_summary.subject_summary_view import SubjectSummaryView
             view = SubjectSummaryView(parent=self.view)
             controller = SubjectSummaryController(
                 view=view,
@@ -248,6 +256,8 @@ class MainWindowController(QObject):
                 performance_service=self.app_context.performance_service,
                 master_subject_service=self.app_context.master_subject_service,
                 user_id=self.current_user.id,
+                executor=self.app_context.service_executor,
+                read_conn_factory=self.app_context.read_conn_factory,
                 parent=view
             )
             return view
@@ -256,6 +266,9 @@ class MainWindowController(QObject):
 
         # Provider for History
         def create_history() -> QWidget:
+            from PySide6.QtWidgets import QLabel
+            from app.features.history.history_controller import HistoryController
+            from app.features.history.history_view import HistoryView
             active_cycle = self.navigator.active_cycle
             if not active_cycle:
                 return QLabel("No active cycle to show history for.")
@@ -263,15 +276,20 @@ class MainWindowController(QObject):
             view.start_session_requested.connect(self._on_start_next_session)
             controller = HistoryController(
                 view=view, cycle_id=active_cycle.id,
-                session_service=self.app_context.session_service
+                session_service=self.app_context.session_service,
+                executor=self.app_context.service_executor
             )
             view.setProperty("controller", controller)
             return view
 
-        self.navigation_service.register("history", create_history)
+        self.navigation_service.register("history", create_history, cache_key=self._active_cycle_key,
+                                         depends_on=HISTORY_DEPENDENCIES)
 
         # Provider for Subject Details
         def create_subject_details(cycle_subject_id: int) -> QWidget:
+            from PySide6.QtWidgets import QLabel
+            from app.features.subject_details.subject_details_controller import SubjectDetailsController
+            from app.features.subject_details.subject_details_view import SubjectDetailsView
             cached_plan = self.plan_manager.get_cached_plan()
             subject_diag = next((s for s in cached_plan.get('processed_subjects', []) if
                                  s['subject_id'] == cycle_subject_id), {}) if cached_plan else {}
@@ -293,12 +311,16 @@ class MainWindowController(QObject):
 
         # Provider for Help
         def create_help() -> QWidget:
+            from app.features.help.help_view import HelpView
             return HelpView(parent=self.view)
 
         self.navigation_service.register("help", create_help)
 
         # Provider for Analytics
         def create_analytics() -> QWidget:
+            from app.common.widgets.empty_state_widget import EmptyStateWidget
+            from app.features.analitics.analytics_controller import AnalyticsController
+            from app.features.analitics.analytics_view import AnalyticsView
             active_cycle = self.navigator.active_cycle
             if not active_cycle:
                 return EmptyStateWidget(icon_name="REBALANCE", title="Analytics Unavailable",
@@ -307,30 +329,46 @@ class MainWindowController(QObject):
             controller = AnalyticsController(
                 view=view, user_id=self.current_user.id, cycle_id=active_cycle.id,
                 performance_service=self.app_context.performance_service,
-                cycle_subject_service=self.app_context.cycle_subject_service
+                cycle_subject_service=self.app_context.cycle_subject_service,
+                executor=self.app_context.service_executor,
+                read_conn_factory=self.app_context.read_conn_factory
             )
             view.setProperty("controller", controller)
             return view
 
-        self.navigation_service.register("analytics", create_analytics)
+        self.navigation_service.register("analytics", create_analytics, cache_key=self._active_cycle_key,
+                                         depends_on=ANALYTICS_DEPENDENCIES)
 
         # Provider for Performance Dashboard
         def create_performance_dashboard() -> QWidget:
+            from PySide6.QtCore import Qt
+            from PySide6.QtWidgets import QLabel
+            from app.features.performance_dashboard.performance_dashboard_controller import PerformanceDashboardController
+            from app.features.performance_dashboard.performance_dashboard_view import PerformanceDashboardView
             active_cycle = self.navigator.active_cycle
             if not active_cycle:
                 return QLabel("No active cycle to show dashboard for.", alignment=Qt.AlignmentFlag.AlignCenter)
             view = PerformanceDashboardView(parent=self.view)
             controller = PerformanceDashboardController(
                 view=view, cycle_id=active_cycle.id, daily_goal=active_cycle.daily_goal_blocks,
-                analytics_service=self.app_context.analytics_service
+                analytics_service=self.app_context.analytics_service,
+                executor=self.app_context.service_executor,
+                read_conn_factory=self.app_context.read_conn_factory
             )
             view.setProperty("controller", controller)
             return view
 
-        self.navigation_service.register("performance_dashboard", create_performance_dashboard)
+        self.navigation_service.register(
+            "performance_dashboard", create_performance_dashboard,
+            # The daily goal is baked into the dashboard, so an edited goal needs a new one.
+            cache_key=lambda: (self._active_cycle_key(), getattr(self.navigator.active_cycle, "daily_goal_blocks", None)),
+            depends_on=DASHBOARD_DEPENDENCIES)
 
         # Provider for Training Screen
         def create_training_screen() -> QWidget:
+            from app.common.widgets.empty_state_widget import EmptyStateWidget
+            from app.features.training_screen.training_screen_controller import TrainingScreenController
+            from app.features.training_screen.training_screen_view import TrainingScreenView
             active_cycle = self.navigator.active_cycle
             if not active_cycle:
                 return EmptyStateWidget(icon_name="TRAINING", title="Training Unavailable",
@@ -351,19 +389,24 @@ class MainWindowController(QObject):
 
         # Provider for Performance Graphs
         def create_performance_graphs() -> QWidget:
+            from app.features.performance_graphs.performance_graph_controller import PerformanceGraphController
+            from app.features.performance_graphs.performance_graph_view import PerformanceGraphView
             view = PerformanceGraphView(parent=self.view)
             controller = PerformanceGraphController(
                 view=view, user_id=self.current_user.id,
                 performance_service=self.app_context.performance_service,
-                master_subject_service=self.app_context.master_subject_service
+                master_subject_service=self.app_context.master_subject_service,
+                executor=self.app_context.service_executor
             )
             view.setProperty("controller", controller)
             return view
 
-        self.navigation_service.register("performance_graphs", create_performance_graphs)
+        self.navigation_service.register("performance_graphs", create_performance_graphs,
+                                         cache_key=lambda: self.current_user.id, depends_on=GRAPH_DEPENDENCIES)
 
         # Provider for Session Choice
         def create_session_choice(recommended: dict, alternatives: list) -> QWidget:
+            from app.features.session_choice.session_choice_view import SessionChoiceView
             view = SessionChoiceView(parent=self.view)
             view.populate_data(recommended, alternatives)
             view.start_session_requested.connect(self.navigator._main_ctl.session_manager.start_study_session)
@@ -374,6 +417,8 @@ class MainWindowController(QObject):
 
         # Provider for Session Mode Choice
         def create_session_mode_choice(initial_session_data: dict) -> QWidget:
+            from app.features.session_mode_choice.session_mode_choice_controller import SessionModeChoiceController
+            from app.features.session_mode_choice.session_mode_choice_view import SessionModeChoiceView
             view = SessionModeChoiceView(parent=self.view)
             all_master_subjects = self.app_context.master_subject_service.get_all_master_subjects()
             controller = SessionModeChoiceController(
@@ -390,6 +435,10 @@ class MainWindowController(QObject):
 
         self.navigation_service.register("session_mode_choice", create_session_mode_choice)
 
+    def _active_cycle_key(self) -> int | None:
+        """Cache key for views built for the active cycle."""
+        return self.navigator.active_cycle.id if self.navigator.active_cycle else None
+
     def _connect_signals_and_actions(self):
         # Top-level actions owned by the main window
         self.action_factory.new_cycle_action.triggered.connect(self.launch_cycle_creator)
@@ -399,7 +448,7 @@ class MainWindowController(QObject):
 
         # Connections to global and manager signals
         self.view.navigation_requested.connect(self.navigator.handle_navigation)
-        app_signals.data_changed.connect(lambda: self.refresh_data_and_views(force_replan=True))
+        invalidation_bus.subscribe(MAIN_VIEW_DEPENDENCIES, self._on_data_changed, owner=self)
         self.session_manager.rebalance_prompt_requested.connect(self.prompt_for_rebalance)
 
     def _populate_ui(self):
@@ -407,6 +456,14 @@ class MainWindowController(QObject):
         self.action_factory.populate_tool_bar(self.view.get_toolbar())
         self.toolbar_manager.setup_widgets(self.view.get_toolbar())
 
+    def _on_data_changed(self, change: DataChange):
+        # Subject or queue edits in another cycle leave the active plan and the views untouched.
+        only_cycle_contents = not change.kinds & ~CYCLE_CONTENT_KINDS
+        if only_cycle_contents and self.active_cycle and not change.affects_cycle(self.active_cycle.id):
+            log.debug(f"Ignoring {change}; it does not touch the active cycle.")
+            return
+        self.refresh_data_and_views(force_replan=True)
+
     def refresh_data_and_views(self, force_replan: bool = False):
         log.debug(f"Refreshing views. Force replan: {force_replan}")
         if self.session_manager.is_session_active():
@@ -417,13 +474,9 @@ class MainWindowController(QObject):
         self.active_cycle = self.app_context.cycle_service.get_active()
         self.navigator.set_active_cycle(self.active_cycle)
 
-        # --- MODIFICATION START ---
-        # On a normal refresh, try to load a valid plan from today's cache first.
-        if not force_replan:
-            self.plan_manager.load_and_validate_cached_plan()
-        else:
-            self.plan_manager.clear_cache() # If forcing, clear the cache first.
-        # --- MODIFICATION END ---
+        # Even a forced refresh reuses the cached plan when its input fingerprint still matches,
+        # so the plan is only regenerated when something the tutor reads has changed.
+        self.plan_manager.load_and_validate_cached_plan()
 
         self.toolbar_manager.update_visibility_and_state()
 
@@ -492,13 +545,15 @@ class MainWindowController(QObject):
 
     def launch_rebalancer(self):
         if not self.active_cycle: return
+        from app.features.rebalancer.rebalance_controller import RebalanceController
         log.info("Rebalance action triggered. Launching rebalancer dialog.")
         rebalance_controller = RebalanceController(
             cycle_id=self.active_cycle.id,
             cycle_subject_service=self.app_context.cycle_subject_service,
             performance_service=self.app_context.performance_service,
             study_queue_service=self.app_context.study_queue_service,
-            parent_view=self.view
+            parent_view=self.view,
+            unit_of_work=self.app_context.unit_of_work
         )
         rebalance_controller.show()
 
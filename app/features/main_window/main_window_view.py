@@ -2,7 +2,7 @@
 import logging
 import sys
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QEvent, Qt, Signal
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QSplitter, QHBoxLayout, QToolBar
 )
@@ -16,10 +16,13 @@ log = logging.getLogger(__name__)
 class MainWindow(QMainWindow):
     """The main application window, configured for native vibrancy on macOS."""
     navigation_requested = Signal(dict)
+    # Emitted once, when the window is first painted (the end of the startup timeline).
+    first_painted = Signal()
 
     def __init__(self):
         super().__init__()
         log.debug("Initializing MainWindow (View).")
+        self._painted = False
         self.setWindowTitle("Serenita")  # A simple, static title is fine for the main window
         self.resize(1100, 700) # Increased default size for better initial view
 
@@ -62,6 +65,13 @@ class MainWindow(QMainWindow):
         """Provides access to the toolbar for the controller."""
         return self.toolbar
 
+    def event(self, event: QEvent) -> bool:
+        handled = super().event(event)
+        if not self._painted and event.type() == QEvent.Type.Paint:
+            self._painted = True
+            self.first_painted.emit()
+        return handled
+
     def set_main_pane_widget(self, widget: QWidget):
         """Replaces the current widget in the main pane without deleting it."""
         log.debug(f"Setting main pane widget to: {widget.__class__.__name__}")
@@ -75,4 +85,5 @@ class MainWindow(QMainWindow):
         if sys.platform == "darwin":
             self.main_pane.setStyleSheet("#mainPane { padding-top: 24px; }")
 
-        self.splitter.insertWidget(1, self.main_pane)
\ No newline at end of file
+        self.splitter.insertWidget(1, self.main_pane)
+        self.main_pane.show()  # A cached pane was hidden when it was detached.
\ No newline at end of file
@@ -34,9 +34,29 @@ class Navigator:
             log.debug(f"Caching onboarding page index: {onboarding_controller.current_page_index}")
             self._main_ctl.onboarding_page_cache = onboarding_controller.current_page_index
 
+        previous_widget = self._main_ctl.current_main_widget
+        if previous_widget is not None and previous_widget is not widget:
+            self.navigation_service.on_hide(previous_widget)
         self.view.set_main_pane_widget(widget)
         self._main_ctl.current_main_widget = widget
+        self.navigation_service.on_show(widget)
         self._main_ctl.toolbar_manager.update_visibility_and_state()
+        self._release_widget(previous_widget, widget)
+
+    def _release_widget(self, previous_widget: QWidget | None, widget: QWidget):
+        """
+        Deletes a replaced pane unless it is cached by the navigation service or is the live session
+        or onboarding view, which are shown again later. Every other pane is rebuilt on its next
+        visit, so keeping it would only keep its controller and that controller's invalidation
+        subscriptions alive.
+        """
+        if previous_widget is None or previous_widget is widget or self.navigation_service.is_cached(previous_widget):
+            return
+        onboarding_controller = self._main_ctl._active_onboarding_controller
+        if previous_widget is self._main_ctl.session_manager.session_view or (
+                onboarding_controller and previous_widget is onboarding_controller.view):
+            return
+        previous_widget.deleteLater()
 
     def handle_navigation(self, nav_data: dict):
         nav_type = nav_data.get("type")
@@ -23,12 +23,17 @@ class PlanManager(QObject):
         self._main_ctl = main_controller
         self.app_context = main_controller.app_context
         self.cached_v20_plan = None
+        # Incremental replans run one at a time; subjects completed meanwhile wait here.
+        self._incremental_replan_running = False
+        self._pending_replan_ids: List[int] = []
         self._input_assembler = V20InputAssembler(
             cycle_service=self.app_context.cycle_service,
             cycle_subject_service=self.app_context.cycle_subject_service,
             work_unit_service=self.app_context.work_unit_service,
             session_service=self.app_context.session_service,
-            user_service=self.app_context.user_service
+            user_service=self.app_context.user_service,
+            columnar_history=self.app_context.config_service.get("tutor.columnar_history", False),
+            config_service=self.app_context.config_service
         )
 
     def get_cached_plan(self) -> dict | None:
@@ -52,21 +57,65 @@ class PlanManager(QObject):
         sessions = recommended_plan.get('sessions', [])
         session_to_remove = next((s for s in sessions if s.get('subject_id') == completed_cycle_subject_id), None)
 
+        completed_ids = self._completed_today(self.cached_v20_plan)
+        if completed_cycle_subject_id not in completed_ids:
+            completed_ids.append(completed_cycle_subject_id)
+        self.cached_v20_plan['completed_today'] = {'date': date.today().isoformat(), 'subject_ids': completed_ids}
+
         if session_to_remove:
             sessions.remove(session_to_remove)
             log.debug(f"Removed session '{session_to_remove.get('subject_name')}' from cached plan.")
-
-            # --- ADD THIS LINE ---
-            # Persist the change immediately to the database
-            self.app_context.cycle_service.save_plan_cache(self._main_ctl.active_cycle.id, self.cached_v20_plan)
-            # --- END ADD ---
-
         else:
             log.warning(f"Could not find session with cycle_subject_id {completed_cycle_subject_id} in the cached plan to remove it.")
 
+        # Persist the change immediately; only the scaffold and header sections are rewritten.
+        self.app_context.cycle_service.update_plan_cache(self._main_ctl.active_cycle.id, {
+            'plan_scaffold': self.cached_v20_plan.get('plan_scaffold', {}),
+            'completed_today': self.cached_v20_plan['completed_today'],
+        })
+
         self._main_ctl.navigator.show_dual_plan_view(self.cached_v20_plan)
         self._main_ctl.update_action_states()
 
+    def replan_after_session(self, completed_cycle_subject_id: int):
+        """
+        Patches the cached plan right away, then re-diagnoses only the studied subject in the
+        background and re-runs scoring and allocation with the other subjects' cached diagnostics.
+        Falls back to a full regeneration when the cached plan does not cover every subject.
+        """
+        self.mark_session_as_completed(completed_cycle_subject_id)
+        if not self.cached_v20_plan or not self._main_ctl.active_cycle:
+            return
+
+        if self._incremental_replan_running:
+            if completed_cycle_subject_id not in self._pending_replan_ids:
+                self._pending_replan_ids.append(completed_cycle_subject_id)
+            return
+        self._start_incremental_replan(completed_cycle_subject_id)
+
+    def _start_incremental_replan(self, cycle_subject_id: int):
+        # The runner falls back to a full replan when the cached plan does not cover every subject.
+        log.info(f"Replanning incrementally after a session of cycle_subject_id {cycle_subject_id}.")
+        self._incremental_replan_running = True
+        runner = TutorRunner(self._input_assembler, self._main_ctl.active_cycle, self._main_ctl.current_user,
+                             self.app_context.cycle_subject_service, self.app_context.config_service,
+                             previous_plan=self.cached_v20_plan, cycle_subject_id=cycle_subject_id)
+        runner.signals.finished.connect(self._on_incremental_replan_finished)
+        runner.signals.error.connect(self._on_incremental_replan_error)
+        self._main_ctl.threadpool.start(runner)
+
+    def _on_incremental_replan_finished(self, v20_plan: dict):
+        self._incremental_replan_running = False
+        self._on_plan_generation_finished(v20_plan)
+        if self._pending_replan_ids and self.cached_v20_plan:
+            self._start_incremental_replan(self._pending_replan_ids.pop(0))
+
+    def _on_incremental_replan_error(self, error_message: str):
+        log.error(f"Incremental replan failed, regenerating the full plan: {error_message}")
+        self._incremental_replan_running = False
+        self._pending_replan_ids.clear()
+        self.regenerate_plan()
+
     def regenerate_plan(self):
         """Asynchronously regenerates the study plan using the Tutor engine."""
         if not self._main_ctl.active_cycle:
@@ -76,11 +125,8 @@ class PlanManager(QObject):
         log.info("Regenerating study plan using v20 Tutor Engine...")
         self._main_ctl.navigator.show_loading_view()
 
-        cycle_config = self._input_assembler.assemble(
-            self._main_ctl.active_cycle,
-            self._main_ctl.current_user
-        )
-        runner = TutorRunner(cycle_config, self.app_context.cycle_subject_service)
+        runner = TutorRunner(self._input_assembler, self._main_ctl.active_cycle, self._main_ctl.current_user,
+                             self.app_context.cycle_subject_service, self.app_context.config_service)
         runner.signals.finished.connect(self._on_plan_generation_finished)
         runner.signals.error.connect(self._on_plan_generation_error)
         self._main_ctl.threadpool.start(runner)
@@ -114,12 +160,13 @@ class PlanManager(QObject):
         """Handles the successful generation of a new plan."""
         log.debug("Plan generation finished. Caching and updating UI.")
 
-        # Re-fetch the full subject models which include work_units, as the plan only has IDs.
-        full_subjects = self._input_assembler.assemble(
-            self._main_ctl.active_cycle,
-            self._main_ctl.current_user
-        )['subjects']
-        v20_plan['subjects'] = full_subjects
+        # Sessions completed today stay off the recommended plan that replaces the cached one.
+        completed_ids = self._completed_today(self.cached_v20_plan)
+        if completed_ids:
+            recommended_plan = v20_plan.get('plan_scaffold', {}).get('recommended_plan', {})
+            recommended_plan['sessions'] = [s for s in recommended_plan.get('sessions', [])
+                                            if s.get('subject_id') not in completed_ids]
+            v20_plan['completed_today'] = {'date': date.today().isoformat(), 'subject_ids': completed_ids}
 
         self._enrich_plan_with_study_times(v20_plan)
 
@@ -141,21 +188,50 @@ class PlanManager(QObject):
 
     def load_and_validate_cached_plan(self):
         """
-        Tries to load a plan from the DB cache. If it exists and was generated
-        today, it's considered valid and loaded into memory. Otherwise, the cache is cleared.
+        Tries to load a plan from the DB cache. It is valid while the tutor inputs still match
+        the fingerprint it was generated from, so it survives restarts and (within
+        plan_cache.max_age_days) day changes. Otherwise, the cache is cleared.
         """
         if not self._main_ctl.active_cycle:
             self.clear_cache()
             return
 
-        plan_from_db = self.app_context.cycle_service.get_plan_cache(self._main_ctl.active_cycle.id)
-        if plan_from_db and plan_from_db.get('generation_date') == date.today().isoformat():
-            log.info("Found a valid plan for today in the database cache. Loading it.")
-            self.cached_v20_plan = plan_from_db
+        # The header alone says whether the plan is current; the large sections are only decoded if it is.
+        cycle_service = self.app_context.cycle_service
+        plan_header = cycle_service.get_plan_cache(self._main_ctl.active_cycle.id, keys=())
+        if plan_header and self._is_plan_current(plan_header):
+            log.info("Found a plan matching the current tutor inputs in the database cache. Loading it.")
+            self.cached_v20_plan = cycle_service.get_plan_cache(self._main_ctl.active_cycle.id)
         else:
-            log.info("No valid plan found for today in the cache. A new one will be generated.")
+            log.info("No valid plan found in the cache. A new one will be generated.")
             self.clear_cache()
 
+    def _is_plan_current(self, plan: dict) -> bool:
+        generation_date = plan.get('generation_date')
+        if not generation_date:
+            return False
+        fingerprint = plan.get('input_fingerprint')
+        if fingerprint is None:
+            # Plans cached before fingerprints were introduced are only trusted on the day they were made.
+            return generation_date == date.today().isoformat()
+
+        # Decay makes the diagnostics drift day by day, so even an unchanged plan is eventually rebuilt.
+        max_age_days = self.app_context.config_service.get("plan_cache.max_age_days", 7)
+        if (date.today() - date.fromisoformat(generation_date)).days > max_age_days:
+            return False
+        return fingerprint == self._input_assembler.input_fingerprint(
+            self._main_ctl.active_cycle,
+            self._main_ctl.current_user
+        )
+
+    @staticmethod
+    def _completed_today(plan: dict | None) -> List[int]:
+        """The cycle subjects whose recommended session was completed today, per `plan`."""
+        completed = (plan or {}).get('completed_today') or {}
+        if completed.get('date') != date.today().isoformat():
+            return []
+        return list(completed.get('subject_ids', []))
+
     def _enrich_plan_with_study_times(self, v20_plan: dict):
         """Adds recent study times to the plan for UI display."""
         user_id = self._main_ctl.current_user.id
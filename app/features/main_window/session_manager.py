@@ -5,6 +5,7 @@ from datetime import datetime, timezone
 from PySide6.QtCore import QObject, Signal
 from PySide6.QtWidgets import QMessageBox
 
+from app.core.signals import ChangeKind, DataChange, invalidation_bus
 from app.features.study_session.study_session_controller import StudySessionController
 from app.features.study_session.study_session_widget import StudySessionWidget
 
@@ -51,6 +52,7 @@ class SessionManager(QObject):
                 description="Manually logged session."
             )
             QMessageBox.information(self._main_ctl.view, "Success", "Manual session has been logged.")
+            invalidation_bus.publish(DataChange.of(ChangeKind.SESSIONS, [self._main_ctl.active_cycle.id]))
 
             # 2. Find the correct cycle_subject_id to remove from the plan
             # The plan uses cycle_subject IDs, but the log form gives us master subject IDs.
@@ -63,9 +65,9 @@ class SessionManager(QObject):
                 if matching_subject:
                     target_cycle_subject_id = matching_subject.id
 
-            # 3. Use the new lightweight method to update the plan view
+            # 3. Patch the plan and replan only the studied subject
             if target_cycle_subject_id:
-                self._main_ctl.plan_manager.mark_session_as_completed(target_cycle_subject_id)
+                self._main_ctl.plan_manager.replan_after_session(target_cycle_subject_id)
             else:
                 # Fallback to a full replan if we can't find the specific subject
                 log.warning("Could not find matching cycle subject for manual log. Falling back to full replan.")
@@ -132,6 +134,9 @@ class SessionManager(QObject):
             self.session_controller = None
         self.session_view = None
 
+        invalidation_bus.publish(DataChange.of(ChangeKind.SESSIONS, [self._main_ctl.active_cycle.id],
+                                               [cycle_subject.id]))
+
         # --- Rebalance prompt logic (unchanged) ---
         session_count = self._main_ctl.app_context.session_service.get_completed_session_count(self._main_ctl.active_cycle.id)
         log.debug(f"Cycle has {session_count} completed sessions.")
@@ -142,8 +147,8 @@ class SessionManager(QObject):
         if should_prompt:
             self.rebalance_prompt_requested.emit()
 
-        # --- MODIFIED: Use the new lightweight update instead of a full replan ---
-        self._main_ctl.plan_manager.mark_session_as_completed(cycle_subject.id)
+        # --- Patch the plan, then replan only the studied subject ---
+        self._main_ctl.plan_manager.replan_after_session(cycle_subject.id)
         self._main_ctl.action_factory.new_cycle_action.setEnabled(True)
 
     def is_session_active(self) -> bool:
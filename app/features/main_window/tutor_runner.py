@@ -1,32 +1,73 @@
 # app/features/main_window/tutor_runner.py
 import logging
+from typing import Optional
 
 from PySide6.QtCore import QObject, Signal, QRunnable
 
+from app.core.config_service import ConfigService
+from app.core.tutor_engine.input_assembler import V20InputAssembler
 from app.core.tutor_engine.tutor import Tutor
+from app.models.cycle import Cycle
+from app.models.user import User
 from app.services.interfaces import ICycleSubjectService
 
 log = logging.getLogger(__name__)
 
 
 class TutorRunner(QRunnable):
+    """
+    Assembles the Tutor's inputs, runs it and reads back the subjects and input fingerprint, all
+    off the GUI thread. The finished plan carries them as 'subjects' and 'input_fingerprint'.
+    """
+
     class Signals(QObject):
         finished = Signal(dict)
         error = Signal(str)
 
-    def __init__(self, cycle_config: dict, cycle_subject_service: ICycleSubjectService):
+    def __init__(self, input_assembler: V20InputAssembler, active_cycle: Cycle, current_user: User,
+                 cycle_subject_service: ICycleSubjectService, config_service: ConfigService,
+                 previous_plan: Optional[dict] = None, cycle_subject_id: Optional[int] = None):
         super().__init__()
         self.signals = self.Signals()
-        self.cycle_config = cycle_config
+        self.input_assembler = input_assembler
+        self.active_cycle = active_cycle
+        self.current_user = current_user
         self.cycle_subject_service = cycle_subject_service
+        self.config_service = config_service
+        # With both set, only the given subject is re-diagnosed (see Tutor.replan_subject).
+        self.previous_plan = previous_plan
+        self.cycle_subject_id = cycle_subject_id
 
     def run(self):
         log.debug("TutorRunner started in background thread.")
         try:
-            tutor = Tutor(self.cycle_subject_service)
-            result = tutor.create_study_cycle(self.cycle_config)
+            cycle_config = self.input_assembler.assemble(self.active_cycle, self.current_user,
+                                                         cycle_subject_id=self.cycle_subject_id)
+            tutor = Tutor(self.cycle_subject_service, self.config_service,
+                          vectorized_diagnoser=self.config_service.get("tutor.vectorized_diagnoser", False),
+                          max_workers=self.config_service.get("tutor.max_workers", 0))
+            if self._can_replan_incrementally(cycle_config):
+                result = tutor.replan_subject(cycle_config, self.previous_plan, self.cycle_subject_id)
+            else:
+                result = tutor.create_study_cycle(cycle_config)
+            # Re-fetch the full subject models which include work_units, as the plan only has IDs.
+            result['subjects'] = self.input_assembler.load_subjects(self.active_cycle.id)
+            # Taken after the run, which has already saved the subjects' new strategic states.
+            result['input_fingerprint'] = self.input_assembler.input_fingerprint(self.active_cycle,
+                                                                                 self.current_user)
             self.signals.finished.emit(result)
         except Exception as e:
             log.error("Error running Tutor engine in background", exc_info=True)
             self.signals.error.emit(f"An unexpected error occurred in the planning engine:\n\n{e}")
-        log.debug("TutorRunner finished.")
\ No newline at end of file
+        log.debug("TutorRunner finished.")
+
+    def _can_replan_incrementally(self, cycle_config: dict) -> bool:
+        """An incremental replan needs a previous plan covering every other subject of the cycle."""
+        if self.previous_plan is None or self.cycle_subject_id is None:
+            return False
+        cached_ids = {p.get('subject_id') for p in self.previous_plan.get('processed_subjects', [])}
+        subject_ids = {s.id for s in cycle_config['subjects']}
+        if self.cycle_subject_id not in subject_ids or not (subject_ids - {self.cycle_subject_id}) <= cached_ids:
+            log.info("Cached plan does not cover the cycle's subjects. Falling back to a full replan.")
+            return False
+        return True
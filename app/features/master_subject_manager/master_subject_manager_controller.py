@@ -5,7 +5,7 @@ import logging
 from PySide6.QtWidgets import QMessageBox
 
 from app.common.error_handler import show_error_message
-from app.core.signals import app_signals
+from app.core.signals import ChangeKind, DataChange, invalidation_bus
 from app.services.interfaces import IMasterSubjectService
 from app.models.subject import Subject
 from .master_subject_editor_dialog import MasterSubjectEditorDialog
@@ -33,7 +33,8 @@ class MasterSubjectManagerController:
         self._view.edit_requested.connect(self._on_edit)
         self._view.delete_requested.connect(self._on_delete)
         self._view.back_requested.connect(self._navigator.show_configurations_landing)
-        app_signals.data_changed.connect(self.load_data)
+        invalidation_bus.subscribe(ChangeKind.MASTER_SUBJECTS, lambda change: self.load_data(),
+                                    owner=self._view)
 
     def load_data(self):
         """Loads all master subjects from the service and populates the view."""
@@ -52,7 +53,7 @@ class MasterSubjectManagerController:
                 try:
                     self._service.create(new_name)
                     log.info(f"New master subject '{new_name}' created.")
-                    app_signals.data_changed.emit() # Reload data in all relevant views
+                    invalidation_bus.publish(DataChange.of(ChangeKind.MASTER_SUBJECTS))
                 except Exception as e:
                     show_error_message(self._view, "Error", f"Could not create subject '{new_name}'.", str(e))
 
@@ -65,7 +66,7 @@ class MasterSubjectManagerController:
                 try:
                     self._service.update(subject.id, new_name)
                     log.info(f"Master subject {subject.id} renamed to '{new_name}'.")
-                    app_signals.data_changed.emit()
+                    invalidation_bus.publish(DataChange.of(ChangeKind.MASTER_SUBJECTS))
                 except Exception as e:
                     show_error_message(self._view, "Error", f"Could not update subject '{subject.name}'.", str(e))
 
@@ -85,6 +86,6 @@ class MasterSubjectManagerController:
             try:
                 self._service.delete(subject.id)
                 log.info(f"Master subject '{subject.name}' (ID: {subject.id}) deleted.")
-                app_signals.data_changed.emit()
+                invalidation_bus.publish(DataChange.of(ChangeKind.MASTER_SUBJECTS))
             except Exception as e:
                 show_error_message(self._view, "Error", f"Could not delete subject '{subject.name}'.", str(e))
\ No newline at end of file
@@ -2,11 +2,13 @@
 
 import logging
 from collections import defaultdict
+from typing import Optional
 
 from PySide6.QtCore import QObject, Signal
 from PySide6.QtWidgets import QWidget, QMessageBox
 
 from app.core import business_logic
+from app.core.database import UnitOfWork
 from app.core.topic_parser import parse_edital_topics
 from app.models.exam import Exam
 from app.models.subject import CycleSubject, Subject
@@ -31,7 +33,8 @@ class OnboardingController(QObject):
     def __init__(self, view: OnboardingView, user_id: int, exam_service: IExamService,
                  master_subject_service: IMasterSubjectService, template_subject_service: ITemplateSubjectService,
                  cycle_service: ICycleService, cycle_subject_service: ICycleSubjectService,
-                 study_queue_service: IStudyQueueService, work_unit_service: IWorkUnitService):
+                 study_queue_service: IStudyQueueService, work_unit_service: IWorkUnitService,
+                 unit_of_work: Optional[UnitOfWork] = None):
         super().__init__(None)
         self._view = view
         self.exam_service = exam_service
@@ -46,7 +49,8 @@ class OnboardingController(QObject):
             cycle_service=cycle_service,
             cycle_subject_service=cycle_subject_service,
             master_subject_service=self.master_subject_service,
-            study_queue_service=study_queue_service
+            study_queue_service=study_queue_service,
+            unit_of_work=unit_of_work
         )
 
         # --- State Data ---
@@ -1,8 +1,11 @@
 # app/features/onboarding/onboarding_result_processor.py
 import logging
 from collections import defaultdict
+from contextlib import nullcontext
+from typing import Optional
 
 from app.core.builders import CycleBuilder
+from app.core.database import UnitOfWork
 from app.services.interfaces import (IExamService, IWorkUnitService, ICycleService,
                                      ICycleSubjectService, IMasterSubjectService, IStudyQueueService)
 
@@ -17,7 +20,8 @@ class OnboardingResultProcessor:
 
     def __init__(self, user_id: int, exam_service: IExamService, work_unit_service: IWorkUnitService,
                  cycle_service: ICycleService, cycle_subject_service: ICycleSubjectService,
-                 master_subject_service: IMasterSubjectService, study_queue_service: IStudyQueueService):
+                 master_subject_service: IMasterSubjectService, study_queue_service: IStudyQueueService,
+                 unit_of_work: Optional[UnitOfWork] = None):
         self.user_id = user_id
         self.exam_service = exam_service
         self.work_unit_service = work_unit_service
@@ -25,12 +29,20 @@ class OnboardingResultProcessor:
         self.cycle_subject_service = cycle_subject_service
         self.master_subject_service = master_subject_service
         self.study_queue_service = study_queue_service
+        self.unit_of_work = unit_of_work
 
     def process_and_create(self, final_exam_data: dict, imported_topics: defaultdict,
                            final_subjects_config: list, final_subject_order: list, final_daily_goal: int):
         """
         Executes the creation of the exam, subjects, topics, and cycle.
+        Everything is written in a single unit of work.
         """
+        with self.unit_of_work or nullcontext():
+            self._create_all(final_exam_data, imported_topics, final_subjects_config,
+                             final_subject_order, final_daily_goal)
+
+    def _create_all(self, final_exam_data: dict, imported_topics: defaultdict,
+                    final_subjects_config: list, final_subject_order: list, final_daily_goal: int):
         log.info(f"Creating new exam '{final_exam_data.get('name')}'.")
         new_exam_id = self.exam_service.create(user_id=self.user_id, **final_exam_data)
         if not new_exam_id:
@@ -52,7 +64,8 @@ class OnboardingResultProcessor:
         }
 
         # The builder handles setting the new cycle as active
-        (CycleBuilder(self.cycle_service, self.cycle_subject_service, self.master_subject_service, self.study_queue_service)
+        (CycleBuilder(self.cycle_service, self.cycle_subject_service, self.master_subject_service, self.study_queue_service,
+                      unit_of_work=self.unit_of_work)
          .for_exam(new_exam_id)
          .with_properties(cycle_properties)
          .with_subjects(final_subjects_config)
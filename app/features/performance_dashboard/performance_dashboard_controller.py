@@ -1,12 +1,15 @@
 # app/features/performance_dashboard/performance_dashboard_controller.py
 import logging
 from collections import defaultdict
+from contextlib import nullcontext
 from datetime import datetime
 from typing import Optional
 
 from PySide6.QtCore import QObject
 
 from app.core import analytics_logic
+from app.core.async_services import ServiceExecutor
+from app.core.database import ReadOnlySqliteConnectionFactory
 from app.services.interfaces import IAnalyticsService, WeeklyPerformance
 from .performance_dashboard_view import PerformanceDashboardView
 
@@ -17,12 +20,16 @@ class PerformanceDashboardController(QObject):
     """Controller for the performance dashboard view."""
 
     def __init__(self, view: PerformanceDashboardView, cycle_id: int, daily_goal: int,
-                 analytics_service: IAnalyticsService):
+                 analytics_service: IAnalyticsService, executor: ServiceExecutor,
+                 read_conn_factory: Optional[ReadOnlySqliteConnectionFactory] = None):
         super().__init__(view)
         self._view = view
         self.cycle_id = cycle_id
         self.daily_goal = daily_goal
         self.analytics_service = analytics_service
+        self._executor = executor
+        self._read_conn_factory = read_conn_factory
+        self._load_generation = 0
 
         # State for the current filter
         self.current_period_days: Optional[int] = 30  # Default to 30 days
@@ -30,6 +37,10 @@ class PerformanceDashboardController(QObject):
         self._view.period_changed.connect(self._on_period_changed)
         self._load_dashboard_data()
 
+    def refresh(self):
+        """Reloads the dashboard for the current period."""
+        self._load_dashboard_data()
+
     def _on_period_changed(self, days_ago: Optional[int]):
         """Handles the user selecting a new date range."""
         log.debug(f"Dashboard period changed to: {days_ago} days")
@@ -37,11 +48,22 @@ class PerformanceDashboardController(QObject):
         self._load_dashboard_data()
 
     def _load_dashboard_data(self):
-        """Fetches, calculates, and populates all dashboard data based on the current filter."""
-        # 1. Fetch the core daily data using the current filter
-        daily_data = self.analytics_service.get_daily_performance(self.cycle_id, days_ago=self.current_period_days)
-        # Fetch weekly summary directly from the service
-        weekly_data = self.analytics_service.get_weekly_summary(self.cycle_id, days_ago=self.current_period_days)
+        """
+        Fetches and calculates the dashboard data for the current filter in the background.
+        Only the newest request updates the view.
+        """
+        self._load_generation += 1
+        generation = self._load_generation
+        self._executor.submit(self._fetch_dashboard_data, self.current_period_days, context=self).then(
+            lambda data: self._on_dashboard_data_loaded(generation, *data)
+        )
+
+    def _fetch_dashboard_data(self, days_ago: Optional[int]):
+        """Runs on a worker thread. Returns everything the panels show."""
+        # 1. Fetch the daily and weekly data from one snapshot so the panels agree with each other
+        with self._read_conn_factory.snapshot() if self._read_conn_factory else nullcontext():
+            daily_data = self.analytics_service.get_daily_performance(self.cycle_id, days_ago=days_ago)
+            weekly_data = self.analytics_service.get_weekly_summary(self.cycle_id, days_ago=days_ago)
 
         # 2. Perform business logic calculations on the filtered daily data
         summary_data = self._calculate_overall_summary(daily_data)
@@ -49,7 +71,12 @@ class PerformanceDashboardController(QObject):
         question_counts = [d.questions_done for d in daily_data]
         trend_line_data = analytics_logic.calculate_moving_average(question_counts, window_size=7)
         average_questions = (summary_data['total_questions'] / len(daily_data)) if daily_data else 0
+        return summary_data, streak_data, weekly_data, daily_data, trend_line_data, average_questions
 
+    def _on_dashboard_data_loaded(self, generation: int, summary_data: dict, streak_data: dict, weekly_data,
+                                  daily_data: list, trend_line_data: list, average_questions: float):
+        if generation != self._load_generation:
+            return  # The period changed while this load was running.
         # 3. Populate the view with the newly processed data
         self._view.populate_summary_stats(summary_data)
         self._view.populate_streak_stats(streak_data)
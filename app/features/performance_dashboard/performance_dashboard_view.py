@@ -8,6 +8,7 @@ from PySide6.QtGui import QPainter, QPalette, QColor
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QGroupBox,
                                QFormLayout, QTableWidget, QHeaderView, QTableWidgetItem, QComboBox, QApplication)
 
+from app.common.widgets.downsampled_chart import ChartDownsampler
 from app.core.constants import SPACING_XLARGE
 from app.core.signals import app_signals
 
@@ -59,6 +60,9 @@ class PerformanceDashboardView(QWidget):
         self.chart.setAnimationOptions(QChart.AnimationOption.SeriesAnimations)
         self.chart_view = QChartView(self.chart)
         self.chart_view.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Drag to zoom into a date range, right-click to zoom back out.
+        self.chart_view.setRubberBand(QChartView.RubberBand.HorizontalRubberBand)
+        self.downsampler = ChartDownsampler(self.chart)
 
         content_layout.addLayout(left_pane_layout, 1)
         content_layout.addWidget(self.chart_view, 2)
@@ -138,6 +142,7 @@ class PerformanceDashboardView(QWidget):
             self.weekly_table.setItem(row, 3, QTableWidgetItem(f"{accuracy:.2f}%"))
 
     def populate_chart(self, daily_data: list, trend_data: list, average: float):
+        self.downsampler.clear()
         self.chart.removeAllSeries()
         # Use a more robust way to clear axes that works across Qt versions
         for axis in self.chart.axes():
@@ -166,19 +171,12 @@ class PerformanceDashboardView(QWidget):
         avg_series.setPen(avg_pen)
 
 
-        min_val, max_val = float('inf'), float('-inf')
-
-        for day in daily_data:
-            dt = datetime.strptime(day.date, "%Y-%m-%d")
-            timestamp = dt.timestamp() * 1000
-            daily_series.append(timestamp, day.questions_done)
-            min_val = min(min_val, day.questions_done)
-            max_val = max(max_val, day.questions_done)
-
-        for i, trend_val in enumerate(trend_data):
-            dt = datetime.strptime(daily_data[i].date, "%Y-%m-%d")
-            timestamp = dt.timestamp() * 1000
-            trend_series.append(timestamp, trend_val)
+        timestamps = [datetime.strptime(day.date, "%Y-%m-%d").timestamp() * 1000 for day in daily_data]
+        questions = [day.questions_done for day in daily_data]
+        max_val = max(questions)
+        # The downsampler draws at most about one point per pixel of the plot width.
+        self.downsampler.set_points(daily_series, timestamps, questions)
+        self.downsampler.set_points(trend_series, timestamps[:len(trend_data)], trend_data)
 
         if daily_data:
             start_dt = datetime.strptime(daily_data[0].date, "%Y-%m-%d")
@@ -211,6 +209,7 @@ class PerformanceDashboardView(QWidget):
         trend_series.attachAxis(axis_y)
         avg_series.attachAxis(axis_x)
         avg_series.attachAxis(axis_y)
+        self.downsampler.apply()
 
         # Apply theme colors to all chart elements, including newly created axes
         self._apply_theme_to_chart()
@@ -2,6 +2,7 @@
 
 from PySide6.QtCore import QObject
 
+from app.core.async_services import ServiceExecutor
 from app.services.interfaces import IPerformanceService, IMasterSubjectService
 from .performance_graph_view import PerformanceGraphView
 
@@ -10,23 +11,29 @@ class PerformanceGraphController(QObject):
     """Controller for the performance graphs view."""
 
     def __init__(self, view: PerformanceGraphView, user_id: int,
-                 performance_service: IPerformanceService, master_subject_service: IMasterSubjectService):
+                 performance_service: IPerformanceService, master_subject_service: IMasterSubjectService,
+                 executor: ServiceExecutor):
         super().__init__(view)
         self._view = view
         self.user_id = user_id
         self.performance_service = performance_service
         self.master_subject_service = master_subject_service
+        self._executor = executor
+        self._load_generation = 0
 
         self._view.subject_changed.connect(self._on_subject_selected)
 
         self._populate_initial_data()
 
+    def refresh(self):
+        """Reloads the subject list and the overall chart."""
+        self._populate_initial_data()
+
     def _populate_initial_data(self):
         # --- FIX: Fetch only subjects that have performance data ---
-        subjects_with_data = self.performance_service.get_subjects_with_performance_data(
-            self.user_id
-        )
-        self._view.populate_subject_combo(subjects_with_data)
+        self._executor.wrap(self.performance_service).get_subjects_with_performance_data(
+            self.user_id, context=self
+        ).then(self._view.populate_subject_combo)
 
         # Load overall performance by default
         self._on_subject_selected(-1)
@@ -35,8 +42,16 @@ class PerformanceGraphController(QObject):
         # -1 is the sentinel for "Overall Performance"
         filter_subject_id = subject_id if subject_id != -1 else None
 
-        performance_data = self.performance_service.get_performance_over_time(
+        # The query runs in the background; only the newest selection updates the chart.
+        self._load_generation += 1
+        generation = self._load_generation
+        self._executor.wrap(self.performance_service).get_performance_over_time(
             user_id=self.user_id,
-            subject_id=filter_subject_id
-        )
+            subject_id=filter_subject_id,
+            context=self
+        ).then(lambda performance_data: self._on_chart_data_loaded(generation, performance_data))
+
+    def _on_chart_data_loaded(self, generation: int, performance_data):
+        if generation != self._load_generation:
+            return  # Another subject was selected while this load was running.
         self._view.update_chart(performance_data)
\ No newline at end of file
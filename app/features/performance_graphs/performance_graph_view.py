@@ -8,7 +8,9 @@ from PySide6.QtCore import Signal, Qt, QDateTime
 from PySide6.QtGui import QPainter, QPalette, QColor
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QApplication, QStackedWidget)
 
+from app.common.widgets.downsampled_chart import ChartDownsampler
 from app.common.widgets.empty_state_widget import EmptyStateWidget
+from app.core.analytics_logic import calculate_moving_average
 from app.core.constants import PAGE_MARGINS
 from app.core.signals import app_signals
 
@@ -46,6 +48,9 @@ class PerformanceGraphView(QWidget):
         self.chart.setAnimationOptions(QChart.AnimationOption.SeriesAnimations)
         self.chart_view = QChartView(self.chart)
         self.chart_view.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Drag to zoom into a date range, right-click to zoom back out.
+        self.chart_view.setRubberBand(QChartView.RubberBand.HorizontalRubberBand)
+        self.downsampler = ChartDownsampler(self.chart)
 
         self.empty_widget = EmptyStateWidget(
             icon_name="VIEW_PERFORMANCE",
@@ -89,6 +94,7 @@ class PerformanceGraphView(QWidget):
         self.subject_changed.emit(subject_id)
 
     def update_chart(self, performance_data: list[dict]):
+        self.downsampler.clear()
         self.chart.removeAllSeries()
         for axis in self.chart.axes():
             self.chart.removeAxis(axis)
@@ -119,14 +125,10 @@ class PerformanceGraphView(QWidget):
             accuracy = (item['total_correct'] / item['total_questions']) * 100 if item['total_questions'] > 0 else 0
             accuracies.append(accuracy)
 
-            accuracy_series.append(date_obj.toMSecsSinceEpoch(), accuracy)
-
-        # Calculate 7-day moving average
-        window_size = 7
-        for i in range(len(accuracies)):
-            window = accuracies[max(0, i - window_size + 1):i + 1]
-            avg = sum(window) / len(window)
-            moving_avg_series.append(dates[i].toMSecsSinceEpoch(), avg)
+        # The downsampler draws at most about one point per pixel of the plot width.
+        timestamps = [date_obj.toMSecsSinceEpoch() for date_obj in dates]
+        self.downsampler.set_points(accuracy_series, timestamps, accuracies)
+        self.downsampler.set_points(moving_avg_series, timestamps, calculate_moving_average(accuracies, 7))
 
         self.chart.addSeries(accuracy_series)
         self.chart.addSeries(moving_avg_series)
@@ -150,6 +152,7 @@ class PerformanceGraphView(QWidget):
 
         self.chart.legend().setVisible(True)
         self.chart.legend().setAlignment(Qt.AlignmentFlag.AlignBottom)
+        self.downsampler.apply()
 
         # Apply theme after all elements are created
         self._apply_theme_to_chart()
\ No newline at end of file
@@ -3,7 +3,7 @@
 from PySide6.QtCore import Signal, Qt
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton
 
-from app.core.icon_manager import get_icon
+from app.core.icon_manager import get_icon, get_pixmap
 
 class EmptyWorkUnitsWidget(QWidget):
     """A widget shown when a subject has no work units defined."""
@@ -18,7 +18,7 @@ class EmptyWorkUnitsWidget(QWidget):
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         icon_label = QLabel()
-        icon_label.setPixmap(get_icon("SUBJECTS").pixmap(48, 48))
+        icon_label.setPixmap(get_pixmap("SUBJECTS", 48))
 
         title_label = QLabel("Plan Your Work")
         title_label.setObjectName("blockTitle")
@@ -2,7 +2,7 @@
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QGroupBox, QVBoxLayout, QLabel
 
-from app.core.icon_manager import get_icon
+from app.core.icon_manager import get_pixmap
 
 
 class GettingStartedWidget(QGroupBox):
@@ -20,7 +20,7 @@ class GettingStartedWidget(QGroupBox):
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         icon_label = QLabel()
-        icon_label.setPixmap(get_icon("MAGIC_WAND").pixmap(32, 32))
+        icon_label.setPixmap(get_pixmap("MAGIC_WAND", 32))
 
         info_label = QLabel(
             "This is a new subject in your plan. The tutor's first goal is to establish a baseline of your performance.\n\n"
@@ -5,7 +5,7 @@ import logging
 from PySide6.QtCore import QObject
 from PySide6.QtWidgets import QMessageBox
 
-from app.core.signals import app_signals
+from app.core.signals import ChangeKind, DataChange, invalidation_bus
 from app.models.subject import CycleSubject, WorkUnit
 from app.services.interfaces import (
     ICycleSubjectService,
@@ -143,4 +143,5 @@ class SubjectDetailsController(QObject):
             f"'{self.cycle_subject.name}' has been prioritized. Its difficulty rating is now {new_difficulty}.\n\n"
             "Your plan will be updated to reflect this change.",
         )
-        app_signals.data_changed.emit()
+        invalidation_bus.publish(DataChange.of(ChangeKind.CYCLE_SUBJECTS, [self.cycle_subject.cycle_id],
+                                               [self.cycle_subject.id]))
@@ -1,8 +1,12 @@
 # app/features/subject_summary/subject_summary_controller.py
+from contextlib import nullcontext
+from typing import Optional
 
 from PySide6.QtCore import QObject
 from PySide6.QtWidgets import QWidget
 
+from app.core.async_services import ServiceExecutor
+from app.core.database import ReadOnlySqliteConnectionFactory
 from app.services.interfaces import IPerformanceService, IMasterSubjectService
 from .subject_summary_view import SubjectSummaryView
 
@@ -12,19 +16,45 @@ class SubjectSummaryController(QObject):
 
     def __init__(self, view: SubjectSummaryView, v20_plan_data: dict,
                  performance_service: IPerformanceService, master_subject_service: IMasterSubjectService,
-                 user_id: int, parent: QObject | None = None):
+                 user_id: int, executor: ServiceExecutor,
+                 read_conn_factory: Optional[ReadOnlySqliteConnectionFactory] = None, parent: QObject | None = None):
         super().__init__(parent)
 
         self._view = view
-        processed_subjects = v20_plan_data.get('processed_subjects', [])
+        self._v20_plan_data = v20_plan_data
+        self._performance_service = performance_service
+        self._master_subject_service = master_subject_service
+        self._user_id = user_id
+        self._read_conn_factory = read_conn_factory
 
-        # --- Populate Summary Tab ---
-        total_time_map = performance_service.get_study_time_summary(user_id, days_ago=9999)
-        weekly_time_map = performance_service.get_study_time_summary(user_id, days_ago=7)
-        total_sessions_map = performance_service.get_study_session_summary(user_id, days_ago=None)
-        weekly_sessions_map = performance_service.get_study_session_summary(user_id, days_ago=7)
+        executor.submit(self._fetch_summary_maps, context=self).then(self._populate_summary)
+        executor.submit(self._fetch_subject_explorer_data, context=self).then(self._view.populate_subject_explorer)
 
-        full_subject_models = v20_plan_data.get('subjects', [])
+    def _fetch_summary_maps(self):
+        """Runs on a worker thread. All four summaries read the same database snapshot."""
+        performance_service, user_id = self._performance_service, self._user_id
+        with self._read_conn_factory.snapshot() if self._read_conn_factory else nullcontext():
+            return (performance_service.get_study_time_summary(user_id, days_ago=9999),
+                    performance_service.get_study_time_summary(user_id, days_ago=7),
+                    performance_service.get_study_session_summary(user_id, days_ago=None),
+                    performance_service.get_study_session_summary(user_id, days_ago=7))
+
+    def _fetch_subject_explorer_data(self) -> list:
+        """Runs on a worker thread."""
+        subjects_data = []
+        for subject in self._master_subject_service.get_all_master_subjects():
+            topics = self._master_subject_service.get_topics_for_subject(subject.id)
+            subjects_data.append({
+                'name': subject.name,
+                'topics': [{'name': topic.name} for topic in topics]
+            })
+        return subjects_data
+
+    def _populate_summary(self, summary_maps: tuple):
+        total_time_map, weekly_time_map, total_sessions_map, weekly_sessions_map = summary_maps
+        processed_subjects = self._v20_plan_data.get('processed_subjects', [])
+
+        full_subject_models = self._v20_plan_data.get('subjects', [])
         cycle_to_master_id_map = {cs.id: cs.subject_id for cs in full_subject_models}
 
         for subject_data in processed_subjects:
@@ -44,16 +74,5 @@ class SubjectSummaryController(QObject):
 
         self._view.populate_summary(processed_subjects)
 
-        # --- Populate Subject Explorer Tab ---
-        subjects = master_subject_service.get_all_master_subjects()
-        subjects_data = []
-        for subject in subjects:
-            topics = master_subject_service.get_topics_for_subject(subject.id)
-            subjects_data.append({
-                'name': subject.name,
-                'topics': [{'name': topic.name} for topic in topics]
-            })
-        self._view.populate_subject_explorer(subjects_data)
-
     def get_view(self) -> QWidget:
         return self._view
\ No newline at end of file
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Cycle:
     """Represents a single Study Cycle, including its scheduling rules."""
     id: int
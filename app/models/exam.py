@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Exam:
     """Represents a specific exam goal (a 'exam')."""
     id: int
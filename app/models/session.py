@@ -1,10 +1,11 @@
 # app/models/session.py
 
+from array import array
 from dataclasses import dataclass, field
 from typing import Optional, List
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SubjectPerformance:
     """Aggregated performance statistics for a subject."""
     # Field names updated to snake_case
@@ -18,7 +19,7 @@ class SubjectPerformance:
         return (self.total_correct / self.total_questions) * 100
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StudyActivity:
     """Represents a single, atomic activity within a study session (T, P, or R)."""
     id: int
@@ -39,7 +40,7 @@ class StudyActivity:
         return (correct / self.questions_done) * 100
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QuestionPerformance:
     """Represents a single question answered during a session, as per v20 spec."""
     id: int  # DB primary key
@@ -49,7 +50,7 @@ class QuestionPerformance:
     is_correct: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StudySession:
     """Represents a complete study session from start to finish."""
     id: int
@@ -70,10 +71,29 @@ class StudySession:
     deleted_at: Optional[str] = None
     subject_name: Optional[str] = None
     user_feedback_effectiveness: Optional[int] = None  # 1-5, as per v20 spec
+    start_epoch: Optional[int] = None  # UTC unix time of start_time
+    local_date: Optional[str] = None  # YYYY-MM-DD of start_time in local time
     questions: List[QuestionPerformance] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class HistoryRow:
+    """A finished session as the history table shows it, with its question totals and accuracy (0-100)."""
+    id: int
+    subject_name: str
+    start_time: str
+    start_epoch: int  # UTC unix time of start_time; what the history is ordered by
+    duration_sec: int
+    questions_done: int
+    questions_correct: int
+    accuracy: float
+
+    def keyset(self, sort_column: str) -> tuple:
+        """The `after` cursor that resumes ISessionService.get_history_rows after this row."""
+        return (self.start_epoch if sort_column == "start_time" else getattr(self, sort_column)), self.id
+
+
+@dataclass(slots=True, frozen=True)
 class ReviewTask:
     """Represents a scheduled spaced repetition review."""
     id: int
@@ -83,3 +103,38 @@ class ReviewTask:
     review_type_id: int
     status_id: int
     completed_date: Optional[str]
+
+
+@dataclass(slots=True)
+class StudyHistoryColumns:
+    """
+    A cycle's study history stored column-wise in compact `array` buffers instead of
+    one StudySession (plus a QuestionPerformance per answer) per row.
+
+    Session columns hold one entry per session and question columns one entry per
+    answered question; `question_session_row` points each question at its session row.
+    Topic and study-method names are interned: the code columns index into
+    `topic_names` / `method_names`, and a method code of -1 means no rated method.
+    `start_day` is the proleptic ordinal (date.toordinal) of the calendar date written in
+    start_time, or NaN when it cannot be parsed.
+    """
+    session_id: array = field(default_factory=lambda: array("q"))
+    subject_id: array = field(default_factory=lambda: array("q"))
+    start_epoch: array = field(default_factory=lambda: array("q"))
+    start_day: array = field(default_factory=lambda: array("d"))
+    liquid_sec: array = field(default_factory=lambda: array("q"))
+    method_code: array = field(default_factory=lambda: array("i"))
+    feedback: array = field(default_factory=lambda: array("b"))
+    question_session_row: array = field(default_factory=lambda: array("i"))
+    question_correct: array = field(default_factory=lambda: array("b"))
+    question_difficulty: array = field(default_factory=lambda: array("b"))
+    question_topic: array = field(default_factory=lambda: array("i"))
+    topic_names: List[str] = field(default_factory=list)
+    method_names: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.session_id)
+
+    @property
+    def question_count(self) -> int:
+        return len(self.question_correct)
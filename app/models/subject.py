@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Optional, List
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Subject:
     """Represents a global, master subject."""
     id: int
@@ -17,7 +17,7 @@ class Subject:
     deleted_at: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Topic:
     """Represents a specific topic within a parent Subject."""
     id: int
@@ -30,7 +30,7 @@ class Topic:
     deleted_at: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkUnit:
     """
     Represents a discrete, plannable task within a subject, as per v20 spec.
@@ -60,7 +60,7 @@ class WorkUnit:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CycleSubject:
     """Represents a Subject in the context of a specific StudyCycle."""
     id: int
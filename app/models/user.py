@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class User:
     """Represents a user profile in the application."""
     id: int
@@ -16,7 +16,7 @@ class User:
     created_at: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HumanFactor:
     """Represents the user's self-reported state for a given day, as per v20 spec."""
     id: int  # DB primary key
@@ -1,56 +1,185 @@
 # app/navigation_service.py
 
 import logging
-from typing import Callable, Dict, Any
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Any, Hashable, Optional, Tuple
 
+from PySide6.QtCore import QObject, QAbstractItemModel
 from PySide6.QtWidgets import QWidget
 
+from app.core.signals import ChangeKind, InvalidationBus, invalidation_bus
+
 log = logging.getLogger(__name__)
 
+# Rough per-object and per-model-cell costs used to estimate what a cached view keeps in memory.
+_OBJECT_BYTES = 2 * 1024
+_CELL_BYTES = 256
+
+
+@dataclass
+class _ViewRegistration:
+    provider: Callable[..., QWidget]
+    # Returns the cache key for a set of provider arguments; None means the view is never cached.
+    cache_key: Optional[Callable[..., Hashable]]
+    depends_on: ChangeKind
+
+
+@dataclass(eq=False)
+class _CachedView:
+    view_name: str
+    widget: QWidget
+    estimated_bytes: int
+    stale: bool = False
+    visible: bool = False
+
 
-class NavigationService:
+def _estimate_bytes(widget: QWidget) -> int:
+    """A rough estimate of the memory a view holds: its QObjects plus the cells of its item models."""
+    cells = sum(model.rowCount() * model.columnCount() for model in widget.findChildren(QAbstractItemModel))
+    return len(widget.findChildren(QObject)) * _OBJECT_BYTES + cells * _CELL_BYTES
+
+
+class NavigationService(QObject):
     """
     A central registry for view providers.
     This service allows features to register themselves for navigation without
     a central factory knowing about all of them.
+
+    Views registered with a cache key are kept after they are hidden and reused on the next
+    visit. A cached view goes stale when one of the kinds of data it depends on changes; it
+    is refreshed through its controller's `refresh()` when it is (or next becomes) visible.
+    The least recently shown hidden views are evicted once the cache holds more than
+    `max_views` views or more than `memory_budget_bytes` by estimate.
     """
 
-    def __init__(self):
-        self._providers: Dict[str, Callable[..., QWidget]] = {}
+    def __init__(self, max_views: int = 6, memory_budget_bytes: int = 32 * 1024 * 1024,
+                 bus: InvalidationBus = invalidation_bus):
+        super().__init__()
+        self._providers: Dict[str, _ViewRegistration] = {}
+        self._cache: "OrderedDict[Tuple[str, Hashable], _CachedView]" = OrderedDict()
+        self._max_views = max_views
+        self._memory_budget_bytes = memory_budget_bytes
+        self._bus = bus
         log.debug("NavigationService initialized.")
 
-    def register(self, view_name: str, provider_func: Callable[..., QWidget]):
+    def register(self, view_name: str, provider_func: Callable[..., QWidget],
+                 cache_key: Optional[Callable[..., Hashable]] = None,
+                 depends_on: ChangeKind = ChangeKind(0)):
         """
         Registers a provider function for a given view name.
 
         Args:
             view_name: The name/route to register (e.g., "configurations_landing").
             provider_func: A function (often a lambda) that creates and returns the view widget.
+            cache_key: Makes the view cacheable. Called with the provider's arguments; views
+                are reused only for an equal key (e.g. the active cycle id).
+            depends_on: The kinds of data changes that make a cached view stale.
         """
         if view_name in self._providers:
             log.warning(f"View provider for '{view_name}' is being overwritten.")
-        self._providers[view_name] = provider_func
+        self._providers[view_name] = _ViewRegistration(provider_func, cache_key, depends_on)
+        if cache_key is not None and depends_on:
+            self._bus.subscribe(depends_on, lambda change: self.invalidate(view_name), owner=self)
         log.debug(f"Registered view provider for '{view_name}'.")
 
     def get_view(self, view_name: str, **kwargs: Any) -> QWidget | None:
         """
-        Gets a view widget by calling its registered provider.
+        Gets a view widget, reusing a cached one when possible, or by calling its registered provider.
 
         Args:
             view_name: The name/route of the view to create.
             **kwargs: Arguments to pass to the provider function.
 
         Returns:
-            The created QWidget, or None if no provider is registered.
+            The QWidget, or None if no provider is registered.
         """
-        provider = self._providers.get(view_name)
-        if provider:
-            log.info(f"Creating view for '{view_name}' using its provider.")
-            try:
-                return provider(**kwargs)
-            except Exception:
-                log.critical(f"Error creating view for '{view_name}'", exc_info=True)
-                return None
-        else:
+        registration = self._providers.get(view_name)
+        if not registration:
             log.error(f"No view provider found for '{view_name}'.")
             return None
+
+        key = None
+        if registration.cache_key is not None:
+            key = (view_name, registration.cache_key(**kwargs))
+            entry = self._cache.get(key)
+            if entry and (not entry.stale or self._refresher(entry.widget)):
+                log.debug(f"Reusing cached view for '{view_name}'.")
+                self._cache.move_to_end(key)
+                return entry.widget
+            if entry:
+                self._evict(key)  # Stale and cannot refresh itself; build a new one.
+
+        log.info(f"Creating view for '{view_name}' using its provider.")
+        try:
+            widget = registration.provider(**kwargs)
+        except Exception:
+            log.critical(f"Error creating view for '{view_name}'", exc_info=True)
+            return None
+        if key is not None and isinstance(widget, QWidget):
+            self._cache[key] = _CachedView(view_name, widget, _estimate_bytes(widget))
+            self._enforce_limits()
+        return widget
+
+    def is_cached(self, widget: QWidget) -> bool:
+        return self._entry_for(widget) is not None
+
+    def on_show(self, widget: QWidget):
+        """Called when `widget` becomes the main pane. Refreshes it if its data changed while hidden."""
+        entry = self._entry_for(widget)
+        if entry:
+            entry.visible = True
+            if entry.stale:
+                self._refresh(entry)
+
+    def on_hide(self, widget: QWidget):
+        """Called when `widget` stops being the main pane. Evicts views if the cache is over its limits."""
+        entry = self._entry_for(widget)
+        if entry:
+            entry.visible = False
+            entry.estimated_bytes = _estimate_bytes(widget)
+            self._enforce_limits()
+
+    def invalidate(self, view_name: Optional[str] = None):
+        """Marks the cached views of `view_name` (or all of them) stale; a visible one is refreshed now."""
+        for entry in list(self._cache.values()):
+            if view_name is None or entry.view_name == view_name:
+                entry.stale = True
+                if entry.visible:
+                    self._refresh(entry)
+
+    def cached_view_count(self) -> int:
+        return len(self._cache)
+
+    def cached_bytes(self) -> int:
+        return sum(entry.estimated_bytes for entry in self._cache.values())
+
+    def _entry_for(self, widget: QWidget) -> Optional[_CachedView]:
+        return next((entry for entry in self._cache.values() if entry.widget is widget), None)
+
+    @staticmethod
+    def _refresher(widget: QWidget) -> Optional[Callable[[], None]]:
+        controller = widget.property("controller")
+        return getattr(controller, "refresh", None)
+
+    def _refresh(self, entry: _CachedView):
+        refresh = self._refresher(entry.widget)
+        if refresh:
+            log.debug(f"Refreshing cached view '{entry.view_name}'.")
+            entry.stale = False
+            refresh()
+
+    def _enforce_limits(self):
+        while len(self._cache) > self._max_views or self.cached_bytes() > self._memory_budget_bytes:
+            # The most recently requested view is about to be shown; never evict it or a visible one.
+            candidates = list(self._cache.items())[:-1]
+            key = next((k for k, entry in candidates if not entry.visible), None)
+            if key is None:
+                return
+            self._evict(key)
+
+    def _evict(self, key: Tuple[str, Hashable]):
+        entry = self._cache.pop(key)
+        log.debug(f"Evicting cached view '{entry.view_name}'.")
+        if not entry.visible:
+            entry.widget.deleteLater()
@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 from typing import List, Optional
 
 from app.core.database import IDatabaseConnectionFactory
+from app.core.time_utils import local_date_cutoff
 from app.models.cycle import Cycle
 from app.services import BaseService
 from app.services.interfaces import (
@@ -25,21 +26,21 @@ class SqliteAnalyticsService(BaseService, IAnalyticsService):
         self, cycle_id: int, days_ago: Optional[int] = None
     ) -> List[DailyPerformance]:
         """Gets the total questions and correct answers grouped by day, with an optional date range."""
+        # Reads the daily_subject_stats rollup, so the cost follows the number of days, not questions.
         query = """
             SELECT
-                DATE(SS.start_time) as session_date,
-                SUM(QP.is_correct) as total_correct,
-                COUNT(QP.id) as total_questions
-            FROM question_performance AS QP
-            JOIN study_sessions AS SS ON QP.session_id = SS.id
-            WHERE SS.cycle_id = :cycle_id
+                local_date as session_date,
+                SUM(correct) as total_correct,
+                SUM(questions) as total_questions
+            FROM daily_subject_stats
+            WHERE cycle_id = :cycle_id
         """
         params = {"cycle_id": cycle_id}
 
         if days_ago is not None:
-            query += " AND DATE(SS.start_time) >= date('now', '-' || :days_ago || ' days')"
-            params["days_ago"] = days_ago
-        query += " GROUP BY session_date ORDER BY session_date ASC;"
+            query += " AND local_date >= :since_date"
+            params["since_date"] = local_date_cutoff(days_ago)
+        query += " GROUP BY session_date HAVING SUM(questions) > 0 ORDER BY session_date ASC;"
         rows = self._execute_query(query, params).fetchall()
 
         return [
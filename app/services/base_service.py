@@ -1,9 +1,13 @@
+import sys
+import time
 from typing import List, Optional, Type, TypeVar, Union
 import sqlite3 # Import sqlite3 to check connection type
 from sqlalchemy import Connection # Import Connection to check type
 from sqlalchemy.sql import text # Import text to wrap query
 
 from app.core.database import IDatabaseConnectionFactory
+from app.core.row_mapping import model_row_factory, tuple_mapper
+from app.core.query_instrumentation import InstrumentedCursor, query_instrumentation
 
 T = TypeVar("T")  # Generic type for our models
 
@@ -16,9 +20,26 @@ class BaseService:
         return model(**dict(row)) if row else None
 
     def _map_rows_to_model_list(self, rows, model: Type[T]) -> List[T]:
+        if rows and isinstance(rows[0], sqlite3.Row):
+            build = tuple_mapper(model, rows[0].keys())
+            return [build(row) for row in rows]
         return [model(**dict(row)) for row in rows]
 
+    def _fetch_models(self, query: str, params: Union[tuple, dict], model: Type[T]) -> List[T]:
+        """
+        Runs a SELECT and returns every row as `model`. On a plain sqlite3 cursor the
+        rows are built by a row_factory straight from the raw tuples, skipping the
+        sqlite3.Row and dict that _map_rows_to_model_list goes through.
+        """
+        result = self._execute_query(query, params)
+        if isinstance(result, sqlite3.Cursor):
+            result.row_factory = model_row_factory(model, result.description)
+            return result.fetchall()
+        return self._map_rows_to_model_list(result.fetchall(), model)
+
     def _execute_query(self, query: str, params: Union[tuple, dict] = ()):
+        if query_instrumentation.enabled:
+            return self._run_instrumented(query, params, many=False)
         with self._conn_factory.get_connection() as conn:
             # Check if the connection is a SQLAlchemy Connection
             if isinstance(conn, Connection):
@@ -27,9 +48,39 @@ class BaseService:
                 return conn.execute(query, params)
 
     def _executemany_query(self, query: str, params: List[tuple]):
+        if query_instrumentation.enabled:
+            return self._run_instrumented(query, params, many=True)
         with self._conn_factory.get_connection() as conn:
             # Check if the connection is a SQLAlchemy Connection
             if isinstance(conn, Connection):
                 return conn.executemany(text(query), params).mappings()
             else:
                 return conn.executemany(query, params)
+
+    def _run_instrumented(self, query: str, params, many: bool):
+        """Executes a statement while timing it and attributing it to the calling service method."""
+        # Skip the BaseService helpers (_execute_query, _fetch_models, ...) to reach the service method.
+        frame = sys._getframe(1)
+        while frame.f_back is not None and frame.f_code in _BASE_SERVICE_CODE:
+            frame = frame.f_back
+        caller = f"{type(self).__name__}.{frame.f_code.co_name}"
+        start = time.perf_counter()
+        with self._conn_factory.get_connection() as conn:
+            if isinstance(conn, Connection):
+                execute = conn.executemany if many else conn.execute
+                result = execute(text(query), params).mappings()
+                rows = 0
+            else:
+                cursor = conn.executemany(query, params) if many else conn.execute(query, params)
+                fetched = cursor.fetchall() if cursor.description is not None else []
+                rows = len(fetched)
+                result = InstrumentedCursor(cursor, fetched)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        query_instrumentation.record(caller, query, elapsed_ms, rows)
+        return result
+
+
+# The code objects of BaseService's own methods, which _run_instrumented looks past.
+_BASE_SERVICE_CODE = frozenset(
+    member.__code__ for member in vars(BaseService).values() if hasattr(member, "__code__")
+)
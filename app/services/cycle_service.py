@@ -1,9 +1,11 @@
 # app/services/cycle_service.py
 import json
 import logging
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from app.core.database import IDatabaseConnectionFactory
+from app.core.plan_codec import (HEADER_SECTION, PLAN_CODEC_VERSION, decode_section, encode_section,
+                                 join_sections, sections_for_keys, split_plan)
 from app.models.cycle import Cycle
 from app.services import BaseService
 from app.services.interfaces import ICycleService
@@ -102,43 +104,99 @@ class SqliteCycleService(BaseService, ICycleService):
         pass
 
     def save_plan_cache(self, cycle_id: int, plan_data: dict):
-        """Saves a JSON snapshot of the plan to the database."""
+        """
+        Replaces the cycle's cached plan. Each section is serialized once and compressed
+        (see app/core/plan_codec.py). The sections are upserted, the ones the new plan lacks are
+        deleted and the legacy JSON column is cleared in one transaction, so a reader never sees
+        the new header with stale sections and a failed save leaves the previous plan intact.
+        """
         try:
-            # Create a deep copy to avoid modifying the original plan_data object
-            serializable_plan_data = json.loads(
-                json.dumps(
-                    plan_data,
-                    default=lambda o: o.to_dict() if hasattr(o, "to_dict") else o,
+            sections = split_plan(plan_data)
+            with self._conn_factory.get_connection() as conn:
+                self._write_plan_sections(conn, cycle_id, sections)
+                conn.execute(
+                    f"DELETE FROM plan_cache_sections WHERE cycle_id = ? AND section NOT IN ({', '.join('?' * len(sections))})",
+                    (cycle_id, *sections),
+                )
+                # Superseded by the sections; left in place it would still be loaded with every Cycle.
+                conn.execute(
+                    "UPDATE study_cycles SET plan_cache_json = NULL WHERE id = ? AND plan_cache_json IS NOT NULL",
+                    (cycle_id,),
                 )
-            )
-
-            plan_json = json.dumps(serializable_plan_data)
-            self._execute_query(
-                "UPDATE study_cycles SET plan_cache_json = ? WHERE id = ?",
-                (plan_json, cycle_id),
-            )
             log.debug(f"Saved plan cache for cycle_id {cycle_id}.")
         except Exception as e:
             log.error(f"Failed to save plan cache for cycle {cycle_id}", exc_info=True)
             # The _execute_query method handles commit/rollback, so we just log the error.
-        finally:
-            pass
 
-    def get_plan_cache(self, cycle_id: int) -> Optional[dict]:
-        """Retrieves the JSON plan snapshot from the database."""
+    def update_plan_cache(self, cycle_id: int, plan_updates: dict):
+        """
+        Overwrites some top-level keys of the cached plan, re-encoding only the sections they
+        live in. Does nothing if the cycle has no cached plan.
+        """
+        try:
+            stored = self._load_plan_sections(cycle_id, set())
+            if stored is None:
+                # At most a legacy JSON plan exists; saving it whole moves it into sections.
+                plan = self.get_plan_cache(cycle_id)
+                if plan is not None:
+                    self.save_plan_cache(cycle_id, {**plan, **plan_updates})
+                return
+
+            sections = split_plan(plan_updates)
+            if sections[HEADER_SECTION]:
+                sections[HEADER_SECTION] = {**stored[HEADER_SECTION], **sections[HEADER_SECTION]}
+            else:
+                del sections[HEADER_SECTION]
+            with self._conn_factory.get_connection() as conn:
+                self._write_plan_sections(conn, cycle_id, sections)
+            log.debug(f"Updated plan cache sections {sorted(sections)} for cycle_id {cycle_id}.")
+        except Exception as e:
+            log.error(f"Failed to update plan cache for cycle {cycle_id}", exc_info=True)
+
+    def get_plan_cache(self, cycle_id: int, keys: Optional[Iterable[str]] = None) -> Optional[dict]:
+        """
+        Retrieves the cached plan. With `keys`, only the sections holding those top-level keys
+        (plus the small header) are fetched and decoded, so the result may lack other keys.
+        """
         try:
+            sections = self._load_plan_sections(cycle_id, None if keys is None else sections_for_keys(keys))
+            if sections is not None:
+                log.debug(f"Retrieved plan cache for cycle_id {cycle_id}.")
+                return join_sections(sections)
+
             row = self._execute_query(
                 "SELECT plan_cache_json FROM study_cycles WHERE id = ?", (cycle_id,)
             ).fetchone()
-
             if row and row["plan_cache_json"]:
-                log.debug(f"Retrieved plan cache for cycle_id {cycle_id}.")
+                log.debug(f"Retrieved legacy JSON plan cache for cycle_id {cycle_id}.")
                 return json.loads(row["plan_cache_json"])
         except Exception as e:
             log.error(
                 f"Failed to retrieve or parse plan cache for cycle {cycle_id}",
                 exc_info=True,
             )
-        finally:
-            pass
         return None
+
+    def _write_plan_sections(self, conn, cycle_id: int, sections: Dict[str, Any]):
+        conn.executemany(
+            "INSERT INTO plan_cache_sections (cycle_id, section, codec, data) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(cycle_id, section) DO UPDATE SET codec = excluded.codec, data = excluded.data",
+            [(cycle_id, section, PLAN_CODEC_VERSION, encode_section(value)) for section, value in sections.items()],
+        )
+
+    def _load_plan_sections(self, cycle_id: int, sections: Optional[set]) -> Optional[Dict[str, Any]]:
+        """
+        Decodes the requested sections (all when None) of the cycle's cached plan. Returns None
+        when there is no header in the current codec, i.e. no sectioned plan to read.
+        """
+        query = "SELECT section, codec, data FROM plan_cache_sections WHERE cycle_id = ?"
+        params: tuple = (cycle_id,)
+        if sections is not None:
+            sections = sections | {HEADER_SECTION}
+            query += f" AND section IN ({', '.join('?' * len(sections))})"
+            params += tuple(sorted(sections))
+        rows = self._execute_query(query, params).fetchall()
+        decoded = {row["section"]: decode_section(row["data"]) for row in rows if row["codec"] == PLAN_CODEC_VERSION}
+        if HEADER_SECTION not in decoded:
+            return None
+        return decoded
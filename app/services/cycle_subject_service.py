@@ -1,7 +1,7 @@
 # app/services/cycle_subject_service.py
 import json
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from app.core.database import IDatabaseConnectionFactory
 from app.models.subject import CycleSubject
@@ -128,3 +128,17 @@ class SqliteCycleSubjectService(BaseService, ICycleSubjectService):
             "UPDATE cycle_subjects SET current_strategic_state = ?, state_hysteresis_data = ? WHERE id = ?",
             (state, hysteresis_data_str, cycle_subject_id),
         )
+
+    def get_diagnoser_states(self, cycle_id: int) -> Dict[int, dict]:
+        rows = self._execute_query(
+            "SELECT DC.cycle_subject_id, DC.state_json FROM diagnoser_checkpoints AS DC JOIN cycle_subjects AS CS ON DC.cycle_subject_id = CS.id WHERE CS.cycle_id = ?",
+            (cycle_id,),
+        ).fetchall()
+        return {row["cycle_subject_id"]: json.loads(row["state_json"]) for row in rows}
+
+    def save_diagnoser_state(self, cycle_subject_id: int, state: dict):
+        self._execute_query(
+            "INSERT INTO diagnoser_checkpoints (cycle_subject_id, state_json) VALUES (?, ?) "
+            "ON CONFLICT(cycle_subject_id) DO UPDATE SET state_json = excluded.state_json, updated_at = CURRENT_TIMESTAMP",
+            (cycle_subject_id, json.dumps(state)),
+        )
@@ -1,10 +1,11 @@
 # app/services/interfaces.py
 from dataclasses import dataclass
-from typing import List, Optional, Protocol
+from typing import Dict, Iterable, Iterator, List, Optional, Protocol, Tuple
 
 from app.models.cycle import Cycle
 from app.models.exam import Exam
-from app.models.session import QuestionPerformance, StudySession, SubjectPerformance
+from app.models.session import (HistoryRow, QuestionPerformance, StudyHistoryColumns, StudySession,
+                                SubjectPerformance)
 from app.models.subject import CycleSubject, Subject, Topic, WorkUnit
 from app.models.user import HumanFactor, User
 
@@ -67,6 +68,12 @@ class ICycleSubjectService(Protocol):
         self, cycle_subject_id: int, state: str, hysteresis_data: dict
     ): ...
 
+    def get_diagnoser_states(self, cycle_id: int) -> Dict[int, dict]:
+        """Returns the persisted Diagnoser checkpoints of a cycle, keyed by cycle_subject id."""
+        ...
+
+    def save_diagnoser_state(self, cycle_subject_id: int, state: dict): ...
+
 
 class IStudyQueueService(Protocol):
     """Manages the creation and retrieval of the study queue for a cycle."""
@@ -142,7 +149,13 @@ class ICycleService(Protocol):
 
     def save_plan_cache(self, cycle_id: int, plan_data: dict): ...
 
-    def get_plan_cache(self, cycle_id: int) -> Optional[dict]: ...
+    def update_plan_cache(self, cycle_id: int, plan_updates: dict):
+        """Overwrites some top-level keys of the cached plan, rewriting only the sections they live in."""
+        ...
+
+    def get_plan_cache(self, cycle_id: int, keys: Optional[Iterable[str]] = None) -> Optional[dict]:
+        """The cached plan; with `keys`, only those top-level keys (and the small header) are decoded."""
+        ...
 
 
 class ISessionService(Protocol):
@@ -189,10 +202,32 @@ class ISessionService(Protocol):
         perf_data: dict,
     ): ...
 
-    def get_history_for_cycle(self, cycle_id: int) -> List[StudySession]: ...
+    def get_history_for_cycle(self, cycle_id: int, subject_id: Optional[int] = None) -> List[StudySession]: ...
+
+    def get_history_page(
+        self, cycle_id: int, page_size: int = 200, after: Optional[Tuple[int, int]] = None
+    ) -> List[HistoryRow]: ...
+
+    def iter_history_for_cycle(self, cycle_id: int, page_size: int = 200) -> Iterator[HistoryRow]: ...
+
+    def get_history_rows(
+        self, cycle_id: int, sort_column: str = "start_time", descending: bool = True, subject_filter: str = "",
+        page_size: int = 200, after: Optional[Tuple[object, int]] = None
+    ) -> List[HistoryRow]: ...
+
+    def get_daily_breakdown(self, cycle_id: int) -> List[Tuple[str, str, int]]: ...
+
+    def get_history_watermark(self, cycle_id: int) -> tuple: ...
+
+    def get_history_columns_for_cycle(self, cycle_id: int, chunk_size: int = 4096,
+                                      subject_id: Optional[int] = None) -> StudyHistoryColumns: ...
 
     def get_completed_session_count(self, cycle_id: int) -> int: ...
 
+    def rebuild_daily_stats(self) -> None:
+        """Recomputes the daily_subject_stats rollup from the raw session and question rows."""
+        ...
+
 
 class IPerformanceService(Protocol):
     """Defines the contract for performance data aggregation."""
@@ -5,6 +5,7 @@ from typing import List, Dict
 import textwrap
 
 from app.core.database import IDatabaseConnectionFactory
+from app.core.time_utils import local_date_cutoff
 from app.models.session import SubjectPerformance
 from app.services import BaseService
 from app.services.interfaces import IPerformanceService
@@ -53,7 +54,7 @@ class SqlitePerformanceService(BaseService, IPerformanceService):
         log.debug(f"Getting performance over time for user_id: {user_id}, subject_id: {subject_id}")
         query_parts = [
             """
-            SELECT strftime('%Y-%m-%d', SS.start_time) as date,
+            SELECT SS.local_date                        as date,
                    COUNT(QP.id)                        as total_questions,
                    SUM(QP.is_correct)                  as total_correct
             FROM question_performance AS QP
@@ -85,8 +86,9 @@ class SqlitePerformanceService(BaseService, IPerformanceService):
             FROM subjects AS S
             JOIN study_sessions AS SS ON S.id = SS.subject_id
             WHERE SS.user_id = ?
-              -- This subquery ensures we only list subjects that actually have questions logged
-              AND SS.id IN (SELECT DISTINCT session_id FROM question_performance)
+              -- This subquery ensures we only list subjects that actually have questions logged.
+              -- EXISTS probes the session_id index instead of scanning every logged question.
+              AND EXISTS (SELECT 1 FROM question_performance AS QP WHERE QP.session_id = SS.id)
             ORDER BY S.name ASC;
         """)
         rows = self._execute_query(query, (user_id,)).fetchall()
@@ -107,8 +109,8 @@ class SqlitePerformanceService(BaseService, IPerformanceService):
         params = [user_id, subject_id]
 
         if days_ago is not None:
-            query_parts.append(" AND date(SS.start_time) >= date('now', '-' || ? || ' days')")
-            params.append(days_ago)
+            query_parts.append(" AND SS.local_date >= ?")
+            params.append(local_date_cutoff(days_ago))
 
         query_parts.append(" GROUP BY QP.topic_name ORDER BY total_correct * 1.0 / total_questions ASC;")
         
@@ -147,15 +149,15 @@ class SqlitePerformanceService(BaseService, IPerformanceService):
             textwrap.dedent("""
             SELECT
                 subject_id,
-                SUM(liquid_duration_sec) as total_seconds
-            FROM study_sessions
+                SUM(seconds) as total_seconds
+            FROM daily_subject_stats
             WHERE
                 user_id = ? AND
-                end_time IS NOT NULL AND
-                date(start_time) >= date('now', '-' || ? || ' days')
-            GROUP BY subject_id;
+                local_date >= ?
+            GROUP BY subject_id
+            HAVING SUM(sessions) > 0;
             """),
-            (user_id, days_ago)
+            (user_id, local_date_cutoff(days_ago))
         ).fetchall()
 
         return {row['subject_id']: row['total_seconds'] for row in rows}
@@ -166,19 +168,18 @@ class SqlitePerformanceService(BaseService, IPerformanceService):
             """
             SELECT
                 subject_id,
-                COUNT(id) as session_count
-            FROM study_sessions
+                SUM(sessions) as session_count
+            FROM daily_subject_stats
             WHERE
-                user_id = ? AND
-                end_time IS NOT NULL"""
+                user_id = ?"""
         ]
         params = [user_id]
 
         if days_ago is not None:
-            query_parts.append(" AND date(start_time) >= date('now', '-' || ? || ' days')")
-            params.append(days_ago)
+            query_parts.append(" AND local_date >= ?")
+            params.append(local_date_cutoff(days_ago))
 
-        query_parts.append("GROUP BY subject_id;")
+        query_parts.append(" GROUP BY subject_id HAVING SUM(sessions) > 0;")
         
         final_query = textwrap.dedent("".join(query_parts))
         rows = self._execute_query(final_query, tuple(params)).fetchall()
@@ -192,50 +193,38 @@ class SqlitePerformanceService(BaseService, IPerformanceService):
         
         date_filter_clause = ""
         if days_ago is not None:
-            date_filter_clause = "AND date(start_time) >= date('now', '-' || ? || ' days')"
+            date_filter_clause = "AND local_date >= ?"
 
         query = textwrap.dedent(f"""
-            WITH TimeAndSessions AS (
+            WITH DailyTotals AS (
                 SELECT
                     subject_id,
-                    SUM(liquid_duration_sec) / 60 AS total_minutes,
-                    COUNT(id) AS session_count
-                FROM study_sessions
-                WHERE user_id = ? AND cycle_id = ? {date_filter_clause} AND end_time IS NOT NULL
+                    SUM(seconds) / 60 AS total_minutes,
+                    SUM(sessions) AS session_count,
+                    SUM(questions) AS total_questions,
+                    SUM(correct) AS total_correct
+                FROM daily_subject_stats
+                WHERE user_id = ? AND cycle_id = ? {date_filter_clause}
                 GROUP BY subject_id
-            ),
-            QuestionPerf AS (
-                SELECT
-                    ss.subject_id,
-                    COUNT(qp.id) AS total_questions,
-                    SUM(qp.is_correct) AS total_correct
-                FROM question_performance qp
-                JOIN study_sessions ss ON qp.session_id = ss.id
-                WHERE ss.user_id = ? AND ss.cycle_id = ? {date_filter_clause}
-                GROUP BY ss.subject_id
             )
             SELECT
                 s.name AS subject_name,
                 s.id as subject_id,
-                COALESCE(ts.total_minutes, 0) AS total_study_minutes,
-                COALESCE(ts.session_count, 0) AS session_count,
-                COALESCE(qp.total_questions, 0) AS total_questions,
-                COALESCE(qp.total_correct, 0) AS total_correct
+                COALESCE(dt.total_minutes, 0) AS total_study_minutes,
+                COALESCE(dt.session_count, 0) AS session_count,
+                COALESCE(dt.total_questions, 0) AS total_questions,
+                COALESCE(dt.total_correct, 0) AS total_correct
             FROM cycle_subjects cs
             JOIN subjects s ON cs.subject_id = s.id
-            LEFT JOIN TimeAndSessions ts ON cs.subject_id = ts.subject_id
-            LEFT JOIN QuestionPerf qp ON cs.subject_id = qp.subject_id
+            LEFT JOIN DailyTotals dt ON cs.subject_id = dt.subject_id
             WHERE cs.cycle_id = ?
             ORDER BY s.name;
         """)
 
-        # Base params for CTEs and final WHERE
+        # Params for the CTE and the final WHERE
         params = [user_id, cycle_id]
         if days_ago is not None:
-            params.append(days_ago)
-        params.extend([user_id, cycle_id])
-        if days_ago is not None:
-            params.append(days_ago)
+            params.append(local_date_cutoff(days_ago))
         params.append(cycle_id)
 
         rows = self._execute_query(query, tuple(params)).fetchall()
@@ -1,17 +1,33 @@
 # app/services/session_service.py
 
 import logging
+import sqlite3
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 from app.core.database import IDatabaseConnectionFactory
-from app.models.session import QuestionPerformance, StudySession
+from app.core.time_utils import normalize_start_time
+from app.models.session import HistoryRow, QuestionPerformance, StudyHistoryColumns, StudySession
 from app.services import BaseService
 from app.services.interfaces import ISessionService
 
 log = logging.getLogger(__name__)
 
 
+HISTORY_CHUNK_SIZE = 4096
+HISTORY_PAGE_SIZE = 200
+# The HistoryRow fields get_history_rows can sort by, and the column each one is ordered on.
+# start_time holds mixed ISO formats, so the date order comes from the normalized start_epoch.
+HISTORY_SORT_COLUMNS = {
+    "subject_name": "subject_name",
+    "start_time": "start_epoch",
+    "duration_sec": "duration_sec",
+    "questions_done": "questions_done",
+    "questions_correct": "questions_correct",
+    "accuracy": "accuracy",
+}
+
+
 class SqliteSessionService(BaseService, ISessionService):
     """The concrete SQLite implementation of the ISessionService interface."""
 
@@ -36,9 +52,10 @@ class SqliteSessionService(BaseService, ISessionService):
             f"Starting new study session for user_id: {user_id}, subject_id: {subject_id}"
         )
         start_time = datetime.now(timezone.utc).isoformat()
+        start_epoch, local_date = normalize_start_time(start_time)
         cursor = self._execute_query(
-            "INSERT INTO study_sessions (user_id, subject_id, cycle_id, topic_id, start_time) VALUES (?, ?, ?, ?, ?)",
-            (user_id, subject_id, cycle_id, topic_id, start_time),
+            "INSERT INTO study_sessions (user_id, subject_id, cycle_id, topic_id, start_time, start_epoch, local_date) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (user_id, subject_id, cycle_id, topic_id, start_time, start_epoch, local_date),
         )
         new_id = cursor.lastrowid
         return new_id
@@ -53,57 +70,60 @@ class SqliteSessionService(BaseService, ISessionService):
         log.info(f"Finishing study session ID: {session_id}")
         end_time = datetime.now(timezone.utc).isoformat()
         try:
-            session_row = self._execute_query(
-                "SELECT start_time FROM study_sessions WHERE id = ?", (session_id,)
-            ).fetchone()
-            pause_row = self._execute_query(
-                "SELECT SUM(duration_sec) AS total_pauses FROM session_pauses WHERE session_id = ?",
-                (session_id,),
-            ).fetchone()
-
-            total_pause_sec = (
-                pause_row["total_pauses"]
-                if pause_row and pause_row["total_pauses"]
-                else 0
-            )
-            start_time_obj = datetime.fromisoformat(session_row["start_time"])
-            end_time_obj = datetime.fromisoformat(end_time)
-            total_duration_sec = int((end_time_obj - start_time_obj).total_seconds())
-            liquid_duration_sec = total_duration_sec - total_pause_sec
+            # One transaction: a replan running on another thread must never see the session
+            # finished without its questions, or it would checkpoint it with none.
+            with self._conn_factory.get_connection() as conn:
+                session_row = conn.execute(
+                    "SELECT start_time FROM study_sessions WHERE id = ?", (session_id,)
+                ).fetchone()
+                pause_row = conn.execute(
+                    "SELECT SUM(duration_sec) AS total_pauses FROM session_pauses WHERE session_id = ?",
+                    (session_id,),
+                ).fetchone()
 
-            self._execute_query(
-                """UPDATE study_sessions
-                   SET end_time                 = ?,
-                       description              = ?,
-                       total_duration_sec       = ?,
-                       total_pause_duration_sec = ?,
-                       liquid_duration_sec      = ?,
-                       topic_id                 = ?
-                   WHERE id = ?""",
-                (
-                    end_time,
-                    description,
-                    total_duration_sec,
-                    total_pause_sec,
-                    liquid_duration_sec,
-                    topic_id,
-                    session_id,
-                ),
-            )
+                total_pause_sec = (
+                    pause_row["total_pauses"]
+                    if pause_row and pause_row["total_pauses"]
+                    else 0
+                )
+                start_time_obj = datetime.fromisoformat(session_row["start_time"])
+                end_time_obj = datetime.fromisoformat(end_time)
+                total_duration_sec = int((end_time_obj - start_time_obj).total_seconds())
+                liquid_duration_sec = total_duration_sec - total_pause_sec
 
-            if questions:
-                question_data_tuples = [
+                if questions:
+                    question_data_tuples = [
+                        (
+                            session_id,
+                            q.topic_name,
+                            q.difficulty_level,
+                            1 if q.is_correct else 0,
+                        )
+                        for q in questions
+                    ]
+                    conn.executemany(
+                        "INSERT INTO question_performance (session_id, topic_name, difficulty_level, is_correct) VALUES (?, ?, ?, ?)",
+                        question_data_tuples,
+                    )
+
+                conn.execute(
+                    """UPDATE study_sessions
+                       SET end_time                 = ?,
+                           description              = ?,
+                           total_duration_sec       = ?,
+                           total_pause_duration_sec = ?,
+                           liquid_duration_sec      = ?,
+                           topic_id                 = ?
+                       WHERE id = ?""",
                     (
+                        end_time,
+                        description,
+                        total_duration_sec,
+                        total_pause_sec,
+                        liquid_duration_sec,
+                        topic_id,
                         session_id,
-                        q.topic_name,
-                        q.difficulty_level,
-                        1 if q.is_correct else 0,
-                    )
-                    for q in questions
-                ]
-                self._executemany_query(
-                    "INSERT INTO question_performance (session_id, topic_name, difficulty_level, is_correct) VALUES (?, ?, ?, ?)",
-                    question_data_tuples,
+                    ),
                 )
 
         except Exception as e:
@@ -128,6 +148,7 @@ class SqliteSessionService(BaseService, ISessionService):
         start_time_obj = datetime.fromisoformat(start_datetime_iso)
         duration_sec = duration_minutes * 60
         end_time_obj = start_time_obj + timedelta(seconds=duration_sec)
+        start_epoch, local_date = normalize_start_time(start_time_obj.isoformat())
 
         try:
             cursor = self._execute_query(
@@ -135,8 +156,8 @@ class SqliteSessionService(BaseService, ISessionService):
                 INSERT INTO study_sessions
                 (user_id, cycle_id, subject_id, topic_id, start_time, end_time,
                  total_duration_sec, liquid_duration_sec, description,
-                 total_questions_done, total_questions_correct)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                 total_questions_done, total_questions_correct, start_epoch, local_date)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     user_id,
@@ -150,6 +171,8 @@ class SqliteSessionService(BaseService, ISessionService):
                     description,
                     total_questions_done,
                     total_questions_correct,
+                    start_epoch,
+                    local_date,
                 ),
             )
             new_id = cursor.lastrowid
@@ -195,31 +218,245 @@ class SqliteSessionService(BaseService, ISessionService):
     ):
         pass  # Not critical for tests
 
-    def get_history_for_cycle(self, cycle_id: int) -> List[StudySession]:
-        session_rows = self._execute_query(
-            """
+    def rebuild_daily_stats(self) -> None:
+        # The triggers from migration 007 keep the rollup current; this is for repairs and bulk imports.
+        log.info("Rebuilding daily_subject_stats from study_sessions.")
+        with self._conn_factory.get_connection() as conn:
+            conn.execute("DELETE FROM daily_subject_stats")
+            conn.execute(
+                """
+                INSERT INTO daily_subject_stats (user_id, cycle_id, subject_id, local_date, questions, correct, seconds, sessions)
+                SELECT SS.user_id,
+                       IFNULL(SS.cycle_id, 0),
+                       SS.subject_id,
+                       SS.local_date,
+                       SUM((SELECT COUNT(*) FROM question_performance AS QP WHERE QP.session_id = SS.id)),
+                       SUM((SELECT IFNULL(SUM(QP.is_correct), 0) FROM question_performance AS QP WHERE QP.session_id = SS.id)),
+                       SUM(CASE WHEN SS.end_time IS NOT NULL THEN IFNULL(SS.liquid_duration_sec, 0) ELSE 0 END),
+                       SUM(SS.end_time IS NOT NULL)
+                FROM study_sessions AS SS
+                WHERE SS.user_id IS NOT NULL AND SS.local_date IS NOT NULL
+                GROUP BY SS.user_id, IFNULL(SS.cycle_id, 0), SS.subject_id, SS.local_date
+                """
+            )
+
+    def get_history_for_cycle(self, cycle_id: int, subject_id: Optional[int] = None) -> List[StudySession]:
+        """A cycle's live sessions with their questions, optionally only those of one master subject."""
+        subject_filter, params = "", (cycle_id,)
+        if subject_id is not None:
+            subject_filter, params = " AND ss.subject_id = ?", (cycle_id, subject_id)
+        sessions = self._fetch_models(
+            f"""
             SELECT ss.*, s.name as subject_name
             FROM study_sessions as ss
             JOIN subjects as s ON ss.subject_id = s.id
-            WHERE ss.cycle_id = ? AND ss.soft_delete = 0
+            WHERE ss.cycle_id = ? AND ss.soft_delete = 0{subject_filter}
             """,
-            (cycle_id,),
-        ).fetchall()
+            params,
+            StudySession,
+        )
+        questions = self._fetch_models(
+            "SELECT qp.* FROM question_performance AS qp JOIN study_sessions AS ss ON qp.session_id = ss.id "
+            f"WHERE ss.cycle_id = ?{subject_filter}",
+            params,
+            QuestionPerformance,
+        )
+        sessions_by_id = {session.id: session for session in sessions}
+        for question in questions:
+            session = sessions_by_id.get(question.session_id)
+            if session is not None:
+                session.questions.append(question)
+        return sessions
+
+    def get_history_page(
+        self, cycle_id: int, page_size: int = HISTORY_PAGE_SIZE, after: Optional[Tuple[int, int]] = None
+    ) -> List[HistoryRow]:
+        """
+        One page of a cycle's finished sessions, newest first. Pass the keyset("start_time") of
+        the last row of the previous page as `after` to get the next one.
+        """
+        return self.get_history_rows(cycle_id, "start_time", True, "", page_size, after)
+
+    def iter_history_for_cycle(self, cycle_id: int, page_size: int = HISTORY_PAGE_SIZE) -> Iterator[HistoryRow]:
+        """
+        Yields every finished session of a cycle, newest first, fetching one page at a time so at
+        most `page_size` rows are held in memory. No cursor stays open between pages.
+        """
+        after = None
+        while True:
+            page = self.get_history_page(cycle_id, page_size, after)
+            yield from page
+            if len(page) < page_size:
+                return
+            after = page[-1].keyset("start_time")
+
+    def get_history_rows(
+        self, cycle_id: int, sort_column: str = "start_time", descending: bool = True, subject_filter: str = "",
+        page_size: int = HISTORY_PAGE_SIZE, after: Optional[Tuple[object, int]] = None
+    ) -> List[HistoryRow]:
+        """
+        One page of a cycle's finished sessions for the history table, ordered by `sort_column`
+        (one of HISTORY_SORT_COLUMNS) and then id, both descending or both ascending. Pass the
+        HistoryRow.keyset(sort_column) of the last row of the previous page as `after` to get the
+        next one. `subject_filter` keeps the subjects whose name contains it, ignoring case.
+        """
+        if sort_column not in HISTORY_SORT_COLUMNS:
+            raise ValueError(f"Cannot sort the history by '{sort_column}'")
+        sort_key = HISTORY_SORT_COLUMNS[sort_column]
+        order, compare = ("DESC", "<") if descending else ("ASC", ">")
+        name_filter, params = "", [cycle_id, cycle_id]
+        if subject_filter:
+            escaped = subject_filter.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            name_filter = " AND s.name LIKE ? ESCAPE '\\'"
+            params.append(f"%{escaped}%")
+        keyset = ""
+        if after is not None:
+            keyset = f"WHERE ({sort_key}, id) {compare} (?, ?)"
+            params.extend(after)
+        params.append(page_size)
+        # The question totals of the cycle are aggregated once, in one grouped pass over
+        # question_performance; sessions logged without question rows keep the totals stored on
+        # the session. Sorting by date walks the keyset index from migration 011 (the unary + keeps
+        # the planner from picking the end_time index instead); the other columns are sorted by
+        # SQLite over the cycle's finished sessions.
+        return self._fetch_models(
+            f"""
+            WITH totals AS (
+                SELECT ss.id, s.name AS subject_name, ss.start_time, ss.start_epoch,
+                       IFNULL(ss.liquid_duration_sec, 0) AS duration_sec,
+                       CASE WHEN qp.done > 0 THEN qp.done ELSE IFNULL(ss.total_questions_done, 0) END
+                           AS questions_done,
+                       CASE WHEN qp.done > 0 THEN qp.correct ELSE IFNULL(ss.total_questions_correct, 0) END
+                           AS questions_correct
+                FROM study_sessions AS ss
+                JOIN subjects AS s ON ss.subject_id = s.id
+                LEFT JOIN (
+                    SELECT q.session_id, COUNT(*) AS done, IFNULL(SUM(q.is_correct), 0) AS correct
+                    FROM question_performance AS q
+                    JOIN study_sessions AS cs ON q.session_id = cs.id
+                    WHERE cs.cycle_id = ? AND cs.soft_delete = 0
+                    GROUP BY q.session_id
+                ) AS qp ON qp.session_id = ss.id
+                WHERE ss.cycle_id = ? AND ss.soft_delete = 0 AND +ss.end_time IS NOT NULL{name_filter}
+            ),
+            history AS (
+                SELECT *, CASE WHEN questions_done > 0 THEN 100.0 * questions_correct / questions_done
+                               ELSE 0.0 END AS accuracy
+                FROM totals
+            )
+            SELECT id, subject_name, start_time, start_epoch, duration_sec, questions_done, questions_correct, accuracy
+            FROM history {keyset}
+            ORDER BY {sort_key} {order}, id {order}
+            LIMIT ?
+            """,
+            tuple(params),
+            HistoryRow,
+        )
 
-        question_rows = self._execute_query(
-            "SELECT qp.* FROM question_performance AS qp JOIN study_sessions AS ss ON qp.session_id = ss.id WHERE ss.cycle_id = ?",
+    def get_daily_breakdown(self, cycle_id: int) -> List[Tuple[str, str, int]]:
+        """(local_date, subject name, finished sessions) for every day of a cycle, newest day first."""
+        rows = self._execute_query(
+            """
+            SELECT ss.local_date, s.name, COUNT(*)
+            FROM study_sessions AS ss
+            JOIN subjects AS s ON ss.subject_id = s.id
+            WHERE ss.cycle_id = ? AND ss.soft_delete = 0 AND ss.end_time IS NOT NULL
+            GROUP BY ss.local_date, s.name
+            ORDER BY ss.local_date DESC, s.name
+            """,
             (cycle_id,),
         ).fetchall()
-        questions_by_session = {}
-        for q_row in question_rows:
-            session_id = q_row["session_id"]
-            if session_id not in questions_by_session:
-                questions_by_session[session_id] = []
-            questions_by_session[session_id].append(QuestionPerformance(**dict(q_row)))
-        sessions_with_questions = []
-        for session_row in session_rows:
-            session_dict = dict(session_row)
-            session_id = session_dict["id"]
-            session_dict["questions"] = questions_by_session.get(session_id, [])
-            sessions_with_questions.append(StudySession(**session_dict))
-        return sessions_with_questions
+        return [tuple(row) for row in rows]
+
+    def get_history_watermark(self, cycle_id: int) -> tuple:
+        """
+        A cheap summary of everything the tutor reads from a cycle's history: it changes whenever
+        a session is added, finished, edited, moved or deleted, or a question is logged, edited or
+        removed. The last column is the cycle's history_versions counter, bumped by triggers on
+        every such write, so edits that keep the sums constant are caught too.
+        """
+        row = self._execute_query(
+            """
+            SELECT COUNT(*), IFNULL(MAX(ss.id), 0), SUM(ss.end_time IS NOT NULL),
+                   IFNULL(SUM(ss.liquid_duration_sec), 0), IFNULL(SUM(ss.start_epoch), 0),
+                   IFNULL(SUM(ss.user_feedback_effectiveness), 0),
+                   (SELECT IFNULL(SUM(questions), 0) FROM daily_subject_stats WHERE cycle_id = :cycle_id),
+                   (SELECT IFNULL(SUM(correct), 0) FROM daily_subject_stats WHERE cycle_id = :cycle_id),
+                   (SELECT IFNULL(MAX(version), 0) FROM history_versions WHERE cycle_id = :cycle_id)
+            FROM study_sessions AS ss
+            WHERE ss.cycle_id = :cycle_id AND ss.soft_delete = 0
+            """,
+            {"cycle_id": cycle_id},
+        ).fetchone()
+        return tuple(row)
+
+    def get_history_columns_for_cycle(self, cycle_id: int, chunk_size: int = HISTORY_CHUNK_SIZE,
+                                      subject_id: Optional[int] = None) -> StudyHistoryColumns:
+        """
+        Loads the same history as get_history_for_cycle into a StudyHistoryColumns, without
+        building a StudySession or QuestionPerformance per row. One joined query ordered by
+        session is streamed in fetchmany chunks, so a session's questions arrive right after it.
+        """
+        subject_filter, params = "", (cycle_id,)
+        if subject_id is not None:
+            subject_filter, params = " AND ss.subject_id = ?", (cycle_id, subject_id)
+        result = self._execute_query(
+            f"""
+            SELECT ss.id, ss.subject_id, IFNULL(ss.start_epoch, 0),
+                   CAST(julianday(substr(ss.start_time, 1, 10)) + 0.5 AS INTEGER) - 1721425,
+                   IFNULL(ss.liquid_duration_sec, 0), ss.study_method, ss.user_feedback_effectiveness,
+                   qp.is_correct, qp.difficulty_level, qp.topic_name
+            FROM study_sessions AS ss
+            JOIN subjects AS s ON ss.subject_id = s.id
+            LEFT JOIN question_performance AS qp ON qp.session_id = ss.id
+            WHERE ss.cycle_id = ? AND ss.soft_delete = 0{subject_filter}
+            ORDER BY ss.id, qp.id
+            """,
+            params,
+        )
+        if isinstance(result, sqlite3.Cursor):
+            result.row_factory = None  # Plain tuples; the columns are read positionally.
+
+        history = StudyHistoryColumns()
+        topics, methods = {}, {}
+        # Bound appends keep the per-row cost down on long histories.
+        add_session_id, add_subject_id = history.session_id.append, history.subject_id.append
+        add_start_epoch, add_start_day = history.start_epoch.append, history.start_day.append
+        add_liquid_sec, add_method = history.liquid_sec.append, history.method_code.append
+        add_feedback, add_q_row = history.feedback.append, history.question_session_row.append
+        add_q_correct, add_q_difficulty = history.question_correct.append, history.question_difficulty.append
+        add_q_topic = history.question_topic.append
+
+        last_session_id, row_index = None, -1
+        while True:
+            chunk = result.fetchmany(chunk_size)
+            if not chunk:
+                break
+            if not isinstance(chunk[0], (tuple, sqlite3.Row)):
+                chunk = [tuple(row.values()) for row in chunk]  # SQLAlchemy mappings
+            for (session_id, subject_id, start_epoch, start_day, liquid_sec, method, feedback,
+                 is_correct, difficulty, topic_name) in chunk:
+                if session_id != last_session_id:
+                    last_session_id = session_id
+                    row_index += 1
+                    add_session_id(session_id)
+                    add_subject_id(subject_id)
+                    add_start_epoch(start_epoch)
+                    add_start_day(float("nan") if start_day is None else start_day)
+                    add_liquid_sec(liquid_sec)
+                    if method and feedback is not None:
+                        add_method(methods.setdefault(method, len(methods)))
+                        add_feedback(feedback)
+                    else:
+                        add_method(-1)
+                        add_feedback(0)
+                if is_correct is None:
+                    continue  # The LEFT JOIN row of a session without questions.
+                add_q_row(row_index)
+                add_q_correct(1 if is_correct else 0)
+                add_q_difficulty(difficulty or 0)
+                add_q_topic(topics.setdefault(topic_name, len(topics)))
+
+        history.topic_names = list(topics)
+        history.method_names = list(methods)
+        return history
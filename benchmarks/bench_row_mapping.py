@@ -0,0 +1,140 @@
+# benchmarks/bench_row_mapping.py
+"""
+Row-mapping benchmark for the session history load.
+
+Compares the old path (sqlite3.Row -> dict -> regular @dataclass) against the
+current one (slotted dataclasses built by a positional row_factory) and the
+columnar loader (flat array buffers) on a generated history, reporting rows
+per second and retained bytes per session.
+
+    python -m benchmarks.bench_row_mapping [--sessions 20000] [--questions 10]
+"""
+import argparse
+import dataclasses
+import gc
+import sqlite3
+import time
+import tracemalloc
+
+from app.core.migrations import run_migrations_on_connection
+from app.core.row_mapping import model_row_factory
+from app.models.session import QuestionPerformance, StudySession
+from app.services.session_service import SqliteSessionService
+from tests.conftest import BASE_PATH
+
+HISTORY_SQL = ("SELECT ss.*, s.name AS subject_name FROM study_sessions AS ss "
+               "JOIN subjects AS s ON ss.subject_id = s.id WHERE ss.cycle_id = 1")
+QUESTIONS_SQL = ("SELECT qp.* FROM question_performance AS qp "
+                 "JOIN study_sessions AS ss ON qp.session_id = ss.id WHERE ss.cycle_id = 1")
+
+
+def _unslotted(model):
+    """A plain @dataclass with the same fields as `model`, i.e. the model before slots."""
+    spec = [(f.name, f.type, f) for f in dataclasses.fields(model)]
+    return dataclasses.make_dataclass(f"Legacy{model.__name__}", spec)
+
+
+LegacyQuestion = _unslotted(QuestionPerformance)
+LegacySession = _unslotted(StudySession)
+
+
+def build_database(sessions: int, questions_per_session: int) -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    run_migrations_on_connection(conn, BASE_PATH)
+    with conn:
+        conn.execute("INSERT INTO users (id, name, study_level) VALUES (1, 'Bench', 'Beginner') ON CONFLICT(id) DO NOTHING")
+        conn.execute("INSERT INTO subjects (id, name) VALUES (1, 'Bench Subject') ON CONFLICT(id) DO NOTHING")
+        conn.execute("INSERT INTO exams (id, user_id, name) VALUES (1, 1, 'Bench Exam') ON CONFLICT(id) DO NOTHING")
+        conn.execute("INSERT INTO study_cycles (id, exam_id, name, block_duration_min, daily_goal_blocks) "
+                     "VALUES (1, 1, 'Bench Cycle', 60, 4) ON CONFLICT(id) DO NOTHING")
+        conn.executemany(
+            "INSERT INTO study_sessions (id, user_id, subject_id, cycle_id, start_time, end_time, "
+            "total_duration_sec, total_pause_duration_sec, liquid_duration_sec) "
+            "VALUES (?, 1, 1, 1, date('2024-01-01', ? || ' days') || 'T10:00:00', "
+            "date('2024-01-01', ? || ' days') || 'T11:00:00', 3600, 0, 3600)",
+            # Spread over many days: the daily_subject_stats triggers re-aggregate a whole day per insert.
+            ((i, i % 3650, i % 3650) for i in range(1, sessions + 1)),
+        )
+        conn.executemany(
+            "INSERT INTO question_performance (session_id, topic_name, difficulty_level, is_correct) VALUES (?, 'topic', 2, ?)",
+            ((i, q % 2) for i in range(1, sessions + 1) for q in range(questions_per_session)),
+        )
+    return conn
+
+
+def load_legacy(conn: sqlite3.Connection) -> list:
+    conn.row_factory = sqlite3.Row
+    by_session = {}
+    for row in conn.execute(QUESTIONS_SQL).fetchall():
+        by_session.setdefault(row["session_id"], []).append(LegacyQuestion(**dict(row)))
+    sessions = []
+    for row in conn.execute(HISTORY_SQL).fetchall():
+        data = dict(row)
+        data["questions"] = by_session.get(data["id"], [])
+        sessions.append(LegacySession(**data))
+    return sessions
+
+
+def load_current(conn: sqlite3.Connection) -> list:
+    conn.row_factory = sqlite3.Row
+    cursor = conn.execute(HISTORY_SQL)
+    cursor.row_factory = model_row_factory(StudySession, cursor.description)
+    sessions = cursor.fetchall()
+    cursor = conn.execute(QUESTIONS_SQL)
+    cursor.row_factory = model_row_factory(QuestionPerformance, cursor.description)
+    by_id = {session.id: session for session in sessions}
+    for question in cursor.fetchall():
+        by_id[question.session_id].questions.append(question)
+    return sessions
+
+
+class _SingleConnectionFactory:
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def get_connection(self) -> sqlite3.Connection:
+        return self._conn
+
+
+def load_columnar(conn: sqlite3.Connection):
+    conn.row_factory = sqlite3.Row
+    return SqliteSessionService(_SingleConnectionFactory(conn)).get_history_columns_for_cycle(1)
+
+
+def measure(loader, conn, sessions: int, total_rows: int, repeat: int) -> tuple:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        loader(conn)
+        best = min(best, time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    result = loader(conn)
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del result
+    return total_rows / best, retained / sessions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=20000)
+    parser.add_argument("--questions", type=int, default=10, help="questions per session")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    conn = build_database(args.sessions, args.questions)
+    total_rows = args.sessions * (args.questions + 1)
+    print(f"{args.sessions} sessions, {total_rows} rows")
+    print(f"{'loader':<10}{'rows/s':>14}{'bytes/session':>16}")
+    for name, loader in (("before", load_legacy), ("after", load_current), ("columnar", load_columnar)):
+        rate, per_session = measure(loader, conn, args.sessions, total_rows, args.repeat)
+        print(f"{name:<10}{rate:>14,.0f}{per_session:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# benchmarks/bench_startup.py
+"""
+Time-to-first-paint benchmark for the application start.
+
+Seeds a profile, extends it with a generated study history of the given size,
+then launches main.py headless (offscreen QPA) against it and reads the
+startup timeline it writes (see app/core/startup_timeline.py). Reports the
+median time to first paint and the slowest phases per database size.
+
+    python -m benchmarks.bench_startup [--sizes small medium multi-year] [--runs 5]
+"""
+import argparse
+import json
+import os
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+from app.core.simulation.seeder import seed_profile
+from app.core.startup_timeline import FIRST_PAINT
+from tests.conftest import BASE_PATH
+
+PROFILE = os.path.join(BASE_PATH, "tests", "fixtures", "profiles", "daniel_3.json")
+
+# name: (days of history, sessions per day, questions per session)
+SIZES = {
+    "small": (30, 2, 10),
+    "medium": (365, 4, 10),
+    "multi-year": (3 * 365, 6, 15),
+}
+
+
+def build_database(path: str, days: int, sessions_per_day: int, questions: int) -> int:
+    """Seeds the profile into `path` and adds `days` of history ending today. Returns the session count."""
+    seed_profile(PROFILE, target=path).dispose()
+    conn = sqlite3.connect(path)
+    with conn:
+        user_id, cycle_id = conn.execute(
+            "SELECT u.id, c.id FROM users u JOIN exams e ON e.user_id = u.id "
+            "JOIN study_cycles c ON c.exam_id = e.id WHERE c.is_active = 1").fetchone()
+        subject_ids = [row[0] for row in conn.execute(
+            "SELECT subject_id FROM cycle_subjects WHERE cycle_id = ?", (cycle_id,))]
+        first_day = datetime.now().replace(hour=8, minute=0, second=0, microsecond=0) - timedelta(days=days)
+        sessions = []
+        for day in range(days):
+            for slot in range(sessions_per_day):
+                start = first_day + timedelta(days=day, hours=2 * slot)
+                sessions.append((user_id, cycle_id, subject_ids[(day + slot) % len(subject_ids)],
+                                 start.isoformat(), (start + timedelta(hours=1)).isoformat()))
+        conn.executemany(
+            "INSERT INTO study_sessions (user_id, cycle_id, subject_id, start_time, end_time, liquid_duration_sec) "
+            "VALUES (?, ?, ?, ?, ?, 3600)", sessions)
+        conn.execute(
+            "INSERT INTO question_performance (session_id, topic_name, difficulty_level, is_correct) "
+            "SELECT s.id, 'topic_' || (q.n % 5), 1 + q.n % 5, (s.id + q.n) % 3 != 0 "
+            "FROM study_sessions s CROSS JOIN (WITH RECURSIVE q(n) AS (SELECT 0 UNION ALL SELECT n + 1 FROM q "
+            f"WHERE n + 1 < {questions}) SELECT n FROM q) q WHERE s.start_time >= ?", (first_day.isoformat(),))
+    conn.close()
+    return len(sessions)
+
+
+def launch(db_path: str, trace_path: str) -> dict:
+    """Starts the app once against `db_path` and returns {phase: (start_ms, duration_ms)} from its trace."""
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    subprocess.run([sys.executable, os.path.join(BASE_PATH, "main.py"), "--database", db_path,
+                    "--startup-trace", trace_path, "--exit-after-first-paint"],
+                   cwd=BASE_PATH, env=env, check=True, capture_output=True, timeout=300)
+    with open(trace_path, encoding="utf-8") as f:
+        events = json.load(f)["traceEvents"]
+    return {e["name"]: (e["ts"] / 1000, e.get("dur", 0) / 1000) for e in events}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=list(SIZES))
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'database':<12}{'sessions':>10}{'first paint ms':>16}   slowest phases (median ms)")
+        for size in args.sizes:
+            db_path = os.path.join(tmp, f"{size}.db")
+            sessions = build_database(db_path, *SIZES[size])
+            runs = [launch(db_path, os.path.join(tmp, f"{size}-{run}.json")) for run in range(args.runs)]
+
+            first_paint = statistics.median(run[FIRST_PAINT][0] for run in runs)
+            phases = {name: statistics.median(run[name][1] for run in runs if name in run)
+                      for name in runs[0] if name != FIRST_PAINT}
+            slowest = sorted(phases.items(), key=lambda item: item[1], reverse=True)[:4]
+            print(f"{size:<12}{sessions:>10}{first_paint:>16.0f}   "
+                  + ", ".join(f"{name} {ms:.0f}" for name, ms in slowest))
+
+
+if __name__ == "__main__":
+    main()
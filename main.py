@@ -1,16 +1,24 @@
+# The startup timeline goes first, so its clock starts before the heavy imports below.
+from app.core.startup_timeline import FIRST_PAINT, startup_timeline
+
 import argparse
 import logging
 import os
 import sys
 
+from PySide6.QtCore import QTimer
 from PySide6.QtGui import QFontDatabase, QFont
 from PySide6.QtWidgets import QApplication
 
+from app.core.async_services import ServiceExecutor
 from app.core.config_service import ConfigService
 from app.core.context import AppContext
-from app.core.database import SqliteConnectionFactory, get_db_file_path
-from app.core.logger import setup_logging
+from app.core.icon_manager import warm_icon_cache
+from app.core.database import (PooledSqliteConnectionFactory, ReadOnlySqliteConnectionFactory, UnitOfWork,
+                               get_db_file_path)
+from app.core.logger import LOG_DIR, setup_logging
 from app.core.migrations import run_migrations
+from app.core.query_instrumentation import query_instrumentation
 from app.core.simulation.seeder import seed_profile
 from app.core.theme_manager import apply_theme
 from app.features.main_window.main_controller import MainWindowController
@@ -60,15 +68,28 @@ def main():
     """
     The main function that sets up and runs the application.
     """
+    startup_timeline.phase_since_start("imports")
     parser = argparse.ArgumentParser(description="Serenita Study App")
     parser.add_argument("--dev", action="store_true", help="Run in development mode with a seeded profile.")
     parser.add_argument("--user", type=str, help="User profile to seed for development mode (e.g., 'alex').")
+    parser.add_argument("--profile-sql", action="store_true", help="Record per-statement SQL latency statistics.")
+    parser.add_argument("--rebuild-stats", action="store_true", help="Rebuild the daily analytics rollup before starting.")
+    parser.add_argument("--database", type=str, help="Open this database file instead of the default one.")
+    parser.add_argument("--startup-trace", type=str, default=os.path.join(LOG_DIR, "startup_trace.json"),
+                        help="Where to write the startup timeline (Chrome trace-event JSON).")
+    parser.add_argument("--exit-after-first-paint", action="store_true",
+                        help="Quit as soon as the main window is painted (for startup benchmarks).")
     args = parser.parse_args()
 
-    setup_logging()
-    check_for_pending_reset(BASE_PATH)
+    with startup_timeline.phase("setup_logging"):
+        setup_logging()
+    with startup_timeline.phase("check_for_pending_reset"):
+        check_for_pending_reset(BASE_PATH)
     log.info("--- Serenita Application Starting Up ---")
 
+    if args.profile_sql:
+        query_instrumentation.enable()
+
     if args.dev and args.user:
         log.info(f"Running in DEV mode for user profile: {args.user}")
         profile_path = os.path.join(BASE_PATH, "tests", "fixtures", "profiles", f"{args.user}.json")
@@ -80,46 +101,74 @@ def main():
         dev_db_path = os.path.join(BASE_PATH, "data", f"{args.user}.db")
         os.makedirs(os.path.dirname(dev_db_path), exist_ok=True)
         log.info(f"Seeding development database at: {dev_db_path}")
-        seed_profile(profile_path, target=dev_db_path)
-        conn_factory = SqliteConnectionFactory(dev_db_path)
-    else:
-        db_file = get_db_file_path(BASE_PATH)
-        conn_factory = SqliteConnectionFactory(db_file)
-        run_migrations(conn_factory, BASE_PATH)
-
-    app = QApplication(sys.argv)
-
-    assets_path = os.path.join(BASE_PATH, "app", "assets", "fonts")
-    font_id = QFontDatabase.addApplicationFont(os.path.join(assets_path, "Geist.ttf"))
-    if font_id != -1:
-        font_families = QFontDatabase.applicationFontFamilies(font_id)
-        if font_families:
-            app_font = QFont(font_families[0], 10)
-            app_font.setStyleStrategy(QFont.StyleStrategy.PreferAntialias)
-            app.setFont(app_font)
-            log.info(f"Successfully loaded and set default font: {font_families[0]}")
+        with startup_timeline.phase("seed_profile"):
+            seed_profile(profile_path, target=dev_db_path)
+        db_file = dev_db_path
+        connection_pool = PooledSqliteConnectionFactory(db_file)
     else:
-        log.warning("Could not load 'Geist.ttf' font.")
+        db_file = args.database or get_db_file_path(BASE_PATH)
+        connection_pool = PooledSqliteConnectionFactory(db_file)
+        with startup_timeline.phase("run_migrations"):
+            run_migrations(connection_pool, BASE_PATH)
+
+    with startup_timeline.phase("open_database"):
+        # Opening the writer first switches the database to WAL, which the read-only snapshot pool relies on.
+        connection_pool.get_connection()
+        read_pool = ReadOnlySqliteConnectionFactory(db_file)
+
+        # Every service shares the unit of work, so multi-step operations can be made atomic.
+        conn_factory = UnitOfWork(connection_pool)
+    if args.rebuild_stats:
+        with startup_timeline.phase("rebuild_daily_stats"):
+            SqliteSessionService(conn_factory).rebuild_daily_stats()
+
+    with startup_timeline.phase("create_qapplication"):
+        app = QApplication(sys.argv)
+        service_executor = ServiceExecutor()
+    # Background queries must finish before their connections are closed.
+    app.aboutToQuit.connect(service_executor.shutdown)
+    app.aboutToQuit.connect(connection_pool.close_all)
+    app.aboutToQuit.connect(read_pool.close_all)
+
+    with startup_timeline.phase("load_fonts"):
+        assets_path = os.path.join(BASE_PATH, "app", "assets", "fonts")
+        font_id = QFontDatabase.addApplicationFont(os.path.join(assets_path, "Geist.ttf"))
+        if font_id != -1:
+            font_families = QFontDatabase.applicationFontFamilies(font_id)
+            if font_families:
+                app_font = QFont(font_families[0], 10)
+                app_font.setStyleStrategy(QFont.StyleStrategy.PreferAntialias)
+                app.setFont(app_font)
+                log.info(f"Successfully loaded and set default font: {font_families[0]}")
+        else:
+            log.warning("Could not load 'Geist.ttf' font.")
 
     log.debug("Composing application services into AppContext...")
-    app_context = AppContext(
-        config_service=ConfigService(),
-        cycle_service=SqliteCycleService(conn_factory),
-        session_service=SqliteSessionService(conn_factory),
-        exam_service=SqliteExamService(conn_factory),
-        user_service=SqliteUserService(conn_factory),
-        performance_service=SqlitePerformanceService(conn_factory),
-        analytics_service=SqliteAnalyticsService(conn_factory),
-        master_subject_service=SqliteMasterSubjectService(conn_factory),
-        cycle_subject_service=SqliteCycleSubjectService(conn_factory),
-        study_queue_service=SqliteStudyQueueService(conn_factory),
-        work_unit_service=SqliteWorkUnitService(conn_factory),
-        template_subject_service=SqliteTemplateSubjectService(conn_factory),
-        conn_factory=conn_factory
-    )
+    with startup_timeline.phase("compose_app_context"):
+        app_context = AppContext(
+            config_service=ConfigService(),
+            cycle_service=SqliteCycleService(conn_factory),
+            session_service=SqliteSessionService(conn_factory),
+            exam_service=SqliteExamService(conn_factory),
+            user_service=SqliteUserService(conn_factory),
+            # The analytics services only read, so they use snapshot readers that never contend with session writes.
+            performance_service=SqlitePerformanceService(read_pool),
+            analytics_service=SqliteAnalyticsService(read_pool),
+            master_subject_service=SqliteMasterSubjectService(conn_factory),
+            cycle_subject_service=SqliteCycleSubjectService(conn_factory),
+            study_queue_service=SqliteStudyQueueService(conn_factory),
+            work_unit_service=SqliteWorkUnitService(conn_factory),
+            template_subject_service=SqliteTemplateSubjectService(conn_factory),
+            conn_factory=conn_factory,
+            unit_of_work=conn_factory,
+            read_conn_factory=read_pool,
+            service_executor=service_executor
+        )
 
     user = app_context.user_service.get_first_user()
     if not user:
+        # Time spent in the welcome dialog is the user's, not startup's; leave it out of the timeline.
+        startup_timeline.finish()
         apply_theme(app, "Dark")
         welcome_view = WelcomeView()
         welcome_controller = WelcomeController(view=welcome_view, user_service=app_context.user_service)
@@ -134,19 +183,33 @@ def main():
                 log.critical("User setup was cancelled or failed. Application cannot start.")
                 sys.exit(0)
 
-    apply_theme(app, user.theme)
+    with startup_timeline.phase("apply_theme"):
+        apply_theme(app, user.theme)
     log.info(f"Application context initialized for user: '{user.name}' (ID: {user.id})")
 
     log.debug("Initializing main window and controller.")
-    window = MainWindow()
-    controller = MainWindowController(
-        view=window,
-        current_user=user,
-        app_context=app_context,
-        is_dev_mode=args.dev
-    )
-
-    window.show()
+    with startup_timeline.phase("create_main_window"):
+        window = MainWindow()
+    with startup_timeline.phase("main_controller_init"):
+        controller = MainWindowController(
+            view=window,
+            current_user=user,
+            app_context=app_context,
+            is_dev_mode=args.dev
+        )
+
+    def on_first_paint():
+        startup_timeline.mark(FIRST_PAINT)
+        startup_timeline.finish()
+        startup_timeline.log_summary()
+        startup_timeline.write_trace(args.startup_trace)
+        warm_icon_cache()
+        if args.exit_after_first_paint:
+            QTimer.singleShot(0, app.quit)
+
+    window.first_painted.connect(on_first_paint)
+    with startup_timeline.phase("show_main_window"):
+        window.show()
     log.info("Main window shown. Entering event loop.")
     sys.exit(app.exec())
 
@@ -0,0 +1,26 @@
+-- Migration 005: Indexes for the join and filter columns used by the service queries.
+-- Every performance query joins question_performance to study_sessions, and most
+-- filter sessions by user or subject, so those paths must never fall back to a full scan.
+-- tests/services/test_query_plans.py checks the plans of every service statement.
+
+-- Covering index: the aggregates only ever need session_id, topic_name and is_correct (id is the rowid).
+CREATE INDEX IF NOT EXISTS idx_question_performance_session
+    ON question_performance(session_id, topic_name, is_correct);
+
+CREATE INDEX IF NOT EXISTS idx_study_sessions_user_start ON study_sessions(user_id, start_time);
+CREATE INDEX IF NOT EXISTS idx_study_sessions_subject_id ON study_sessions(subject_id);
+-- Deleting a topic checks study_sessions.topic_id for the foreign key, which would otherwise scan.
+CREATE INDEX IF NOT EXISTS idx_study_sessions_topic_id ON study_sessions(topic_id);
+
+-- Partial index for the history and progress lookups, which only ever read live sessions.
+CREATE INDEX IF NOT EXISTS idx_study_sessions_live_cycle
+    ON study_sessions(cycle_id, end_time) WHERE soft_delete = 0;
+
+CREATE INDEX IF NOT EXISTS idx_session_pauses_session_id ON session_pauses(session_id);
+CREATE INDEX IF NOT EXISTS idx_work_units_subject_order ON work_units(subject_id, sequence_order);
+CREATE INDEX IF NOT EXISTS idx_study_queue_cycle_order ON study_queue(cycle_id, queue_order);
+
+-- Partial indexes over the rows that are not soft-deleted.
+CREATE INDEX IF NOT EXISTS idx_study_cycles_live_active ON study_cycles(is_active) WHERE soft_delete = 0;
+CREATE INDEX IF NOT EXISTS idx_exams_live_user_name ON exams(user_id, name) WHERE soft_delete = 0;
+CREATE INDEX IF NOT EXISTS idx_subjects_live_name ON subjects(name) WHERE soft_delete = 0;
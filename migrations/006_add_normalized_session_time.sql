@@ -0,0 +1,65 @@
+-- Migration 006: Normalized, index-friendly time columns for study_sessions.
+-- start_time holds a mix of ISO strings ('Z' suffixes, offsets, naive local times),
+-- so date-range filters had to wrap it in date(), which no index can serve.
+-- start_epoch is the UTC unix time; local_date is the YYYY-MM-DD calendar day in local time.
+-- The services write both columns; the triggers below cover rows inserted by other paths.
+
+ALTER TABLE study_sessions ADD COLUMN start_epoch INTEGER;
+ALTER TABLE study_sessions ADD COLUMN local_date TEXT;
+
+-- A value is timezone-aware when it ends in 'Z' or in a '+HH:MM' / '-HH:MM' offset.
+-- Naive values are already local time, so 'utc' converts them for the epoch and the date is taken as-is.
+UPDATE study_sessions
+SET start_epoch = CAST(CASE
+        WHEN start_time LIKE '%Z' OR (length(start_time) > 10 AND substr(start_time, -6, 1) IN ('+', '-'))
+            THEN strftime('%s', start_time)
+        ELSE strftime('%s', start_time, 'utc')
+    END AS INTEGER),
+    local_date = CASE
+        WHEN start_time LIKE '%Z' OR (length(start_time) > 10 AND substr(start_time, -6, 1) IN ('+', '-'))
+            THEN date(start_time, 'localtime')
+        ELSE date(start_time)
+    END;
+
+CREATE TRIGGER IF NOT EXISTS trg_study_sessions_normalize_insert
+AFTER INSERT ON study_sessions
+WHEN NEW.start_epoch IS NULL OR NEW.local_date IS NULL
+BEGIN
+    UPDATE study_sessions
+    SET start_epoch = CAST(CASE
+            WHEN NEW.start_time LIKE '%Z' OR (length(NEW.start_time) > 10 AND substr(NEW.start_time, -6, 1) IN ('+', '-'))
+                THEN strftime('%s', NEW.start_time)
+            ELSE strftime('%s', NEW.start_time, 'utc')
+        END AS INTEGER),
+        local_date = CASE
+            WHEN NEW.start_time LIKE '%Z' OR (length(NEW.start_time) > 10 AND substr(NEW.start_time, -6, 1) IN ('+', '-'))
+                THEN date(NEW.start_time, 'localtime')
+            ELSE date(NEW.start_time)
+        END
+    WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_study_sessions_normalize_update
+AFTER UPDATE OF start_time ON study_sessions
+WHEN NEW.start_time IS NOT OLD.start_time
+BEGIN
+    UPDATE study_sessions
+    SET start_epoch = CAST(CASE
+            WHEN NEW.start_time LIKE '%Z' OR (length(NEW.start_time) > 10 AND substr(NEW.start_time, -6, 1) IN ('+', '-'))
+                THEN strftime('%s', NEW.start_time)
+            ELSE strftime('%s', NEW.start_time, 'utc')
+        END AS INTEGER),
+        local_date = CASE
+            WHEN NEW.start_time LIKE '%Z' OR (length(NEW.start_time) > 10 AND substr(NEW.start_time, -6, 1) IN ('+', '-'))
+                THEN date(NEW.start_time, 'localtime')
+            ELSE date(NEW.start_time)
+        END
+    WHERE id = NEW.id;
+END;
+
+-- Day-window filters are per user (performance screens) or per cycle (analytics dashboard).
+-- (user_id, start_epoch) supersedes the raw-string (user_id, start_time) index from migration 005.
+DROP INDEX IF EXISTS idx_study_sessions_user_start;
+CREATE INDEX IF NOT EXISTS idx_study_sessions_user_local_date ON study_sessions(user_id, local_date);
+CREATE INDEX IF NOT EXISTS idx_study_sessions_cycle_local_date ON study_sessions(cycle_id, local_date);
+CREATE INDEX IF NOT EXISTS idx_study_sessions_user_start_epoch ON study_sessions(user_id, start_epoch);
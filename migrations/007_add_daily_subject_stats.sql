@@ -0,0 +1,141 @@
+-- Migration 007: daily_subject_stats, a per-day rollup of study_sessions and question_performance.
+-- One row per (user, cycle, subject, local_date). The analytics queries read this table instead
+-- of re-aggregating every logged question, so their cost grows with days rather than questions.
+-- cycle_id is 0 for sessions logged outside a cycle (primary key columns cannot be NULL here).
+-- questions/correct count every logged question; seconds/sessions only count finished sessions.
+-- The triggers below keep it current. SqliteSessionService.rebuild_daily_stats() rebuilds it from scratch.
+
+CREATE TABLE IF NOT EXISTS daily_subject_stats (
+    user_id    INTEGER NOT NULL,
+    cycle_id   INTEGER NOT NULL,
+    subject_id INTEGER NOT NULL,
+    local_date TEXT    NOT NULL,
+    questions  INTEGER NOT NULL DEFAULT 0,
+    correct    INTEGER NOT NULL DEFAULT 0,
+    seconds    INTEGER NOT NULL DEFAULT 0,
+    sessions   INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, cycle_id, subject_id, local_date)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_daily_subject_stats_cycle_date ON daily_subject_stats(cycle_id, local_date);
+CREATE INDEX IF NOT EXISTS idx_daily_subject_stats_user_date ON daily_subject_stats(user_id, local_date);
+
+INSERT INTO daily_subject_stats (user_id, cycle_id, subject_id, local_date, questions, correct, seconds, sessions)
+SELECT SS.user_id,
+       IFNULL(SS.cycle_id, 0),
+       SS.subject_id,
+       SS.local_date,
+       SUM((SELECT COUNT(*) FROM question_performance AS QP WHERE QP.session_id = SS.id)),
+       SUM((SELECT IFNULL(SUM(QP.is_correct), 0) FROM question_performance AS QP WHERE QP.session_id = SS.id)),
+       SUM(CASE WHEN SS.end_time IS NOT NULL THEN IFNULL(SS.liquid_duration_sec, 0) ELSE 0 END),
+       SUM(SS.end_time IS NOT NULL)
+FROM study_sessions AS SS
+WHERE SS.user_id IS NOT NULL AND SS.local_date IS NOT NULL
+GROUP BY SS.user_id, IFNULL(SS.cycle_id, 0), SS.subject_id, SS.local_date;
+
+-- A session row changing (or appearing/disappearing) re-aggregates the one or two day groups it belongs to.
+-- A group holds a single day of one subject, so this touches a handful of sessions at most.
+CREATE TRIGGER IF NOT EXISTS trg_daily_stats_session_insert
+AFTER INSERT ON study_sessions
+WHEN NEW.user_id IS NOT NULL AND NEW.local_date IS NOT NULL
+BEGIN
+    DELETE FROM daily_subject_stats
+    WHERE user_id = NEW.user_id AND cycle_id = IFNULL(NEW.cycle_id, 0)
+      AND subject_id = NEW.subject_id AND local_date = NEW.local_date;
+    INSERT INTO daily_subject_stats (user_id, cycle_id, subject_id, local_date, questions, correct, seconds, sessions)
+    SELECT NEW.user_id, IFNULL(NEW.cycle_id, 0), NEW.subject_id, NEW.local_date,
+           SUM((SELECT COUNT(*) FROM question_performance AS QP WHERE QP.session_id = SS.id)),
+           SUM((SELECT IFNULL(SUM(QP.is_correct), 0) FROM question_performance AS QP WHERE QP.session_id = SS.id)),
+           SUM(CASE WHEN SS.end_time IS NOT NULL THEN IFNULL(SS.liquid_duration_sec, 0) ELSE 0 END),
+           SUM(SS.end_time IS NOT NULL)
+    FROM study_sessions AS SS
+    WHERE SS.user_id = NEW.user_id AND SS.local_date = NEW.local_date
+      AND SS.subject_id = NEW.subject_id AND IFNULL(SS.cycle_id, 0) = IFNULL(NEW.cycle_id, 0)
+    HAVING COUNT(*) > 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_daily_stats_session_update
+AFTER UPDATE OF user_id, cycle_id, subject_id, local_date, end_time, liquid_duration_sec ON study_sessions
+BEGIN
+    DELETE FROM daily_subject_stats
+    WHERE user_id = OLD.user_id AND cycle_id = IFNULL(OLD.cycle_id, 0)
+      AND subject_id = OLD.subject_id AND local_date = OLD.local_date;
+    INSERT INTO daily_subject_stats (user_id, cycle_id, subject_id, local_date, questions, correct, seconds, sessions)
+    SELECT OLD.user_id, IFNULL(OLD.cycle_id, 0), OLD.subject_id, OLD.local_date,
+           SUM((SELECT COUNT(*) FROM question_performance AS QP WHERE QP.session_id = SS.id)),
+           SUM((SELECT IFNULL(SUM(QP.is_correct), 0) FROM question_performance AS QP WHERE QP.session_id = SS.id)),
+           SUM(CASE WHEN SS.end_time IS NOT NULL THEN IFNULL(SS.liquid_duration_sec, 0) ELSE 0 END),
+           SUM(SS.end_time IS NOT NULL)
+    FROM study_sessions AS SS
+    WHERE SS.user_id = OLD.user_id AND SS.local_date = OLD.local_date
+      AND SS.subject_id = OLD.subject_id AND IFNULL(SS.cycle_id, 0) = IFNULL(OLD.cycle_id, 0)
+    HAVING COUNT(*) > 0;
+
+    DELETE FROM daily_subject_stats
+    WHERE user_id = NEW.user_id AND cycle_id = IFNULL(NEW.cycle_id, 0)
+      AND subject_id = NEW.subject_id AND local_date = NEW.local_date;
+    INSERT INTO daily_subject_stats (user_id, cycle_id, subject_id, local_date, questions, correct, seconds, sessions)
+    SELECT NEW.user_id, IFNULL(NEW.cycle_id, 0), NEW.subject_id, NEW.local_date,
+           SUM((SELECT COUNT(*) FROM question_performance AS QP WHERE QP.session_id = SS.id)),
+           SUM((SELECT IFNULL(SUM(QP.is_correct), 0) FROM question_performance AS QP WHERE QP.session_id = SS.id)),
+           SUM(CASE WHEN SS.end_time IS NOT NULL THEN IFNULL(SS.liquid_duration_sec, 0) ELSE 0 END),
+           SUM(SS.end_time IS NOT NULL)
+    FROM study_sessions AS SS
+    WHERE SS.user_id = NEW.user_id AND SS.local_date = NEW.local_date
+      AND SS.subject_id = NEW.subject_id AND IFNULL(SS.cycle_id, 0) = IFNULL(NEW.cycle_id, 0)
+    HAVING COUNT(*) > 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_daily_stats_session_delete
+AFTER DELETE ON study_sessions
+BEGIN
+    DELETE FROM daily_subject_stats
+    WHERE user_id = OLD.user_id AND cycle_id = IFNULL(OLD.cycle_id, 0)
+      AND subject_id = OLD.subject_id AND local_date = OLD.local_date;
+    INSERT INTO daily_subject_stats (user_id, cycle_id, subject_id, local_date, questions, correct, seconds, sessions)
+    SELECT OLD.user_id, IFNULL(OLD.cycle_id, 0), OLD.subject_id, OLD.local_date,
+           SUM((SELECT COUNT(*) FROM question_performance AS QP WHERE QP.session_id = SS.id)),
+           SUM((SELECT IFNULL(SUM(QP.is_correct), 0) FROM question_performance AS QP WHERE QP.session_id = SS.id)),
+           SUM(CASE WHEN SS.end_time IS NOT NULL THEN IFNULL(SS.liquid_duration_sec, 0) ELSE 0 END),
+           SUM(SS.end_time IS NOT NULL)
+    FROM study_sessions AS SS
+    WHERE SS.user_id = OLD.user_id AND SS.local_date = OLD.local_date
+      AND SS.subject_id = OLD.subject_id AND IFNULL(SS.cycle_id, 0) = IFNULL(OLD.cycle_id, 0)
+    HAVING COUNT(*) > 0;
+END;
+
+-- Questions arrive in bulk when a session finishes, so they adjust the counters by delta instead.
+CREATE TRIGGER IF NOT EXISTS trg_daily_stats_question_insert
+AFTER INSERT ON question_performance
+BEGIN
+    UPDATE daily_subject_stats
+    SET questions = questions + 1,
+        correct = correct + IFNULL(NEW.is_correct, 0)
+    WHERE (user_id, cycle_id, subject_id, local_date) =
+          (SELECT user_id, IFNULL(cycle_id, 0), subject_id, local_date FROM study_sessions WHERE id = NEW.session_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_daily_stats_question_delete
+AFTER DELETE ON question_performance
+BEGIN
+    UPDATE daily_subject_stats
+    SET questions = questions - 1,
+        correct = correct - IFNULL(OLD.is_correct, 0)
+    WHERE (user_id, cycle_id, subject_id, local_date) =
+          (SELECT user_id, IFNULL(cycle_id, 0), subject_id, local_date FROM study_sessions WHERE id = OLD.session_id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_daily_stats_question_update
+AFTER UPDATE OF session_id, is_correct ON question_performance
+BEGIN
+    UPDATE daily_subject_stats
+    SET questions = questions - 1,
+        correct = correct - IFNULL(OLD.is_correct, 0)
+    WHERE (user_id, cycle_id, subject_id, local_date) =
+          (SELECT user_id, IFNULL(cycle_id, 0), subject_id, local_date FROM study_sessions WHERE id = OLD.session_id);
+    UPDATE daily_subject_stats
+    SET questions = questions + 1,
+        correct = correct + IFNULL(NEW.is_correct, 0)
+    WHERE (user_id, cycle_id, subject_id, local_date) =
+          (SELECT user_id, IFNULL(cycle_id, 0), subject_id, local_date FROM study_sessions WHERE id = NEW.session_id);
+END;
@@ -0,0 +1,10 @@
+-- Migration 008: Persisted Diagnoser aggregates, one checkpoint per cycle subject.
+-- state_json is a DiagnoserState (app/core/tutor_engine/diagnoser_state.py). A replan resumes
+-- from it and only folds in sessions newer than last_session_id, instead of rescanning the history.
+
+CREATE TABLE IF NOT EXISTS diagnoser_checkpoints (
+    cycle_subject_id INTEGER PRIMARY KEY,
+    state_json       TEXT NOT NULL,
+    updated_at       TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (cycle_subject_id) REFERENCES cycle_subjects (id) ON DELETE CASCADE
+);
@@ -0,0 +1,6 @@
+-- Migration 009: Keyset pagination index for the paged session history.
+-- get_history_page walks a cycle's live sessions newest first by (start_time, id) and resumes
+-- after the last row of the previous page, so each page is an index range seek rather than
+-- an OFFSET that re-reads every earlier page (id is the rowid, so it is part of every index entry).
+CREATE INDEX IF NOT EXISTS idx_study_sessions_live_cycle_start
+    ON study_sessions(cycle_id, start_time) WHERE soft_delete = 0;
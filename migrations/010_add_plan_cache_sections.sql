@@ -0,0 +1,15 @@
+-- Migration 010: Sectioned, compressed plan cache.
+-- A cached plan is stored as one row per section (see app/core/plan_codec.py): the recommended
+-- scaffold, the processed subjects, the subject models, the sequenced plan and a small header.
+-- Each row holds zlib-compressed JSON, so readers decode only the sections they need and a plan
+-- patch rewrites only the sections it touches. study_cycles.plan_cache_json is still read for
+-- plans cached before this migration and is cleared the next time the plan is saved.
+
+CREATE TABLE IF NOT EXISTS plan_cache_sections (
+    cycle_id INTEGER NOT NULL,
+    section  TEXT    NOT NULL,
+    codec    INTEGER NOT NULL,
+    data     BLOB    NOT NULL,
+    PRIMARY KEY (cycle_id, section),
+    FOREIGN KEY (cycle_id) REFERENCES study_cycles (id) ON DELETE CASCADE
+) WITHOUT ROWID;
@@ -0,0 +1,8 @@
+-- Migration 011: Order the paged session history by the normalized start time.
+-- start_time holds mixed ISO formats (see migration 006), so comparing it as text can misorder
+-- sessions. get_history_rows now orders the date column by (start_epoch, id) and resumes after the
+-- last row of the previous page; this index serves that range seek the way migration 009's
+-- (cycle_id, start_time) index did, which nothing orders by any more.
+DROP INDEX IF EXISTS idx_study_sessions_live_cycle_start;
+CREATE INDEX IF NOT EXISTS idx_study_sessions_live_cycle_epoch
+    ON study_sessions(cycle_id, start_epoch) WHERE soft_delete = 0;
@@ -0,0 +1,62 @@
+-- Migration 012: A per-cycle version number of everything the Tutor reads from the study history.
+-- The plan cache is keyed by a fingerprint of the Tutor's inputs (get_history_watermark). Sums over
+-- the sessions miss edits that keep them constant: a session moved to another subject, a changed
+-- study method, or questions whose topic or correctness changed at the same totals. The triggers
+-- below bump the version of every cycle such a write touches, so any of them changes the fingerprint.
+-- cycle_id is 0 for sessions logged outside a cycle, as in daily_subject_stats.
+
+CREATE TABLE IF NOT EXISTS history_versions (
+    cycle_id INTEGER PRIMARY KEY,
+    version  INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_history_version_session_insert
+AFTER INSERT ON study_sessions
+BEGIN
+    INSERT INTO history_versions (cycle_id, version) VALUES (IFNULL(NEW.cycle_id, 0), 1)
+    ON CONFLICT(cycle_id) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_history_version_session_update
+AFTER UPDATE OF cycle_id, subject_id, start_time, start_epoch, end_time, liquid_duration_sec,
+                study_method, user_feedback_effectiveness, soft_delete ON study_sessions
+BEGIN
+    INSERT INTO history_versions (cycle_id, version) VALUES (IFNULL(OLD.cycle_id, 0), 1)
+    ON CONFLICT(cycle_id) DO UPDATE SET version = version + 1;
+    INSERT INTO history_versions (cycle_id, version) VALUES (IFNULL(NEW.cycle_id, 0), 1)
+    ON CONFLICT(cycle_id) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_history_version_session_delete
+AFTER DELETE ON study_sessions
+BEGIN
+    INSERT INTO history_versions (cycle_id, version) VALUES (IFNULL(OLD.cycle_id, 0), 1)
+    ON CONFLICT(cycle_id) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_history_version_question_insert
+AFTER INSERT ON question_performance
+BEGIN
+    INSERT INTO history_versions (cycle_id, version)
+    VALUES ((SELECT IFNULL(cycle_id, 0) FROM study_sessions WHERE id = NEW.session_id), 1)
+    ON CONFLICT(cycle_id) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_history_version_question_update
+AFTER UPDATE OF session_id, topic_name, difficulty_level, is_correct ON question_performance
+BEGIN
+    INSERT INTO history_versions (cycle_id, version)
+    VALUES ((SELECT IFNULL(cycle_id, 0) FROM study_sessions WHERE id = OLD.session_id), 1)
+    ON CONFLICT(cycle_id) DO UPDATE SET version = version + 1;
+    INSERT INTO history_versions (cycle_id, version)
+    VALUES ((SELECT IFNULL(cycle_id, 0) FROM study_sessions WHERE id = NEW.session_id), 1)
+    ON CONFLICT(cycle_id) DO UPDATE SET version = version + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_history_version_question_delete
+AFTER DELETE ON question_performance
+BEGIN
+    INSERT INTO history_versions (cycle_id, version)
+    VALUES ((SELECT IFNULL(cycle_id, 0) FROM study_sessions WHERE id = OLD.session_id), 1)
+    ON CONFLICT(cycle_id) DO UPDATE SET version = version + 1;
+END;
@@ -0,0 +1,56 @@
+# tests/common/widgets/test_downsampled_chart.py
+import pytest
+from PySide6.QtCharts import QChart, QChartView, QLineSeries, QValueAxis
+from PySide6.QtCore import Qt
+
+from app.common.widgets.downsampled_chart import ANIMATION_POINT_LIMIT, ChartDownsampler
+
+
+@pytest.fixture
+def chart_view(qtbot):
+    chart = QChart()
+    chart.setAnimationOptions(QChart.AnimationOption.SeriesAnimations)
+    view = QChartView(chart)
+    view.resize(400, 300)
+    qtbot.addWidget(view)
+    return view
+
+
+def _plot(chart: QChart, downsampler: ChartDownsampler, xs, ys) -> QLineSeries:
+    series = QLineSeries()
+    downsampler.set_points(series, xs, ys)
+    chart.addSeries(series)
+    axis_x = QValueAxis()
+    axis_x.setRange(xs[0], xs[-1])
+    chart.addAxis(axis_x, Qt.AlignmentFlag.AlignBottom)
+    series.attachAxis(axis_x)
+    downsampler.apply()
+    return series
+
+
+def _xs(series: QLineSeries) -> list:
+    return [point.x() for point in series.points()]
+
+
+def test_small_series_are_drawn_whole_and_animated(chart_view):
+    chart = chart_view.chart()
+    series = _plot(chart, ChartDownsampler(chart), [0, 1, 2, 3], [4, 2, 5, 1])
+
+    assert _xs(series) == [0, 1, 2, 3]
+    assert chart.animationOptions() == QChart.AnimationOption.SeriesAnimations
+
+
+def test_long_series_follow_the_plot_width_and_zoom(qtbot, chart_view):
+    chart = chart_view.chart()
+    chart_view.show()
+    qtbot.waitUntil(lambda: chart.plotArea().width() > 1)
+    xs = list(range(5000))
+    series = _plot(chart, ChartDownsampler(chart), xs, [x % 10 for x in xs])
+
+    assert chart.animationOptions() == QChart.AnimationOption.NoAnimation
+    assert 3 <= series.count() <= chart.plotArea().width() < ANIMATION_POINT_LIMIT
+
+    # Zooming in redraws just the visible range (plus a point past each edge) at full width.
+    chart.axes(Qt.Orientation.Horizontal)[0].setRange(1000, 1100)
+    qtbot.waitUntil(lambda: _xs(series)[0] == 999)
+    assert _xs(series) == list(range(999, 1102))
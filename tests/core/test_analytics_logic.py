@@ -1,5 +1,5 @@
 import pytest
-from app.core.analytics_logic import calculate_moving_average, calculate_streak_stats
+from app.core.analytics_logic import calculate_moving_average, calculate_streak_stats, downsample_lttb
 from app.services.interfaces import DailyPerformance
 from datetime import date
 
@@ -31,6 +31,26 @@ def test_calculate_moving_average_window_larger_than_data():
     assert calculate_moving_average(data, window_size) == expected
 
 
+# Tests for downsample_lttb
+def test_downsample_lttb_keeps_short_lines():
+    assert downsample_lttb([1, 2, 3], [5, 6, 7], threshold=3) == ([1, 2, 3], [5, 6, 7])
+    assert downsample_lttb([1, 2, 3, 4], [5, 6, 7, 8], threshold=2) == ([1, 2, 3, 4], [5, 6, 7, 8])
+
+
+def test_downsample_lttb_keeps_the_ends_and_the_extremes():
+    xs = list(range(1000))
+    ys = [(x % 7) / 10 for x in xs]
+    ys[400], ys[700] = 50.0, -50.0
+
+    sampled_x, sampled_y = downsample_lttb(xs, ys, threshold=50)
+
+    assert len(sampled_x) == len(sampled_y) == 50
+    assert (sampled_x[0], sampled_x[-1]) == (0, 999)
+    assert sampled_x == sorted(set(sampled_x))
+    assert 400 in sampled_x and 700 in sampled_x
+    assert max(sampled_y) == 50.0 and min(sampled_y) == -50.0
+
+
 # Tests for calculate_streak_stats
 def test_calculate_streak_stats_empty_data():
     expected = {
@@ -0,0 +1,86 @@
+# tests/core/test_async_services.py
+import asyncio
+import threading
+
+import pytest
+from PySide6.QtCore import QObject
+
+from app.core.async_services import ServiceExecutor
+
+
+class _FakeService:
+    def __init__(self):
+        self.calls = []
+
+    def get_history(self, cycle_id: int):
+        self.calls.append(threading.get_ident())
+        return [f"session-{cycle_id}"]
+
+    def broken(self):
+        raise ValueError("query failed")
+
+
+@pytest.fixture
+def executor(qapp):
+    executor = ServiceExecutor(max_threads=2)
+    yield executor
+    executor.shutdown()
+
+
+def test_facade_runs_off_the_gui_thread_and_delivers_on_it(qtbot, executor):
+    service = _FakeService()
+    delivered_on = []
+
+    future = executor.wrap(service).get_history(7)
+    future.then(lambda result: delivered_on.append((threading.get_ident(), result)))
+
+    with qtbot.waitSignal(future.finished, timeout=2000) as blocker:
+        pass
+
+    assert blocker.args == [["session-7"]]
+    assert service.calls[0] != threading.get_ident()
+    assert delivered_on == [(threading.get_ident(), ["session-7"])]
+
+
+def test_errors_are_delivered_to_the_error_callback(qtbot, executor):
+    errors = []
+    future = executor.wrap(_FakeService()).broken().then(lambda _: None, errors.append)
+
+    with qtbot.waitSignal(future.failed, timeout=2000):
+        pass
+
+    assert isinstance(errors[0], ValueError)
+
+
+def test_future_is_awaitable_from_asyncio(executor):
+    future = executor.wrap(_FakeService()).get_history(3)
+
+    async def load():
+        return await future
+
+    assert asyncio.run(load()) == ["session-3"]
+
+
+def test_result_is_dropped_when_context_is_destroyed(qtbot, executor):
+    context = QObject()
+    release = threading.Event()
+    delivered = []
+
+    def slow_call():
+        release.wait(2)
+        return "late"
+
+    executor.submit(slow_call, context=context).then(delivered.append)
+    context.deleteLater()
+    qtbot.wait(10)
+    release.set()
+    executor.wait_for_done(2000)
+    qtbot.wait(10)
+
+    assert delivered == []
+
+
+def test_inline_executor_resolves_immediately(qapp):
+    delivered = []
+    ServiceExecutor(max_threads=0).wrap(_FakeService()).get_history(1).then(delivered.append)
+    assert delivered == [["session-1"]]
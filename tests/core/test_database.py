@@ -0,0 +1,112 @@
+# tests/core/test_database.py
+import sqlite3
+import threading
+
+import pytest
+
+from app.core.database import PooledSqliteConnectionFactory, ReadOnlySqliteConnectionFactory
+
+
+@pytest.fixture
+def pooled_factory(tmp_path):
+    factory = PooledSqliteConnectionFactory(str(tmp_path / "pool.db"))
+    yield factory
+    factory.close_all()
+
+
+def test_same_thread_reuses_connection(pooled_factory):
+    assert pooled_factory.get_connection() is pooled_factory.get_connection()
+    assert pooled_factory.active_connection_count() == 1
+
+
+def test_each_thread_gets_its_own_connection(pooled_factory):
+    main_conn = pooled_factory.get_connection()
+    worker_conns = []
+
+    def worker():
+        worker_conns.append(pooled_factory.get_connection())
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert worker_conns[0] is not main_conn
+    assert pooled_factory.active_connection_count() == 2
+
+
+def test_tuned_pragmas_are_applied(pooled_factory):
+    conn = pooled_factory.get_connection()
+
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0].lower() == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+    assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+    assert conn.execute("PRAGMA cache_size").fetchone()[0] == -16000
+
+
+def test_close_releases_without_closing(pooled_factory):
+    conn = pooled_factory.get_connection()
+    conn.execute("CREATE TABLE t (x INTEGER)")
+    conn.execute("INSERT INTO t VALUES (1)")
+    conn.close()
+
+    # The uncommitted insert is rolled back, but the connection stays usable.
+    assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+    assert pooled_factory.get_connection() is conn
+
+
+def test_close_all_disposes_and_reopens(pooled_factory):
+    first = pooled_factory.get_connection()
+    pooled_factory.close_all()
+
+    assert pooled_factory.active_connection_count() == 0
+    second = pooled_factory.get_connection()
+    assert second is not first
+    assert second.execute("SELECT 1").fetchone()[0] == 1
+
+
+def test_unhealthy_connection_is_replaced(tmp_path):
+    factory = PooledSqliteConnectionFactory(str(tmp_path / "pool.db"), health_check_interval_sec=0)
+    conn = factory.get_connection()
+    conn.dispose()
+
+    replacement = factory.get_connection()
+    assert replacement is not conn
+    assert replacement.execute("SELECT 1").fetchone()[0] == 1
+    factory.close_all()
+
+
+@pytest.fixture
+def writer_and_reader(tmp_path):
+    db_path = str(tmp_path / "snapshot.db")
+    writer = PooledSqliteConnectionFactory(db_path)
+    with writer.get_connection() as conn:
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.execute("INSERT INTO t VALUES (1)")
+    reader = ReadOnlySqliteConnectionFactory(db_path)
+    yield writer, reader
+    reader.close_all()
+    writer.close_all()
+
+
+def test_read_only_connection_rejects_writes(writer_and_reader):
+    _, reader = writer_and_reader
+    conn = reader.get_connection()
+
+    assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 1
+    with pytest.raises(sqlite3.OperationalError):
+        conn.execute("INSERT INTO t VALUES (2)")
+
+
+def test_snapshot_is_consistent_and_does_not_block_writer(writer_and_reader):
+    writer, reader = writer_and_reader
+
+    with reader.snapshot() as conn:
+        with conn:  # A service-style call must not end the pinned read transaction.
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 1
+
+        with writer.get_connection() as writer_conn:
+            writer_conn.execute("INSERT INTO t VALUES (2)")
+
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 1
+
+    assert reader.get_connection().execute("SELECT COUNT(*) FROM t").fetchone()[0] == 2
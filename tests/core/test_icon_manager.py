@@ -0,0 +1,50 @@
+# tests/core/test_icon_manager.py
+import pytest
+from PySide6.QtGui import QColor
+
+from app.core import icon_manager
+from app.core.icon_manager import clear_icon_cache, get_icon, get_pixmap, warm_icon_cache
+from app.core.signals import app_signals
+
+
+@pytest.fixture(autouse=True)
+def empty_caches(qapp):
+    clear_icon_cache()
+    yield
+    clear_icon_cache()
+
+
+def test_icons_are_built_once_per_name_and_color():
+    icon = get_icon("HISTORY", "#EAEAEA")
+
+    assert get_icon("HISTORY", QColor("#eaeaea")) is icon
+    assert get_icon("HISTORY") is icon
+    assert get_icon("HISTORY", "#FFCC00") is not icon
+
+
+def test_pixmaps_are_rasterized_once_per_size():
+    pixmap = get_pixmap("SUBJECTS", 48)
+
+    assert pixmap.width() == 48
+    assert get_pixmap("SUBJECTS", 48) is pixmap
+    assert get_pixmap("SUBJECTS", 24) is not pixmap
+
+
+def test_theme_change_drops_cached_icons_and_pixmaps():
+    get_icon("HISTORY")
+    pixmap = get_pixmap("HISTORY", 32)
+
+    app_signals.theme_changed.emit()
+
+    assert not icon_manager._icon_cache and not icon_manager._pixmap_cache
+    assert get_pixmap("HISTORY", 32) is not pixmap
+
+
+def test_warm_up_fills_the_caches_in_batches(qtbot):
+    pixmaps = [("SUBJECTS", size) for size in (16, 24, 32, 48, 64)]
+
+    warm_icon_cache(icons=["HISTORY"], pixmaps=pixmaps)
+
+    assert not icon_manager._pixmap_cache  # Nothing is built until the event loop runs.
+    qtbot.waitUntil(lambda: len(icon_manager._pixmap_cache) == len(pixmaps))
+    assert ("HISTORY", "#ffeaeaea") in icon_manager._icon_cache
@@ -0,0 +1,67 @@
+# tests/core/test_query_instrumentation.py
+import pytest
+
+from app.core.query_instrumentation import QueryInstrumentation, normalize_statement, query_instrumentation
+from app.services.session_service import SqliteSessionService
+from app.services.user_service import SqliteUserService
+
+
+@pytest.fixture
+def instrumentation():
+    query_instrumentation.reset()
+    query_instrumentation.enable()
+    yield query_instrumentation
+    query_instrumentation.disable()
+    query_instrumentation.reset()
+
+
+def test_normalize_statement_strips_literals_and_whitespace():
+    query = """
+        SELECT * FROM users   -- fetch one
+        WHERE name = 'O''Brien' AND id = 42;
+    """
+    assert normalize_statement(query) == "SELECT * FROM users WHERE name = ? AND id = ?"
+
+
+def test_snapshot_reports_percentiles_and_sorts_by_total_time():
+    recorder = QueryInstrumentation()
+    for ms in range(1, 101):
+        recorder.record("Svc.slow", "SELECT 1", float(ms), rows=2)
+    recorder.record("Svc.fast", "SELECT 2", 0.5, rows=1)
+
+    slow, fast = recorder.snapshot()
+
+    assert slow.caller == "Svc.slow"
+    assert slow.calls == 100
+    assert slow.rows == 200
+    assert slow.p50_ms == 50.0
+    assert slow.p95_ms == 95.0
+    assert slow.p99_ms == 99.0
+    assert fast.caller == "Svc.fast"
+
+
+def test_base_service_records_caller_and_rows(mock_db_factory, instrumentation):
+    service = SqliteUserService(mock_db_factory)
+    user = service.create_user("Profiled User", "Beginner")
+    assert service.get_user(user.id).name == "Profiled User"
+
+    stats = {(s.caller, s.statement): s for s in instrumentation.snapshot()}
+
+    lookup = stats[("SqliteUserService.get_user", "SELECT * FROM users WHERE id = ?")]
+    assert lookup.calls == 1
+    assert lookup.rows == 1
+    assert ("SqliteUserService.create_user", "INSERT INTO users (name, study_level) VALUES (?, ?)") in stats
+
+
+
+def test_queries_run_through_fetch_models_are_attributed_to_the_service_method(mock_db_factory, instrumentation):
+    SqliteSessionService(mock_db_factory).get_history_for_cycle(1)
+
+    callers = {s.caller for s in instrumentation.snapshot()}
+
+    assert callers == {"SqliteSessionService.get_history_for_cycle"}
+
+def test_disabled_instrumentation_records_nothing(mock_db_factory):
+    query_instrumentation.reset()
+    SqliteUserService(mock_db_factory).get_first_user()
+    assert query_instrumentation.snapshot() == []
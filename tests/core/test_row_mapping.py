@@ -0,0 +1,62 @@
+# tests/core/test_row_mapping.py
+import sqlite3
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import pytest
+
+from app.core.row_mapping import model_row_factory, tuple_mapper
+from app.models.session import QuestionPerformance, StudySession
+
+
+@dataclass(slots=True, frozen=True)
+class _Sample:
+    id: int
+    name: str
+    note: Optional[str] = None
+    score: int = 0
+    tags: List[str] = field(default_factory=list)
+
+
+def test_tuple_mapper_reorders_columns_and_fills_defaults():
+    build = tuple_mapper(_Sample, ["score", "name", "id"])
+
+    assert build((7, "a", 1)) == _Sample(id=1, name="a", note=None, score=7)
+
+
+def test_tuple_mapper_falls_back_when_a_factory_field_is_skipped():
+    @dataclass
+    class Gapped:
+        id: int
+        tags: List[str] = field(default_factory=list)
+        name: str = ""
+
+    build = tuple_mapper(Gapped, ["id", "name"])
+
+    assert build((1, "a")) == Gapped(id=1, name="a")
+
+
+def test_tuple_mapper_rejects_unknown_and_missing_columns():
+    with pytest.raises(TypeError):
+        tuple_mapper(_Sample, ["id", "name", "bogus"])
+    with pytest.raises(TypeError):
+        tuple_mapper(_Sample, ["name"])
+
+
+def test_model_row_factory_builds_models_from_cursor(db_connection):
+    db_connection.execute("INSERT INTO users (id, name, study_level) VALUES (1, 'Row User', 'Beginner') ON CONFLICT(id) DO NOTHING")
+    db_connection.execute("INSERT INTO subjects (id, name) VALUES (1, 'Math') ON CONFLICT(id) DO NOTHING")
+    db_connection.execute("INSERT INTO study_sessions (id, user_id, subject_id, start_time) VALUES (1, 1, 1, '2024-01-01T10:00:00')")
+    db_connection.execute("INSERT INTO question_performance (session_id, topic_name, difficulty_level, is_correct) VALUES (1, 't', 2, 1)")
+
+    cursor = db_connection.execute("SELECT * FROM question_performance")
+    cursor.row_factory = model_row_factory(QuestionPerformance, cursor.description)
+    assert cursor.fetchall() == [QuestionPerformance(id=1, session_id=1, topic_name='t', difficulty_level=2, is_correct=1)]
+
+    cursor = db_connection.execute("SELECT ss.*, s.name AS subject_name FROM study_sessions ss JOIN subjects s ON s.id = ss.subject_id")
+    cursor.row_factory = model_row_factory(StudySession, cursor.description)
+    session = cursor.fetchone()
+    expected = StudySession(**dict(db_connection.execute(
+        "SELECT ss.*, s.name AS subject_name FROM study_sessions ss JOIN subjects s ON s.id = ss.subject_id").fetchone()))
+    assert session == expected
+    assert session.questions == [] and session.questions is not expected.questions
@@ -0,0 +1,101 @@
+# tests/core/test_signals.py
+import pytest
+import shiboken6
+from PySide6.QtCore import QCoreApplication, QEvent, QObject
+
+from app.core.signals import ChangeKind, DataChange, InvalidationBus
+
+
+@pytest.fixture
+def bus(qapp):
+    return InvalidationBus()
+
+
+@pytest.fixture
+def owner(qapp):
+    return QObject()
+
+
+def test_changes_published_in_one_turn_are_delivered_once(qtbot, bus, owner):
+    received = []
+    bus.subscribe(ChangeKind.CYCLES | ChangeKind.STUDY_QUEUE, received.append, owner=owner)
+
+    bus.publish(DataChange.of(ChangeKind.CYCLES, [1]))
+    bus.publish(DataChange.of(ChangeKind.STUDY_QUEUE, [2]))
+    bus.publish(DataChange.of(ChangeKind.CYCLES, [1]))
+    assert received == []
+
+    qtbot.waitUntil(lambda: len(received) == 1, timeout=1000)
+    qtbot.wait(20)
+
+    assert received == [DataChange.of(ChangeKind.CYCLES | ChangeKind.STUDY_QUEUE, [1, 2])]
+
+
+def test_subscribers_only_see_kinds_they_depend_on(bus, owner):
+    exams, sessions = [], []
+    bus.subscribe(ChangeKind.EXAMS, exams.append, owner=owner)
+    bus.subscribe(ChangeKind.SESSIONS, sessions.append, owner=owner)
+
+    bus.publish(DataChange.of(ChangeKind.EXAMS | ChangeKind.CYCLES))
+    bus.flush()
+
+    assert exams == [DataChange.of(ChangeKind.EXAMS | ChangeKind.CYCLES)]
+    assert sessions == []
+
+
+def test_an_unscoped_change_leaves_the_merge_unscoped():
+    scoped = DataChange.of(ChangeKind.CYCLES, [1], [10])
+    merged = scoped.merge(DataChange.of(ChangeKind.EXAMS))
+
+    assert merged.kinds == ChangeKind.CYCLES | ChangeKind.EXAMS
+    assert merged.cycle_ids == frozenset() and merged.subject_ids == frozenset()
+    assert merged.affects_cycle(99)
+    assert scoped.affects_cycle(1) and not scoped.affects_cycle(2)
+
+
+def test_unsubscribe_and_failing_subscribers(bus, owner):
+    received, removed = [], []
+
+    def broken(change):
+        raise RuntimeError("boom")
+
+    bus.subscribe(ChangeKind.CYCLES, broken, owner=owner)
+    unsubscribe = bus.subscribe(ChangeKind.CYCLES, removed.append, owner=owner)
+    bus.subscribe(ChangeKind.CYCLES, received.append, owner=owner)
+    unsubscribe()
+    assert bus.subscriber_count() == 2
+
+    bus.publish(DataChange.of(ChangeKind.CYCLES))
+    bus.flush()
+
+    assert removed == []
+    assert received == [DataChange.of(ChangeKind.CYCLES)]
+
+
+def test_subscriptions_end_with_their_owner(bus):
+    received = []
+    owners = [QObject() for _ in range(12)]
+    for owner in owners:
+        bus.subscribe(ChangeKind.EXAMS, received.append, owner=owner)
+    assert bus.live_subscriptions() == {"QObject": 12}
+
+    for owner in owners[1:]:
+        owner.deleteLater()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+    assert bus.live_subscriptions() == {"QObject": 1}
+    bus.publish(DataChange.of(ChangeKind.EXAMS))
+    bus.flush()
+    assert len(received) == 1
+
+
+def test_a_subscriber_destroyed_mid_delivery_is_skipped(bus, owner):
+    doomed, received = QObject(), []
+    bus.subscribe(ChangeKind.CYCLES, lambda change: shiboken6.delete(doomed), owner=owner)
+    bus.subscribe(ChangeKind.CYCLES, received.append, owner=doomed)
+
+    bus.publish(DataChange.of(ChangeKind.CYCLES))
+    bus.flush()
+
+    assert received == []
+    assert bus.subscriber_count() == 1
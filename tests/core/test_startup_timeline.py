@@ -0,0 +1,65 @@
+# tests/core/test_startup_timeline.py
+import json
+
+from app.core.startup_timeline import FIRST_PAINT, StartupTimeline, TimelineEvent
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1_000_000
+
+    def __call__(self) -> int:
+        return self.now
+
+    def advance_ms(self, ms: float):
+        self.now += int(ms * 1e6)
+
+
+def test_phases_nest_and_are_relative_to_the_start():
+    clock = _FakeClock()
+    timeline = StartupTimeline(clock=clock)
+    clock.advance_ms(5)
+    timeline.phase_since_start("imports")
+    with timeline.phase("main_controller_init"):
+        clock.advance_ms(2)
+        with timeline.phase("first_refresh_data_and_views"):
+            clock.advance_ms(3)
+    timeline.mark(FIRST_PAINT)
+
+    assert timeline.events() == [
+        TimelineEvent("imports", 0, 5_000_000),
+        TimelineEvent("main_controller_init", 5_000_000, 10_000_000),
+        TimelineEvent("first_refresh_data_and_views", 7_000_000, 10_000_000),
+        TimelineEvent(FIRST_PAINT, 10_000_000, 10_000_000),
+    ]
+    assert timeline.elapsed_ms(FIRST_PAINT) == 10.0
+    assert timeline.elapsed_ms("missing") is None
+
+
+def test_nothing_is_recorded_after_finish():
+    clock = _FakeClock()
+    timeline = StartupTimeline(clock=clock)
+    timeline.mark(FIRST_PAINT)
+    timeline.finish()
+
+    with timeline.phase("first_refresh_data_and_views"):
+        clock.advance_ms(1)
+
+    assert [event.name for event in timeline.events()] == [FIRST_PAINT]
+
+
+def test_trace_is_chrome_trace_event_json(tmp_path):
+    clock = _FakeClock()
+    timeline = StartupTimeline(clock=clock)
+    with timeline.phase("run_migrations"):
+        clock.advance_ms(1.5)
+    timeline.mark(FIRST_PAINT)
+    path = tmp_path / "logs" / "startup_trace.json"
+
+    timeline.write_trace(str(path))
+
+    events = json.loads(path.read_text())["traceEvents"]
+    assert [(e["name"], e["ph"], e["ts"], e.get("dur")) for e in events] == [
+        ("run_migrations", "X", 0, 1500),
+        (FIRST_PAINT, "i", 1500, None),
+    ]
@@ -0,0 +1,42 @@
+# tests/core/test_time_utils.py
+from datetime import date, datetime, timedelta, timezone
+
+from app.core.database import PooledSqliteConnectionFactory
+from app.core.migrations import run_migrations_on_connection
+from app.core.time_utils import local_date_cutoff, normalize_start_time
+from tests.conftest import BASE_PATH
+
+
+def test_normalize_aware_and_naive_timestamps_agree():
+    aware = datetime(2024, 3, 1, 12, 30, tzinfo=timezone.utc)
+    naive_local = aware.astimezone().replace(tzinfo=None)
+
+    assert normalize_start_time(aware.isoformat()) == normalize_start_time(naive_local.isoformat())
+    assert normalize_start_time("2024-03-01T12:30:00Z")[0] == int(aware.timestamp())
+
+
+def test_local_date_cutoff():
+    assert local_date_cutoff(0) == date.today().isoformat()
+    assert local_date_cutoff(7) == (date.today() - timedelta(days=7)).isoformat()
+
+
+def test_triggers_fill_columns_like_the_services(tmp_path):
+    factory = PooledSqliteConnectionFactory(str(tmp_path / "time.db"))
+    conn = factory.get_connection()
+    run_migrations_on_connection(conn, BASE_PATH)
+    starts = ["2024-03-01T12:30:00Z", "2024-03-01T23:30:00-03:00", "2024-03-01T00:15:00"]
+    with conn:
+        conn.execute("INSERT INTO users (id, name, study_level) VALUES (1, 'Time User', 'Beginner') "
+                     "ON CONFLICT(id) DO NOTHING")
+        conn.execute("INSERT INTO subjects (id, name) VALUES (1, 'Time Subject') ON CONFLICT(id) DO NOTHING")
+        for start in starts:
+            conn.execute("INSERT INTO study_sessions (user_id, subject_id, start_time) VALUES (1, 1, ?)", (start,))
+
+    rows = conn.execute("SELECT start_time, start_epoch, local_date FROM study_sessions ORDER BY id").fetchall()
+    assert [(r["start_epoch"], r["local_date"]) for r in rows] == [normalize_start_time(s) for s in starts]
+
+    with conn:
+        conn.execute("UPDATE study_sessions SET start_time = ? WHERE start_time = ?", ("2024-05-02T08:00:00", starts[2]))
+    row = conn.execute("SELECT start_epoch, local_date FROM study_sessions WHERE start_time = '2024-05-02T08:00:00'").fetchone()
+    assert (row["start_epoch"], row["local_date"]) == normalize_start_time("2024-05-02T08:00:00")
+    factory.close_all()
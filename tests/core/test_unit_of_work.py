@@ -0,0 +1,98 @@
+# tests/core/test_unit_of_work.py
+import sqlite3
+
+import pytest
+
+from app.core.builders import CycleBuilder
+from app.core.database import PooledSqliteConnectionFactory, UnitOfWork
+from app.core.migrations import run_migrations_on_connection
+from app.services.cycle_service import SqliteCycleService
+from app.services.cycle_subject_service import SqliteCycleSubjectService
+from app.services.master_subject_service import SqliteMasterSubjectService
+from app.services.study_queue_service import SqliteStudyQueueService
+from app.services.user_service import SqliteUserService
+from tests.conftest import BASE_PATH
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "uow.db")
+    conn = sqlite3.connect(path)
+    run_migrations_on_connection(conn, BASE_PATH)
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def unit_of_work(db_path):
+    pool = PooledSqliteConnectionFactory(db_path)
+    yield UnitOfWork(pool)
+    pool.close_all()
+
+
+def _count_users(db_path: str, name: str) -> int:
+    with sqlite3.connect(db_path) as other:
+        return other.execute("SELECT COUNT(*) FROM users WHERE name = ?", (name,)).fetchone()[0]
+
+
+def test_unit_commits_once_on_exit(unit_of_work, db_path):
+    users = SqliteUserService(unit_of_work)
+
+    with unit_of_work:
+        users.create_user("First", "Beginner")
+        users.create_user("Second", "Beginner")
+        # Another connection must not see the writes before the unit finishes.
+        assert _count_users(db_path, "First") == 0
+
+    assert _count_users(db_path, "First") == 1
+    assert _count_users(db_path, "Second") == 1
+
+
+def test_exception_rolls_back_the_whole_unit(unit_of_work, db_path):
+    users = SqliteUserService(unit_of_work)
+
+    with pytest.raises(RuntimeError):
+        with unit_of_work:
+            users.create_user("Doomed", "Beginner")
+            raise RuntimeError("boom")
+
+    assert _count_users(db_path, "Doomed") == 0
+    assert not unit_of_work.is_active
+
+
+def test_nested_failure_only_rolls_back_its_savepoint(unit_of_work, db_path):
+    users = SqliteUserService(unit_of_work)
+
+    with unit_of_work:
+        users.create_user("Outer", "Beginner")
+        with pytest.raises(ValueError):
+            with unit_of_work:
+                users.create_user("Inner", "Beginner")
+                raise ValueError("inner failure")
+
+    assert _count_users(db_path, "Outer") == 1
+    assert _count_users(db_path, "Inner") == 0
+
+
+def test_cycle_builder_leaves_nothing_behind_when_a_step_fails(unit_of_work, db_path, mocker):
+    master_subjects = SqliteMasterSubjectService(unit_of_work)
+    master_subjects.create("Math")
+    queue_service = SqliteStudyQueueService(unit_of_work)
+    mocker.patch.object(queue_service, "save_queue", side_effect=sqlite3.OperationalError("disk I/O error"))
+    mocker.patch('app.core.business_logic.calculate_final_weight', return_value=1.0)
+    mocker.patch('app.core.business_logic.calculate_num_blocks', return_value=1)
+    mocker.patch('app.core.business_logic.generate_study_queue', return_value=[1])
+
+    builder = (CycleBuilder(SqliteCycleService(unit_of_work), SqliteCycleSubjectService(unit_of_work),
+                            master_subjects, queue_service, unit_of_work=unit_of_work)
+               .for_exam(1)
+               .with_properties({'name': 'Atomic Cycle', 'duration': 60, 'is_continuous': True,
+                                 'daily_goal': 4, 'timing_strategy': 'Adaptive'})
+               .with_subjects([{'name': 'Math', 'relevance': 3, 'volume': 3, 'difficulty': 3, 'is_active': True}]))
+
+    with pytest.raises(sqlite3.OperationalError):
+        builder.build()
+
+    with sqlite3.connect(db_path) as other:
+        assert other.execute("SELECT COUNT(*) FROM study_cycles WHERE name = 'Atomic Cycle'").fetchone()[0] == 0
+        assert other.execute("SELECT COUNT(*) FROM cycle_subjects").fetchone()[0] == 0
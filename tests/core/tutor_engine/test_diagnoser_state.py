@@ -0,0 +1,181 @@
+# tests/core/tutor_engine/test_diagnoser_state.py
+import math
+import os
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.config_service import ConfigService
+from app.core.tutor_engine.diagnoser import Diagnoser
+from app.core.tutor_engine.diagnoser_state import DiagnoserState
+from app.models.session import QuestionPerformance, StudySession
+from app.models.subject import CycleSubject
+from tests.conftest import BASE_PATH
+
+METRIC_KEYS = ("durable_mastery_score", "durability_factor", "learning_velocity", "total_time_invested_hr")
+
+
+@pytest.fixture
+def config():
+    return ConfigService(os.path.join(BASE_PATH, "config.toml"))
+
+
+def _subject():
+    return CycleSubject(
+        id=1, cycle_id=1, subject_id=1, name="Test Subject",
+        relevance_weight=3, volume_weight=3, difficulty_weight=3,
+        is_active=True, final_weight_calc=0, num_blocks_in_cycle=0,
+        current_strategic_state='DISCOVERY'
+    )
+
+
+def _session(session_id, days_ago, answers, finished=True, method=None, feedback=None, subject_id=1):
+    start = datetime.now(timezone.utc) - timedelta(days=days_ago)
+    return StudySession(
+        id=session_id, subject_id=subject_id, start_time=start.isoformat(),
+        user_id=1, cycle_id=1, topic_id=None,
+        end_time=start.isoformat() if finished else None,
+        total_duration_sec=1800, total_pause_duration_sec=0, liquid_duration_sec=1800,
+        study_method=method, user_feedback_effectiveness=feedback,
+        questions=[
+            QuestionPerformance(id=None, session_id=session_id, topic_name=topic, difficulty_level=3, is_correct=correct)
+            for topic, correct in answers
+        ],
+    )
+
+
+def _history(count):
+    return [
+        _session(i, days_ago=count - i, answers=[(f"t{i % 3}", i % 2 == 0), ("t9", i % 5 != 0)],
+                 method="Reading" if i % 4 else None, feedback=i % 5 + 1 if i % 4 else None)
+        for i in range(1, count + 1)
+    ]
+
+
+def _full_scan_metrics(history, decay_rate):
+    """The pre-checkpoint Diagnoser computation, kept verbatim as the reference."""
+    today_date = datetime.now(timezone.utc).date()
+    weighted_scores, weights = [], []
+    for session in history:
+        days_ago = (today_date - datetime.fromisoformat(session.start_time).date()).days
+        weight = math.exp(-decay_rate * days_ago)
+        weights.append(weight)
+        for q in session.questions:
+            weighted_scores.append(q.is_correct * weight)
+    by_topic = defaultdict(lambda: {'correct': 0, 'total': 0})
+    for q in (q for s in history for q in s.questions):
+        by_topic[q.topic_name]['correct'] += q.is_correct
+        by_topic[q.topic_name]['total'] += 1
+    by_method = defaultdict(lambda: {'total_score': 0, 'count': 0})
+    for s in history:
+        if s.study_method and s.user_feedback_effectiveness is not None:
+            by_method[s.study_method]['total_score'] += s.user_feedback_effectiveness
+            by_method[s.study_method]['count'] += 1
+    total_time_hr = sum(s.liquid_duration_sec for s in history) / 60 / 60
+    durable = sum(weighted_scores) / len(weighted_scores)
+    return {
+        "durable_mastery_score": durable,
+        "durability_factor": sum(weights) / len(weights),
+        "learning_velocity": durable / total_time_hr,
+        "total_time_invested_hr": total_time_hr,
+        "total_questions": len(weighted_scores),
+        "mastery_by_topic": {t: d['correct'] / d['total'] for t, d in by_topic.items()},
+        "effectiveness_metrics": {m: d['total_score'] / d['count'] for m, d in by_method.items()},
+    }
+
+
+def _assert_matches(metrics, expected):
+    for key in METRIC_KEYS:
+        assert metrics[key] == pytest.approx(expected[key], rel=1e-12)
+    assert metrics["total_questions"] == expected["total_questions"]
+    assert metrics["mastery_by_topic"] == pytest.approx(expected["mastery_by_topic"], rel=1e-12)
+    assert metrics["effectiveness_metrics"] == pytest.approx(expected["effectiveness_metrics"], rel=1e-12)
+
+
+def test_fresh_run_matches_full_scan(config):
+    history = _history(40)
+    diagnoser = Diagnoser(_subject(), history, config)
+
+    _assert_matches(diagnoser._calculate_performance_metrics(), _full_scan_metrics(history, config.get("diagnoser.decay_rate")))
+    assert diagnoser.state.last_session_id == 40
+    assert diagnoser.state.session_count == 40
+
+
+def test_resumed_checkpoint_matches_full_scan(config):
+    history = _history(60)
+    first = Diagnoser(_subject(), history[:35], config)
+    first._calculate_performance_metrics()
+    # Persist, then age the checkpoint as if it had been written ten days ago.
+    saved = first.state.to_dict()
+    anchor = datetime.fromisoformat(saved["anchor_date"]).date()
+    factor = math.exp(config.get("diagnoser.decay_rate") * 10)
+    saved.update(anchor_date=(anchor - timedelta(days=10)).isoformat(),
+                 weighted_correct=saved["weighted_correct"] * factor,
+                 weighted_session_sum=saved["weighted_session_sum"] * factor)
+
+    resumed = Diagnoser(_subject(), history, config, state=DiagnoserState.from_dict(saved))
+
+    _assert_matches(resumed._calculate_performance_metrics(), _full_scan_metrics(history, config.get("diagnoser.decay_rate")))
+    assert resumed.state.session_count == 60
+
+
+def test_in_progress_sessions_are_not_checkpointed(config):
+    history = _history(10) + [_session(11, 0, [("t1", True)], finished=False), _session(12, 0, [("t1", False)])]
+    diagnoser = Diagnoser(_subject(), history, config)
+
+    _assert_matches(diagnoser._calculate_performance_metrics(), _full_scan_metrics(history, config.get("diagnoser.decay_rate")))
+    assert diagnoser.state.last_session_id == 12
+    assert diagnoser.state.open_session_ids == [11]
+
+    # The session finishes with more questions; the next replan picks it up from the checkpoint.
+    history[10] = _session(11, 0, [("t1", True), ("t2", True)])
+    resumed = Diagnoser(_subject(), history, config, state=DiagnoserState.from_dict(diagnoser.state.to_dict()))
+    _assert_matches(resumed._calculate_performance_metrics(), _full_scan_metrics(history, config.get("diagnoser.decay_rate")))
+    assert resumed.state.last_session_id == 12
+    assert resumed.state.open_session_ids == []
+
+
+def test_stale_checkpoint_is_rebuilt(config):
+    history = _history(20)
+    diagnoser = Diagnoser(_subject(), history, config)
+    diagnoser._calculate_performance_metrics()
+    saved = diagnoser.state.to_dict()
+
+    del history[4]  # A checkpointed session was deleted.
+    rebuilt = Diagnoser(_subject(), history, config, state=DiagnoserState.from_dict(saved))
+
+    _assert_matches(rebuilt._calculate_performance_metrics(), _full_scan_metrics(history, config.get("diagnoser.decay_rate")))
+    assert rebuilt.state.session_count == 19
+
+
+def test_checkpoint_whose_sessions_changed_is_rebuilt(config):
+    history = _history(20) + [_session(21, 0, [])]
+    diagnoser = Diagnoser(_subject(), history, config)
+    diagnoser._calculate_performance_metrics()
+    saved = diagnoser.state.to_dict()
+    assert saved["last_session_id"] == 21
+
+    # Session 21 was checkpointed before its questions were visible; they show up afterwards.
+    history[20] = _session(21, 0, [("t1", True), ("t2", False)])
+    rebuilt = Diagnoser(_subject(), history, config, state=DiagnoserState.from_dict(saved))
+
+    _assert_matches(rebuilt._calculate_performance_metrics(), _full_scan_metrics(history, config.get("diagnoser.decay_rate")))
+    assert rebuilt.state.total_questions == 42
+
+
+def test_abandoned_session_does_not_hold_back_newer_sessions(config):
+    decay_rate = config.get("diagnoser.decay_rate")
+    history = _history(10) + [_session(11, 5, [("t1", True)], finished=False)] + [
+        _session(i, 12 - i, [("t2", i % 2 == 0)]) for i in range(12, 16)]
+    first = Diagnoser(_subject(), history, config)
+    first._calculate_performance_metrics()
+    assert first.state.last_session_id == 15
+    assert first.state.session_count == 14
+
+    # Later replans only fold the new session; the abandoned one stays out of the checkpoint.
+    history.append(_session(16, 0, [("t3", True)]))
+    resumed = Diagnoser(_subject(), history, config, state=DiagnoserState.from_dict(first.state.to_dict()))
+    _assert_matches(resumed._calculate_performance_metrics(), _full_scan_metrics(history, decay_rate))
+    assert resumed.state.session_count == 15
+    assert resumed.state.open_session_ids == [11]
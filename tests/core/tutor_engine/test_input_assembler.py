@@ -1,14 +1,21 @@
+import copy
+import dataclasses
 import pytest
 from unittest.mock import MagicMock, call
-from datetime import date
+from datetime import date, timedelta
 
 from app.core.tutor_engine.input_assembler import V20InputAssembler
 from app.models.cycle import Cycle
 from app.models.user import User, HumanFactor
 from app.models.subject import CycleSubject, WorkUnit
-from app.models.session import StudySession
+from app.models.session import StudyHistoryColumns, StudySession
 from app.services.interfaces import (ICycleService, ICycleSubjectService, IWorkUnitService,
                                      ISessionService, IUserService)
+from app.services.cycle_service import SqliteCycleService
+from app.services.exam_service import SqliteExamService
+from app.services.master_subject_service import SqliteMasterSubjectService
+from app.services.session_service import SqliteSessionService
+from app.services.user_service import SqliteUserService
 
 
 @pytest.fixture
@@ -154,6 +161,26 @@ def test_assemble_with_study_history(input_assembler, mock_services, mock_active
     mock_services["session_service"].get_history_for_cycle.assert_called_once_with(mock_active_cycle.id)
 
 
+def test_assemble_with_columnar_history(mock_services, mock_active_cycle, mock_current_user):
+    """Test that the columnar option loads the history through the columnar loader."""
+    pytest.importorskip("numpy")
+    # Arrange
+    assembler = V20InputAssembler(**mock_services, columnar_history=True)
+    columns = StudyHistoryColumns()
+    mock_services["cycle_subject_service"].get_subjects_for_cycle.return_value = []
+    mock_services["session_service"].get_history_columns_for_cycle.return_value = columns
+    mock_services["user_service"].get_human_factor_history.return_value = []
+    mock_services["cycle_service"].get_plan_cache.return_value = None
+
+    # Act
+    result = assembler.assemble(mock_active_cycle, mock_current_user)
+
+    # Assert
+    assert result["study_history"] is columns
+    mock_services["session_service"].get_history_columns_for_cycle.assert_called_once_with(mock_active_cycle.id)
+    mock_services["session_service"].get_history_for_cycle.assert_not_called()
+
+
 def test_assemble_human_factor_current_in_history(input_assembler, mock_services, mock_active_cycle, mock_current_user):
     """Test assembly when current human factor is found in history."""
     # Arrange
@@ -217,4 +244,81 @@ def test_assemble_with_previous_cycle_config(input_assembler, mock_services, moc
 
     # Assert
     assert result["previous_cycle_config"] == mock_cached_plan
-    mock_services["cycle_service"].get_plan_cache.assert_called_once_with(mock_active_cycle.id)
\ No newline at end of file
+    mock_services["cycle_service"].get_plan_cache.assert_called_once_with(mock_active_cycle.id, keys=("subjects",))
+
+def test_input_fingerprint_tracks_tutor_inputs(mock_services, mock_active_cycle, mock_current_user, mocker):
+    """Test that the fingerprint changes with the tutor inputs and nothing else."""
+    # Arrange
+    config_service = MagicMock()
+    config_service.as_dict.return_value = {"diagnoser": {"decay_rate": 0.1}}
+    assembler = V20InputAssembler(**mock_services, config_service=config_service)
+    subject = CycleSubject(
+        id=1, cycle_id=mock_active_cycle.id, subject_id=101, relevance_weight=1,
+        volume_weight=1, difficulty_weight=1, is_active=True, final_weight_calc=1.0,
+        num_blocks_in_cycle=1, name="Math", current_strategic_state="DISCOVERY"
+    )
+    work_unit = WorkUnit(
+        id=1, subject_id=101, unit_id="wu_101_1", title="Algebra Basics", type="reading",
+        estimated_time_minutes=60, is_completed=False, related_questions_topic="Algebra", sequence_order=1
+    )
+    mock_services["cycle_subject_service"].get_subjects_for_cycle.side_effect = lambda _: [copy.deepcopy(subject)]
+    mock_services["work_unit_service"].get_work_units_for_subject.side_effect = lambda _: [work_unit]
+    mock_services["session_service"].get_history_watermark.return_value = (3, 7, 3, 5400, 0, 0, 12, 9)
+    mock_services["user_service"].get_human_factor_history.return_value = []
+    baseline = assembler.input_fingerprint(mock_active_cycle, mock_current_user)
+
+    # Act / Assert: unrelated cycle fields and a new day leave it unchanged.
+    assert assembler.input_fingerprint(
+        dataclasses.replace(mock_active_cycle, updated_at="2023-02-01", plan_cache_json="{}"), mock_current_user
+    ) == baseline
+    tomorrow = date.today() + timedelta(days=1)
+    mocker.patch("app.core.tutor_engine.input_assembler.date", MagicMock(today=MagicMock(return_value=tomorrow)))
+    assert assembler.input_fingerprint(mock_active_cycle, mock_current_user) == baseline
+    mocker.stopall()
+
+    # Act / Assert: each input the tutor reads changes it.
+    mock_services["session_service"].get_history_watermark.return_value = (4, 8, 3, 5400, 0, 0, 12, 9)
+    after_session = assembler.input_fingerprint(mock_active_cycle, mock_current_user)
+    assert after_session != baseline
+
+    work_unit.is_completed = True
+    after_work_unit = assembler.input_fingerprint(mock_active_cycle, mock_current_user)
+    assert after_work_unit != after_session
+
+    subject.current_strategic_state = "DEEP_WORK"
+    after_state = assembler.input_fingerprint(mock_active_cycle, mock_current_user)
+    assert after_state != after_work_unit
+
+    mock_services["user_service"].get_human_factor_history.return_value = [HumanFactor(
+        id=1, user_id=mock_current_user.id, date=date.today().isoformat(), energy_level="Low", stress_level="High")]
+    after_human_factor = assembler.input_fingerprint(mock_active_cycle, mock_current_user)
+    assert after_human_factor != after_state
+
+    config_service.as_dict.return_value = {"diagnoser": {"decay_rate": 0.2}}
+    assert assembler.input_fingerprint(mock_active_cycle, mock_current_user) != after_human_factor
+
+def test_input_fingerprint_changes_when_a_session_moves_to_another_subject(
+        mock_services, mock_active_cycle, mock_current_user, mock_db_factory):
+    """Test that moving a session between subjects, which keeps every cycle total, changes the fingerprint."""
+    # Arrange
+    user = SqliteUserService(mock_db_factory).create_user("Test User", "Beginner")
+    exam_id = SqliteExamService(mock_db_factory).create(user_id=user.id, name="Test Exam")
+    cycle_id = SqliteCycleService(mock_db_factory).create("Test Cycle", 60, True, 2, exam_id, "Adaptive")
+    math_id = SqliteMasterSubjectService(mock_db_factory).create("Math")
+    physics_id = SqliteMasterSubjectService(mock_db_factory).create("Physics")
+    session_service = SqliteSessionService(mock_db_factory)
+    session_id = session_service.log_manual_session(user.id, cycle_id, math_id, None, "2024-01-01T10:00:00",
+                                                    total_questions_done=10, total_questions_correct=7,
+                                                    duration_minutes=30)
+    mock_services["cycle_subject_service"].get_subjects_for_cycle.return_value = []
+    mock_services["user_service"].get_human_factor_history.return_value = []
+    assembler = V20InputAssembler(**dict(mock_services, session_service=session_service))
+    active_cycle = dataclasses.replace(mock_active_cycle, id=cycle_id)
+    baseline = assembler.input_fingerprint(active_cycle, mock_current_user)
+
+    # Act
+    mock_db_factory.get_connection().execute(
+        "UPDATE study_sessions SET subject_id = ? WHERE id = ?", (physics_id, session_id))
+
+    # Assert
+    assert assembler.input_fingerprint(active_cycle, mock_current_user) != baseline
@@ -0,0 +1,155 @@
+# tests/core/tutor_engine/test_tutor.py
+import copy
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core.config_service import ConfigService
+from app.core.tutor_engine.subject_pipeline import PARALLEL_MIN_SUBJECTS
+from app.core.tutor_engine.tutor import Tutor
+from app.models.session import QuestionPerformance, StudySession
+from app.models.subject import CycleSubject
+from app.services.interfaces import ICycleSubjectService
+
+SUBJECT_COUNT = PARALLEL_MIN_SUBJECTS + 4
+
+
+@pytest.fixture
+def config(tmp_path):
+    path = tmp_path / "config.toml"
+    path.write_text(
+        "[diagnoser]\n"
+        "decay_rate = 0.1\n"
+        "target_questions_for_confidence = 200\n"
+        "mastery_target = 0.90\n"
+        "conquer_threshold = 0.80\n"
+        "min_cycles_in_state_for_regression = 3\n"
+        "mastery_drop_threshold_for_regression = 0.20\n"
+        "state_progression = ['DISCOVERY', 'DEEP_WORK', 'CONQUER', 'CEMENT', 'MAINTAIN']\n"
+        "[priority_engine]\n"
+        "max_discovery_boosts_per_cycle = 2\n"
+        "roi_time_threshold_hr = 20\n"
+        "roi_velocity_threshold = 0.01\n"
+        "roi_point_value_threshold = 3\n"
+    )
+    return ConfigService(str(path))
+
+
+def _cycle_config():
+    subjects = [
+        CycleSubject(
+            id=100 + i, cycle_id=1, subject_id=i, name=f"Subject {i}",
+            relevance_weight=1 + i % 5, volume_weight=3, difficulty_weight=1 + i % 3,
+            is_active=True, final_weight_calc=0, num_blocks_in_cycle=0,
+            date_added=f"2024-01-{1 + i:02d}",
+            current_strategic_state=('DISCOVERY', 'DEEP_WORK', 'CONQUER')[i % 3],
+        )
+        for i in range(SUBJECT_COUNT)
+    ]
+    now = datetime.now(timezone.utc)
+    history = [
+        StudySession(
+            id=n, subject_id=n % SUBJECT_COUNT, start_time=(now - timedelta(days=n % 20, hours=n)).isoformat(),
+            user_id=1, cycle_id=1, topic_id=None, end_time=now.isoformat(),
+            total_duration_sec=1800, total_pause_duration_sec=0, liquid_duration_sec=300 * (n % 9),
+            study_method="Drills" if n % 2 else None, user_feedback_effectiveness=n % 5 + 1,
+            questions=[QuestionPerformance(id=None, session_id=n, topic_name=f"t{k}", difficulty_level=3,
+                                           is_correct=(n + k) % 3 != 0) for k in range(n % 7)],
+        )
+        for n in range(1, 400)
+        if n % SUBJECT_COUNT != 1  # One subject has no history at all.
+    ]
+    return {
+        "subjects": subjects,
+        "study_history": history,
+        "available_time_minutes": 240,
+        "cycle_duration_days": 7,
+        "human_factor_input": {"energy_level": "Normal", "stress_level": "Normal"},
+        "human_factor_history": [],
+        "previous_cycle_config": {},
+        "meta": {},
+    }
+
+
+def _plan(config, cycle_config, **tutor_options):
+    service = MagicMock(spec=ICycleSubjectService)
+    service.get_diagnoser_states.return_value = {}
+    plan = Tutor(service, config, **tutor_options).create_study_cycle(cycle_config)
+    saved_states = [c.args[:2] for c in service.update_cycle_subject_state.call_args_list]
+    checkpoints = [c.args[0] for c in service.save_diagnoser_state.call_args_list]
+    return plan, saved_states, checkpoints, cycle_config["subjects"]
+
+
+@pytest.mark.parametrize("options", [
+    pytest.param({"max_workers": 4}, id="python-backend-stays-serial"),
+    pytest.param({"max_workers": 4, "vectorized_diagnoser": True}, id="threads"),
+])
+def test_parallel_plan_matches_serial(config, options):
+    if options.get("vectorized_diagnoser"):
+        pytest.importorskip("numpy")
+    cycle_config = _cycle_config()
+    serial_options = {k: v for k, v in options.items() if k != "max_workers"}
+
+    expected = _plan(config, copy.deepcopy(cycle_config), **serial_options)
+    result = _plan(config, copy.deepcopy(cycle_config), **options)
+
+    assert len(result[0]["processed_subjects"]) == SUBJECT_COUNT
+    assert result[0] == expected[0]
+    # Persistence happens on the calling thread, in subject order.
+    assert result[1] == expected[1]
+    assert [subject_id for subject_id, _ in result[1]] == [s.id for s in cycle_config["subjects"]]
+    assert result[2] == expected[2]
+    assert [s.state_hysteresis_data['last_mastery_score'] for s in result[3]] == [
+        s.state_hysteresis_data['last_mastery_score'] for s in expected[3]]
+
+
+def _with_new_session(cycle_config, subject_id):
+    now = datetime.now(timezone.utc)
+    session = StudySession(
+        id=1000, subject_id=subject_id, start_time=now.isoformat(), user_id=1, cycle_id=1, topic_id=None,
+        end_time=now.isoformat(), total_duration_sec=3600, total_pause_duration_sec=0, liquid_duration_sec=3600,
+        study_method="Drills", user_feedback_effectiveness=5,
+        questions=[QuestionPerformance(id=None, session_id=1000, topic_name="t0", difficulty_level=3,
+                                       is_correct=k % 4 != 0) for k in range(40)],
+    )
+    return {**cycle_config, "study_history": cycle_config["study_history"] + [session]}
+
+
+@pytest.mark.parametrize("options", [
+    pytest.param({}, id="python"),
+    pytest.param({"vectorized_diagnoser": True}, id="vectorized"),
+])
+def test_incremental_replan_matches_full_replan(config, options):
+    if options.get("vectorized_diagnoser"):
+        pytest.importorskip("numpy")
+    cycle_config = _cycle_config()
+    changed = cycle_config["subjects"][3]
+    # The cached plan goes through the JSON plan cache before it is reused.
+    previous_plan = json.loads(json.dumps(_plan(config, copy.deepcopy(cycle_config), **options)[0]))
+
+    updated = _with_new_session(cycle_config, changed.subject_id)
+    expected, _, _, _ = _plan(config, copy.deepcopy(updated), **options)
+
+    incremental_config = copy.deepcopy(updated)
+    incremental_config["study_history"] = [s for s in updated["study_history"] if s.subject_id == changed.subject_id]
+    service = MagicMock(spec=ICycleSubjectService)
+    service.get_diagnoser_states.return_value = {}
+    result = Tutor(service, config, **options).replan_subject(incremental_config, previous_plan, changed.id)
+
+    assert result == expected
+    assert result["processed_subjects"] != previous_plan["processed_subjects"]
+    # Only the studied subject was re-diagnosed and persisted.
+    assert [c.args[0] for c in service.update_cycle_subject_state.call_args_list] == [changed.id]
+
+
+def test_incremental_replan_needs_cached_diagnostics_for_every_subject(config):
+    cycle_config = _cycle_config()
+    previous_plan, _, _, _ = _plan(config, copy.deepcopy(cycle_config))
+    dropped = cycle_config["subjects"][1].id
+    previous_plan["processed_subjects"] = [p for p in previous_plan["processed_subjects"] if p["subject_id"] != dropped]
+
+    with pytest.raises(ValueError):
+        Tutor(MagicMock(spec=ICycleSubjectService), config).replan_subject(
+            cycle_config, previous_plan, cycle_config["subjects"][0].id)
@@ -0,0 +1,128 @@
+# tests/core/tutor_engine/test_vectorized_diagnoser.py
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from app.core.config_service import ConfigService
+from app.core.time_utils import normalize_start_time
+from app.core.tutor_engine.diagnoser import Diagnoser
+from app.core.tutor_engine.vectorized_diagnoser import HistoryColumns, VectorizedDiagnoser
+from app.models.session import QuestionPerformance, StudyHistoryColumns, StudySession
+from app.models.subject import CycleSubject
+
+
+@pytest.fixture
+def config(tmp_path):
+    path = tmp_path / "config.toml"
+    path.write_text(
+        "[diagnoser]\n"
+        "decay_rate = 0.1\n"
+        "target_questions_for_confidence = 200\n"
+        "mastery_target = 0.90\n"
+        "conquer_threshold = 0.80\n"
+        "min_cycles_in_state_for_regression = 3\n"
+        "mastery_drop_threshold_for_regression = 0.20\n"
+        "state_progression = ['DISCOVERY', 'DEEP_WORK', 'CONQUER', 'CEMENT', 'MAINTAIN']\n"
+    )
+    return ConfigService(str(path))
+
+
+def _subject(subject_id):
+    return CycleSubject(
+        id=subject_id, cycle_id=1, subject_id=subject_id, name=f"Subject {subject_id}",
+        relevance_weight=3, volume_weight=3, difficulty_weight=3,
+        is_active=True, final_weight_calc=0, num_blocks_in_cycle=0,
+        current_strategic_state='DEEP_WORK'
+    )
+
+
+def _history():
+    now = datetime.now(timezone.utc)
+    sessions = []
+    for i in range(1, 61):
+        start = (now - timedelta(days=i % 17, hours=i)).isoformat() if i % 13 else "not a date"
+        sessions.append(StudySession(
+            id=i, subject_id=1 + i % 3, start_time=start,
+            user_id=1, cycle_id=1, topic_id=None, end_time=None,
+            total_duration_sec=0, total_pause_duration_sec=0, liquid_duration_sec=600 * (i % 7),
+            study_method=("Reading", "Drills")[i % 2] if i % 5 else None,
+            user_feedback_effectiveness=i % 5 + 1 if i % 3 else None,
+            questions=[
+                QuestionPerformance(id=None, session_id=i, topic_name=f"t{(i + k) % 4}", difficulty_level=3,
+                                    is_correct=(i * k) % 3 != 0)
+                for k in range(i % 6)
+            ],
+        ))
+    return sessions
+
+
+@pytest.mark.parametrize("subject_id", [1, 2, 3, 4])
+def test_vectorized_run_matches_python_diagnoser(config, subject_id):
+    history = _history()
+    columns = HistoryColumns.from_sessions(history, datetime.now(timezone.utc).date())
+
+    expected = Diagnoser(_subject(subject_id), history, config).run()
+    result = VectorizedDiagnoser(_subject(subject_id), columns, config).run()
+
+    assert result.keys() == expected.keys()
+    for key, value in expected.items():
+        if isinstance(value, float):
+            assert result[key] == pytest.approx(value, rel=1e-12), key
+        elif isinstance(value, dict):
+            assert result[key] == pytest.approx(value, rel=1e-12), key
+        else:
+            assert result[key] == value, key
+
+
+def test_recent_sessions_follow_python_ordering(config):
+    history = _history()
+    columns = HistoryColumns.from_sessions(history, datetime.now(timezone.utc).date())
+
+    for subject_id in (1, 2, 3):
+        python = Diagnoser(_subject(subject_id), history, config)
+        vectorized = VectorizedDiagnoser(_subject(subject_id), columns, config)
+        assert vectorized._recent_session_durations() == python._recent_session_durations()
+
+
+def _study_history_columns(sessions):
+    """Packs sessions the way SqliteSessionService.get_history_columns_for_cycle does."""
+    columns, topics, methods = StudyHistoryColumns(), {}, {}
+    for row, session in enumerate(sessions):
+        columns.session_id.append(session.id)
+        columns.subject_id.append(session.subject_id)
+        try:
+            columns.start_epoch.append(normalize_start_time(session.start_time)[0])
+            columns.start_day.append(datetime.fromisoformat(session.start_time).date().toordinal())
+        except (ValueError, TypeError):
+            columns.start_epoch.append(0)
+            columns.start_day.append(float("nan"))
+        columns.liquid_sec.append(session.liquid_duration_sec)
+        if session.study_method and session.user_feedback_effectiveness is not None:
+            columns.method_code.append(methods.setdefault(session.study_method, len(methods)))
+            columns.feedback.append(session.user_feedback_effectiveness)
+        else:
+            columns.method_code.append(-1)
+            columns.feedback.append(0)
+        for q in session.questions:
+            columns.question_session_row.append(row)
+            columns.question_correct.append(int(q.is_correct))
+            columns.question_difficulty.append(q.difficulty_level)
+            columns.question_topic.append(topics.setdefault(q.topic_name, len(topics)))
+    columns.topic_names, columns.method_names = list(topics), list(methods)
+    return columns
+
+
+@pytest.mark.parametrize("subject_id", [1, 2, 3])
+def test_columnar_history_matches_session_objects(config, subject_id):
+    history = _history()
+    today = datetime.now(timezone.utc).date()
+    from_objects = HistoryColumns.from_sessions(history, today)
+    from_buffers = HistoryColumns.from_study_history(_study_history_columns(history), today)
+
+    expected = VectorizedDiagnoser(_subject(subject_id), from_objects, config)._calculate_performance_metrics()
+    result = VectorizedDiagnoser(_subject(subject_id), from_buffers, config)._calculate_performance_metrics()
+    assert result.keys() == expected.keys()
+    for key, value in expected.items():
+        assert result[key] == pytest.approx(value, rel=1e-12), key
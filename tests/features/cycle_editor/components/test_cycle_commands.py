@@ -4,11 +4,11 @@ from app.features.cycle_editor.components.cycle_commands import (
     DeleteCycleCommand, CreateCycleCommand
 )
 from app.models.cycle import Cycle
-from app.core.signals import app_signals
+from app.core.signals import ChangeKind, DataChange
 
 
 def test_delete_cycle_command(mocker, sample_cycle):
-    mock_signal = mocker.patch('app.core.signals.app_signals.data_changed')
+    mock_publish = mocker.patch('app.core.signals.invalidation_bus.publish')
     mock_cycle_service = mocker.MagicMock()
 
     sample_cycle.id = 123
@@ -23,11 +23,11 @@ def test_delete_cycle_command(mocker, sample_cycle):
 
     command.undo()
     mock_cycle_service.restore_soft_deleted.assert_called_once_with(123)
-    assert mock_signal.emit.call_count == 2
+    assert mock_publish.call_args_list == [mocker.call(DataChange.of(ChangeKind.CYCLES, [123]))] * 2
 
 
 def test_create_cycle_command(mocker):
-    mock_signal = mocker.patch('app.core.signals.app_signals.data_changed')
+    mock_publish = mocker.patch('app.core.signals.invalidation_bus.publish')
 
     # --- FIX: Patch CycleBuilder where it is imported and used ---
     mock_builder_class = mocker.patch('app.features.cycle_editor.components.cycle_commands.CycleBuilder')
@@ -79,4 +79,5 @@ def test_create_cycle_command(mocker):
     mock_builder_instance.with_subjects.assert_called_once_with(subjects_data)
     mock_builder_instance.build.assert_called_once()
 
-    mock_signal.emit.assert_called_once()
\ No newline at end of file
+    mock_publish.assert_called_once_with(DataChange.of(
+        ChangeKind.CYCLES | ChangeKind.CYCLE_SUBJECTS | ChangeKind.STUDY_QUEUE, [1]))
\ No newline at end of file
@@ -0,0 +1,98 @@
+# tests/features/history/test_history_controller.py
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+from PySide6.QtCore import Qt
+
+from app.core.async_services import ServiceExecutor
+from app.features.history import history_table_model
+from app.features.history.history_controller import HistoryController
+from app.features.history.history_view import HistoryView
+from app.models.session import HistoryRow
+from app.services.interfaces import ISessionService
+
+
+def _epoch(start_time):
+    return int(datetime.fromisoformat(start_time).replace(tzinfo=timezone.utc).timestamp())
+
+
+def _row(row_id, start_time, subject_name="Math", done=4, correct=3):
+    return HistoryRow(id=row_id, subject_name=subject_name, start_time=start_time,
+                      start_epoch=_epoch(start_time), duration_sec=605,
+                      questions_done=done, questions_correct=correct, accuracy=correct / done * 100)
+
+
+def _controller(qtbot, pages, breakdown=()):
+    service = MagicMock(spec=ISessionService)
+    service.get_history_rows.side_effect = pages
+    service.get_daily_breakdown.return_value = list(breakdown)
+    view = HistoryView()
+    qtbot.addWidget(view)
+    controller = HistoryController(view, 1, service, ServiceExecutor(max_threads=0))
+    return controller, view, service
+
+
+def _query_args(service):
+    """(sort column, descending, subject filter, after) of every get_history_rows call."""
+    return [(c.args[1], c.args[2], c.args[3], c.args[5]) for c in service.get_history_rows.call_args_list]
+
+
+def test_history_rows_are_fetched_page_by_page(qtbot, monkeypatch):
+    monkeypatch.setattr(history_table_model, "HISTORY_PAGE_SIZE", 2)
+    pages = [
+        [_row(5, "2024-01-03T10:00:00"), _row(4, "2024-01-02T18:00:00")],
+        [_row(3, "2024-01-02T09:00:00")],
+    ]
+    controller, view, service = _controller(qtbot, pages)
+    model = controller.history_model
+
+    # Only the first page is loaded up front; the rest waits for the view to scroll.
+    assert model.rowCount() == 2 and model.canFetchMore()
+    model.fetchMore()
+
+    assert _query_args(service) == [("start_time", True, "", None),
+                                    ("start_time", True, "", (_epoch("2024-01-02T18:00:00"), 4))]
+    assert model.rowCount() == 3 and not model.canFetchMore()
+    assert view.content_stack.currentWidget() is view.history_page
+    assert [model.index(0, column).data() for column in range(6)] == [
+        "Math", "2024-01-03 10:00", "10m 5s", "4", "3", "75.0%"]
+
+
+def test_sorting_and_filtering_restart_the_query(qtbot):
+    pages = [[_row(2, "2024-01-02T10:00:00")], [_row(1, "2024-01-01T10:00:00", correct=1)], []]
+    controller, view, service = _controller(qtbot, pages)
+
+    view.history_table.sortByColumn(5, Qt.SortOrder.AscendingOrder)
+    controller.history_model.set_subject_filter(" Physics ")
+
+    assert _query_args(service) == [("start_time", True, "", None),
+                                    ("accuracy", False, "", None),
+                                    ("accuracy", False, "Physics", None)]
+    # An empty filtered result keeps the table (and its filter box) on screen.
+    assert controller.history_model.rowCount() == 0
+    assert view.content_stack.currentWidget() is view.history_page
+
+
+def test_filter_input_is_debounced(qtbot):
+    controller, view, service = _controller(qtbot, [[], []])
+
+    for text in ("P", "Ph", "Phy"):
+        view.subject_filter_input.setText(text)
+
+    qtbot.waitUntil(lambda: service.get_history_rows.call_count == 2)
+    assert _query_args(service)[-1] == ("start_time", True, "Phy", None)
+
+
+def test_empty_history_shows_empty_state(qtbot):
+    _, view, _ = _controller(qtbot, [[]])
+
+    assert view.content_stack.currentWidget() is view.empty_widget
+
+
+def test_daily_breakdown_groups_subjects_under_dates(qtbot):
+    breakdown = [("2024-01-03", "Math", 1), ("2024-01-01", "History", 1), ("2024-01-01", "Math", 2)]
+    _, view, _ = _controller(qtbot, [[]], breakdown)
+
+    model = view.daily_breakdown_model
+    assert [model.item(row).text() for row in range(model.rowCount())] == ["2024-01-03", "2024-01-01"]
+    assert [model.item(1).child(row).text() for row in range(2)] == ["History", "Math (2 sessions)"]
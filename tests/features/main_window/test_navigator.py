@@ -113,4 +113,66 @@ def test_navigator_redirects_to_session_if_active(mock_main_controller):
     # It should NOT create the configurations view
     mock_main_controller.view_controller_factory.create_configurations_landing.assert_not_called()
     # It SHOULD show the active session view
-    mock_main_controller.view.set_main_pane_widget.assert_called_once_with(mock_session_view)
\ No newline at end of file
+    mock_main_controller.view.set_main_pane_widget.assert_called_once_with(mock_session_view)
+
+def test_repeated_navigation_keeps_subscriptions_flat(qtbot, mocker):
+    """Panes replaced by navigation are deleted, and their bus subscriptions with them."""
+    from PySide6.QtCore import QCoreApplication, QEvent, QObject
+    from PySide6.QtWidgets import QWidget
+
+    from app.core.signals import ChangeKind, InvalidationBus
+    from app.navigation_service import NavigationService
+
+    bus = InvalidationBus()
+    main_controller = MagicMock()
+    main_controller.current_main_widget = None
+    main_controller._active_onboarding_controller = None
+    main_controller.session_manager.session_view = None
+    navigation_service = NavigationService()
+
+    def create_cycle_manager():
+        view = QWidget()
+        controller = QObject(view)
+        controller.view = view  # Controllers keep their view, as the real ones do.
+        bus.subscribe(ChangeKind.CYCLES, lambda change: controller.view.update(), owner=controller)
+        return view
+
+    navigation_service.register("cycle_manager", create_cycle_manager)
+    navigator = Navigator(main_controller, navigation_service)
+
+    for _ in range(12):
+        navigator.show_cycle_manager()
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+    assert bus.live_subscriptions() == {"QObject": 1}
+
+
+def test_cached_views_survive_navigation_and_are_reused(qtbot):
+    from PySide6.QtCore import QCoreApplication, QEvent
+    from PySide6.QtWidgets import QWidget
+
+    from app.core.signals import InvalidationBus
+    from app.navigation_service import NavigationService
+
+    main_controller = MagicMock()
+    main_controller.current_main_widget = None
+    main_controller._active_onboarding_controller = None
+    main_controller.session_manager.session_view = None
+    navigation_service = NavigationService(bus=InvalidationBus())
+    built = []
+
+    def create_history():
+        built.append(QWidget())
+        return built[-1]
+
+    navigation_service.register("history", create_history, cache_key=lambda: 1)
+    navigation_service.register("help", QWidget)
+    navigator = Navigator(main_controller, navigation_service)
+
+    navigator.show_history()
+    navigator.show_help()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    navigator.show_history()
+
+    assert len(built) == 1
+    assert main_controller.current_main_widget is built[0]
@@ -0,0 +1,60 @@
+# tests/features/main_window/test_tutor_runner.py
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.features.main_window.tutor_runner import TutorRunner
+
+
+@pytest.fixture
+def config_service():
+    settings = {"tutor.vectorized_diagnoser": True, "tutor.max_workers": 4}
+    config_service = MagicMock()
+    config_service.get.side_effect = lambda key, default=None: settings.get(key, default)
+    return config_service
+
+
+@pytest.fixture
+def input_assembler():
+    input_assembler = MagicMock()
+    input_assembler.assemble.return_value = {"subjects": [SimpleNamespace(id=1), SimpleNamespace(id=2)]}
+    input_assembler.load_subjects.return_value = ["subject models"]
+    input_assembler.input_fingerprint.return_value = "fingerprint"
+    return input_assembler
+
+
+def _run(runner):
+    finished = MagicMock()
+    runner.signals.finished.connect(finished)
+    runner.run()
+    return finished
+
+
+def test_runner_builds_the_tutor_from_the_tutor_settings(mocker, config_service, input_assembler):
+    tutor_cls = mocker.patch('app.features.main_window.tutor_runner.Tutor')
+    tutor_cls.return_value.create_study_cycle.return_value = {"plan": True}
+    cycle, user, cycle_subject_service = SimpleNamespace(id=7), MagicMock(), MagicMock()
+
+    finished = _run(TutorRunner(input_assembler, cycle, user, cycle_subject_service, config_service))
+
+    tutor_cls.assert_called_once_with(cycle_subject_service, config_service, vectorized_diagnoser=True, max_workers=4)
+    input_assembler.assemble.assert_called_once_with(cycle, user, cycle_subject_id=None)
+    input_assembler.load_subjects.assert_called_once_with(7)
+    input_assembler.input_fingerprint.assert_called_once_with(cycle, user)
+    finished.assert_called_once_with({"plan": True, "subjects": ["subject models"], "input_fingerprint": "fingerprint"})
+
+
+@pytest.mark.parametrize("cached_ids, incremental", [([1, 2], True), ([2], True), ([1], False)])
+def test_runner_replans_incrementally_only_when_the_cached_plan_covers_the_other_subjects(
+        mocker, config_service, input_assembler, cached_ids, incremental):
+    tutor = mocker.patch('app.features.main_window.tutor_runner.Tutor').return_value
+    tutor.replan_subject.return_value = {"incremental": True}
+    tutor.create_study_cycle.return_value = {"incremental": False}
+    previous_plan = {"processed_subjects": [{"subject_id": i} for i in cached_ids]}
+
+    finished = _run(TutorRunner(input_assembler, SimpleNamespace(id=7), MagicMock(), MagicMock(), config_service,
+                                previous_plan=previous_plan, cycle_subject_id=1))
+
+    assert finished.call_args.args[0]["incremental"] is incremental
+    assert input_assembler.assemble.call_args.kwargs == {"cycle_subject_id": 1}
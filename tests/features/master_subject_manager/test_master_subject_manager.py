@@ -9,6 +9,7 @@ from app.features.master_subject_manager.master_subject_manager_controller impor
 from app.features.master_subject_manager.master_subject_manager_view import MasterSubjectManagerView
 from app.services.interfaces import IMasterSubjectService
 from app.models.subject import Subject
+from app.core.signals import ChangeKind, DataChange
 
 
 @pytest.fixture
@@ -63,14 +64,14 @@ def test_on_add_success(controller, mock_master_subject_service, mocker):
             get_subject_name=lambda: "New Subject"
         )
     )
-    mock_signal = mocker.patch('app.features.master_subject_manager.master_subject_manager_controller.app_signals.data_changed')
+    mock_publish = mocker.patch('app.features.master_subject_manager.master_subject_manager_controller.invalidation_bus.publish')
 
     # Act
     controller._on_add()
 
     # Assert
     mock_master_subject_service.create.assert_called_once_with("New Subject")
-    mock_signal.emit.assert_called_once()
+    mock_publish.assert_called_once_with(DataChange.of(ChangeKind.MASTER_SUBJECTS))
 
 
 def test_on_add_cancel(controller, mock_master_subject_service, mocker):
@@ -99,14 +100,14 @@ def test_on_edit_success(controller, mock_master_subject_service, mocker):
             get_subject_name=lambda: "New Name"
         )
     )
-    mock_signal = mocker.patch('app.features.master_subject_manager.master_subject_manager_controller.app_signals.data_changed')
+    mock_publish = mocker.patch('app.features.master_subject_manager.master_subject_manager_controller.invalidation_bus.publish')
 
     # Act
     controller._on_edit(subject_to_edit)
 
     # Assert
     mock_master_subject_service.update.assert_called_once_with(1, "New Name")
-    mock_signal.emit.assert_called_once()
+    mock_publish.assert_called_once_with(DataChange.of(ChangeKind.MASTER_SUBJECTS))
 
 
 def test_on_delete_confirm(controller, mock_master_subject_service, mocker):
@@ -114,14 +115,14 @@ def test_on_delete_confirm(controller, mock_master_subject_service, mocker):
     # Arrange
     subject_to_delete = Subject(id=1, name="To Delete", color=None, created_at="", updated_at="", soft_delete=False, deleted_at=None)
     mocker.patch('PySide6.QtWidgets.QMessageBox.warning', return_value=QMessageBox.StandardButton.Yes)
-    mock_signal = mocker.patch('app.features.master_subject_manager.master_subject_manager_controller.app_signals.data_changed')
+    mock_publish = mocker.patch('app.features.master_subject_manager.master_subject_manager_controller.invalidation_bus.publish')
 
     # Act
     controller._on_delete(subject_to_delete)
 
     # Assert
     mock_master_subject_service.delete.assert_called_once_with(1)
-    mock_signal.emit.assert_called_once()
+    mock_publish.assert_called_once_with(DataChange.of(ChangeKind.MASTER_SUBJECTS))
 
 
 def test_on_delete_cancel(controller, mock_master_subject_service, mocker):
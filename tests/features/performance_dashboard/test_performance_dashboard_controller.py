@@ -0,0 +1,49 @@
+# tests/features/performance_dashboard/test_performance_dashboard_controller.py
+from unittest.mock import MagicMock
+
+from app.core.async_services import ServiceFuture
+from app.features.performance_dashboard.performance_dashboard_controller import PerformanceDashboardController
+from app.features.performance_dashboard.performance_dashboard_view import PerformanceDashboardView
+from app.services.interfaces import DailyPerformance, IAnalyticsService
+
+
+class _DeferredExecutor:
+    """Holds every call back until the test completes it, in any order."""
+
+    def __init__(self):
+        self.pending = []
+
+    def submit(self, fn, *args, context=None, **kwargs):
+        future = ServiceFuture(context)
+        self.pending.append((future, fn, args, kwargs))
+        return future
+
+    def complete(self, index):
+        future, fn, args, kwargs = self.pending[index]
+        future._set_outcome(fn(*args, **kwargs), None)
+
+
+def _service():
+    service = MagicMock(spec=IAnalyticsService)
+    service.get_daily_performance.side_effect = lambda cycle_id, days_ago: [
+        DailyPerformance(date="2024-01-01", questions_done=days_ago or 0, questions_correct=0)]
+    service.get_weekly_summary.return_value = []
+    return service
+
+
+def test_only_the_newest_period_populates_the_dashboard(qtbot, mocker):
+    view = PerformanceDashboardView()
+    qtbot.addWidget(view)
+    populate_chart = mocker.patch.object(view, "populate_chart")
+    executor = _DeferredExecutor()
+    service = _service()
+
+    controller = PerformanceDashboardController(view, 1, 4, service, executor)
+    controller._on_period_changed(7)
+    service.get_daily_performance.assert_not_called()  # Nothing is queried on the GUI thread.
+
+    executor.complete(1)
+    executor.complete(0)  # The 30-day load finishes last and is dropped.
+
+    populate_chart.assert_called_once()
+    assert populate_chart.call_args.args[0][0].questions_done == 7
@@ -0,0 +1,48 @@
+# tests/features/performance_graphs/test_performance_graph_controller.py
+from unittest.mock import MagicMock
+
+from app.core.async_services import AsyncServiceFacade, ServiceFuture
+from app.features.performance_graphs.performance_graph_controller import PerformanceGraphController
+from app.features.performance_graphs.performance_graph_view import PerformanceGraphView
+from app.services.interfaces import IMasterSubjectService, IPerformanceService
+
+
+class _DeferredExecutor:
+    """Holds every call back until the test completes it, in any order."""
+
+    def __init__(self):
+        self.pending = []
+
+    def submit(self, fn, *args, context=None, **kwargs):
+        future = ServiceFuture(context)
+        self.pending.append((future, fn, args, kwargs))
+        return future
+
+    def wrap(self, service):
+        return AsyncServiceFacade(service, self)
+
+    def complete(self, index):
+        future, fn, args, kwargs = self.pending[index]
+        future._set_outcome(fn(*args, **kwargs), None)
+
+
+def test_only_the_newest_subject_selection_updates_the_chart(qtbot, mocker):
+    service = MagicMock(spec=IPerformanceService)
+    service.get_subjects_with_performance_data.return_value = [{'id': 3, 'name': 'Math'}]
+    service.get_performance_over_time.side_effect = lambda user_id, subject_id: [{'subject': subject_id}]
+    view = PerformanceGraphView()
+    qtbot.addWidget(view)
+    update_chart = mocker.patch.object(view, "update_chart")
+    executor = _DeferredExecutor()
+
+    controller = PerformanceGraphController(view, 1, service, MagicMock(spec=IMasterSubjectService), executor)
+    # Nothing is queried on the GUI thread; the overall chart and the subject list are pending.
+    service.get_performance_over_time.assert_not_called()
+    controller._on_subject_selected(3)
+
+    executor.complete(2)  # Subject 3 finishes first ...
+    executor.complete(1)  # ... the stale overall chart finishes afterwards and is dropped.
+    executor.complete(0)
+
+    update_chart.assert_called_once_with([{'subject': 3}])
+    assert view.subject_combo.count() > 0
@@ -8,6 +8,7 @@ from sqlalchemy.engine import Connection
 
 from app.services.analytics_service import SqliteAnalyticsService
 from app.core.database import IDatabaseConnectionFactory
+from app.core.time_utils import local_date_cutoff
 from app.services.interfaces import DailyPerformance, WeeklyPerformance
 
 
@@ -46,12 +47,11 @@ def test_get_daily_performance_no_data(analytics_service, mock_db_connection):
     """Test get_daily_performance when no data is returned from the database."""
     cycle_id = 1
     expected_query = """SELECT
-                DATE(SS.start_time) as session_date,
-                SUM(QP.is_correct) as total_correct,
-                COUNT(QP.id) as total_questions
-            FROM question_performance AS QP
-            JOIN study_sessions AS SS ON QP.session_id = SS.id
-            WHERE SS.cycle_id = :cycle_id GROUP BY session_date
+                local_date as session_date,
+                SUM(correct) as total_correct,
+                SUM(questions) as total_questions
+            FROM daily_subject_stats
+            WHERE cycle_id = :cycle_id GROUP BY session_date HAVING SUM(questions) > 0
                 ORDER BY session_date ASC;"""
     
     result = analytics_service.get_daily_performance(cycle_id) # Define result
@@ -78,12 +78,11 @@ def test_get_daily_performance_with_data(analytics_service, mock_db_connection):
         DailyPerformance(date='2023-01-02', questions_done=12, questions_correct=8),
     ]
     expected_query = """SELECT
-                DATE(SS.start_time) as session_date,
-                SUM(QP.is_correct) as total_correct,
-                COUNT(QP.id) as total_questions
-            FROM question_performance AS QP
-            JOIN study_sessions AS SS ON QP.session_id = SS.id
-            WHERE SS.cycle_id = :cycle_id GROUP BY session_date
+                local_date as session_date,
+                SUM(correct) as total_correct,
+                SUM(questions) as total_questions
+            FROM daily_subject_stats
+            WHERE cycle_id = :cycle_id GROUP BY session_date HAVING SUM(questions) > 0
                 ORDER BY session_date ASC;"""
     mock_db_connection.execute.assert_called_once()
     actual_call_args, _ = mock_db_connection.execute.call_args
@@ -107,17 +106,16 @@ def test_get_daily_performance_with_days_ago(analytics_service, mock_db_connecti
         DailyPerformance(date='2023-01-05', questions_done=10, questions_correct=5),
     ]
     expected_query = """SELECT
-                DATE(SS.start_time) as session_date,
-                SUM(QP.is_correct) as total_correct,
-                COUNT(QP.id) as total_questions
-            FROM question_performance AS QP
-            JOIN study_sessions AS SS ON QP.session_id = SS.id
-            WHERE SS.cycle_id = :cycle_id AND DATE(SS.start_time) >= date('now', '-' || :days_ago || ' days') GROUP BY session_date
+                local_date as session_date,
+                SUM(correct) as total_correct,
+                SUM(questions) as total_questions
+            FROM daily_subject_stats
+            WHERE cycle_id = :cycle_id AND local_date >= :since_date GROUP BY session_date HAVING SUM(questions) > 0
                 ORDER BY session_date ASC;"""
     mock_db_connection.execute.assert_called_once()
     actual_call_args, _ = mock_db_connection.execute.call_args
     assert "".join(str(actual_call_args[0]).split()) == "".join(str(text(expected_query)).split())
-    assert actual_call_args[1] == {"cycle_id": cycle_id, "days_ago": days_ago}
+    assert actual_call_args[1] == {"cycle_id": cycle_id, "since_date": local_date_cutoff(days_ago)}
     assert result == expected
 
 def test_get_weekly_summary_no_daily_data(analytics_service, mocker):
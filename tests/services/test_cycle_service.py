@@ -1,4 +1,5 @@
 # tests/services/test_cycle_service.py
+from app.models.subject import CycleSubject
 from app.services.cycle_service import SqliteCycleService
 from app.services.exam_service import SqliteExamService
 from app.services.user_service import SqliteUserService
@@ -52,4 +53,78 @@ def test_soft_delete_and_restore(mock_db_factory):
     service.soft_delete(cycle_id)
     assert service.get_by_id(cycle_id) is None
     service.restore_soft_deleted(cycle_id)
-    assert service.get_by_id(cycle_id) is not None
\ No newline at end of file
+    assert service.get_by_id(cycle_id) is not None
+
+def _cycle_with_plan(mock_db_factory):
+    user = SqliteUserService(mock_db_factory).create_user("Test User", "Beginner")
+    exam_id = SqliteExamService(mock_db_factory).create(user_id=user.id, name="Test Exam")
+    service = SqliteCycleService(mock_db_factory)
+    cycle_id = service.create("Planned Cycle", 60, True, 2, exam_id, "Adaptive")
+    subject = CycleSubject(id=7, cycle_id=cycle_id, subject_id=3, name="Physics", relevance_weight=3,
+                           volume_weight=3, difficulty_weight=3, is_active=True, final_weight_calc=1.0,
+                           num_blocks_in_cycle=2)
+    plan = {
+        "cycle_focus": "Focus on <b>Physics</b>",
+        "generation_date": "2024-01-01",
+        "plan_scaffold": {"recommended_plan": {"sessions": [{"subject_id": 7, "allocated_minutes": 60}]}},
+        "processed_subjects": [{"subject_id": 7, "diagnostics": {"strategic_mode": "DEEP_WORK"}}],
+        "sequenced_plan": [],
+        "subjects": [subject],
+    }
+    return service, cycle_id, plan
+
+
+def test_plan_cache_round_trip(mock_db_factory):
+    service, cycle_id, plan = _cycle_with_plan(mock_db_factory)
+    service.save_plan_cache(cycle_id, plan)
+
+    # Stored the way the previous JSON column stored it: models as their to_dict().
+    assert service.get_plan_cache(cycle_id) == {**plan, "subjects": [plan["subjects"][0].to_dict()]}
+    assert service.get_by_id(cycle_id).plan_cache_json is None
+
+
+def test_plan_cache_sections_load_and_update_independently(mock_db_factory):
+    service, cycle_id, plan = _cycle_with_plan(mock_db_factory)
+    service.save_plan_cache(cycle_id, plan)
+
+    header = service.get_plan_cache(cycle_id, keys=())
+    assert header == {"cycle_focus": plan["cycle_focus"], "generation_date": "2024-01-01"}
+    assert service.get_plan_cache(cycle_id, keys=("plan_scaffold",)).keys() == {
+        "cycle_focus", "generation_date", "plan_scaffold"}
+
+    service.update_plan_cache(cycle_id, {"plan_scaffold": {"recommended_plan": {"sessions": []}},
+                                         "completed_today": {"date": "2024-01-01", "subject_ids": [7]}})
+    updated = service.get_plan_cache(cycle_id)
+    assert updated["plan_scaffold"] == {"recommended_plan": {"sessions": []}}
+    assert updated["completed_today"]["subject_ids"] == [7]
+    assert updated["generation_date"] == "2024-01-01"
+    assert updated["processed_subjects"] == plan["processed_subjects"]
+
+
+def test_legacy_json_plan_cache_is_still_read(mock_db_factory):
+    service, cycle_id, _ = _cycle_with_plan(mock_db_factory)
+    conn = mock_db_factory.get_connection()
+    conn.execute("UPDATE study_cycles SET plan_cache_json = ? WHERE id = ?",
+                 ('{"generation_date": "2024-01-01", "plan_scaffold": {}}', cycle_id))
+
+    assert service.get_plan_cache(cycle_id) == {"generation_date": "2024-01-01", "plan_scaffold": {}}
+    service.update_plan_cache(cycle_id, {"completed_today": {"date": "2024-01-01", "subject_ids": []}})
+    assert service.get_plan_cache(cycle_id, keys=()) == {
+        "generation_date": "2024-01-01", "completed_today": {"date": "2024-01-01", "subject_ids": []}}
+    assert service.get_by_id(cycle_id).plan_cache_json is None
+
+
+def test_failed_plan_cache_save_leaves_the_previous_plan(mock_db_factory):
+    service, cycle_id, plan = _cycle_with_plan(mock_db_factory)
+    conn = mock_db_factory.get_connection()
+    conn.execute("UPDATE study_cycles SET plan_cache_json = ? WHERE id = ?",
+                 ('{"generation_date": "2023-12-31", "plan_scaffold": {}}', cycle_id))
+    conn.commit()
+    # Fail the last statement of the save, after the sections were already written.
+    conn.execute("CREATE TEMP TRIGGER fail_plan_clear BEFORE UPDATE OF plan_cache_json ON study_cycles "
+                 "BEGIN SELECT RAISE(ABORT, 'disk full'); END")
+
+    service.save_plan_cache(cycle_id, plan)
+
+    assert conn.execute("SELECT COUNT(*) FROM plan_cache_sections WHERE cycle_id = ?", (cycle_id,)).fetchone()[0] == 0
+    assert service.get_plan_cache(cycle_id) == {"generation_date": "2023-12-31", "plan_scaffold": {}}
@@ -204,4 +204,25 @@ def test_update_cycle_subject_state(cycle_subject_service, mock_db_connection):
         "UPDATE cycle_subjects SET current_strategic_state = ?, state_hysteresis_data = ? WHERE id = ?",
         (state, json.dumps(hysteresis_data), cycle_subject_id)
     )
-    mock_db_connection.commit.assert_called_once()
\ No newline at end of file
+    mock_db_connection.commit.assert_called_once()
+
+def test_save_diagnoser_state(cycle_subject_service, mock_db_connection):
+    """Test upserting the Diagnoser checkpoint of a cycle subject."""
+    state = {'last_session_id': 7, 'weighted_correct': 1.5}
+    cycle_subject_service.save_diagnoser_state(1, state)
+
+    mock_db_connection.execute.assert_called_once_with(
+        "INSERT INTO diagnoser_checkpoints (cycle_subject_id, state_json) VALUES (?, ?) "
+        "ON CONFLICT(cycle_subject_id) DO UPDATE SET state_json = excluded.state_json, updated_at = CURRENT_TIMESTAMP",
+        (1, json.dumps(state))
+    )
+    mock_db_connection.commit.assert_called_once()
+
+
+def test_get_diagnoser_states(cycle_subject_service, mock_db_connection):
+    """Test loading the Diagnoser checkpoints of a cycle keyed by cycle subject."""
+    mock_db_connection.execute.return_value.fetchall.return_value = [
+        {'cycle_subject_id': 3, 'state_json': '{"last_session_id": 7}'},
+    ]
+
+    assert cycle_subject_service.get_diagnoser_states(1) == {3: {'last_session_id': 7}}
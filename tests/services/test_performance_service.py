@@ -5,6 +5,7 @@ import textwrap
 
 from app.services.performance_service import SqlitePerformanceService
 from app.core.database import IDatabaseConnectionFactory
+from app.core.time_utils import local_date_cutoff
 from app.models.session import SubjectPerformance
 
 
@@ -102,7 +103,7 @@ def test_get_performance_over_time_no_data(performance_service):
     assert result == []
     performance_service._execute_query.assert_called_once_with(
         textwrap.dedent("""
-            SELECT strftime('%Y-%m-%d', SS.start_time) as date,
+            SELECT SS.local_date                        as date,
                    COUNT(QP.id)                        as total_questions,
                    SUM(QP.is_correct)                  as total_correct
             FROM question_performance AS QP
@@ -134,7 +135,7 @@ def test_get_performance_over_time_with_data(performance_service):
     assert result == expected
     performance_service._execute_query.assert_called_once_with(
         textwrap.dedent("""
-            SELECT strftime('%Y-%m-%d', SS.start_time) as date,
+            SELECT SS.local_date                        as date,
                    COUNT(QP.id)                        as total_questions,
                    SUM(QP.is_correct)                  as total_correct
             FROM question_performance AS QP
@@ -163,8 +164,9 @@ def test_get_subjects_with_performance_data_no_data(performance_service):
             FROM subjects AS S
             JOIN study_sessions AS SS ON S.id = SS.subject_id
             WHERE SS.user_id = ?
-              -- This subquery ensures we only list subjects that actually have questions logged
-              AND SS.id IN (SELECT DISTINCT session_id FROM question_performance)
+              -- This subquery ensures we only list subjects that actually have questions logged.
+              -- EXISTS probes the session_id index instead of scanning every logged question.
+              AND EXISTS (SELECT 1 FROM question_performance AS QP WHERE QP.session_id = SS.id)
             ORDER BY S.name ASC;
         """),
         (user_id,)
@@ -193,8 +195,9 @@ def test_get_subjects_with_performance_data_with_data(performance_service):
             FROM subjects AS S
             JOIN study_sessions AS SS ON S.id = SS.subject_id
             WHERE SS.user_id = ?
-              -- This subquery ensures we only list subjects that actually have questions logged
-              AND SS.id IN (SELECT DISTINCT session_id FROM question_performance)
+              -- This subquery ensures we only list subjects that actually have questions logged.
+              -- EXISTS probes the session_id index instead of scanning every logged question.
+              AND EXISTS (SELECT 1 FROM question_performance AS QP WHERE QP.session_id = SS.id)
             ORDER BY S.name ASC;
         """),
         (user_id,)
@@ -251,8 +254,8 @@ def test_get_topic_performance_with_data(performance_service):
                 SUM(QP.is_correct) AS total_correct
             FROM question_performance AS QP
             JOIN study_sessions SS ON QP.session_id = SS.id
-            WHERE SS.user_id = ? AND SS.subject_id = ? AND QP.topic_name != 'general' AND date(SS.start_time) >= date('now', '-' || ? || ' days') GROUP BY QP.topic_name ORDER BY total_correct * 1.0 / total_questions ASC;"""),
-        (user_id, subject_id, days_ago)
+            WHERE SS.user_id = ? AND SS.subject_id = ? AND QP.topic_name != 'general' AND SS.local_date >= ? GROUP BY QP.topic_name ORDER BY total_correct * 1.0 / total_questions ASC;"""),
+        (user_id, subject_id, local_date_cutoff(days_ago))
     )
 
 
@@ -303,15 +306,15 @@ def test_get_study_time_summary_no_data(performance_service):
         textwrap.dedent("""
             SELECT
                 subject_id,
-                SUM(liquid_duration_sec) as total_seconds
-            FROM study_sessions
+                SUM(seconds) as total_seconds
+            FROM daily_subject_stats
             WHERE
                 user_id = ? AND
-                end_time IS NOT NULL AND
-                date(start_time) >= date('now', '-' || ? || ' days')
-            GROUP BY subject_id;
+                local_date >= ?
+            GROUP BY subject_id
+            HAVING SUM(sessions) > 0;
         """),
-        (user_id, days_ago)
+        (user_id, local_date_cutoff(days_ago))
     )
 
 def test_get_study_time_summary_with_data(performance_service):
@@ -333,15 +336,15 @@ def test_get_study_time_summary_with_data(performance_service):
         textwrap.dedent("""
             SELECT
                 subject_id,
-                SUM(liquid_duration_sec) as total_seconds
-            FROM study_sessions
+                SUM(seconds) as total_seconds
+            FROM daily_subject_stats
             WHERE
                 user_id = ? AND
-                end_time IS NOT NULL AND
-                date(start_time) >= date('now', '-' || ? || ' days')
-            GROUP BY subject_id;
+                local_date >= ?
+            GROUP BY subject_id
+            HAVING SUM(sessions) > 0;
         """),
-        (user_id, days_ago)
+        (user_id, local_date_cutoff(days_ago))
     )
 
 def test_get_study_session_summary_no_data(performance_service):
@@ -358,12 +361,11 @@ def test_get_study_session_summary_no_data(performance_service):
     assert "".join(textwrap.dedent("""
             SELECT
                 subject_id,
-                COUNT(id) as session_count
-            FROM study_sessions
+                SUM(sessions) as session_count
+            FROM daily_subject_stats
             WHERE
-                user_id = ? AND
-                end_time IS NOT NULL
-            GROUP BY subject_id;""").split()) == "".join(textwrap.dedent(args[0]).split())
+                user_id = ?
+            GROUP BY subject_id HAVING SUM(sessions) > 0;""").split()) == "".join(textwrap.dedent(args[0]).split())
     assert args[1] == (user_id,)
 def test_get_study_session_summary_with_data(performance_service):
     """Test get_study_session_summary with some data and days_ago."""
@@ -385,14 +387,13 @@ def test_get_study_session_summary_with_data(performance_service):
     assert "".join(textwrap.dedent("""
             SELECT
                 subject_id,
-                COUNT(id) as session_count
-            FROM study_sessions
+                SUM(sessions) as session_count
+            FROM daily_subject_stats
             WHERE
-                user_id = ? AND
-                end_time IS NOT NULL
-            AND date(start_time) >= date('now', '-' || ? || ' days')
-            GROUP BY subject_id;""").split()) == "".join(textwrap.dedent(args[0]).split())
-    assert args[1] == (user_id, days_ago)
+                user_id = ?
+            AND local_date >= ?
+            GROUP BY subject_id HAVING SUM(sessions) > 0;""").split()) == "".join(textwrap.dedent(args[0]).split())
+    assert args[1] == (user_id, local_date_cutoff(days_ago))
 
 def test_get_subject_summary_for_analytics_no_data(performance_service):
     """Test get_subject_summary_for_analytics when no data is returned."""
@@ -407,40 +408,31 @@ def test_get_subject_summary_for_analytics_no_data(performance_service):
     performance_service._execute_query.assert_called_once()
     args, kwargs = performance_service._execute_query.call_args
     assert "".join(textwrap.dedent("""
-            WITH TimeAndSessions AS (
+            WITH DailyTotals AS (
                 SELECT
                     subject_id,
-                    SUM(liquid_duration_sec) / 60 AS total_minutes,
-                    COUNT(id) AS session_count
-                FROM study_sessions
-                WHERE user_id = ? AND cycle_id = ?  AND end_time IS NOT NULL
+                    SUM(seconds) / 60 AS total_minutes,
+                    SUM(sessions) AS session_count,
+                    SUM(questions) AS total_questions,
+                    SUM(correct) AS total_correct
+                FROM daily_subject_stats
+                WHERE user_id = ? AND cycle_id = ? 
                 GROUP BY subject_id
-            ),
-            QuestionPerf AS (
-                SELECT
-                    ss.subject_id,
-                    COUNT(qp.id) AS total_questions,
-                    SUM(qp.is_correct) AS total_correct
-                FROM question_performance qp
-                JOIN study_sessions ss ON qp.session_id = ss.id
-                WHERE ss.user_id = ? AND ss.cycle_id = ? 
-                GROUP BY ss.subject_id
             )
             SELECT
                 s.name AS subject_name,
                 s.id as subject_id,
-                COALESCE(ts.total_minutes, 0) AS total_study_minutes,
-                COALESCE(ts.session_count, 0) AS session_count,
-                COALESCE(qp.total_questions, 0) AS total_questions,
-                COALESCE(qp.total_correct, 0) AS total_correct
+                COALESCE(dt.total_minutes, 0) AS total_study_minutes,
+                COALESCE(dt.session_count, 0) AS session_count,
+                COALESCE(dt.total_questions, 0) AS total_questions,
+                COALESCE(dt.total_correct, 0) AS total_correct
             FROM cycle_subjects cs
             JOIN subjects s ON cs.subject_id = s.id
-            LEFT JOIN TimeAndSessions ts ON cs.subject_id = ts.subject_id
-            LEFT JOIN QuestionPerf qp ON cs.subject_id = qp.subject_id
+            LEFT JOIN DailyTotals dt ON cs.subject_id = dt.subject_id
             WHERE cs.cycle_id = ?
             ORDER BY s.name;
         """).split()) == "".join(textwrap.dedent(args[0]).split())
-    assert args[1] == (user_id, cycle_id, user_id, cycle_id, cycle_id)
+    assert args[1] == (user_id, cycle_id, cycle_id)
 
 
 def test_get_subject_summary_for_analytics_with_data(performance_service):
@@ -477,37 +469,29 @@ def test_get_subject_summary_for_analytics_with_data(performance_service):
     performance_service._execute_query.assert_called_once()
     args, kwargs = performance_service._execute_query.call_args
     assert "".join(textwrap.dedent("""
-            WITH TimeAndSessions AS (
+            WITH DailyTotals AS (
                 SELECT
                     subject_id,
-                    SUM(liquid_duration_sec) / 60 AS total_minutes,
-                    COUNT(id) AS session_count
-                FROM study_sessions
-                WHERE user_id = ? AND cycle_id = ? AND date(start_time) >= date('now', '-' || ? || ' days') AND end_time IS NOT NULL
+                    SUM(seconds) / 60 AS total_minutes,
+                    SUM(sessions) AS session_count,
+                    SUM(questions) AS total_questions,
+                    SUM(correct) AS total_correct
+                FROM daily_subject_stats
+                WHERE user_id = ? AND cycle_id = ? AND local_date >= ?
                 GROUP BY subject_id
-            ),
-            QuestionPerf AS (
-                SELECT
-                    ss.subject_id,
-                    COUNT(qp.id) AS total_questions,
-                    SUM(qp.is_correct) AS total_correct
-                FROM question_performance qp
-                JOIN study_sessions ss ON qp.session_id = ss.id
-                WHERE ss.user_id = ? AND ss.cycle_id = ? AND date(start_time) >= date('now', '-' || ? || ' days')
-                GROUP BY ss.subject_id
             )
             SELECT
                 s.name AS subject_name,
                 s.id as subject_id,
-                COALESCE(ts.total_minutes, 0) AS total_study_minutes,
-                COALESCE(ts.session_count, 0) AS session_count,
-                COALESCE(qp.total_questions, 0) AS total_questions,
-                COALESCE(qp.total_correct, 0) AS total_correct
+                COALESCE(dt.total_minutes, 0) AS total_study_minutes,
+                COALESCE(dt.session_count, 0) AS session_count,
+                COALESCE(dt.total_questions, 0) AS total_questions,
+                COALESCE(dt.total_correct, 0) AS total_correct
             FROM cycle_subjects cs
             JOIN subjects s ON cs.subject_id = s.id
-            LEFT JOIN TimeAndSessions ts ON cs.subject_id = ts.subject_id
-            LEFT JOIN QuestionPerf qp ON cs.subject_id = qp.subject_id
+            LEFT JOIN DailyTotals dt ON cs.subject_id = dt.subject_id
             WHERE cs.cycle_id = ?
             ORDER BY s.name;
         """).split()) == "".join(textwrap.dedent(args[0]).split())
-    assert args[1] == (user_id, cycle_id, days_ago, user_id, cycle_id, days_ago, cycle_id)
\ No newline at end of file
+    cutoff = local_date_cutoff(days_ago)
+    assert args[1] == (user_id, cycle_id, cutoff, cycle_id)
\ No newline at end of file
@@ -0,0 +1,210 @@
+# tests/services/test_query_plans.py
+"""
+Query-plan regression suite.
+
+Every public method of every Sqlite*Service is called against a migrated database
+while the connection traces the statements it runs. Each traced SELECT/UPDATE/DELETE
+is then passed through EXPLAIN QUERY PLAN, and the test fails if the plan scans
+question_performance, study_sessions or the daily_subject_stats rollup instead of searching an index.
+New service methods must be registered in SERVICE_CALLS (test_every_service_method_is_covered).
+"""
+import importlib
+import inspect
+import pkgutil
+import re
+
+import pytest
+
+import app.services
+from app.core.database import PooledSqliteConnectionFactory
+from app.core.migrations import run_migrations_on_connection
+from app.models.session import QuestionPerformance
+from app.services.analytics_service import SqliteAnalyticsService
+from app.services.cycle_service import SqliteCycleService
+from app.services.cycle_subject_service import SqliteCycleSubjectService
+from app.services.exam_service import SqliteExamService
+from app.services.master_subject_service import SqliteMasterSubjectService
+from app.services.performance_service import SqlitePerformanceService
+from app.services.session_service import SqliteSessionService
+from app.services.study_queue_service import SqliteStudyQueueService
+from app.services.template_subject_service import SqliteTemplateSubjectService
+from app.services.user_service import SqliteUserService
+from app.services.work_unit_service import SqliteWorkUnitService
+from tests.conftest import BASE_PATH
+
+MONITORED_TABLES = ("question_performance", "study_sessions", "daily_subject_stats")
+
+_UNIT = {'title': 'Unit', 'type': 'Reading', 'estimated_time': 30, 'topic': 'general'}
+_QUESTIONS = [QuestionPerformance(id=None, session_id=1, topic_name='general', difficulty_level=1, is_correct=True)]
+
+# (service class, method, args, kwargs). Methods with optional filters are listed once per query shape.
+SERVICE_CALLS = [
+    (SqliteAnalyticsService, "get_daily_performance", (1,), {}),
+    (SqliteAnalyticsService, "get_daily_performance", (1,), {"days_ago": 30}),
+    (SqliteAnalyticsService, "get_overall_summary", (1,), {}),
+    (SqliteAnalyticsService, "get_weekly_summary", (1,), {"days_ago": 30}),
+    (SqliteCycleService, "advance_queue_position", (1,), {}),
+    (SqliteCycleService, "create", ("Plan Cycle", 60, True, 4, 1, "Adaptive"), {}),
+    (SqliteCycleService, "get_active", (), {}),
+    (SqliteCycleService, "get_all_for_exam", (1,), {}),
+    (SqliteCycleService, "get_by_id", (1,), {}),
+    (SqliteCycleService, "get_plan_cache", (1,), {}),
+    (SqliteCycleService, "get_plan_cache", (1,), {"keys": ("plan_scaffold",)}),
+    (SqliteCycleService, "restore_soft_deleted", (1,), {}),
+    (SqliteCycleService, "save_plan_cache", (1, {"subjects": []}), {}),
+    (SqliteCycleService, "update_plan_cache", (1, {"plan_scaffold": {}, "generation_date": "2024-01-01"}), {}),
+    (SqliteCycleService, "set_active", (1,), {}),
+    (SqliteCycleService, "set_all_inactive", (), {}),
+    (SqliteCycleService, "soft_delete", (1,), {}),
+    (SqliteCycleService, "update_properties", (1, "Plan Cycle", 60, True, 4, True, "Adaptive"), {}),
+    (SqliteCycleSubjectService, "add_subject_to_cycle", (1, 1, {"relevance": 3, "volume": 3, "difficulty": 3, "is_active": True},
+                                                         {"final_weight": 1.0, "num_blocks": 1}), {}),
+    (SqliteCycleSubjectService, "delete_subjects_for_cycle", (1,), {}),
+    (SqliteCycleSubjectService, "get_cycle_subject", (1,), {}),
+    (SqliteCycleSubjectService, "get_diagnoser_states", (1,), {}),
+    (SqliteCycleSubjectService, "get_subjects_for_cycle", (1,), {}),
+    (SqliteCycleSubjectService, "save_diagnoser_state", (1, {"last_session_id": 1}), {}),
+    (SqliteCycleSubjectService, "update_cycle_subject_calculated_fields", (1, 1.0, 1), {}),
+    (SqliteCycleSubjectService, "update_cycle_subject_difficulty", (1, 4), {}),
+    (SqliteCycleSubjectService, "update_cycle_subject_state", (1, "DEEP_WORK", {}), {}),
+    (SqliteExamService, "create", (1, "Plan Exam"), {}),
+    (SqliteExamService, "get_all_for_user", (1,), {}),
+    (SqliteExamService, "get_available_templates", (), {}),
+    (SqliteExamService, "get_by_id", (1,), {}),
+    (SqliteExamService, "soft_delete", (1,), {}),
+    (SqliteExamService, "update", (1, "Plan Exam", "", "", "", "", "PREVISTO", None, 0, None), {}),
+    (SqliteMasterSubjectService, "create", ("Plan Subject",), {}),
+    (SqliteMasterSubjectService, "delete", (9999,), {}),
+    (SqliteMasterSubjectService, "get_all_master_subjects", (), {}),
+    (SqliteMasterSubjectService, "get_master_subject_by_name", ("Plan Subject",), {}),
+    (SqliteMasterSubjectService, "get_subject_by_id", (1,), {}),
+    (SqliteMasterSubjectService, "get_topics_for_subject", (1,), {}),
+    (SqliteMasterSubjectService, "update", (9999, "Renamed"), {}),
+    (SqlitePerformanceService, "get_performance_over_time", (1,), {}),
+    (SqlitePerformanceService, "get_performance_over_time", (1,), {"subject_id": 1}),
+    (SqlitePerformanceService, "get_study_session_summary", (1,), {}),
+    (SqlitePerformanceService, "get_study_session_summary", (1,), {"days_ago": 7}),
+    (SqlitePerformanceService, "get_study_time_summary", (1, 7), {}),
+    (SqlitePerformanceService, "get_subject_summary_for_analytics", (1, 1), {}),
+    (SqlitePerformanceService, "get_subject_summary_for_analytics", (1, 1), {"days_ago": 30}),
+    (SqlitePerformanceService, "get_subjects_with_performance_data", (1,), {}),
+    (SqlitePerformanceService, "get_summary", (1,), {}),
+    (SqlitePerformanceService, "get_topic_performance", (1, 1), {}),
+    (SqlitePerformanceService, "get_topic_performance", (1, 1), {"days_ago": 30}),
+    (SqlitePerformanceService, "get_work_unit_summary", (1,), {}),
+    (SqlitePerformanceService, "get_work_unit_summary", (1,), {"subject_id": 1}),
+    (SqliteSessionService, "add_pause_end", (1,), {}),
+    (SqliteSessionService, "add_pause_start", (1,), {}),
+    (SqliteSessionService, "finish_session", (1,), {"questions": _QUESTIONS}),
+    (SqliteSessionService, "get_completed_session_count", (1,), {}),
+    (SqliteSessionService, "get_history_for_cycle", (1,), {}),
+    (SqliteSessionService, "get_history_for_cycle", (1,), {"subject_id": 1}),
+    (SqliteSessionService, "get_history_columns_for_cycle", (1,), {}),
+    (SqliteSessionService, "get_history_columns_for_cycle", (1,), {"subject_id": 1}),
+    (SqliteSessionService, "get_history_page", (1,), {"after": (1704103200, 5)}),
+    (SqliteSessionService, "iter_history_for_cycle", (1,), {}),
+    (SqliteSessionService, "get_history_rows", (1,), {"after": (1704103200, 5)}),
+    (SqliteSessionService, "get_history_rows", (1, "accuracy", False), {"subject_filter": "Plan",
+                                                                         "after": (50.0, 5)}),
+    (SqliteSessionService, "get_daily_breakdown", (1,), {}),
+    (SqliteSessionService, "get_history_watermark", (1,), {}),
+    (SqliteSessionService, "log_activity_and_create_reviews", (1, None, "study", 60, {}), {}),
+    (SqliteSessionService, "log_manual_session", (1, 1, 1, None, "2024-01-01T10:00:00"), {}),
+    (SqliteSessionService, "rebuild_daily_stats", (), {}),
+    (SqliteSessionService, "start_session", (1, 1, 1), {}),
+    (SqliteStudyQueueService, "get_next_in_queue", (1, 0), {}),
+    (SqliteStudyQueueService, "save_queue", (1, [1]), {}),
+    (SqliteTemplateSubjectService, "get_subjects_for_template", (1,), {}),
+    (SqliteUserService, "create_user", ("Plan User", "Beginner"), {}),
+    (SqliteUserService, "get_first_user", (), {}),
+    (SqliteUserService, "get_human_factor_history", (1,), {}),
+    (SqliteUserService, "get_user", (1,), {}),
+    (SqliteUserService, "save_human_factor", (1, "2024-01-01", "High", "Low"), {}),
+    (SqliteUserService, "update_user", (1, "Plan User", "Beginner", "Dark"), {}),
+    (SqliteWorkUnitService, "add_topics_bulk", (1, ["Plan Topic"]), {}),
+    (SqliteWorkUnitService, "add_work_unit", (1, _UNIT), {}),
+    (SqliteWorkUnitService, "delete_work_unit", (9999,), {}),
+    (SqliteWorkUnitService, "get_work_units_for_subject", (1,), {}),
+    (SqliteWorkUnitService, "update_work_unit", (1, _UNIT), {}),
+    (SqliteWorkUnitService, "update_work_unit_status", (1, True), {}),
+]
+
+# Full rebuilds read every row by design; they are still called so a broken statement fails the suite.
+FULL_REBUILDS = {(SqliteSessionService, "rebuild_daily_stats")}
+
+_EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE")
+_ALIAS_KEYWORDS = {"ON", "WHERE", "JOIN", "LEFT", "INNER", "GROUP", "ORDER", "LIMIT", "SET", "AS"}
+
+
+def _monitored_names(sql: str) -> set:
+    """The monitored table names plus any aliases they are given in this statement."""
+    names = set(MONITORED_TABLES)
+    pattern = rf"\b(?:FROM|JOIN)\s+({'|'.join(MONITORED_TABLES)})(?:\s+(?:AS\s+)?(\w+))?"
+    for match in re.finditer(pattern, sql, re.IGNORECASE):
+        alias = match.group(2)
+        if alias and alias.upper() not in _ALIAS_KEYWORDS:
+            names.add(alias)
+    return names
+
+
+def _full_scans(conn, sql: str) -> list:
+    names = _monitored_names(sql)
+    details = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}")]
+    return [d for d in details if re.match(rf"SCAN ({'|'.join(map(re.escape, names))})\b", d)]
+
+
+@pytest.fixture
+def traced_factory(tmp_path):
+    factory = PooledSqliteConnectionFactory(str(tmp_path / "plans.db"))
+    conn = factory.get_connection()
+    run_migrations_on_connection(conn, BASE_PATH)
+    # Parent rows with id 1 everywhere, so the calls above satisfy the foreign keys.
+    with conn:
+        conn.execute("INSERT INTO users (id, name, study_level) VALUES (1, 'Plan User', 'Beginner') "
+                     "ON CONFLICT(id) DO NOTHING")
+        conn.execute("INSERT INTO subjects (id, name) VALUES (1, 'Plan Base Subject') ON CONFLICT(id) DO NOTHING")
+        conn.execute("INSERT INTO exams (id, user_id, name) VALUES (1, 1, 'Plan Base Exam') ON CONFLICT(id) DO NOTHING")
+        conn.execute("INSERT INTO study_cycles (id, exam_id, name, block_duration_min, daily_goal_blocks) "
+                     "VALUES (1, 1, 'Plan Base Cycle', 60, 4) ON CONFLICT(id) DO NOTHING")
+        conn.execute("INSERT INTO cycle_subjects (id, cycle_id, subject_id) VALUES (1, 1, 1) ON CONFLICT(id) DO NOTHING")
+        conn.execute("INSERT INTO study_sessions (id, user_id, subject_id, cycle_id, start_time) "
+                     "VALUES (1, 1, 1, 1, '2024-01-01T10:00:00')")
+        conn.execute("INSERT INTO work_units (id, subject_id, unit_id, title, type, estimated_time_minutes) "
+                     "VALUES (1, 1, 'wu_1_1', 'Unit', 'Reading', 30)")
+    yield factory
+    factory.close_all()
+
+
+@pytest.mark.parametrize(
+    "service_cls, method, args, kwargs",
+    SERVICE_CALLS,
+    ids=[f"{cls.__name__}.{method}-{i}" for i, (cls, method, _, _) in enumerate(SERVICE_CALLS)],
+)
+def test_service_queries_do_not_scan_hot_tables(traced_factory, service_cls, method, args, kwargs):
+    conn = traced_factory.get_connection()
+    statements = []
+    conn.set_trace_callback(statements.append)
+    try:
+        getattr(service_cls(traced_factory), method)(*args, **kwargs)
+    finally:
+        conn.set_trace_callback(None)
+    if (service_cls, method) in FULL_REBUILDS:
+        return
+
+    explained = [s for s in statements if s.lstrip().upper().startswith(_EXPLAINABLE)]
+    offenders = {s.strip(): scans for s in explained if (scans := _full_scans(conn, s))}
+    assert not offenders, f"{service_cls.__name__}.{method} scans {MONITORED_TABLES}: {offenders}"
+
+
+def test_every_service_method_is_covered():
+    registered = {(cls, method) for cls, method, _, _ in SERVICE_CALLS}
+    missing = []
+    for module_info in pkgutil.iter_modules(app.services.__path__):
+        module = importlib.import_module(f"app.services.{module_info.name}")
+        for name, cls in inspect.getmembers(module, inspect.isclass):
+            if not name.startswith("Sqlite") or cls.__module__ != module.__name__:
+                continue
+            for method_name, _ in inspect.getmembers(cls, inspect.isfunction):
+                if not method_name.startswith("_") and (cls, method_name) not in registered:
+                    missing.append(f"{name}.{method_name}")
+    assert not missing, f"Register these methods in SERVICE_CALLS: {missing}"
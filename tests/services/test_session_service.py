@@ -1,4 +1,6 @@
 # tests/services/test_session_service.py
+from datetime import date
+
 import pytest
 from app.services.session_service import SqliteSessionService
 from app.services.user_service import SqliteUserService
@@ -67,6 +69,28 @@ def test_start_and_finish_session(session_setup):
     assert len(question_rows) == 2
 
 
+
+def test_finish_session_writes_end_time_and_questions_together(session_setup):
+    service = SqliteSessionService(session_setup["factory"])
+    session_id = service.start_session(
+        user_id=session_setup["user_id"],
+        subject_id=session_setup["subject_id"],
+        cycle_id=session_setup["cycle_id"]
+    )
+
+    questions = [
+        QuestionPerformance(id=0, session_id=0, topic_name="t1", difficulty_level=3, is_correct=True),
+        QuestionPerformance(id=0, session_id=0, topic_name=None, difficulty_level=3, is_correct=True),
+    ]
+    service.finish_session(session_id=session_id, questions=questions)
+
+    # The second question violates NOT NULL, so nothing of the finish may be visible.
+    conn = session_setup["factory"].get_connection()
+    session_row = conn.execute("SELECT end_time FROM study_sessions WHERE id = ?", (session_id,)).fetchone()
+    question_count = conn.execute("SELECT COUNT(*) FROM question_performance WHERE session_id = ?", (session_id,)).fetchone()[0]
+    assert session_row["end_time"] is None
+    assert question_count == 0
+
 def test_get_history_for_cycle(session_setup):
     service = SqliteSessionService(session_setup["factory"])
 
@@ -81,4 +105,188 @@ def test_get_history_for_cycle(session_setup):
 
     assert len(history) == 2
     session1 = next(s for s in history if s.id == session_id_1)
-    assert len(session1.questions) == 1
\ No newline at end of file
+    assert len(session1.questions) == 1
+
+
+def test_history_columns_match_history_objects(session_setup):
+    service = SqliteSessionService(session_setup["factory"])
+    user_id, cycle_id, subject_id = session_setup["user_id"], session_setup["cycle_id"], session_setup["subject_id"]
+    conn = session_setup["factory"].get_connection()
+    for day, answers in enumerate([[("a", True), ("b", False)], [], [("b", True), ("c", True), ("a", False)]], start=1):
+        session_id = service.start_session(user_id, subject_id, cycle_id)
+        service.finish_session(session_id, questions=[
+            QuestionPerformance(id=0, session_id=0, topic_name=topic, difficulty_level=day, is_correct=correct)
+            for topic, correct in answers])
+        conn.execute("UPDATE study_sessions SET start_time = ? WHERE id = ?", (f"2024-01-0{day}T10:00:00", session_id))
+
+    history = service.get_history_for_cycle(cycle_id)
+    columns = service.get_history_columns_for_cycle(cycle_id, chunk_size=2)  # Chunks split sessions.
+
+    assert len(columns) == len(history) == 3
+    assert list(columns.session_id) == [s.id for s in history]
+    assert list(columns.liquid_sec) == [s.liquid_duration_sec for s in history]
+    assert list(columns.start_day) == [date(2024, 1, day).toordinal() for day in (1, 2, 3)]
+    assert columns.topic_names == ["a", "b", "c"]
+    # Questions come back in insertion order within each session.
+    assert [(row, columns.topic_names[topic], correct, difficulty) for row, topic, correct, difficulty in zip(
+        columns.question_session_row, columns.question_topic, columns.question_correct, columns.question_difficulty)
+    ] == [(0, "a", 1, 1), (0, "b", 0, 1), (2, "b", 1, 3), (2, "c", 1, 3), (2, "a", 0, 3)]
+    assert sorted((q.session_id, q.topic_name) for s in history for q in s.questions) == sorted(
+        (columns.session_id[row], columns.topic_names[topic])
+        for row, topic in zip(columns.question_session_row, columns.question_topic))
+
+
+def test_history_can_be_limited_to_one_subject(session_setup):
+    service = SqliteSessionService(session_setup["factory"])
+    user_id, cycle_id, subject_id = session_setup["user_id"], session_setup["cycle_id"], session_setup["subject_id"]
+    other_subject_id = SqliteMasterSubjectService(session_setup["factory"]).create("Other Subject")
+    for subject in (subject_id, other_subject_id, subject_id):
+        session_id = service.start_session(user_id, subject, cycle_id)
+        service.finish_session(session_id, questions=[
+            QuestionPerformance(id=0, session_id=0, topic_name="t", difficulty_level=1, is_correct=True)])
+
+    history = service.get_history_for_cycle(cycle_id, subject_id=other_subject_id)
+    columns = service.get_history_columns_for_cycle(cycle_id, subject_id=other_subject_id)
+
+    assert [s.subject_id for s in history] == [other_subject_id]
+    assert [q.session_id for q in history[0].questions] == [history[0].id]
+    assert list(columns.session_id) == [history[0].id]
+    assert columns.question_count == 1
+    assert len(service.get_history_for_cycle(cycle_id)) == 3
+
+
+def test_history_pages_follow_keyset_order(session_setup):
+    service = SqliteSessionService(session_setup["factory"])
+    conn = session_setup["factory"].get_connection()
+    user_id, cycle_id, subject_id = session_setup["user_id"], session_setup["cycle_id"], session_setup["subject_id"]
+    # Two sessions share a start_time, so the id breaks the tie.
+    for start in ("2024-01-01T10:00:00", "2024-01-02T10:00:00", "2024-01-02T10:00:00", "2024-01-03T10:00:00"):
+        session_id = service.start_session(user_id, subject_id, cycle_id)
+        service.finish_session(session_id, questions=[
+            QuestionPerformance(id=0, session_id=0, topic_name="t", difficulty_level=1, is_correct=i % 2 == 0)
+            for i in range(session_id)])
+        conn.execute("UPDATE study_sessions SET start_time = ? WHERE id = ?", (start, session_id))
+
+    first = service.get_history_page(cycle_id, page_size=3)
+    second = service.get_history_page(cycle_id, page_size=3, after=first[-1].keyset("start_time"))
+    streamed = list(service.iter_history_for_cycle(cycle_id, page_size=2))
+
+    newest_first = sorted(service.get_history_for_cycle(cycle_id), key=lambda s: (s.start_time, s.id), reverse=True)
+    assert [r.id for r in first + second] == [r.id for r in streamed] == [s.id for s in newest_first]
+    assert [(r.questions_done, r.questions_correct) for r in streamed] == [
+        (len(s.questions), sum(q.is_correct for q in s.questions)) for s in newest_first]
+
+
+def test_history_rows_sort_filter_and_resume_in_sql(session_setup):
+    service = SqliteSessionService(session_setup["factory"])
+    user_id, cycle_id, subject_id = session_setup["user_id"], session_setup["cycle_id"], session_setup["subject_id"]
+    other_subject_id = SqliteMasterSubjectService(session_setup["factory"]).create("Other_Subject")
+    # (subject, questions answered, correct answers); the manual session has no question rows.
+    for subject, done, correct in ((subject_id, 4, 1), (other_subject_id, 2, 2), (subject_id, 4, 3)):
+        session_id = service.start_session(user_id, subject, cycle_id)
+        service.finish_session(session_id, questions=[
+            QuestionPerformance(id=0, session_id=0, topic_name="t", difficulty_level=1, is_correct=i < correct)
+            for i in range(done)])
+    service.log_manual_session(user_id, cycle_id, subject_id, None, "2024-01-01T10:00:00",
+                               total_questions_done=10, total_questions_correct=5)
+    service.start_session(user_id, subject_id, cycle_id)  # Unfinished, so not in the history.
+
+    by_accuracy = service.get_history_rows(cycle_id, "accuracy", descending=False, page_size=2)
+    rest = service.get_history_rows(cycle_id, "accuracy", descending=False, page_size=2,
+                                    after=(by_accuracy[-1].accuracy, by_accuracy[-1].id))
+    filtered = service.get_history_rows(cycle_id, subject_filter="other_")
+
+    assert [(r.questions_done, r.questions_correct, r.accuracy) for r in by_accuracy + rest] == [
+        (4, 1, 25.0), (10, 5, 50.0), (4, 3, 75.0), (2, 2, 100.0)]
+    assert [r.subject_name for r in filtered] == ["Other_Subject"]
+    assert service.get_history_rows(cycle_id, subject_filter="%") == []
+    with pytest.raises(ValueError):
+        service.get_history_rows(cycle_id, "id; DROP TABLE study_sessions")
+
+
+
+def test_history_rows_order_dates_by_instant_not_by_text(session_setup):
+    service = SqliteSessionService(session_setup["factory"])
+    conn = session_setup["factory"].get_connection()
+    user_id, cycle_id, subject_id = session_setup["user_id"], session_setup["cycle_id"], session_setup["subject_id"]
+    # As text the offset value sorts last; as an instant (20:00 UTC) it is the earlier session.
+    for start in ("2024-01-01T22:00:00+00:00", "2024-01-02T01:00:00+05:00"):
+        session_id = service.start_session(user_id, subject_id, cycle_id)
+        service.finish_session(session_id)
+        conn.execute("UPDATE study_sessions SET start_time = ? WHERE id = ?", (start, session_id))
+
+    first = service.get_history_rows(cycle_id, page_size=1)
+    second = service.get_history_rows(cycle_id, page_size=1, after=first[0].keyset("start_time"))
+
+    assert [r.start_time for r in first + second] == ["2024-01-01T22:00:00+00:00", "2024-01-02T01:00:00+05:00"]
+
+def test_daily_breakdown_counts_finished_sessions_per_day_and_subject(session_setup):
+    service = SqliteSessionService(session_setup["factory"])
+    user_id, cycle_id, subject_id = session_setup["user_id"], session_setup["cycle_id"], session_setup["subject_id"]
+    for start in ("2024-01-01T09:00:00", "2024-01-01T15:00:00", "2024-01-02T09:00:00"):
+        service.log_manual_session(user_id, cycle_id, subject_id, None, start, duration_minutes=30)
+    service.start_session(user_id, subject_id, cycle_id)
+
+    subject_name = service.get_history_rows(cycle_id)[0].subject_name
+    assert service.get_daily_breakdown(cycle_id) == [("2024-01-02", subject_name, 1), ("2024-01-01", subject_name, 2)]
+
+
+def _daily_stats(conn):
+    return [tuple(row) for row in conn.execute(
+        "SELECT user_id, cycle_id, subject_id, local_date, questions, correct, seconds, sessions "
+        "FROM daily_subject_stats ORDER BY user_id, cycle_id, subject_id, local_date")]
+
+
+def test_daily_stats_follow_session_writes(session_setup):
+    service = SqliteSessionService(session_setup["factory"])
+    conn = session_setup["factory"].get_connection()
+    user_id, cycle_id, subject_id = session_setup["user_id"], session_setup["cycle_id"], session_setup["subject_id"]
+
+    session_id = service.start_session(user_id, subject_id, cycle_id)
+    questions = [
+        QuestionPerformance(id=0, session_id=0, topic_name="t1", difficulty_level=3, is_correct=True),
+        QuestionPerformance(id=0, session_id=0, topic_name="t1", difficulty_level=4, is_correct=False),
+    ]
+    service.finish_session(session_id, questions=questions)
+    service.log_manual_session(user_id, cycle_id, subject_id, None, "2024-01-01T10:00:00", duration_minutes=30)
+    service.start_session(user_id, subject_id, None)  # Unfinished and outside any cycle.
+
+    today = conn.execute("SELECT local_date FROM study_sessions WHERE id = ?", (session_id,)).fetchone()[0]
+    seconds = conn.execute("SELECT liquid_duration_sec FROM study_sessions WHERE id = ?", (session_id,)).fetchone()[0]
+    assert _daily_stats(conn) == [
+        (user_id, 0, subject_id, today, 0, 0, 0, 0),
+        (user_id, cycle_id, subject_id, "2024-01-01", 0, 0, 1800, 1),
+        (user_id, cycle_id, subject_id, today, 2, 1, seconds, 1),
+    ]
+
+    conn.execute("DELETE FROM question_performance WHERE session_id = ? AND is_correct = 1", (session_id,))
+    conn.execute("UPDATE study_sessions SET start_time = '2024-01-01T09:00:00' WHERE id = ?", (session_id,))
+    incremental = _daily_stats(conn)
+    assert incremental[1] == (user_id, cycle_id, subject_id, "2024-01-01", 1, 0, 1800 + seconds, 2)
+
+    service.rebuild_daily_stats()
+    assert _daily_stats(conn) == incremental
+
+
+def test_history_watermark_changes_on_edits_at_constant_totals(session_setup):
+    service = SqliteSessionService(session_setup["factory"])
+    conn = session_setup["factory"].get_connection()
+    user_id, cycle_id, subject_id = session_setup["user_id"], session_setup["cycle_id"], session_setup["subject_id"]
+    other_subject_id = SqliteMasterSubjectService(session_setup["factory"]).create("Other Subject")
+    session_id = service.log_manual_session(user_id, cycle_id, subject_id, None, "2024-01-01T10:00:00",
+                                            duration_minutes=30)
+    conn.execute(
+        "INSERT INTO question_performance (session_id, topic_name, difficulty_level, is_correct) "
+        "VALUES (?, 't1', 3, 1), (?, 't2', 3, 0)", (session_id, session_id))
+
+    edits = [
+        "UPDATE study_sessions SET subject_id = %d WHERE id = ?" % other_subject_id,
+        "UPDATE study_sessions SET study_method = 'Flashcards' WHERE id = ?",
+        "UPDATE question_performance SET topic_name = 't3' WHERE session_id = ? AND topic_name = 't1'",
+        "UPDATE question_performance SET is_correct = 1 - is_correct WHERE session_id = ?",
+    ]
+    watermark = service.get_history_watermark(cycle_id)
+    for edit in edits:
+        conn.execute(edit, (session_id,))
+        assert service.get_history_watermark(cycle_id) != watermark, edit
+        watermark = service.get_history_watermark(cycle_id)
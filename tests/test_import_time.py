@@ -0,0 +1,62 @@
+# tests/test_import_time.py
+"""Keeps the modules imported before the first window cheap (see MainWindowController._register_features)."""
+import os
+import subprocess
+import sys
+
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative `python -X importtime` time of `import main`, in microseconds. On a development machine
+# it takes 0.8-1.0 s with lazy features and 1.3 s with every feature imported eagerly; the budget
+# leaves headroom for slower machines, and LAZY_MODULES below is the strict check.
+STARTUP_IMPORT_BUDGET_US = 1_500_000
+
+# Modules that must only be imported when the view that needs them is first shown.
+LAZY_MODULES = (
+    "PySide6.QtCharts",
+    "qtawesome",
+    "app.features.analitics",
+    "app.features.configurations",
+    "app.features.cycle_manager",
+    "app.features.exam_editor",
+    "app.features.exam_manager",
+    "app.features.help",
+    "app.features.history",
+    "app.features.master_subject_manager",
+    "app.features.performance_dashboard",
+    "app.features.performance_graphs",
+    "app.features.rebalancer",
+    "app.features.session_choice",
+    "app.features.session_mode_choice",
+    "app.features.subject_details",
+    "app.features.subject_summary",
+    "app.features.training_screen",
+)
+
+
+def _import_main() -> dict:
+    """Imports main in a fresh interpreter and returns {module: cumulative microseconds}."""
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"],
+                            cwd=BASE_PATH, env=env, capture_output=True, text=True, check=True)
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        timings[module.strip()] = int(cumulative)
+    return timings
+
+
+def test_startup_does_not_import_lazy_features():
+    timings = _import_main()
+
+    eager = sorted(m for m in timings if any(m == lazy or m.startswith(lazy + ".") for lazy in LAZY_MODULES))
+    assert eager == []
+
+
+def test_startup_imports_stay_within_budget():
+    # The best of two runs, so a busy machine does not fail the build on its own.
+    best = min(_import_main()["main"] for _ in range(2))
+
+    assert best < STARTUP_IMPORT_BUDGET_US, f"import main took {best / 1000:.0f} ms"
@@ -0,0 +1,142 @@
+# tests/test_navigation_service.py
+import pytest
+from PySide6.QtCore import QCoreApplication, QEvent, QObject
+from PySide6.QtWidgets import QWidget
+
+from app.core.signals import ChangeKind, DataChange, InvalidationBus
+from app.navigation_service import NavigationService
+
+
+class _Controller(QObject):
+    def __init__(self, view):
+        super().__init__(view)
+        self.refreshes = 0
+
+    def refresh(self):
+        self.refreshes += 1
+
+
+@pytest.fixture
+def bus(qapp):
+    return InvalidationBus()
+
+
+def _provider(built: list):
+    def create(**kwargs):
+        view = QWidget()
+        view.setProperty("controller", _Controller(view))
+        built.append(view)
+        return view
+    return create
+
+
+def _controller(view) -> _Controller:
+    return view.property("controller")
+
+
+def _process_deletes():
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+
+def test_cached_views_are_reused_per_key(bus):
+    built, cycle = [], {"id": 1}
+    service = NavigationService(bus=bus)
+    service.register("history", _provider(built), cache_key=lambda: cycle["id"])
+
+    first = service.get_view("history")
+    assert service.get_view("history") is first
+    cycle["id"] = 2
+    assert service.get_view("history") is not first
+    assert len(built) == 2 and service.cached_view_count() == 2
+
+
+def test_uncached_views_are_built_every_time(bus):
+    built = []
+    service = NavigationService(bus=bus)
+    service.register("help", _provider(built))
+
+    service.get_view("help")
+    service.get_view("help")
+
+    assert len(built) == 2 and service.cached_view_count() == 0
+
+
+def test_stale_views_refresh_only_when_shown(bus):
+    built = []
+    service = NavigationService(bus=bus)
+    service.register("history", _provider(built), cache_key=lambda: None, depends_on=ChangeKind.SESSIONS)
+    view = service.get_view("history")
+    service.on_show(view)
+
+    # While visible, a relevant change refreshes the view straight away; others are ignored.
+    bus.publish(DataChange.of(ChangeKind.EXAMS))
+    bus.flush()
+    bus.publish(DataChange.of(ChangeKind.SESSIONS))
+    bus.flush()
+    assert _controller(view).refreshes == 1
+
+    # While hidden, changes only mark it stale, however many arrive.
+    service.on_hide(view)
+    for _ in range(3):
+        bus.publish(DataChange.of(ChangeKind.SESSIONS))
+        bus.flush()
+    assert _controller(view).refreshes == 1
+
+    assert service.get_view("history") is view
+    service.on_show(view)
+    assert _controller(view).refreshes == 2
+    service.on_show(view)
+    assert _controller(view).refreshes == 2
+
+
+def test_stale_views_without_a_refresh_hook_are_rebuilt(bus):
+    service = NavigationService(bus=bus)
+    service.register("label", QWidget, cache_key=lambda: None)
+    view = service.get_view("label")
+
+    service.invalidate("label")
+
+    assert service.get_view("label") is not view
+
+
+def test_least_recently_used_hidden_views_are_evicted(bus):
+    built = []
+    service = NavigationService(max_views=2, bus=bus)
+    for name in ("a", "b", "c"):
+        service.register(name, _provider(built), cache_key=lambda: None)
+
+    a = service.get_view("a")
+    service.on_show(a)
+    b = service.get_view("b")
+    service.on_hide(a)
+    service.on_show(b)
+    service.get_view("a")  # Touch a, so b is now the least recently used.
+    service.on_hide(b)
+    service.on_show(a)
+    c = service.get_view("c")
+    service.on_hide(a)
+    service.on_show(c)
+
+    assert service.cached_view_count() == 2
+    assert not service.is_cached(b) and service.is_cached(a) and service.is_cached(c)
+    destroyed = []
+    b.destroyed.connect(lambda: destroyed.append(True))
+    _process_deletes()
+    assert destroyed == [True]
+
+
+def test_memory_budget_evicts_hidden_views(bus):
+    built = []
+    service = NavigationService(memory_budget_bytes=1, bus=bus)
+    service.register("a", _provider(built), cache_key=lambda: None)
+    service.register("b", _provider(built), cache_key=lambda: None)
+
+    a = service.get_view("a")
+    service.on_show(a)
+    b = service.get_view("b")
+    assert service.is_cached(a) and service.is_cached(b)  # Neither is hidden yet.
+
+    service.on_hide(a)
+    service.on_show(b)
+
+    assert not service.is_cached(a) and service.is_cached(b)